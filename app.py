@@ -3,6 +3,9 @@ of `main_page` module of `bmgui` package.
 """
 
 
+# Standard library imports
+import multiprocessing
+
 # Local imports
 from bmgui.main_page import AppMain
 
@@ -17,4 +20,6 @@ def run_bibliometer():
         print(err)
 
 if __name__ == "__main__":
+    # Required for the worker processes of the frozen Windows executable
+    multiprocessing.freeze_support()
     run_bibliometer()
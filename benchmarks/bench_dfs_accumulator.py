@@ -0,0 +1,107 @@
+"""Micro-benchmark of the accumulation of dataframes.
+
+Compares the successive concatenations through the `concat_dfs` function
+with the single final concatenation of the `DfsAccumulator` class
+when 2-row dataframes are appended one by one.
+
+Usage, from the root of the repository:
+    python benchmarks/bench_dfs_accumulator.py [rows_nb ...] [--concat-loop-max-rows N]
+
+By default, the successive concatenations are run for all the numbers
+of rows; the option skips them above N rows, and the setting used is
+printed with the timings.
+
+"""
+
+# Standard library imports
+import argparse
+import time
+
+# 3rd party imports
+import pandas as pd
+
+# Local imports
+from bmfuncts.dfs_utils import DfsAccumulator
+from bmfuncts.useful_functs import concat_dfs
+
+# Numbers of rows benchmarked by default
+DEFAULT_ROWS_NB_LIST = [1000, 10000, 50000]
+
+
+def _build_frames(rows_nb):
+    """Builds the list of 2-row dataframes to accumulate.
+
+    Args:
+        rows_nb (int): The total number of rows.
+    Returns:
+        (list): The list of dataframes.
+    """
+    frames_list = [pd.DataFrame({"a": [idx, idx + 1],
+                                 "b": [str(idx)] * 2,
+                                 "c": [idx * 0.5] * 2})
+                   for idx in range(rows_nb // 2)]
+    return frames_list
+
+
+def _run_concat_loop(frames_list):
+    """Accumulates the dataframes through successive concatenations.
+
+    Args:
+        frames_list (list): The list of dataframes to accumulate.
+    Returns:
+        (tup): (accumulated dataframe, elapsed time in seconds).
+    """
+    start_time = time.perf_counter()
+    acc_df = pd.DataFrame()
+    for df in frames_list:
+        acc_df = concat_dfs([acc_df, df])
+    return acc_df, time.perf_counter() - start_time
+
+
+def _run_accumulator(frames_list):
+    """Accumulates the dataframes through the `DfsAccumulator` class.
+
+    Args:
+        frames_list (list): The list of dataframes to accumulate.
+    Returns:
+        (tup): (accumulated dataframe, elapsed time in seconds).
+    """
+    start_time = time.perf_counter()
+    accumulator = DfsAccumulator()
+    for df in frames_list:
+        accumulator.append(df)
+    acc_df = accumulator.get_df()
+    return acc_df, time.perf_counter() - start_time
+
+
+def main(rows_nb_list, concat_loop_max_rows=None):
+    """Runs the benchmark for each number of rows and prints the timings.
+
+    Args:
+        rows_nb_list (list): The numbers of rows to accumulate.
+        concat_loop_max_rows (int): Number of rows above which the successive \
+        concatenations are skipped (optional, default = None, never skipped).
+    """
+    print(f"concat_dfs loop max rows: {concat_loop_max_rows or 'none'}")
+    for rows_nb in rows_nb_list:
+        frames_list = _build_frames(rows_nb)
+        new_df, new_time = _run_accumulator(frames_list)
+        if concat_loop_max_rows is None or rows_nb <= concat_loop_max_rows:
+            old_df, old_time = _run_concat_loop(frames_list)
+            if not new_df.equals(old_df):
+                raise AssertionError(f"Different results for {rows_nb} rows")
+            old_time_str = f"{old_time:.2f}s"
+        else:
+            old_time_str = "skipped"
+        print(f"{rows_nb} rows: concat_dfs loop {old_time_str}, "
+              f"DfsAccumulator {new_time:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of the accumulation of dataframes.")
+    parser.add_argument("rows_nb", nargs="*", type=int, default=DEFAULT_ROWS_NB_LIST,
+                        help="numbers of rows to accumulate")
+    parser.add_argument("--concat-loop-max-rows", type=int, default=None,
+                        help="skip the successive concatenations above this number of rows")
+    args = parser.parse_args()
+    main(args.rows_nb, args.concat_loop_max_rows)
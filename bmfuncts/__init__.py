@@ -6,20 +6,27 @@ __license__ = 'MIT'
 
 from bmfuncts.institute_globals import *
 from bmfuncts.config_utils import *
+from bmfuncts.cache_utils import *
 from bmfuncts.useful_functs import *
+from bmfuncts.dfs_utils import *
 from bmfuncts.employees_globals import *
 from bmfuncts.pub_globals import *
 from bmfuncts.rename_cols import *
+from bmfuncts.parse_corpuses import *
 from bmfuncts.build_otps_info import *
 from bmfuncts.add_otps import *
 from bmfuncts.add_ifs import *
 from bmfuncts.use_homonyms import *
+from bmfuncts.otps_history import *
 from bmfuncts.use_otps import *
+from bmfuncts.employees_cache import *
 from bmfuncts.update_employees import *
 from bmfuncts.build_pub_authors import *
 from bmfuncts.build_year_pub_empl import *
 from bmfuncts.create_hash_id import *
+from bmfuncts.merge_state import *
 from bmfuncts.merge_pub_employees import *
+from bmfuncts.merge_years import *
 from bmfuncts.consolidate_pub_list import *
 from bmfuncts.update_impact_factors import *
 from bmfuncts.authors_analysis import *
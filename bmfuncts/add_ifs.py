@@ -367,7 +367,7 @@ def _format_and_save_add_if_dfs(dfs_tup, out_cols_tup, empty_kw,
 
     # Formatting and saving 'corpus_df' as openpyxl file at full path 'out_file_path'
     corpus_df_title = pg.DF_TITLES_LIST[0]
-    wb, ws = format_page(corpus_df, corpus_df_title)
+    wb, ws = format_page(corpus_df, corpus_df_title, write_only=True)
     ws.title = "Publications " +  corpus_year
     wb.save(out_file_path)
 
@@ -5,10 +5,13 @@ in terms of attributing OTPs to each publication.
 
 __all__ = ['add_data_val',
            'add_otp',
+           'save_otp_workbooks',
           ]
 
 
 # Standard library imports
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # 3rd party imports
@@ -21,17 +24,21 @@ import bmfuncts.employees_globals as eg
 import bmfuncts.institute_globals as ig
 import bmfuncts.pub_globals as pg
 from bmfuncts.build_otps_info import set_lab_otps
+from bmfuncts.format_files import build_cell_fill_patterns
 from bmfuncts.format_files import build_data_val
 from bmfuncts.format_files import format_page
 from bmfuncts.format_files import format_wb_sheet
 from bmfuncts.format_files import get_col_letter
 from bmfuncts.rename_cols import build_col_conversion_dic
 from bmfuncts.rename_cols import set_otp_col_names
+from bmfuncts.dfs_utils import DfsAccumulator
 from bmfuncts.useful_functs import concat_dfs
 
 
 def add_data_val(ws, data_val, df_len, col_letter, xl_idx_base):
     """Adding a list-data-validation rule to each row of an openpyxl worksheet.
+
+    The rule is added to the cells of the rows as a single range of the column.
     
     Args:
         ws (openpyxl worksheet): Worksheet to be added with validation data list.
@@ -47,14 +54,39 @@ def add_data_val(ws, data_val, df_len, col_letter, xl_idx_base):
         (openpyxl worksheet): Worksheet added with validation data list.
     """
     ws.add_data_validation(data_val)
-    lab_df_rows_nb = df_len + 1
-    for df_row_idx in range(1, lab_df_rows_nb):
-        xl_row_idx = df_row_idx + xl_idx_base
-        cell_name = col_letter + str(xl_row_idx)
-        data_val.add(ws[cell_name])
+    if df_len:
+        first_xl_row_idx = 1 + xl_idx_base
+        last_xl_row_idx = df_len + xl_idx_base
+        data_val.add(f"{col_letter}{first_xl_row_idx}:{col_letter}{last_xl_row_idx}")
     return ws
 
 
+def save_otp_workbooks(save_otp_file, args_tups_list, max_workers=None):
+    """Builds and saves the workbooks for setting OTPs attribute of publications 
+    in parallel with one task per department.
+
+    The tasks are run in a pool of worker processes, each task calling 
+    'save_otp_file' with the args of a department. The exceptions raised 
+    in a task are raised again when getting its result.
+
+    Args:
+        save_otp_file (function): Module-level function that builds and saves \
+        the workbook of a department.
+        args_tups_list (list): The args (tup) of 'save_otp_file' for each department.
+        max_workers (int): Number of worker processes (optional, default = None, \
+        the number of departments limited to the number of CPUs).
+    """
+    if not args_tups_list:
+        return
+    if max_workers is None:
+        max_workers = min(len(args_tups_list), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures_list = [executor.submit(save_otp_file, *args_tup)
+                        for args_tup in args_tups_list]
+        for future in futures_list:
+            future.result()
+
+
 def _set_otps_dept_affil(org_tup, in_df, otp_col_dict):
     """Replaces the 'dpt_col' column of affiliation department by 'otp_dept_col'
     new column filled with the department label to be used for the OTP attribution.
@@ -174,7 +206,7 @@ def _add_authors_name_list(institute, org_tup, in_df):
     in_df[prenom_alias] = in_df[prenom_alias].apply(lambda x: x.capitalize())
     in_df[full_name_alias] = in_df[nom_alias] + ', ' + in_df[prenom_alias]
 
-    out_df = pd.DataFrame()
+    out_dfs = DfsAccumulator()
     for _, pub_id_df in in_df.groupby(pub_id_alias):
 
         authors_tup_list = sorted(list(set(zip(pub_id_df[idx_authors_alias],
@@ -190,7 +222,8 @@ def _add_authors_name_list(institute, org_tup, in_df):
                             for x in authors_tup_list]
         authors_full_str = "; ".join(authors_str_list)
         pub_id_df[full_name_list_alias] = authors_full_str
-        out_df = concat_dfs([out_df, pub_id_df])
+        out_dfs.append(pub_id_df)
+    out_df = out_dfs.get_df()
     out_df.fillna('')
 
     end_message = "Column with co-authors list added"
@@ -241,17 +274,13 @@ def _enhance_homonyms_file(institute, org_tup, in_path):
     return final_solved_homonymies_df
 
 
-def _save_dpt_otp_file(dpt, dpt_df, dpt_otp_list,
-                       otp_alias, xl_dpt_path, otp_col_list):
+def _save_dpt_otp_file(dpt, dpt_df, data_val_tup, otp_alias,
+                       xl_dpt_path, otp_col_list, cell_colors):
     """Creates an openpyxl file to allow the user to set the OTP attribute   
     of the publications for the Institute department labelled 'dpt'.
 
-    First, a validation list and a list-data-validation rule are defined 
-    based on the list of OTPs of the department given by 'dpt_otp_list' list 
-    and through the `build_data_val` function imported from the 
-    `bmfuncts.format_files` module. 
-    A new column named 'otp_alias' is added to the dataframe 'dpt_df' 
-    with values set to the validation list. 
+    First, a new column named 'otp_alias' is added to the dataframe 'dpt_df' 
+    with values set to the validation list of the OTPs of the department. 
     The dataframe columns are renamed using 'otp_col_list'. 
     Then the dataframe is formatted as an openpyxl workbook through 
     the `format_page` function imported from `bmfuncts.format_files` 
@@ -267,17 +296,19 @@ def _save_dpt_otp_file(dpt, dpt_df, dpt_otp_list,
     Arg:
         dpt (str): Institute department.
         dpt_df (dataframe): The publications-list dataframe of the 'dpt' department.
-        dpt_otp_list (list): List of Institute departments (str).
+        data_val_tup (tup): (Validation list (str), list-data-validation rule \
+        (openpyxl.DataValidation)) of the OTPs of the 'dpt' department.
         otp_alias (str): OTPs column name.
         xl_dpt_path (path): Full path to the file for setting publication OTP.
         otp_col_list (list): Column names for rename of columns of the file created \
         for setting publications OTP.
+        cell_colors (list): List of openpyxl.PatternFill objects.
     """
     # Setting num of first col and first row in EXCEL files
     xl_idx_base = pg.XL_INDEX_BASE
 
-    # Building validation list of OTPs for 'dpt' department
-    validation_list, data_val = build_data_val(dpt_otp_list)
+    # Setting parameters from args
+    validation_list, data_val = data_val_tup
 
     # Adding a column containing OTPs of 'dpt' department
     dpt_df[otp_alias] = validation_list
@@ -287,7 +318,7 @@ def _save_dpt_otp_file(dpt, dpt_df, dpt_otp_list,
 
     # Formatting 'dpt_df' as openpyxl workbook
     dpt_df_title = pg.DF_TITLES_LIST[2]
-    wb, ws = format_page(dpt_df, dpt_df_title)
+    wb, ws = format_page(dpt_df, dpt_df_title, cell_colors=cell_colors)
     ws.title = pg.OTP_SHEET_NAME_BASE + " " +  dpt
 
     # Activating the validation data list in all cells of the OTPs column
@@ -301,7 +332,8 @@ def _save_dpt_otp_file(dpt, dpt_df, dpt_otp_list,
     wb.save(xl_dpt_path)
 
 
-def _add_dept_otp(institute, org_tup, in_path, out_path, out_file_base):
+def _add_dept_otp(institute, org_tup, in_path, out_path, out_file_base,
+                  max_workers=None):
     """Creates the files for setting OTP attribute of publications by the user 
     for the Institute departments.
 
@@ -310,7 +342,10 @@ def _add_dept_otp(institute, org_tup, in_path, out_path, out_file_base):
     through the `_add_authors_name_list` internal function. 
     Then, for each department, a sub_dataframe is extracted selecting rows 
     of publications where at least one author is affiliated to the department. 
-    Each sub-dataframe is saved through the `_save_dpt_otp_file` internal function.
+    The validation list of the OTPs of each department and the cell colors 
+    are built once. 
+    Each sub-dataframe is saved through the `_save_dpt_otp_file` internal function 
+    run in parallel for the departments through the `save_otp_workbooks` function.
 
     Args:
         institute (str): Institute name.
@@ -318,6 +353,7 @@ def _add_dept_otp(institute, org_tup, in_path, out_path, out_file_base):
         in_path (path): Full path to the file where homonyms have been solved.
         out_path (path): Full path to the files for setting OTPs attributes by the user.
         out_file_base (str): Base for building created-files names.
+        max_workers (int): Number of worker processes (optional, default = None).
     Returns:
         (str): End message recalling out_path.
     """
@@ -355,7 +391,11 @@ def _add_dept_otp(institute, org_tup, in_path, out_path, out_file_base):
     # Removing possible spaces in dept name
     out_df[dpt_alias] = out_df[dpt_alias].apply(lambda x: x.strip())
 
+    # Setting cell colors
+    cell_colors = build_cell_fill_patterns()
+
     # Configuring an Excel file per department with the list of OTPs
+    args_tups_list = []
     for dpt in sorted(dpt_list):
         # Setting dpt_df with only pub_ids for which the first author
         # is from the 'dpt' department
@@ -364,29 +404,28 @@ def _add_dept_otp(institute, org_tup, in_path, out_path, out_file_base):
             filtre_dpt = filtre_dpt | (out_df[dpt_alias]==dpt_value)
         dpt_df = out_df[filtre_dpt].copy()
 
-        # Setting the list of OTPs for the 'dpt' department
-        dpt_otp_list = dpt_attributs_dict[dpt][dpt_otp_alias]
+        # Building validation list of OTPs for the 'dpt' department
+        data_val_tup = build_data_val(dpt_attributs_dict[dpt][dpt_otp_alias])
 
         # Setting the full path of the EXCEl file for the 'dpt' department
         otp_file_name_dpt = f'{out_file_base}_{dpt}.xlsx'
         xl_dpt_path = out_path / Path(otp_file_name_dpt)
 
-        # Adding a column with validation list for OTPs and saving the file
-        _save_dpt_otp_file(dpt, dpt_df, dpt_otp_list,
-                           otp_alias, xl_dpt_path, otp_col_list)
+        args_tups_list.append((dpt, dpt_df, data_val_tup, otp_alias,
+                               xl_dpt_path, otp_col_list, cell_colors))
 
+    # Adding a column with validation list for OTPs and saving the files
+    save_otp_workbooks(_save_dpt_otp_file, args_tups_list, max_workers=max_workers)
 
-def _save_dpt_lab_otp_file(institute, dpt_df, dpt_otp_dict, xl_dpt_path,
-                           otp_col_dic, otp_lab_name_col, dpt):
+
+def _save_dpt_lab_otp_file(institute, dpt_df, dpt_data_val_dict, xl_dpt_path,
+                           otp_col_dic, otp_lab_name_col, dpt, cell_colors):
     """Creates an openpyxl file to allow the user to set the OTP attribute   
     of the publications for each laboratory of a department of the Institute. 
 
-    First, a validation list and a list-data-validation rule are defined 
-    based on the list of OTPs of the laboratory given by 'lab_otp_list' list 
-    and through the `build_data_val` function imported from the 
-    `bmfuncts.format_files` module. 
-    A new column named 'otp_alias' is added to the dataframe 'otp_lab_df' 
-    with values set to the validation list. 
+    First, a new column named 'otp_alias' is added to the dataframe 'otp_lab_df' 
+    of each laboratory with values set to the validation list of the OTPs 
+    of the laboratory. 
     The dataframe columns are renamed using 'otp_col_list'. 
     Then the dataframe is formatted as a multisheet openpxl workbook through 
     the `format_wb_sheet` function imported from `bmfuncts.format_files` 
@@ -403,13 +442,16 @@ def _save_dpt_lab_otp_file(institute, dpt_df, dpt_otp_dict, xl_dpt_path,
         institute (str): Institute name.
         dpt_df (dataframe): The publications-list dataframe of a department of \
         the Institute.
-        dpt_otp_dict (dict): Dict keyed by lab-names and valued by lab-OTPs lists.
+        dpt_data_val_dict (dict): Dict keyed by lab-names and valued by tuples \
+        (validation list (str), list-data-validation rule (openpyxl.DataValidation)) \
+        of the lab OTPs.
         xl_dpt_path (path): Full path to the file for setting publication OTP.  
         otp_col_dic (dict): Dict valued by the column names for rename of columns \
         of the file created for setting publications OTP.
         otp_lab_name_col (str): Column name of lab name to be used for the selection \
         of the OTPs validation list.
         dpt (str): The department label.
+        cell_colors (list): List of openpyxl.PatternFill objects.
     """
     # Setting num of first col and first row in EXCEL files
     xl_idx_base = pg.XL_INDEX_BASE
@@ -427,9 +469,8 @@ def _save_dpt_lab_otp_file(institute, dpt_df, dpt_otp_dict, xl_dpt_path,
     if len(dpt_df):
         first = True
         for otp_lab, otp_lab_df in dpt_df.groupby(otp_lab_name_col):
-            # Setting a validation list per lab
-            lab_otp_list = dpt_otp_dict[otp_lab]
-            validation_list, data_val = build_data_val(lab_otp_list)
+            # Setting the validation list of the lab
+            validation_list, data_val = dpt_data_val_dict[otp_lab]
 
             # Adding a column containing OTPs of 'otp_lab' laboratory
             otp_lab_df[otp_alias] = validation_list
@@ -442,7 +483,8 @@ def _save_dpt_lab_otp_file(institute, dpt_df, dpt_otp_dict, xl_dpt_path,
             sheet_name = otp_lab
             otp_lab_df_title = pg.DF_TITLES_LIST[2]
             wb = format_wb_sheet(sheet_name, otp_lab_df,
-                                 otp_lab_df_title, wb, first)
+                                 otp_lab_df_title, wb, first,
+                                 cell_colors=cell_colors)
             ws = wb.active
 
             # Getting the column letter for the OTPs column
@@ -459,7 +501,7 @@ def _save_dpt_lab_otp_file(institute, dpt_df, dpt_otp_dict, xl_dpt_path,
 
         # Formatting 'dpt_df' as openpyxl workbook
         dpt_df_title = pg.DF_TITLES_LIST[2]
-        wb, ws = format_page(dpt_df, dpt_df_title)
+        wb, ws = format_page(dpt_df, dpt_df_title, cell_colors=cell_colors)
         dpt_label = dpt
         if dpt=="DIR":
             dpt_label = "(" + institute.upper() + ")"
@@ -605,7 +647,8 @@ def _set_full_pub_df(init_pub_df, cols_list, dpt_list):
     return full_pub_df
 
 
-def _add_lab_otp(institute, org_tup, in_path, out_path, out_file_base, lab_otps_dict):
+def _add_lab_otp(institute, org_tup, in_path, out_path, out_file_base, lab_otps_dict,
+                 max_workers=None):
     """Creates the files for setting OTP attribute of publications by the user 
     for each of the laboratories of the Institute departments.
 
@@ -615,7 +658,10 @@ def _add_lab_otp(institute, org_tup, in_path, out_path, out_file_base, lab_otps_
     Then, for each department, a sub_dataframe is extracted selecting rows 
     of publications where at least one author is affiliated to the department 
     through the `_build_otp_dept_df` internal function.
+    The validation lists of the OTPs of each laboratory and the cell colors 
+    are built once. 
     Each sub-dataframe is saved through the `_save_dpt_lab_otp_file` internal 
+    function run in parallel for the departments through the `save_otp_workbooks` 
     function.
 
     Args:
@@ -626,6 +672,7 @@ def _add_lab_otp(institute, org_tup, in_path, out_path, out_file_base, lab_otps_
         out_file_base (str): Base for building created-files names.
         lab_otps_dict (dict): OTPs hierarchical dict keyed by departments \
         and valued by dicts keyed by labs and valued by OTPs lists.
+        max_workers (int): Number of worker processes (optional, default = None).
     """
 
     # Setting institute parameters
@@ -653,11 +700,19 @@ def _add_lab_otp(institute, org_tup, in_path, out_path, out_file_base, lab_otps_
     cols_list = [pub_id_col, idx_author_col, dpt_col]
     full_pub_df = _set_full_pub_df(init_pub_df, cols_list, dpt_list)
 
+    # Setting cell colors
+    cell_colors = build_cell_fill_patterns()
+
     # Configuring an Excel file per department with the list of OTPs
+    args_tups_list = []
     for dpt in sorted(dpt_list):
         # Setting the dict of list of OTPs for the 'dpt' department
         dpt_otp_dict = lab_otps_dict[dpt]
 
+        # Building validation lists of OTPs for the labs of the department
+        dpt_data_val_dict = {lab: build_data_val(lab_otp_list)
+                             for lab, lab_otp_list in dpt_otp_dict.items()}
+
         # Setting list of the labs of the department
         dpt_labs_list = dpt_otp_dict.keys()
 
@@ -671,12 +726,15 @@ def _add_lab_otp(institute, org_tup, in_path, out_path, out_file_base, lab_otps_
         otp_file_name_dpt = f'{out_file_base}_{dpt}.xlsx'
         xl_dpt_path = out_path / Path(otp_file_name_dpt)
 
-       # Adding a column with validation list for OTPs and saving the file
-        _save_dpt_lab_otp_file(institute, otp_dpt_df, dpt_otp_dict, xl_dpt_path,
-                               otp_col_dic, otp_lab_name_col, dpt)
+        args_tups_list.append((institute, otp_dpt_df, dpt_data_val_dict, xl_dpt_path,
+                               otp_col_dic, otp_lab_name_col, dpt, cell_colors))
+
+    # Adding a column with validation list for OTPs and saving the files
+    save_otp_workbooks(_save_dpt_lab_otp_file, args_tups_list, max_workers=max_workers)
 
 
-def add_otp(institute, org_tup, bibliometer_path, in_path, out_path, out_file_base):
+def add_otp(institute, org_tup, bibliometer_path, in_path, out_path, out_file_base,
+            max_workers=None):
     """Creates the files for setting OTP attribute of publications by the user 
     for the Institute departments either among OTPs list at department level 
     or lab level.
@@ -687,6 +745,8 @@ def add_otp(institute, org_tup, bibliometer_path, in_path, out_path, out_file_ba
     - The OTPs info are got through 'org_tup' parameter or `set_lab_otps` \
     function imported from `bmfuncts.build_otps_info` module.
 
+    The files of the departments are built and saved in parallel.
+
     Args:
         institute (str): Institute name.
         org_tup (tup): Contains Institute parameters.
@@ -694,6 +754,8 @@ def add_otp(institute, org_tup, bibliometer_path, in_path, out_path, out_file_ba
         in_path (path): Full path to the file where homonyms have been solved.
         out_path (path): Full path to the files for setting OTPs attributes by the user.
         out_file_base (str): Base for building created-files names.
+        max_workers (int): Number of worker processes (optional, default = None, \
+        the number of departments limited to the number of CPUs).
     Returns:
         (str): end message recalling out_path.
     """
@@ -702,9 +764,11 @@ def add_otp(institute, org_tup, bibliometer_path, in_path, out_path, out_file_ba
 
     if otp_level=="LAB":
         lab_otps_dict = set_lab_otps(institute, org_tup, bibliometer_path)
-        _add_lab_otp(institute, org_tup, in_path, out_path, out_file_base, lab_otps_dict)
+        _add_lab_otp(institute, org_tup, in_path, out_path, out_file_base, lab_otps_dict,
+                     max_workers=max_workers)
     else:
-        _add_dept_otp(institute, org_tup, in_path, out_path, out_file_base)
+        _add_dept_otp(institute, org_tup, in_path, out_path, out_file_base,
+                      max_workers=max_workers)
 
     end_message = ("Files for setting publication OTPs per department "
                    f"saved in folder: \n  '{out_path}'")
@@ -27,7 +27,7 @@ from bmfuncts.useful_functs import set_year_pub_id
 
 
 def _read_authors_data(bibliometer_path, saved_results_path,
-                       corpus_year):
+                       corpus_year, cols_list=None):
     """Reads saved authors data resulting from the parsing step.
 
     It uses the `get_final_dedup` function of 
@@ -38,6 +38,8 @@ def _read_authors_data(bibliometer_path, saved_results_path,
         saved_results_path (path): Full path to the folder \
         where final results are saved.
         corpus_year (str): 4 digits year of the corpus.
+        cols_list (list): Optional list of the columns to read \
+        (default = None for all the columns).
     Returns:
         (dataframe): The dataframe of the authors data.
     """
@@ -47,7 +49,8 @@ def _read_authors_data(bibliometer_path, saved_results_path,
     # Getting the dict of deduplication results
     dedup_parsing_dict = get_final_dedup(bibliometer_path,
                                          saved_results_path,
-                                         corpus_year)
+                                         corpus_year,
+                                         columns_dict={authors_item_alias: cols_list})
 
     # Getting ID of each author with author name
     authors_df = dedup_parsing_dict[authors_item_alias]
@@ -115,7 +118,7 @@ def _build_auth_nb_per_pub(bibliometer_path, saved_results_path,
 
     # Getting the authors per pub-ID file from parsing results
     authors_df = _read_authors_data(bibliometer_path, saved_results_path,
-                                    corpus_year)
+                                    corpus_year, cols_list=[pub_id_col])
 
     # Creating a dataframe with a column with number of authors per pub-ID
     count_auth_df = pd.DataFrame()
@@ -337,7 +340,8 @@ def authors_analysis(institute, org_tup, bibliometer_path, datatype,
     # Saving the author-employee dataframe as EXCEL file
     author_employee_xlsx_file_path = Path(auth_analysis_folder_path) / Path(year_authors_file + ".xlsx")
     auth_df_title = pg.DF_TITLES_LIST[4]
-    wb, ws = format_page(author_employee_df, auth_df_title)
+    wb, ws = format_page(author_employee_df, auth_df_title,
+                         write_only=True)
     ws.title = 'Auteurs ' + corpus_year
     wb.save(author_employee_xlsx_file_path)
     if progress_callback:
@@ -6,11 +6,13 @@ __all__ = ['build_and_save_institutions_stat']
 
 # Standard Library imports
 import re
+from itertools import chain
 from pathlib import Path
 from string import Template
 
 # 3rd party imports
 import BiblioParsing as bp
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook as openpyxl_Workbook
 
@@ -33,6 +35,11 @@ def _build_distributed_inst_df(norm_institutions_df, institutions_col, inst_type
         => "Lab" col value = "['IMEP-LaHC Lab']"
         => Other type col value = "[]"
 
+    The institutions lists are split and exploded once, then the institution-type \
+    suffixes are extracted through a single compiled pattern and the institutions \
+    are pivoted back to one list column per institution type. The progress status \
+    is updated after each of these steps.
+
     Args:
         norm_institutions_df (dataframe): Data of the normalized institutions per publication.
         institutions_col (str): Column name of the normalizedinstitutions list in \
@@ -46,25 +53,48 @@ def _build_distributed_inst_df(norm_institutions_df, institutions_col, inst_type
         type and per publication.
     """
     if progress_param:
-        step_nb = len(norm_institutions_df) * len(inst_types_list)
         progress_callback, progress_init, progress_final = progress_param
-        progress_step = (progress_final - progress_init) / step_nb
-        progress_status = progress_init
-        progress_callback(progress_status)
-
-    set_words_template = Template(r'[\s]$word$$')
-    distrib_institutions_df = pd.DataFrame()
-    for _, row in norm_institutions_df.iterrows():
-        inst_list = row[institutions_col].split("; ")
-        for inst_type in inst_types_list:
-            re_search_words = re.compile(set_words_template.substitute({"word":inst_type}))
-            row[inst_type] = [inst for inst in inst_list if re.search(re_search_words, inst)]
-            if progress_param:
-                progress_status += progress_step
-                progress_callback(progress_status)
-        row_df = row.to_frame().T.astype(str)
-        distrib_institutions_df = concat_dfs([distrib_institutions_df, row_df])
-    distrib_institutions_df = distrib_institutions_df.astype(str)
+        progress_step = (progress_final - progress_init) / 3
+        progress_callback(progress_init)
+
+    # Setting useful column names
+    row_col, inst_col, type_col = "row", "inst", "type"
+
+    # Splitting and exploding once the institutions lists
+    inst_lists = [inst_names.split("; ") for inst_names in norm_institutions_df[institutions_col]]
+    inst_df = pd.DataFrame({row_col: np.repeat(np.arange(len(inst_lists)),
+                                               [len(x) for x in inst_lists]),
+                            inst_col: list(chain.from_iterable(inst_lists))})
+    if progress_param:
+        progress_callback(progress_init + progress_step)
+
+    # Extracting the institution-type suffixes of each institution
+    # with a single pattern matching all the types
+    set_words_template = Template(r'[\s](?=($words)$$)')
+    inst_types_pattern = "|".join(dict.fromkeys(inst_types_list))
+    re_search_types = re.compile(set_words_template.substitute({"words": inst_types_pattern}))
+    inst_types_dict = {inst: list(dict.fromkeys(match.group(1) for match
+                                                in re_search_types.finditer(inst)))
+                       for inst in inst_df[inst_col].unique()}
+    inst_df[type_col] = inst_df[inst_col].map(inst_types_dict)
+    inst_df = inst_df.explode(type_col).dropna(subset=[type_col])
+    if progress_param:
+        progress_callback(progress_init + 2 * progress_step)
+
+    # Pivoting back to one column of institutions list per institution type
+    inst_type_lists_df = inst_df.groupby([row_col, type_col], sort=False)[inst_col].agg(list) \
+                                .unstack(type_col)
+    distrib_institutions_df = norm_institutions_df.reset_index(drop=True).astype(str)
+    for inst_type in inst_types_list:
+        if inst_type in inst_type_lists_df.columns:
+            type_lists = inst_type_lists_df[inst_type].reindex(distrib_institutions_df.index)
+        else:
+            type_lists = pd.Series(np.nan, index=distrib_institutions_df.index, dtype=object)
+        distrib_institutions_df[inst_type] = [str(x) if isinstance(x, list) else str([])
+                                              for x in type_lists]
+    distrib_institutions_df = concat_dfs([distrib_institutions_df])
+    if progress_param:
+        progress_callback(progress_final)
     return distrib_institutions_df
 
 
@@ -274,7 +274,8 @@ def _read_addresses_data(bibliometer_path, saved_results_path,
     # Getting the dict of deduplication results
     dedup_parsing_dict = get_final_dedup(bibliometer_path,
                                          saved_results_path,
-                                         corpus_year)
+                                         corpus_year,
+                                         columns_dict={addresses_item_alias: None})
 
     # Getting ID of each author with author name
     addresses_df = dedup_parsing_dict[addresses_item_alias]
@@ -230,6 +230,67 @@ def _build_filt_authors_inst(authorsinst_authors_df, inst_col_list, main_status,
     return filt_authors_inst_
 
 
+def _set_names_rules_map(rules_df, rules_cols_list):
+    """Compiles the name-correction rules of 'rules_df' into a lookup map 
+    keyed by (last name, initials).
+
+    When several rules have the same key, the last one is retained as it was \
+    the one finally applied when the rules were applied successively.
+
+    Args:
+        rules_df (dataframe): The name-correction rules with one row per rule.
+        rules_cols_list (list): Useful column names in 'rules_df' dataframe \
+        = [initial last name, initial initials, new last name, new initials].
+    Returns:
+        (tup): (keys (pandas MultiIndex) of the rules as (initial last name, \
+        initial initials), array of the new last names, array of the new initials).
+    """
+    init_lastname_col, init_initials_col, new_lastname_col, new_initials_col = rules_cols_list
+    rules_df = rules_df.drop_duplicates(subset=[init_lastname_col, init_initials_col],
+                                        keep='last')
+    rules_keys = pd.MultiIndex.from_arrays([rules_df[init_lastname_col],
+                                           rules_df[init_initials_col]])
+    return (rules_keys,
+            rules_df[new_lastname_col].to_numpy(),
+            rules_df[new_initials_col].to_numpy())
+
+
+def _apply_names_rules_map(init_df, rules_map_tup, cols_list):
+    """Replaces author names in 'init_df' dataframe using the lookup map 
+    of name-correction rules built through the `_set_names_rules_map` 
+    internal function.
+
+    The rule of each author is got by a single lookup of its (last name, initials) \
+    in the map and the names of the authors with a rule are replaced at once.
+
+    Args:
+        init_df (dataframe): Publications list with one row per author \
+        where author names should be corrected.
+        rules_map_tup (tup): The lookup map of the name-correction rules.
+        cols_list (list): Useful column names in 'init_df' dataframe \
+        = [full name, last name, first name].
+    Returns:
+        (dataframe): Publications list with one row per author where \
+        author names have been corrected.
+    """
+    # Setting parameters from args
+    pub_fullname_col, pub_last_name_col, pub_first_name_col = cols_list
+    rules_keys, new_lastnames_array, new_initials_array = rules_map_tup
+
+    new_df = init_df.copy()
+    pub_keys = pd.MultiIndex.from_arrays([new_df[pub_last_name_col],
+                                         new_df[pub_first_name_col]])
+    rules_idx_array = rules_keys.get_indexer(pub_keys)
+    rules_mask = rules_idx_array>=0
+    if rules_mask.any():
+        new_lastnames = new_lastnames_array[rules_idx_array[rules_mask]]
+        new_initials = new_initials_array[rules_idx_array[rules_mask]]
+        new_df.loc[rules_mask, pub_last_name_col] = new_lastnames
+        new_df.loc[rules_mask, pub_first_name_col] = new_initials
+        new_df.loc[rules_mask, pub_fullname_col] = new_lastnames + ' ' + new_initials
+    return new_df
+
+
 def _check_names_spelling(bibliometer_path, init_df, cols_list):
     """Replace author names in 'init_df' dataframe by the employee name.
 
@@ -238,6 +299,9 @@ def _check_names_spelling(bibliometer_path, init_df, cols_list):
     folder of the working folder.
     Beforehand, the full name given by this file is standardized through the 
     `standardize_txt` function imported from `bmfuncts.useful_functs` module.
+    The spelling rules are compiled into a lookup map keyed by (last name, initials) 
+    through the `_set_names_rules_map` internal function and applied at once 
+    through the `_apply_names_rules_map` internal function.
 
     Args:
         bibliometer_path (path): Full path to working folder.
@@ -250,12 +314,6 @@ def _check_names_spelling(bibliometer_path, init_df, cols_list):
         spelling of author names have been corrected.
     """
 
-    # Setting parameters from args
-    col0, col1, col2 = cols_list
-    pub_fullname_col = col0
-    pub_last_name_col = col1
-    pub_first_name_col = col2
-
     # Setting useful aliases
     orphan_treat_root = pg.ARCHI_ORPHAN["root"]
     orthograph_file_name = pg.ARCHI_ORPHAN["orthograph file"]
@@ -282,22 +340,11 @@ def _check_names_spelling(bibliometer_path, init_df, cols_list):
     ortho_df[ortho_initials_new] = ortho_df[ortho_initials_new].\
         apply(standardize_firstname_initials)
 
-    new_df = init_df.copy()
-    new_df = new_df.reset_index(drop=True)
-    for pub_row_num, _ in new_df.iterrows():
-        lastname_init = init_df.loc[pub_row_num, pub_last_name_col]
-        initials_init = init_df.loc[pub_row_num, pub_first_name_col]
-        for ortho_row_num, _ in ortho_df.iterrows():
-            lastname_pub_ortho = ortho_df.loc[ortho_row_num, ortho_lastname_init]
-            initials_pub_ortho = ortho_df.loc[ortho_row_num, ortho_initials_init]
-
-            if lastname_init==lastname_pub_ortho and initials_init==initials_pub_ortho:
-                lastname_eff_ortho = ortho_df.loc[ortho_row_num, ortho_lastname_new]
-                initials_eff_ortho = ortho_df.loc[ortho_row_num, ortho_initials_new]
-                new_df.loc[pub_row_num, pub_last_name_col] = lastname_eff_ortho
-                new_df.loc[pub_row_num, pub_first_name_col] = initials_eff_ortho
-                new_df.loc[pub_row_num, pub_fullname_col] = lastname_eff_ortho + \
-                                                            ' ' + initials_eff_ortho
+    # Applying the name-correction rules compiled into a lookup map
+    ortho_cols_list = [ortho_lastname_init, ortho_initials_init,
+                       ortho_lastname_new, ortho_initials_new]
+    ortho_map_tup = _set_names_rules_map(ortho_df, ortho_cols_list)
+    new_df = _apply_names_rules_map(init_df.reset_index(drop=True), ortho_map_tup, cols_list)
 
     print("    Misspelling of author names corrected")
     return new_df
@@ -309,6 +356,9 @@ def _check_names_to_replace(bibliometer_path, year, init_df, cols_list):
     This is done when metadata error is reported in the dedicated Excel file named 
     'complements_file_name' at sheet 'compl_to_replace_sheet' and located 
     in the 'orphan_treat_root' folder of the working folder.
+    The replacement rules of the year are compiled into a lookup map keyed 
+    by (last name, initials) through the `_set_names_rules_map` internal function 
+    and applied at once through the `_apply_names_rules_map` internal function.
 
     Args:
         bibliometer_path (path): Full path to working folder.
@@ -322,12 +372,6 @@ def _check_names_to_replace(bibliometer_path, year, init_df, cols_list):
         author names have been corrected.
     """
 
-    # Setting parameters from args
-    col0, col1, col2 = cols_list
-    pub_fullname_col = col0
-    pub_last_name_col = col1
-    pub_first_name_col = col2
-
     # Setting useful aliases
     orphan_treat_root = pg.ARCHI_ORPHAN["root"]
     complements_file_name = pg.ARCHI_ORPHAN["complementary file"]
@@ -359,21 +403,11 @@ def _check_names_to_replace(bibliometer_path, year, init_df, cols_list):
     year_compl_df = compl_df[compl_df[compl_year_pub]==int(year)]
     year_compl_df = year_compl_df.reset_index()
 
-    new_df = init_df.copy()
-    for pub_row_num, _ in new_df.iterrows():
-        lastname_init = init_df.loc[pub_row_num, pub_last_name_col]
-        initials_init = init_df.loc[pub_row_num, pub_first_name_col]
-        for compl_row_num, _ in year_compl_df.iterrows():
-            lastname_pub_compl = year_compl_df.loc[compl_row_num, compl_lastname_init]
-            initials_pub_compl = year_compl_df.loc[compl_row_num, compl_initials_init]
-            if lastname_init==lastname_pub_compl and initials_init==initials_pub_compl:
-
-                lastname_eff_compl = year_compl_df.loc[compl_row_num, compl_lastname_new]
-                initials_eff_compl = year_compl_df.loc[compl_row_num, compl_initials_new]
-                new_df.loc[pub_row_num, pub_last_name_col] = lastname_eff_compl
-                new_df.loc[pub_row_num, pub_first_name_col] = initials_eff_compl
-                new_df.loc[pub_row_num, pub_fullname_col] = lastname_eff_compl \
-                + ' ' + initials_eff_compl
+    # Applying the name-correction rules compiled into a lookup map
+    compl_cols_list = [compl_lastname_init, compl_initials_init,
+                       compl_lastname_new, compl_initials_new]
+    compl_map_tup = _set_names_rules_map(year_compl_df, compl_cols_list)
+    new_df = _apply_names_rules_map(init_df, compl_map_tup, cols_list)
 
     print("    False author names replaced")
     return new_df
@@ -385,6 +419,8 @@ def _check_authors_to_remove(institute, bibliometer_path, pub_df, cols_list):
     The authors to remove are reported in the dedicated xlsx 
     file named 'outliers_file_name' at sheet 'outliers_sheet' 
     and located in the 'orphan_treat_root' folder of the working folder.
+    The rows to drop are selected at once by a mask of the authors which 
+    (last name, initials) are among those of the outliers.
 
     Args:
         institute (str): The institute name.
@@ -423,25 +459,15 @@ def _check_authors_to_remove(institute, bibliometer_path, pub_df, cols_list):
     outliers_df[outliers_initials_col] = outliers_df[outliers_initials_col].\
         apply(standardize_firstname_initials)
 
-    # Initializing the dataframe that will contain the rows to drop
-    # with the same columns names as the dataframe to update
-    drop_df = pd.DataFrame(columns=list(pub_df.columns))
-
     # Searching for the outliers in the dataframe to update by lastname and initials
-    for pub_row_num, _ in pub_df.iterrows():
-        pub_lastname = pub_df.loc[pub_row_num, pub_last_col]
-        pub_initials = pub_df.loc[pub_row_num, pub_initials_col]
-        for outliers_row_num, _ in outliers_df.iterrows():
-            outliers_lastname = outliers_df.loc[outliers_row_num, outliers_lastname_col]
-            outliers_initials = outliers_df.loc[outliers_row_num, outliers_initials_col]
-            if pub_lastname==outliers_lastname and pub_initials==outliers_initials:
-                # Setting the row to drop as a dataframe
-                row_to_drop_df = pub_df.loc[pub_row_num].to_frame().T
-                # Appending the row to drop to the dataframe that will contain all the rows to drop
-                drop_df = concat_dfs([drop_df, row_to_drop_df], concat_ignore_index=True)
+    outliers_keys = pd.MultiIndex.from_arrays([outliers_df[outliers_lastname_col],
+                                              outliers_df[outliers_initials_col]])
+    pub_keys = pd.MultiIndex.from_arrays([pub_df[pub_last_col],
+                                         pub_df[pub_initials_col]])
+    drop_mask = pub_keys.isin(outliers_keys)
 
     # Removing the rows to drop from the dataframe to update
-    new_pub_df = concat_dfs([pub_df, drop_df], keep=False)
+    new_pub_df = concat_dfs([pub_df, pub_df[drop_mask]], keep=False)
 
     print("    External authors removed")
     return new_pub_df
@@ -477,7 +503,8 @@ def _read_useful_parsing_data(bibliometer_path, saved_results_path,
     # Getting the dict of deduplication results
     dedup_parsing_dict = get_final_dedup(bibliometer_path,
                                          saved_results_path,
-                                         corpus_year)
+                                         corpus_year,
+                                         columns_dict=dict.fromkeys(items_list))
 
     # Getting ID of each publication with complementary info
     articles_df = dedup_parsing_dict[articles_item]
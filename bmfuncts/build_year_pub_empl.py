@@ -3,7 +3,12 @@ of the Institute for a year corpus.
 
 """
 
-__all__ = ['build_submit_df']
+__all__ = ['build_empl_index',
+           'build_fuzzy_orphan_df',
+           'build_submit_df',
+           'build_trigram_index',
+           'build_years_submit_df',
+          ]
 
 # Standard Library imports
 import os
@@ -11,6 +16,7 @@ from pathlib import Path
 
 # 3rd party imports
 import BiblioParsing as bp
+import numpy as np
 import pandas as pd
 
 # Local imports
@@ -166,174 +172,604 @@ def _reduce_orphan_df(orphan_lastname, eff_lastname):
     return lastname_match_list
 
 
-def build_submit_df(empl_df, pub_df, bibliometer_path, test_case="No test", test_name="No name"):
+def build_empl_index(empl_df):
+    """Builds the indexes of the employees data of a given year used 
+    for matching the authors of the publications list with the employees.
+
+    The indexes are built once for the year and are the following:
+
+    - the last-name index as a dict keyed by the employees last names \
+    and valued by the positions of the corresponding rows in 'empl_df';
+    - the list of the employees last names (without duplicates) padded by \
+    spaces as used by the `_reduce_orphan_df` internal function;
+    - the token index as a dict keyed by the words of the employees \
+    last names and valued by the set of positions in the padded \
+    last-names list of the last names containing the word.
+
+    Args:
+        empl_df (dataframe): Employees database of a given year.
+    Returns:
+        (tup): (last-name index (dict), padded last-names list (list), \
+        token index (dict)).
+    """
+    # Setting useful aliases
+    empl_name_alias = eg.EMPLOYEES_USEFUL_COLS['name']
+
+    # Building the last-name index of the employees rows positions
+    lastname_dict = empl_df.groupby(empl_name_alias, sort=False).indices
+
+    # Building the set of lastnames (without duplicates) of the dataframe 'empl_df'
+    eff_lastnames = set(empl_df[empl_name_alias].to_list())
+    eff_lastnames = [' ' + x + ' ' for x in eff_lastnames]
+
+    # Building the token index of the padded lastnames
+    tokens_dict = {}
+    for name_pos, eff_name in enumerate(eff_lastnames):
+        for token in set(eff_name[1:-1].split(' ')):
+            tokens_dict.setdefault(token, set()).add(name_pos)
+    return lastname_dict, eff_lastnames, tokens_dict
+
+
+def _get_lastname_matches(pub_lastname, empl_index):
+    """Finds the positions of the employees rows that match 
+    with the author's last name.
+
+    The full match is searched through the last-name index. When no full match 
+    is found, the similarities are searched through the `_reduce_orphan_df` 
+    internal function applied only to the candidate last names sharing 
+    at least one word with the author's last name using the token index.
+
+    Args:
+        pub_lastname (str): The author last-name.
+        empl_index (tup): The indexes of the employees data of a given year \
+        as built by the `build_empl_index` function.
+    Returns:
+        (tup): (list of the positions (int) of the matching rows in the employees \
+        data, list of the employees last-names (str) found by similarity \
+        that is empty in case of full match).
+    """
+    lastname_dict, eff_lastnames, tokens_dict = empl_index
+
+    if pub_lastname in lastname_dict:
+        return list(lastname_dict[pub_lastname]), []
+
+    # Selecting candidate lastnames sharing a word with the author lastname
+    candidates_pos = set()
+    for token in set(pub_lastname.split(' ')):
+        candidates_pos.update(tokens_dict.get(token, ()))
+    candidates_list = [eff_lastnames[name_pos] for name_pos in sorted(candidates_pos)]
+
+    # Checking for a similarity among the candidates
+    lastname_match_list = _reduce_orphan_df(pub_lastname, candidates_list)
+    match_pos_list = []
+    for lastname_match in lastname_match_list:
+        match_pos_list += list(lastname_dict.get(lastname_match, []))
+    return match_pos_list, lastname_match_list
+
+
+def _test_lastname_matches(pub_df, empl_df, empl_match_df, test_tup):
+    """Prints and saves the info of the tests of the matching results 
+    for the author's last name defined by 'test_name'.
+
+    Args:
+        pub_df (dataframe): Institute publications list with one row per author.
+        empl_df (dataframe): Employees database of a given year.
+        empl_match_df (dataframe): The rows of the employees database matching \
+        each of the authors last-names with the last name set in 'match_key_col' column.
+        test_tup (tup): (The test states (list), The full path for saving \
+        the testing data (path), The author's last-name for the test (str), \
+        The name of the column of the matched last names (str), The indexes \
+        of the employees data as built by the `build_empl_index` function (tup)).
+    """
+    test_states, checks_path, test_name, match_key_col, empl_index = test_tup
+    lastname_dict = empl_index[0]
+
+    test_pub_df = pub_df[pub_df[pg.COL_NAMES_BM['Last_name']]==test_name]
+    for _, pub_df_row in test_pub_df.iterrows():
+        flag_lastname_match = True
+        empl_pub_match_df = empl_df.iloc[list(lastname_dict.get(test_name, []))].copy()
+        if test_states[0]:
+            _test_full_match(empl_pub_match_df, test_name)
+
+        if len(empl_pub_match_df)==0:
+            _, lastname_match_list = _get_lastname_matches(test_name, empl_index)
+            if lastname_match_list:
+                empl_pub_match_df = empl_match_df[empl_match_df[match_key_col]==test_name]
+                empl_pub_match_df = empl_pub_match_df.drop(columns=[match_key_col])
+                if test_states[1]:
+                    _test_similarity(empl_pub_match_df, test_name,
+                                     lastname_match_list, flag_lastname_match)
+            else:
+                flag_lastname_match = False
+                if test_states[2]:
+                    _test_no_similarity(pub_df_row, test_name, lastname_match_list,
+                                        flag_lastname_match)
+
+        if flag_lastname_match:
+            pub_firstname = pub_df_row[pg.COL_NAMES_BM['First_name']]
+            eff_firstnames = empl_pub_match_df[pg.COL_NAMES_BM['First_name']].to_list()
+            eff_lastnames_spec = empl_pub_match_df[eg.EMPLOYEES_USEFUL_COLS['name']].to_list()
+            list_idx = [idx for idx, eff_firstname in enumerate(eff_firstnames)
+                        if pub_firstname==eff_firstname]
+            if test_states[3]:
+                _test_match_of_firstname_initials(pub_df_row, test_name, pub_firstname,
+                                                  eff_firstnames, list_idx, eff_lastnames_spec)
+            if list_idx and test_states[4]:
+                temp_df = pub_df_row.to_frame().T
+                temp_df[pg.COL_NAMES_BM['Homonym']]=\
+                    pg.HOMONYM_FLAG if len(list_idx) > 1 else '_'
+                _save_spec_dfs(temp_df, empl_pub_match_df, test_name, checks_path)
+
+
+def _build_empl_match_df(empl_df, pub_lastnames, empl_index, match_key_col):
+    """Builds the dataframe of the rows of the employees data of a given year 
+    matching the authors last names.
+
+    The positions of the employees rows matching each distinct author last name \
+    are got through the `_get_lastname_matches` internal function; for matches \
+    by similarity, the employee full name is built with the author last name.
+
+    Args:
+        empl_df (dataframe): Employees database of a given year.
+        pub_lastnames (array): The distinct authors last names (str).
+        empl_index (tup): The indexes of 'empl_df' as built by \
+        the `build_empl_index` function.
+        match_key_col (str): The name of the column of the matched last names.
+    Returns:
+        (dataframe): The matching rows of 'empl_df' keyed by the author last name \
+        in 'match_key_col' column.
+    """
+    # Setting useful aliases
+    empl_full_name_alias = eg.EMPLOYEES_ADD_COLS['employee_full_name']
+    first_name_alias = pg.COL_NAMES_BM['First_name']
+
+    # Building the positions of the 'empl_df' rows matching each author lastname
+    match_lastnames_list = []
+    match_pos_list = []
+    similarity_list = []
+    for pub_lastname in pub_lastnames:
+        lastname_pos_list, lastname_match_list = _get_lastname_matches(pub_lastname,
+                                                                       empl_index)
+        match_lastnames_list += [pub_lastname] * len(lastname_pos_list)
+        match_pos_list += lastname_pos_list
+        similarity_list += [bool(lastname_match_list)] * len(lastname_pos_list)
+
+    # Building the dataframe 'empl_match_df' with the matching rows of 'empl_df'
+    # keyed by the author lastname in column 'match_key_col'
+    empl_match_df = empl_df.iloc[match_pos_list].reset_index(drop=True)
+    empl_match_df[match_key_col] = match_lastnames_list
+    similarity_mask = np.array(similarity_list, dtype=bool)
+
+    # Replacing the employee last name by the publication last name
+    # for matches found by similarity and dropping duplicates among them
+    similar_df = empl_match_df[similarity_mask].copy()
+    similar_df[empl_full_name_alias] = (similar_df[match_key_col] + ' '
+                                        + similar_df[first_name_alias])
+    empl_match_df = concat_dfs([empl_match_df[~similarity_mask],
+                                similar_df.drop_duplicates()], dedup=False)
+    return empl_match_df
+
+
+def build_years_submit_df(empl_dict, years, pub_df, bibliometer_path,
+                          test_case="No test", test_name="No name",
+                          empl_index_dict=None):
     """Builds a dataframe of the merged employees information with the publications 
-    list with one row per author.
+    list with one row per author searching the authors among the employees 
+    of several years in a single pass.
+
+    The employees of each author are searched first in the most recent year \
+    of 'years' list, then in the next years for the authors not yet found, \
+    as given by successive calls of the `build_submit_df` function. \
+    This is done through the following steps:
+
+    1. The rows of the employees data of each year matching the authors last names \
+    are got through the `_build_empl_match_df` internal function and stacked \
+    in a single dataframe with the rank of the year in 'years' list.
+    2. For each author, the most recent year with at least one employee sharing \
+    both last name and first-name initials is selected through a single count \
+    of the matches by year rank; the authors with no such employee whatever \
+    the year are set as orphans.
+    3. The other authors are merged with the matching employees rows \
+    of the selected year in a single join on last name, full name and year rank.
 
-    The merge is based on test of similarities between last names and first names 
-    of employees and authors. 
     The 'test_case' arg allows to print and save the results of the similarity 
     test for a given author name defined by the 'test_name' arg. The test parameters  
-    are set through the `_set_match_test_info` internal function. The values of the test 
-    parameters are printed through the `_test_full_match`, `_test_similarity` and 
-    `_test_no_similarity` internal functions. The results are saved through the 
-    `_save_spec_dfs` internal function.
+    are set through the `_set_match_test_info` internal function. The tests are 
+    run for each year through the `_test_lastname_matches` internal function.
     Found homonyms are tagged by 'HOMONYM_FLAG' global imported from globals 
     module imported as pg.
 
     Args:
-        empl_df (dataframe): Employees database of a given year.
+        empl_dict (dict): The employees database as a dict keyed by the years \
+        and valued by the employees data for each year.
+        years (list): The years of search in 'empl_dict' ordered by priority.
         pub_df (dataframe): Institute publications list with one row per author. 
         bibliometer_path (path): Full path to working folder.
         test_case (str): Optional test case for testing the function (default = "No test").
         test_name (str): Optional author's last-name for testing the function \
         (default = "No name").
+        empl_index_dict (dict): Optional indexes of the employees data \
+        as built by the `build_empl_index` function keyed by the years \
+        (default = None, the indexes are then built from 'empl_dict').
     Returns:
         (tup): (dataframe of merged employees information with \
         the publications list with one row per Institute author with \
-        identified homonyms, dataframe of publications list with \
-        one row per author that has not been identified as Institute employee).
+        identified homonyms ordered by year rank, dataframe of publications list with \
+        one row per author that has not been identified as Institute employee, \
+        year ranks (numpy array) of the rows of the first dataframe).
     Note:
         Care is taken to keep 'NA' value for the first name initiales \
         (that are set to NaN otherwise) through the `keep_initials` function \
         imported from `bmfuncts.useful_functs` module.
     """
-    # Replace in "pub_df" NaN values "NA" in first name initials
-    pub_df = keep_initials(pub_df, pg.COL_NAMES_BM['First_name'])
+    # Setting useful aliases
+    empl_full_name_alias = eg.EMPLOYEES_ADD_COLS['employee_full_name']
+    pub_last_name_alias = pg.COL_NAMES_BM['Last_name']
+    pub_full_name_alias = pg.COL_NAMES_BM['Full_name']
+    first_name_alias = pg.COL_NAMES_BM['First_name']
+    homonym_alias = pg.COL_NAMES_BM['Homonym']
+    match_key_alias = "Match_key"
+    year_rank_alias = "Year_rank"
 
-    # Initializing a Data frame that will contain all matches
-    # between 'pub_df' author-name and 'empl_df' emmployee-name
-    submit_df = pd.DataFrame()
-
-    # Initializing a Data frame that will contain all 'pub_df' author-names
-    # which do not match with any of the 'empl_df' emmployee-names
-    orphan_df = pd.DataFrame(columns=list(pub_df.columns))
-
-    # Building the set of lastnames (without duplicates) of the dataframe 'empl_df'
-    eff_lastnames = set(empl_df[eg.EMPLOYEES_USEFUL_COLS['name']].to_list())
-    eff_lastnames = [' ' + x + ' ' for x in eff_lastnames]
+    # Replace in "pub_df" NaN values "NA" in first name initials
+    pub_df = keep_initials(pub_df, first_name_alias)
 
     # Setting the useful info for testing the function
-    # Setting a dict keyed by type of test with values for test states and
-    # test name from column [COL_NAMES_BM['Last_name']] of the dataframe 'pub_df'
     test_states, checks_path = _set_match_test_info(bibliometer_path, test_case)
 
-    # Building submit_df and orphan_df dataframes
-    for _, pub_df_row in pub_df.iterrows():
-
-        # Building a dataframe 'empl_pub_match_df' with rows of 'empl_df'
-        # where name in column COL_NAMES_BM['Last_name'] of the dataframe 'pub_df'
-        # matches with name in column EMPLOYEES_USEFUL_COLS['name'] of the dataframe 'empl_df'
-
-        # Initializing the flag 'flag_lastname_match' as True by default
-        flag_lastname_match = True
-
-        # Getting the lastname from pub_df_row row of the dataframe pub_df
-        pub_lastname = pub_df_row[pg.COL_NAMES_BM['Last_name']]
+    # Stacking the matching rows of the employees data of all the years
+    # with the year rank in column 'year_rank_alias'
+    pub_lastnames = pub_df[pub_last_name_alias].unique()
+    empl_index_list = []
+    empl_match_dfs_list = []
+    for year_rank, year in enumerate(years):
+        empl_index = None
+        if empl_index_dict is not None:
+            empl_index = empl_index_dict.get(year)
+        if empl_index is None:
+            empl_index = build_empl_index(empl_dict[year])
+        year_match_df = _build_empl_match_df(empl_dict[year], pub_lastnames,
+                                             empl_index, match_key_alias)
+        year_match_df[year_rank_alias] = year_rank
+        empl_index_list.append(empl_index)
+        empl_match_dfs_list.append(year_match_df)
+    empl_match_df = concat_dfs(empl_match_dfs_list, dedup=False,
+                               concat_ignore_index=True)
+
+    # Counting the matches on firstname initials for each author
+    # at the most recent year with matches which is the first one in 'empl_match_df'
+    counts_df = empl_match_df.groupby([match_key_alias, first_name_alias, year_rank_alias],
+                                      sort=False).size().reset_index(name="Count")
+    counts_df = counts_df.drop_duplicates(subset=[match_key_alias, first_name_alias])
+    counts_dict = dict(zip(zip(counts_df[match_key_alias], counts_df[first_name_alias]),
+                           zip(counts_df[year_rank_alias], counts_df["Count"])))
+    pub_keys_zip = zip(pub_df[pub_last_name_alias], pub_df[first_name_alias])
+    author_ranks, firstname_counts = np.array([counts_dict.get(key, (-1, 0)) for key
+                                               in pub_keys_zip], dtype=int).reshape(-1, 2).T
+
+    # Building the dataframe of effective orphans
+    orphan_df = pub_df[firstname_counts==0]
+
+    # Merging the matching employees to the authors with at least one match
+    # on firstname initials by matching author lastname, full name and year rank
+    # and adding the item value HOMONYM_FLAG at column COL_NAMES_BM['Homonym']
+    # when several matches on firstname initials are found
+    submit_pub_df = pub_df[firstname_counts>0].copy()
+    if submit_pub_df.empty:
+        submit_df = pd.DataFrame()
+        submit_ranks = np.zeros(0, dtype=int)
+    else:
+        submit_pub_df[homonym_alias] = [pg.HOMONYM_FLAG if count>1 else '_'
+                                        for count in firstname_counts[firstname_counts>0]]
+        submit_pub_df[year_rank_alias] = author_ranks[firstname_counts>0]
+        submit_pub_df = submit_pub_df.sort_values(by=[year_rank_alias], kind='stable')
+        submit_df = pd.merge(submit_pub_df,
+                             empl_match_df,
+                             how='left',
+                             left_on=[pub_last_name_alias, pub_full_name_alias, year_rank_alias],
+                             right_on=[match_key_alias, empl_full_name_alias, year_rank_alias])
+        submit_df = submit_df.drop(columns=[match_key_alias])
+        submit_df = submit_df.drop_duplicates()
+        submit_ranks = submit_df.pop(year_rank_alias).to_numpy(dtype=int)
+
+    # Running the tests of the function for each year
+    # on the authors not found in the previous years
+    if any(test_states) and test_name in set(pub_df[pub_last_name_alias]):
+        for year_rank, year in enumerate(years):
+            year_pub_df = pub_df[(firstname_counts==0) | (author_ranks>=year_rank)]
+            if test_name in set(year_pub_df[pub_last_name_alias]):
+                year_match_df = empl_match_df[empl_match_df[year_rank_alias]==year_rank]
+                year_match_df = year_match_df.drop(columns=[year_rank_alias])
+                test_tup = (test_states, checks_path, test_name, match_key_alias,
+                            empl_index_list[year_rank])
+                _test_lastname_matches(year_pub_df, empl_dict[year], year_match_df, test_tup)
+
+    # Dropping duplicate rows in orphans dataframe (mandatory)
+    orphan_df = orphan_df.drop_duplicates()
 
-        # Building the dataframe 'empl_pub_match_df' with rows of dataframe empl_df
-        # where item at EMPLOYEES_USEFUL_COLS['name'] matches author lastname 'pub_lastname'
-        empl_pub_match_df = empl_df[empl_df[eg.EMPLOYEES_USEFUL_COLS['name']]==pub_lastname].copy()
+    return submit_df, orphan_df, submit_ranks
 
-        # Test of lastname full match
-        if pub_lastname==test_name and test_states[0]:
-            _test_full_match(empl_pub_match_df, pub_lastname)
 
-        if len(empl_pub_match_df)==0: # No match found
-            flag_lastname_match = False
-            # Checking for a similarity
-            lastname_match_list = _reduce_orphan_df(pub_lastname, eff_lastnames)
+def build_submit_df(empl_df, pub_df, bibliometer_path, test_case="No test",
+                    test_name="No name", empl_index=None):
+    """Builds a dataframe of the merged employees information with the publications 
+    list with one row per author.
 
-            if lastname_match_list:
-                # Concatenating in the dataframe 'empl_pub_match_df',
-                # the rows of the dataframe 'empl_df'
-                # corresponding to each of the found similarities by orphan reduction
-                frames = []
-                for lastname_match in lastname_match_list:
-                    temp_df = empl_df[empl_df[eg.EMPLOYEES_USEFUL_COLS['name']]\
-                                      ==lastname_match].copy()
-                    # Replacing the employee last name by the publication last name
-                    # for 'pub_emp_join_df' building
-                    temp_df[eg.EMPLOYEES_ADD_COLS['employee_full_name']]=\
-                        pub_lastname + ' ' + temp_df[pg.COL_NAMES_BM['First_name']]
-                    frames.append(temp_df)
-
-                empl_pub_match_df = concat_dfs(frames, concat_ignore_index=True)
-                flag_lastname_match = True
-
-                # Test of lastnames similarity found by '_reduce_orphan_df' function
-                if pub_lastname==test_name and test_states[1]:
-                    _test_similarity(empl_pub_match_df, pub_lastname,
-                                     lastname_match_list, flag_lastname_match)
+    The merge is based on test of similarities between last names and first names 
+    of employees and authors. This is done through the `build_years_submit_df` 
+    function applied to the employees data of a single year.
 
-            else:
-                # Appending to dataframe orphan_df the row 'pub_df_row'
-                # as effective orphan after orphan reduction
-                orphan_df = concat_dfs([orphan_df, pub_df_row.to_frame().T])
-                flag_lastname_match = False
+    Args:
+        empl_df (dataframe): Employees database of a given year.
+        pub_df (dataframe): Institute publications list with one row per author. 
+        bibliometer_path (path): Full path to working folder.
+        test_case (str): Optional test case for testing the function (default = "No test").
+        test_name (str): Optional author's last-name for testing the function \
+        (default = "No name").
+        empl_index (tup): Optional indexes of 'empl_df' as built by \
+        the `build_empl_index` function (default = None, the indexes \
+        are then built from 'empl_df').
+    Returns:
+        (tup): (dataframe of merged employees information with \
+        the publications list with one row per Institute author with \
+        identified homonyms, dataframe of publications list with \
+        one row per author that has not been identified as Institute employee).
+    """
+    empl_index_dict = None
+    if empl_index is not None:
+        empl_index_dict = {0: empl_index}
+    submit_df, orphan_df, _ = build_years_submit_df({0: empl_df}, [0], pub_df,
+                                                    bibliometer_path,
+                                                    test_case=test_case,
+                                                    test_name=test_name,
+                                                    empl_index_dict=empl_index_dict)
+    return submit_df, orphan_df
 
-                # Test of lastnames no-similarity by '_reduce_orphan_df' function
-                if pub_lastname==test_name and test_states[2]:
-                    _test_no_similarity(pub_df_row, pub_lastname, lastname_match_list,
-                                        flag_lastname_match)
 
-        # Checking match for a given lastname between the publication first-name
-        # and the employee first-name
-        if flag_lastname_match:
+def _set_name_trigrams(name):
+    """Sets the set of the character trigrams of a last name padded by spaces.
 
-            # Finding the author name initials for the current publication
-            pub_firstname = pub_df_row[pg.COL_NAMES_BM['First_name']]
+    Args:
+        name (str): The last name.
+    Returns:
+        (set): The trigrams (str) of the padded last name.
+    """
+    padded_name = '  ' + name + ' '
+    return {padded_name[idx:idx + 3] for idx in range(len(padded_name) - 2)}
 
-            # List of firstnames initials of a given name in the employees data
-            eff_firstnames = empl_pub_match_df[pg.COL_NAMES_BM['First_name']].to_list()
-            eff_lastnames_spec = empl_pub_match_df[eg.EMPLOYEES_USEFUL_COLS['name']].to_list()
 
-            # Building the list of index of first names initials
-            list_idx = []
-            for idx, eff_firstname in enumerate(eff_firstnames):
+def build_trigram_index(empl_df):
+    """Builds the character-trigram inverted index of the employees last names 
+    of a given year used for the search of near-miss matches of the orphan authors.
 
-                if pub_firstname==eff_firstname:
-                    list_idx.append(idx)
+    The index is built once for the year and is composed of:
 
-            # Test of match of firstname initials for lastname match or similarity
-            if pub_lastname==test_name and test_states[3]:
-                _test_match_of_firstname_initials(pub_df_row, pub_lastname, pub_firstname,
-                                                  eff_firstnames, list_idx, eff_lastnames_spec)
+    - the sorted list of the employees last names without duplicates;
+    - the inverted index as a dict keyed by the trigrams of the last names, \
+    set through the `_set_name_trigrams` internal function, and valued \
+    by the array of the positions in the last-names list of the last names \
+    containing the trigram;
+    - the array of the numbers of trigrams of the last names;
+    - the array of the lengths of the last names.
 
-            if list_idx:
-                # Building a dataframe 'temp_df' with the row 'pub_df_row'
-                # related to a given publication
-                # and adding the item value HOMONYM_FLAG
-                # at column COL_NAMES_BM['Homonym']
-                # when several matches on firstname initials are found
-                temp_df = pub_df_row.to_frame().T
-                temp_df[pg.COL_NAMES_BM['Homonym']]=\
-                    pg.HOMONYM_FLAG if len(list_idx) > 1 else '_'
+    Args:
+        empl_df (dataframe): Employees database of a given year.
+    Returns:
+        (tup): (last-names list (list), trigrams index (dict), \
+        trigrams numbers (numpy array), last-names lengths (numpy array)).
+    """
+    # Setting useful aliases
+    empl_name_alias = eg.EMPLOYEES_USEFUL_COLS['name']
+
+    eff_lastnames = sorted(set(empl_df[empl_name_alias].to_list()))
+    trigrams_dict = {}
+    trigrams_nbs_list = []
+    for name_pos, eff_name in enumerate(eff_lastnames):
+        name_trigrams = _set_name_trigrams(eff_name)
+        trigrams_nbs_list.append(len(name_trigrams))
+        for trigram in name_trigrams:
+            trigrams_dict.setdefault(trigram, []).append(name_pos)
+    trigrams_dict = {trigram: np.array(names_pos_list, dtype=int)
+                     for trigram, names_pos_list in trigrams_dict.items()}
+    lengths_array = np.array([len(eff_name) for eff_name in eff_lastnames], dtype=int)
+    return (eff_lastnames, trigrams_dict,
+            np.array(trigrams_nbs_list, dtype=int), lengths_array)
+
+
+def _bounded_edit_distance(text_a, text_b, max_dist):
+    """Computes the edit distance between two texts bounded by 'max_dist'.
+
+    Only the cells of the distance matrix in the diagonal band of width \
+    'max_dist' are computed and the computation is stopped as soon as \
+    the distance exceeds 'max_dist'.
 
-                # Saving specific dataframes 'temp_df' and 'empl_pub_match_df' for function testing
-                if pub_lastname==test_name and test_states[4]:
-                    _save_spec_dfs(temp_df, empl_pub_match_df, test_name, checks_path)
-
-                # Merging the dataframe 'empl_pub_match_df' to the dataframe 'temp_df'
-                # by matching column '[COL_NAMES_BM['Last_name']]' of the dataframe 'temp_df'
-                # to the column 'EMPLOYEES_ADD_COLS['employee_full_name']'
-                # of the dataframe 'empl_pub_match_df'
-                pub_emp_join_df = pd.merge(temp_df,
-                                           empl_pub_match_df,
-                                           how='left',
-                                           left_on=[pg.COL_NAMES_BM['Full_name']],
-                                           right_on=[eg.EMPLOYEES_ADD_COLS['employee_full_name']])
-
-                # Appending to the dataframe 'submit_df' the dataframe 'pub_emp_join_df'
-                # which is specific to a given publication
-                submit_df = concat_dfs([submit_df, pub_emp_join_df], concat_ignore_index=True)
-            else:
-                # Appending to the dataframe orphan_df the row 'pub_df_row' as effective orphan
-                # after complementary checking of match via first name initials
-                orphan_df = concat_dfs([orphan_df, pub_df_row.to_frame().T], concat_ignore_index=True)
+    Args:
+        text_a (str): The first text.
+        text_b (str): The second text.
+        max_dist (int): The maximum edit distance of interest.
+    Returns:
+        (int): The edit distance if not greater than 'max_dist', \
+        'max_dist' + 1 otherwise.
+    """
+    len_b = len(text_b)
+    if abs(len(text_a) - len_b)>max_dist:
+        return max_dist + 1
+    out_dist = max_dist + 1
+    prev_row = [idx_b if idx_b<=max_dist else out_dist for idx_b in range(len_b + 1)]
+    for idx_a, char_a in enumerate(text_a, start=1):
+        row = [out_dist] * (len_b + 1)
+        if idx_a<=max_dist:
+            row[0] = idx_a
+        row_min = row[0]
+        for idx_b in range(max(1, idx_a - max_dist), min(len_b, idx_a + max_dist) + 1):
+            cell = prev_row[idx_b - 1] + (char_a!=text_b[idx_b - 1])
+            if prev_row[idx_b]<cell:
+                cell = prev_row[idx_b] + 1
+            if row[idx_b - 1]<cell:
+                cell = row[idx_b - 1] + 1
+            cell = min(cell, out_dist)
+            row[idx_b] = cell
+            row_min = min(row_min, cell)
+        if row_min>max_dist:
+            return out_dist
+        prev_row = row
+    return prev_row[-1]
+
+
+def _get_trigram_candidates(pub_lastname, trigram_index, max_dist, distances_dict):
+    """Finds the employees last names at a bounded edit distance 
+    from the author's last name using the trigrams index.
+
+    Only the last names sharing trigrams with the author's last name are counted \
+    through the postings of its trigrams. As an edit destroys at most 3 trigrams, \
+    the candidates sharing less than the number of trigrams of the longest name \
+    minus 3 times 'max_dist', or sharing no trigram, are discarded together with \
+    those which length differs by more than 'max_dist' before computing \
+    the edit distance through the `_bounded_edit_distance` internal function.
 
-    # Dropping duplicate rows in both dataframes (mandatory)
-    submit_df = submit_df.drop_duplicates()
-    orphan_df = orphan_df.drop_duplicates()
+    Args:
+        pub_lastname (str): The author last-name.
+        trigram_index (tup): The trigrams index of the employees last names \
+        as built by the `build_trigram_index` function.
+        max_dist (int): The maximum edit distance.
+        distances_dict (dict): The edit distances (int) already computed \
+        keyed by the tuples (author last name, employee last name), \
+        that is updated with the new ones.
+    Returns:
+        (list): The tuples (employee last name (str), edit distance (int), \
+        trigrams similarity (float)) of the candidates at a distance \
+        from 1 to 'max_dist'.
+    """
+    eff_lastnames, trigrams_dict, trigrams_nbs, lengths_array = trigram_index
+
+    pub_trigrams = _set_name_trigrams(pub_lastname)
+    postings_list = [trigrams_dict[trigram] for trigram in pub_trigrams
+                     if trigram in trigrams_dict]
+    if not postings_list:
+        return []
+    names_pos, shared_nbs = np.unique(np.concatenate(postings_list), return_counts=True)
+    min_shared_nbs = np.maximum(trigrams_nbs[names_pos], len(pub_trigrams)) - 3 * max_dist
+    candidates_mask = (shared_nbs>=np.maximum(min_shared_nbs, 1)) & \
+                      (np.abs(lengths_array[names_pos] - len(pub_lastname))<=max_dist)
+
+    candidates_list = []
+    for name_pos, shared_nb in zip(names_pos[candidates_mask], shared_nbs[candidates_mask]):
+        eff_lastname = eff_lastnames[name_pos]
+        names_tup = (pub_lastname, eff_lastname)
+        if names_tup not in distances_dict:
+            distances_dict[names_tup] = _bounded_edit_distance(pub_lastname, eff_lastname,
+                                                               max_dist)
+        edit_dist = distances_dict[names_tup]
+        if 0<edit_dist<=max_dist:
+            similarity = 2 * shared_nb / (len(pub_trigrams) + trigrams_nbs[name_pos])
+            candidates_list.append((eff_lastname, edit_dist, round(similarity, 2)))
+    return candidates_list
+
+
+def build_fuzzy_orphan_df(empl_dict, years, orphan_df, max_dist=2, min_length=4,
+                          trigram_index_dict=None):
+    """Builds the proposals of near-miss matches of the orphan authors 
+    with the employees for review.
+
+    For each distinct last name of the orphan authors of at least 'min_length' \
+    characters, the employees last names at an edit distance from 1 \
+    to 'max_dist' are searched for each year of 'years' list through \
+    the `_get_trigram_candidates` internal function using the trigrams index \
+    of the employees last names of the year built through \
+    the `build_trigram_index` function. The employees with such a last name \
+    and the same first-name initials as the orphan author are proposed, \
+    keeping for each employee the most recent year.
+
+    The proposals are set with the columns of the orthography file so that \
+    the accepted proposals can be copied in this file.
 
-    return submit_df, orphan_df
+    Args:
+        empl_dict (dict): The employees database as a dict keyed by the years \
+        and valued by the employees data for each year.
+        years (list): The years of search in 'empl_dict' ordered by priority.
+        orphan_df (dataframe): Publications list with one row per author \
+        that has not been identified as Institute employee.
+        max_dist (int): Optional maximum edit distance between last names \
+        (default = 2).
+        min_length (int): Optional minimum length of the orphan last names \
+        searched (default = 4).
+        trigram_index_dict (dict): Optional trigrams indexes of the employees \
+        data as built by the `build_trigram_index` function keyed by the years \
+        (default = None, the indexes are then built from 'empl_dict').
+    Returns:
+        (dataframe): The proposals with one row per couple of orphan author \
+        and employee ordered by edit distance and decreasing similarity.
+    """
+    # Setting useful aliases
+    pub_last_name_alias = pg.COL_NAMES_BM['Last_name']
+    first_name_alias = pg.COL_NAMES_BM['First_name']
+    empl_name_alias = eg.EMPLOYEES_USEFUL_COLS['name']
+    empl_mat_alias = eg.EMPLOYEES_USEFUL_COLS['matricule']
+    lastname_init_alias = pg.COL_NAMES_FUZZY['last name init']
+    initials_init_alias = pg.COL_NAMES_FUZZY['initials init']
+    lastname_new_alias = pg.COL_NAMES_FUZZY['last name new']
+    initials_new_alias = pg.COL_NAMES_FUZZY['initials new']
+    mat_alias = pg.COL_NAMES_FUZZY['matricule']
+    empl_year_alias = pg.COL_NAMES_FUZZY['employees year']
+    distance_alias = pg.COL_NAMES_FUZZY['distance']
+    similarity_alias = pg.COL_NAMES_FUZZY['similarity']
+    pub_nb_alias = pg.COL_NAMES_FUZZY['pub nb']
+    fuzzy_cols_list = list(pg.COL_NAMES_FUZZY.values())
+
+    if orphan_df.empty:
+        return pd.DataFrame(columns=fuzzy_cols_list)
+
+    # Setting the distinct orphan authors with their number of rows
+    orphan_keys_df = orphan_df.groupby([pub_last_name_alias, first_name_alias], sort=False).\
+                     size().reset_index(name=pub_nb_alias)
+    orphan_keys_df = orphan_keys_df.rename(columns={pub_last_name_alias: lastname_init_alias,
+                                                    first_name_alias: initials_init_alias})
+    orphan_lastnames = [name for name in orphan_keys_df[lastname_init_alias].unique()
+                        if isinstance(name, str) and len(name)>=min_length]
+
+    # Searching the candidate employees last names for each year
+    # computing once the edit distance of each couple of last names
+    distances_dict = {}
+    proposals_dfs_list = []
+    for year in years:
+        trigram_index = None
+        if trigram_index_dict is not None:
+            trigram_index = trigram_index_dict.get(year)
+        if trigram_index is None:
+            trigram_index = build_trigram_index(empl_dict[year])
+        candidates_list = [(pub_lastname, ) + candidate_tup
+                           for pub_lastname in orphan_lastnames
+                           for candidate_tup in _get_trigram_candidates(pub_lastname,
+                                                                        trigram_index,
+                                                                        max_dist,
+                                                                        distances_dict)]
+        if not candidates_list:
+            continue
+        candidates_df = pd.DataFrame(candidates_list,
+                                     columns=[lastname_init_alias, lastname_new_alias,
+                                              distance_alias, similarity_alias])
+
+        # Selecting the employees with the candidate last names and same initials
+        year_empl_df = empl_dict[year][[empl_name_alias, first_name_alias, empl_mat_alias]]
+        year_empl_df = year_empl_df.rename(columns={empl_name_alias: lastname_new_alias,
+                                                    first_name_alias: initials_new_alias,
+                                                    empl_mat_alias: mat_alias})
+        year_proposals_df = orphan_keys_df.merge(candidates_df, how='inner',
+                                                 on=lastname_init_alias)
+        year_proposals_df = year_proposals_df.merge(year_empl_df, how='inner',
+                                                    left_on=[lastname_new_alias,
+                                                             initials_init_alias],
+                                                    right_on=[lastname_new_alias,
+                                                              initials_new_alias])
+        year_proposals_df[empl_year_alias] = year
+        proposals_dfs_list.append(year_proposals_df)
+
+    if not proposals_dfs_list:
+        return pd.DataFrame(columns=fuzzy_cols_list)
+    proposals_df = concat_dfs(proposals_dfs_list, dedup=False, concat_ignore_index=True)
+    proposals_df = proposals_df.drop_duplicates(subset=[lastname_init_alias, initials_init_alias,
+                                                        lastname_new_alias, initials_new_alias,
+                                                        mat_alias])
+    proposals_df = proposals_df.sort_values(by=[distance_alias, similarity_alias],
+                                            ascending=[True, False], kind='stable')
+    return proposals_df[fuzzy_cols_list].reset_index(drop=True)
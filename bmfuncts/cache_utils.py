@@ -0,0 +1,190 @@
+"""Module of functions for skipping the work on unchanged files 
+used by several modules of package `bmfuncts`.
+
+The content hashes of the input files are saved in json manifests. 
+The files of the parsing items are read through binary cache files 
+saved alongside them, the cache file type being given by 
+the 'PARSING_CACHE_EXTENT' global imported from the `bmfuncts.pub_globals` module. 
+As the cached data are the data read from the item file, reading the cache 
+gives the same data with the same dtypes.
+
+"""
+
+__all__ = ['get_file_hash',
+           'read_cached_item',
+           'read_manifest',
+           'save_item_cache',
+           'set_item_path',
+           'write_manifest',
+          ]
+
+
+# Standard library imports
+import hashlib
+import json
+from pathlib import Path
+
+# 3rd party imports
+import pandas as pd
+
+# local imports
+import bmfuncts.pub_globals as pg
+
+
+def get_file_hash(file_path):
+    """Computes the SHA-256 hash of the content of a file 
+    read by blocks.
+
+    Args:
+        file_path (path): Full path to the file.
+    Returns:
+        (str): The hexadecimal hash of the file content \
+        or None if the file is not set or does not exist.
+    """
+    if not file_path or not Path(file_path).is_file():
+        return None
+    file_hash = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+def read_manifest(manifest_path):
+    """Reads a json manifest of the content hashes of input files.
+
+    Args:
+        manifest_path (path): Full path to the manifest file.
+    Returns:
+        (dict): The manifest or None if not available.
+    """
+    if not Path(manifest_path).is_file():
+        return None
+    try:
+        with open(manifest_path, 'r', encoding="utf-8") as file:
+            manifest_dict = json.load(file)
+    except (OSError, ValueError):
+        return None
+    return manifest_dict
+
+
+def write_manifest(manifest_path, manifest_dict):
+    """Writes a json manifest of the content hashes of input files.
+
+    Args:
+        manifest_path (path): Full path to the manifest file.
+        manifest_dict (dict): The manifest to be written.
+    """
+    with open(manifest_path, 'w', encoding="utf-8") as file:
+        json.dump(manifest_dict, file, indent=4)
+
+
+def set_item_path(item_filename_base, save_extent, parsing_path):
+    """Sets the full path to the file of a parsing item.
+
+    Args:
+        item_filename_base (str): The file name base of the item file.
+        save_extent (str): The extent of the item file without the dot separator.
+        parsing_path (path): Full path to the folder of the item file.
+    Returns:
+        (path): The full path to the item file.
+    """
+    item_file_name = item_filename_base + "." + save_extent
+    item_path = parsing_path / Path(item_file_name)
+    return item_path
+
+
+def _select_item_columns(item_df, columns):
+    """Selects the columns of the data of a parsing item.
+
+    Args:
+        item_df (dataframe): The data of the parsing item.
+        columns (list): The list of the columns to keep, \
+        None for keeping all the columns.
+    Returns:
+        (dataframe): The data of the parsing item restricted to the columns.
+    """
+    if columns is not None and not item_df.columns.empty:
+        item_df = item_df[columns].copy()
+    return item_df
+
+
+def _read_item_file(item_path, save_extent):
+    """Reads the data of a parsing item from its xlsx or tsv file.
+
+    Args:
+        item_path (path): Full path to the item file.
+        save_extent (str): The extent of the item file ("xlsx" or "dat").
+    Returns:
+        (dataframe): The data of the parsing item, empty if the file \
+        has no data.
+    """
+    try:
+        if save_extent=="xlsx":
+            item_df = pd.read_excel(item_path)
+        else:
+            item_df = pd.read_csv(item_path, sep="\t")
+    except pd.errors.EmptyDataError:
+        item_df = pd.DataFrame()
+    return item_df
+
+
+def save_item_cache(item_filename_base, save_extent, parsing_path):
+    """Saves the data of a parsing item as read from its file
+    in a binary cache file alongside it.
+
+    Args:
+        item_filename_base (str): The file name base of the item file.
+        save_extent (str): The extent of the item file ("xlsx" or "dat").
+        parsing_path (path): Full path to the folder of the item file.
+    Returns:
+        (dataframe): The data of the parsing item.
+    """
+    cache_extent = pg.PARSING_CACHE_EXTENT
+    item_path = set_item_path(item_filename_base, save_extent, parsing_path)
+    cache_path = set_item_path(item_filename_base, cache_extent, parsing_path)
+    item_df = _read_item_file(item_path, save_extent)
+    if cache_extent=="parquet":
+        item_df.to_parquet(cache_path, index=False)
+    elif cache_extent=="feather":
+        item_df.to_feather(cache_path)
+    else:
+        item_df.to_pickle(cache_path)
+    return item_df
+
+
+def read_cached_item(item_filename_base, save_extent, parsing_path, columns=None):
+    """Reads the data of a parsing item from its binary cache file
+    if it is not older than the item file, from the item file otherwise.
+
+    When the cache file is missing or older than the item file, \
+    it is rebuilt through the `save_item_cache` function with all the columns. \
+    Only the columns given by 'columns' arg are read from the parquet \
+    and feather cache files; they are selected after loading otherwise.
+
+    Args:
+        item_filename_base (str): The file name base of the item file.
+        save_extent (str): The extent of the item file ("xlsx" or "dat").
+        parsing_path (path): Full path to the folder of the item file.
+        columns (list): Optional list of the columns to read (default = None \
+        for all the columns).
+    Returns:
+        (dataframe): The data of the parsing item.
+    """
+    cache_extent = pg.PARSING_CACHE_EXTENT
+    item_path = set_item_path(item_filename_base, save_extent, parsing_path)
+    if not cache_extent:
+        item_df = _read_item_file(item_path, save_extent)
+        return _select_item_columns(item_df, columns)
+
+    cache_path = set_item_path(item_filename_base, cache_extent, parsing_path)
+    if cache_path.is_file() and cache_path.stat().st_mtime>=item_path.stat().st_mtime:
+        if cache_extent=="parquet":
+            item_df = pd.read_parquet(cache_path, columns=columns)
+        elif cache_extent=="feather":
+            item_df = pd.read_feather(cache_path, columns=columns)
+        else:
+            item_df = pd.read_pickle(cache_path)
+    else:
+        item_df = save_item_cache(item_filename_base, save_extent, parsing_path)
+    return _select_item_columns(item_df, columns)
@@ -1,13 +1,19 @@
 """The `config_utils.py` module gathers the useful functions 
 for setting the configuration parameters for the use of the BiblioMeter application.
 
+The configuration parameters are cached for the process keyed by the arguments 
+of the functions setting them and checked against the modification time 
+and size of the json file they are set from.
+
 """
-__all__ = ['set_org_params',
+__all__ = ['clear_config_cache',
+           'set_org_params',
            'set_user_config', ]
 
 
 # Standard library imports
 import json
+import os
 from pathlib import Path
 
 # Local imports
@@ -16,6 +22,67 @@ import bmfuncts.institute_globals as ig
 import bmfuncts.pub_globals as pg
 
 
+# Cache of the configuration parameters keyed by the arguments of the functions
+# setting them and valued by tuples (json file stamp, parameters)
+_CONFIG_CACHE = {}
+
+
+def clear_config_cache():
+    """Clears the cache of the configuration parameters so that they are 
+    set again from the json files at the next call of the functions 
+    `set_user_config` and `set_org_params`.
+    """
+    _CONFIG_CACHE.clear()
+
+
+def _copy_config(config_value):
+    """Copies the containers (dict, list and tuple) of configuration parameters 
+    down to their values that are immutable (str, numbers, booleans and paths).
+    """
+    if isinstance(config_value, dict):
+        return {key: _copy_config(value) for key, value in config_value.items()}
+    if isinstance(config_value, list):
+        return [_copy_config(value) for value in config_value]
+    if isinstance(config_value, tuple):
+        return tuple(_copy_config(value) for value in config_value)
+    return config_value
+
+
+def _get_cached_config(cache_key, config_file_path, set_config):
+    """Gets configuration parameters from the cache of the process.
+
+    The parameters are set through the 'set_config' function when they are 
+    not in the cache or when the modification time or the size of the json 
+    file pointed by 'config_file_path' have changed since they were cached.
+    A copy of the cached parameters is returned through the `_copy_config` 
+    function of the same module so that the callers can modify them.
+
+    Args:
+        cache_key (tup): The key (hashable) of the parameters in the cache.
+        config_file_path (path): Full path to the json file the parameters \
+        are set from.
+        set_config (function): Function without argument returning \
+        the parameters.
+    Returns:
+        The configuration parameters.
+    """
+    file_stat = os.stat(config_file_path)
+    file_stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached_tup = _CONFIG_CACHE.get(cache_key)
+    if cached_tup is None or cached_tup[0]!=file_stamp:
+        cached_tup = (file_stamp, set_config())
+        _CONFIG_CACHE[cache_key] = cached_tup
+    return _copy_config(cached_tup[1])
+
+
+def _get_bm_parsing_config_path():
+    """Returns the full path to the json file giving the architecture 
+    of the parsing folder and the names of the parsing files.
+    """
+    config_folder_path = Path(__file__).parent / Path(pg.CONFIG_FOLDER)
+    return config_folder_path / Path(pg.PARSING_CONFIG_FILE)
+
+
 def _get_bm_parsing_config():
     """Reads the json file giving the architecture of the parsing folder 
     and the names of the parsing files.
@@ -31,12 +98,8 @@ def _get_bm_parsing_config():
     Returns:
         (dict): The dict resulting from the parsing of the json file.
     """
-    config_folder_name = pg.CONFIG_FOLDER
-    config_json_file_name = pg.PARSING_CONFIG_FILE
-
     # Reads the json file
-    config_folder_path = Path(__file__).parent / Path(config_folder_name)
-    config_file_path = config_folder_path / Path(config_json_file_name)
+    config_file_path = _get_bm_parsing_config_path()
     with open(config_file_path, encoding = 'utf-8') as file:
         config_dict = json.load(file)
     return config_dict
@@ -156,6 +219,35 @@ def _build_files_paths(bibliometer_path, year, db_list, parsing_folder_dict):
     return (rawdata_path_dict, parsing_path_dict)
 
 
+def _set_user_config(bibliometer_path, year, db_list):
+    """Sets the full paths to the rawdata folders and to the parsing folders
+    and the names of the parsing file for each parsed item as described 
+    in the `set_user_config` function of the same module.
+
+    Args:
+        bibliometer_path (path): The full path to the working folder.
+        year (str): The name of the corpus folder defined by 4 digits \
+        corresponding to the corpus year.
+        db_list (list): The list of the database string names.
+    Returns:
+        (tup of dicts): A tuple of the 3 set parameters.
+    """
+    # Getting the configuration dict
+    config_dict = _get_bm_parsing_config()
+
+    # Getting the working folder architecture base
+    parsing_folder_dict = config_dict['PARSING_FOLDER_ARCHI']
+
+    # getting useful paths of the working folder architecture for a corpus single year "year"
+    rawdata_path_dict, parsing_path_dict = _build_files_paths(bibliometer_path, year, db_list,
+                                                              parsing_folder_dict)
+
+    # Getting the filenames for each parsing item
+    item_filename_dict = config_dict['PARSING_FILE_NAMES']
+
+    return (rawdata_path_dict, parsing_path_dict, item_filename_dict)
+
+
 def set_user_config(bibliometer_path, year, db_list):
     """Sets the full paths to the rawdata folders and to the parsing folders.
 
@@ -171,6 +263,10 @@ def set_user_config(bibliometer_path, year, db_list):
     and for each database.
     - index 3 = the dict giving the name of the parsing file for each parsed item.
 
+    The parameters are cached through the `_get_cached_config` function 
+    of the same module keyed by the working folder, the corpus year 
+    and the databases list.
+
     Args:
         bibliometer_path (path): The full path to the working folder.
         year (str): The name of the corpus folder defined by 4 digits \
@@ -179,20 +275,17 @@ def set_user_config(bibliometer_path, year, db_list):
     Returns:
         (tup of dicts): A tuple of the 3 set parameters.
     """
-    # Getting the configuration dict
-    config_dict = _get_bm_parsing_config()
+    cache_key = ("user_config", str(Path(bibliometer_path)), str(year), tuple(db_list))
+    return _get_cached_config(cache_key, _get_bm_parsing_config_path(),
+                              lambda: _set_user_config(bibliometer_path, year, db_list))
 
-    # Getting the working folder architecture base
-    parsing_folder_dict = config_dict['PARSING_FOLDER_ARCHI']
 
-    # getting useful paths of the working folder architecture for a corpus single year "year"
-    rawdata_path_dict, parsing_path_dict = _build_files_paths(bibliometer_path, year, db_list,
-                                                              parsing_folder_dict)
-
-    # Getting the filenames for each parsing item
-    item_filename_dict = config_dict['PARSING_FILE_NAMES']
-
-    return (rawdata_path_dict, parsing_path_dict, item_filename_dict)
+def _get_insitute_config_path(institute, bibliometer_path):
+    """Returns the full path to the json file giving the parameters 
+    of the organization structure for the Institute.
+    """
+    config_root_path = bibliometer_path / Path(eg.EMPLOYEES_ARCHI["root"])
+    return config_root_path / Path(ig.CONFIG_JSON_FILES_DICT[institute])
 
 
 def _get_insitute_config(institute, bibliometer_path):
@@ -213,8 +306,7 @@ Args:
     Returns:
         (dict): The dict resulting from the parsing of the json file.
     """
-    config_root_path = bibliometer_path / Path(eg.EMPLOYEES_ARCHI["root"])
-    config_file_path = config_root_path / Path(ig.CONFIG_JSON_FILES_DICT[institute])
+    config_file_path = _get_insitute_config_path(institute, bibliometer_path)
 
     # Reads the json_file
     with open(config_file_path, encoding = 'utf-8') as file:
@@ -222,52 +314,20 @@ Args:
     return inst_org_dict
 
 
-def set_org_params(institute, bibliometer_path):
-    """Sets the parameters of the organization structure for the Institute.
-
-    For that, it uses the configuration dict returned by the `_get_insitute_config` 
-    function of the same module. The set parameters are returned in a tuple as follows:
-
-    - index 0 = the dict giving the column name (str) for each department (str).
-    - index 1 = the dict giving the list of historical labels (str) for each department (str).
-    - index 2 = the dict giving the list of attributes (OTPs, str) for each department (str).
-    - index 3 = the list of tuples giving the potential labels (str) of the Institute \
-    in the authors affiliations associated with the country (str) that will be used to filter \
-    the authors affiliated to the Institute:
-        ex: [("LITEN","France"), ("INES","France")].
-    - index 4 = the list of columns names (str) that will be used for each of the potential labels \
-    of the Institute filtering the authors affiliated to the Institute.
-    - index 5 = the status (bool) of the impact factors database:
-        - True, if the database specific to the Institute will be used; 
-        - False, if a general database will be used.
-    - index 6 = the list of document types (str) for which the impact factors will not be analysed.
-    - index 7 = the index of the main institution among the tuples at index 3.
-    - index 8 = the status of the combination of the tuples at index 3.
-    - index 9 = the status of splitting the file of list of publications with one row per author \
-    that has not been identified as Institute employee.
-    - index 10 = the status of droping particular affiliation authors in the file of list of \
-    publications with one row per author that has not been identified as Institute employee.
-    - index 11 = the level at which the OTPs are predefined before final set by the user.
-    - index 12 = the name of the database file of OTPs per departement, service and labs.
-    - index 13 = the name of the sheet to be read in the database file of OTPs.
-    - index 14 = the lines number of the header in the database file of OTPs.
-    - index 15 = the column names to be read in the database file of OTPs.
-    - index 16 = the list of departments that have not lab-OTPs available.
+def _set_org_params(institute, bibliometer_path):
+    """Sets the parameters of the organization structure for the Institute 
+    as described in the `set_org_params` function of the same module.
 
     Args:
         institute (str): The Intitute name.
         bibliometer_path (path): The full path to the working folder.
     Returns:
-        (tup): A tuple of the 9 set parameters. 
+        (tup): A tuple of the set parameters.
     """
-
-    config_root_path = bibliometer_path / Path(eg.EMPLOYEES_ARCHI["root"])
-    config_file_path = config_root_path / Path(ig.CONFIG_JSON_FILES_DICT[institute])
     dpt_label_key = ig.DPT_LABEL_KEY
     dpt_otp_key = ig.DPT_OTP_KEY
 
-    with open(config_file_path, encoding = 'utf-8') as file:
-        inst_org_dict = json.load(file)
+    inst_org_dict = _get_insitute_config(institute, bibliometer_path)
 
     col_names_dpt = inst_org_dict["COL_NAMES_DPT"]
     dpt_label_dict = inst_org_dict["DPT_LABEL_DICT"]
@@ -308,3 +368,50 @@ def set_org_params(institute, bibliometer_path):
                   orphan_drop_dict, otps_level, lab_otps_bdd,
                   otps_sheet, otps_header, otps_cols, nolab_depts)
     return return_tup
+
+
+def set_org_params(institute, bibliometer_path):
+    """Sets the parameters of the organization structure for the Institute.
+
+    For that, it uses the `_set_org_params` function of the same module 
+    that reads the configuration dict returned by the `_get_insitute_config` 
+    function of the same module. The parameters are cached through 
+    the `_get_cached_config` function of the same module keyed by 
+    the Institute and the working folder. 
+    The set parameters are returned in a tuple as follows:
+
+    - index 0 = the dict giving the column name (str) for each department (str).
+    - index 1 = the dict giving the list of historical labels (str) for each department (str).
+    - index 2 = the dict giving the list of attributes (OTPs, str) for each department (str).
+    - index 3 = the list of tuples giving the potential labels (str) of the Institute \
+    in the authors affiliations associated with the country (str) that will be used to filter \
+    the authors affiliated to the Institute:
+        ex: [("LITEN","France"), ("INES","France")].
+    - index 4 = the list of columns names (str) that will be used for each of the potential labels \
+    of the Institute filtering the authors affiliated to the Institute.
+    - index 5 = the status (bool) of the impact factors database:
+        - True, if the database specific to the Institute will be used; 
+        - False, if a general database will be used.
+    - index 6 = the list of document types (str) for which the impact factors will not be analysed.
+    - index 7 = the index of the main institution among the tuples at index 3.
+    - index 8 = the status of the combination of the tuples at index 3.
+    - index 9 = the status of splitting the file of list of publications with one row per author \
+    that has not been identified as Institute employee.
+    - index 10 = the status of droping particular affiliation authors in the file of list of \
+    publications with one row per author that has not been identified as Institute employee.
+    - index 11 = the level at which the OTPs are predefined before final set by the user.
+    - index 12 = the name of the database file of OTPs per departement, service and labs.
+    - index 13 = the name of the sheet to be read in the database file of OTPs.
+    - index 14 = the lines number of the header in the database file of OTPs.
+    - index 15 = the column names to be read in the database file of OTPs.
+    - index 16 = the list of departments that have not lab-OTPs available.
+
+    Args:
+        institute (str): The Intitute name.
+        bibliometer_path (path): The full path to the working folder.
+    Returns:
+        (tup): A tuple of the 9 set parameters. 
+    """
+    cache_key = ("org_params", institute, str(Path(bibliometer_path)))
+    return _get_cached_config(cache_key, _get_insitute_config_path(institute, bibliometer_path),
+                              lambda: _set_org_params(institute, bibliometer_path))
@@ -28,6 +28,7 @@ from bmfuncts.format_files import format_page
 from bmfuncts.rename_cols import set_final_col_names
 from bmfuncts.save_final_results import save_final_results
 from bmfuncts.use_otps import save_otps
+from bmfuncts.dfs_utils import DfsAccumulator
 from bmfuncts.useful_functs import concat_dfs
 from bmfuncts.useful_functs import reorder_df
 
@@ -90,12 +91,12 @@ def split_pub_list_by_doc_type(institute, org_tup, bibliometer_path, corpus_year
         key_dg_path = pub_list_path / Path(key_dg_file_alias)
 
         key_dg = key_dg.sort_values(by=[pub_id_col])
-        wb, ws = format_page(key_dg, common_df_title)
+        wb, ws = format_page(key_dg, common_df_title, write_only=True)
         ws.title = key + " " + corpus_year
         wb.save(key_dg_path)
 
     other_dg = other_dg.sort_values(by=[pub_id_col])
-    wb, ws = format_page(other_dg, common_df_title)
+    wb, ws = format_page(other_dg, common_df_title, write_only=True)
     ws.title = "Others " + corpus_year
     wb.save(other_dg_path)
 
@@ -258,7 +259,7 @@ def concatenate_pub_lists(bibliometer_path, years_list):
     bdd_multi_annuelle_file_alias = pg.ARCHI_BDD_MULTI_ANNUELLE["concat file name base"]
 
     # Building the concatenated dataframe of available publications lists
-    concat_df = pd.DataFrame()
+    concat_dfs_acc = DfsAccumulator()
     available_liste_conso = ""
     for year in years_list:
         try:
@@ -267,11 +268,12 @@ def concatenate_pub_lists(bibliometer_path, years_list):
             pub_list_file_name = f"{pub_list_file_base_alias} {year}.xlsx"
             pub_list_path = pub_list_folder_path / Path(pub_list_file_name)
             inter_df = pd.read_excel(pub_list_path)
-            concat_df = concat_dfs([concat_df, inter_df])
+            concat_dfs_acc.append(inter_df)
             available_liste_conso += f" {year}"
 
         except FileNotFoundError:
             pass
+    concat_df = concat_dfs_acc.get_df()
 
     # Formatting and saving the concatenated dataframe in an EXCEL file
     date = str(datetime.now())[:16].replace(':', 'h')
@@ -280,7 +282,7 @@ def concatenate_pub_lists(bibliometer_path, years_list):
     out_path = bibliometer_path / Path(bdd_multi_annuelle_folder_alias)
     out_file_path = out_path / Path(out_file)
     concat_df_title = pg.DF_TITLES_LIST[0]
-    wb, ws = format_page(concat_df, concat_df_title)
+    wb, ws = format_page(concat_df, concat_df_title, write_only=True)
     ws.title = "Publications de " + available_liste_conso
     wb.save(out_file_path)
 
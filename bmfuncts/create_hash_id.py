@@ -3,13 +3,17 @@ that is independent of the extraction from the external databases.
 
 """
 
-__all__ = ['create_hash_id']
+__all__ = ['build_hash_id_dfs',
+           'build_pub_hash_ids',
+           'create_hash_id',
+          ]
 
 
 # Standard Library imports
 from pathlib import Path
 
 # 3rd party imports
+import numpy as np
 import pandas as pd
 import BiblioParsing as bp
 
@@ -37,6 +41,62 @@ def _my_hash(text:str):
     return my_hash
 
 
+def _my_hash_array(texts_list):
+    """Builds the hashes of the strings of 'texts_list' with the same bits mixing 
+    as the `_my_hash` internal function but for all the strings at once.
+
+    The strings are converted to an array of unicode code points and the hashes \
+    are updated character position by character position for the strings \
+    that are long enough, ordering them by decreasing length.
+
+    Args:
+        texts_list (list): The texts (str) for which the Hash Ids are built.
+    Returns:
+        (numpy.ndarray): The built Hash IDs as unsigned integers.
+    """
+    facts = (np.uint64(257), np.uint64(961)) # prime numbers to mix up the bits
+    minus_one = np.uint64(0xFFFFFFFF) # "-1" hex code
+
+    texts_nb = len(texts_list)
+    hashes = np.zeros(texts_nb, dtype=np.uint64)
+    if not texts_nb:
+        return hashes
+
+    # Ordering the texts by decreasing length
+    lengths = np.fromiter((len(text) for text in texts_list), dtype=np.int64, count=texts_nb)
+    order = np.argsort(-lengths, kind='stable')
+    sorted_lengths = lengths[order]
+
+    # Setting the array of code points with one row per character position
+    texts_array = np.array([texts_list[idx] for idx in order], dtype=str)
+    codes_array = texts_array.view(np.uint32).reshape(texts_nb, -1).T.copy()
+
+    sorted_hashes = np.zeros(texts_nb, dtype=np.uint64)
+    active_nbs = np.searchsorted(-sorted_lengths, -np.arange(sorted_lengths[0]), side='left')
+    for pos, active_nb in enumerate(active_nbs):
+        active_hashes = sorted_hashes[:active_nb] * facts[0]
+        active_hashes ^= codes_array[pos, :active_nb].astype(np.uint64) * facts[1]
+        sorted_hashes[:active_nb] = active_hashes & minus_one
+    hashes[order] = sorted_hashes
+    return hashes
+
+
+def build_pub_hash_ids(pub_df, hash_cols_list):
+    """Builds the hash ID of each row of 'pub_df' on the basis of the values 
+    of the 'hash_cols_list' columns through the `_my_hash_array` internal function.
+
+    Args:
+        pub_df (dataframe): Data of the publications.
+        hash_cols_list (list): The names (str) of the columns used to build \
+        the hash IDs.
+    Returns:
+        (numpy.ndarray): The built Hash IDs as strings.
+    """
+    texts_list = [''.join(values) for values
+                  in zip(*[map(str, pub_df[col]) for col in hash_cols_list])]
+    return _my_hash_array(texts_list).astype(str)
+
+
 def _clean_hash_id_df(dfs_tup, cols_tup):
     """Cleans data from publications with same hash ID.
 
@@ -56,26 +116,14 @@ def _clean_hash_id_df(dfs_tup, cols_tup):
     submit_df, orphan_df, hash_id_df = dfs_tup
     pub_id_col, hash_id_col = cols_tup
 
-    # Setting publications IDs list
-    submit_pub_id_list = list(submit_df[pub_id_col])
-    orphan_pub_id_list = list(orphan_df[pub_id_col])
-
-    new_hash_id_df = pd.DataFrame()
-    new_submit_df = submit_df.copy()
-    new_orphan_df = orphan_df.copy()
-    for _, hash_id_dg in hash_id_df.groupby(hash_id_col):
-        add_hash_id_dg = hash_id_dg.copy()
-        if len(hash_id_dg)>1:
-            pub_id_list = list(hash_id_dg[pub_id_col])
-            pub_id_to_keep = pub_id_list[0]
-            pub_id_to_drop_list = pub_id_list[1:]
-            for pub_id_to_drop in pub_id_to_drop_list:
-                if pub_id_to_drop in submit_pub_id_list:
-                    new_submit_df = new_submit_df[new_submit_df[pub_id_col]!=pub_id_to_drop]
-                if pub_id_to_drop in orphan_pub_id_list:
-                    new_orphan_df = new_orphan_df[new_orphan_df[pub_id_col]!=pub_id_to_drop]
-            add_hash_id_dg = hash_id_dg[hash_id_dg[pub_id_col]==pub_id_to_keep].copy()
-        new_hash_id_df = concat_dfs([new_hash_id_df, add_hash_id_dg])
+    # Keeping the first publication ID of each hash ID ordered by hash ID
+    dup_hash_id_mask = hash_id_df.duplicated(subset=[hash_id_col], keep='first')
+    pub_id_to_drop_list = hash_id_df.loc[dup_hash_id_mask, pub_id_col]
+    new_hash_id_df = hash_id_df[~dup_hash_id_mask].sort_values(by=[hash_id_col], kind='stable')
+
+    # Dropping the publications with same hash ID in one pass
+    new_submit_df = submit_df[~submit_df[pub_id_col].isin(pub_id_to_drop_list)]
+    new_orphan_df = orphan_df[~orphan_df[pub_id_col].isin(pub_id_to_drop_list)]
 
     # Adding column of Hash-IDs and reordering columns in new_submit_df
     new_submit_df = new_submit_df.merge(new_hash_id_df,
@@ -95,18 +143,75 @@ def _clean_hash_id_df(dfs_tup, cols_tup):
     return new_submit_df, new_orphan_df, new_hash_id_df
 
 
+def build_hash_id_dfs(institute, org_tup, submit_df, orphan_df):
+    """Builds the unique hash ID of each publication and cleans the data 
+    from the publications that have same hash ID.
+
+    The hash IDs are built for all the publications at once through \
+    the `build_pub_hash_ids` function on the basis of the values \
+    of 'year_alias', 'first_auth_alias', 'title_alias', 'issn_alias' \
+    and 'doi_alias' columns. Then, the data are cleaned from the publications \
+    that have same hash ID through the `_clean_hash_id_df` internal function.
+
+    Args:
+        institute (str): Institute name.
+        org_tup (tup): Contains Institute parameters.
+        submit_df (dataframe): Data of the publications list with one row \
+        per author that has been identified as Institute employee.
+        orphan_df (dataframe): Data of the publications list with one row \
+        per author that has not been identified as Institute employee.
+    Returns:
+        (tup): (The cleaned data (dataframe) of publications list with one row \
+        per institute author and attributes as employee, \
+        The cleaned data (dataframe) of publications list with one row per author not found \
+        in the employees database, The data of Hash IDs with related publication IDs).
+    """
+    # Setting useful col names
+    col_rename_tup = build_col_conversion_dic(institute, org_tup)
+    submit_col_rename_dic = col_rename_tup[1]
+
+    # Setting useful aliases
+    hash_id_col_alias = pg.COL_HASH['hash_id']
+    pub_id_alias = submit_col_rename_dic[bp.COL_NAMES["pub_id"]]
+    year_alias = submit_col_rename_dic[bp.COL_NAMES['articles'][2]]
+    first_auth_alias = submit_col_rename_dic[bp.COL_NAMES['articles'][1]]
+    doi_alias = submit_col_rename_dic[bp.COL_NAMES['articles'][6]]
+    title_alias = submit_col_rename_dic[bp.COL_NAMES['articles'][9]]
+    issn_alias = submit_col_rename_dic[bp.COL_NAMES['articles'][10]]
+
+    # Setting useful columns list
+    useful_cols = [pub_id_alias, year_alias, first_auth_alias,
+                   title_alias, issn_alias, doi_alias]
+
+    # Concatenate de dataframes to hash
+    submit_to_hash = submit_df[useful_cols].copy()
+    orphan_to_hash = orphan_df[useful_cols].copy()
+    dg_to_hash = concat_dfs([submit_to_hash, orphan_to_hash],
+                            dedup_cols=[pub_id_alias], drop_ignore_index=True)
+
+    # Building the hash IDs in one batch
+    hash_id_df = pd.DataFrame({hash_id_col_alias: build_pub_hash_ids(dg_to_hash,
+                                                                     useful_cols[1:]),
+                               pub_id_alias: dg_to_hash[pub_id_alias]})
+
+    # Cleaning dataframe from publications with same hash ID
+    dfs_tup = (submit_df, orphan_df, hash_id_df)
+    cols_tup = (pub_id_alias, hash_id_col_alias)
+    return _clean_hash_id_df(dfs_tup, cols_tup)
+
+
 def create_hash_id(institute, org_tup, working_folder_path, file_names_tup):
     """Creates a dataframe which columns are given by 'hash_id_col_alias' and 'pub_id_alias'.
 
     The content of these columns is as follows:
 
     - The 'hash_id_col_alias' column contains the unique hash ID built for each publication \
-    through the `_my_hash` internal function on the basis of the values of 'year_alias', \
+    through the `build_hash_id_dfs` function on the basis of the values of 'year_alias', \
     'first_auth_alias', 'title_alias', 'issn_alias' and 'doi_alias' columns.
     - The 'pub_id_alias' column contains the publication order number in the publications list.
 
     Finally, the data are cleaned from the publications that have same hash ID through \
-    the `_clean_hash_id_df` internal function and the dataframes are saved as Excel files.
+    the same function and the dataframes are saved as Excel files.
 
     Args:
         institute (str): Institute name.
@@ -122,55 +227,21 @@ def create_hash_id(institute, org_tup, working_folder_path, file_names_tup):
     # Setting parameters from args
     submit_file_name, orphan_file_name = file_names_tup
 
-    # Setting useful col names
-    col_rename_tup = build_col_conversion_dic(institute, org_tup)
-    submit_col_rename_dic = col_rename_tup[1]
-
     # Setting useful aliases
     hash_id_file_alias = pg.ARCHI_YEAR["hash_id file name"]
-    hash_id_col_alias = pg.COL_HASH['hash_id']
-    pub_id_alias = submit_col_rename_dic[bp.COL_NAMES["pub_id"]]
-    year_alias = submit_col_rename_dic[bp.COL_NAMES['articles'][2]]
-    first_auth_alias = submit_col_rename_dic[bp.COL_NAMES['articles'][1]]
-    doi_alias = submit_col_rename_dic[bp.COL_NAMES['articles'][6]]
-    title_alias = submit_col_rename_dic[bp.COL_NAMES['articles'][9]]
-    issn_alias = submit_col_rename_dic[bp.COL_NAMES['articles'][10]]
 
     # Setting useful paths
     submit_file_path = working_folder_path / Path(submit_file_name)
     orphan_file_path = working_folder_path / Path(orphan_file_name)
     hash_id_file_path = working_folder_path / Path(hash_id_file_alias)
 
-    # Setting useful columns list
-    useful_cols = [pub_id_alias, year_alias, first_auth_alias,
-                   title_alias, issn_alias, doi_alias]
-
     # Getting dataframes to hash
     submit_df = pd.read_excel(submit_file_path)
     orphan_df = pd.read_excel(orphan_file_path)
 
-    # Concatenate de dataframes to hash
-    submit_to_hash = submit_df[useful_cols].copy()
-    orphan_to_hash = orphan_df[useful_cols].copy()
-    dg_to_hash = concat_dfs([submit_to_hash, orphan_to_hash],
-                            dedup_cols=[pub_id_alias], drop_ignore_index=True)
-
-    hash_id_df = pd.DataFrame()
-    for idx in range(len(dg_to_hash)):
-        pub_id = dg_to_hash.loc[idx, pub_id_alias]
-        text   = (f"{str(dg_to_hash.loc[idx, year_alias])}"
-                  f"{str(dg_to_hash.loc[idx, first_auth_alias])}"
-                  f"{str(dg_to_hash.loc[idx, title_alias])}"
-                  f"{str(dg_to_hash.loc[idx, issn_alias])}"
-                  f"{str(dg_to_hash.loc[idx, doi_alias])}")
-        hash_id = _my_hash(text)
-        hash_id_df.loc[idx, hash_id_col_alias] = str(hash_id)
-        hash_id_df.loc[idx, pub_id_alias] = pub_id
-
-    # Cleaning dataframe from publications with same hash ID
-    dfs_tup = (submit_df, orphan_df, hash_id_df)
-    cols_tup = (pub_id_alias, hash_id_col_alias)
-    new_submit_df, new_orphan_df, new_hash_id_df = _clean_hash_id_df(dfs_tup, cols_tup)
+    # Building hash IDs and cleaning dataframes from publications with same hash ID
+    new_submit_df, new_orphan_df, new_hash_id_df = build_hash_id_dfs(institute, org_tup,
+                                                                     submit_df, orphan_df)
 
     # Saving the data
     new_submit_df.to_excel(submit_file_path, index=False)
@@ -0,0 +1,198 @@
+"""Module of useful objects for building dataframes in memory 
+used by several modules of package `bmfuncts`.
+
+"""
+
+__all__ = ['DfsAccumulator',
+           'read_as_xlsx',
+          ]
+
+
+# Standard library imports
+import datetime as dt
+import math
+
+# 3rd party imports
+import pandas as pd
+from openpyxl.cell.cell import ERROR_CODES as openpyxl_ERROR_CODES
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE as openpyxl_ILLEGAL_CHARACTERS_RE
+from openpyxl.utils.datetime import from_excel as openpyxl_from_excel
+from openpyxl.utils.datetime import to_excel as openpyxl_to_excel
+from openpyxl.utils.exceptions import IllegalCharacterError
+from pandas.io.parsers import TextParser
+
+# local imports
+from bmfuncts.useful_functs import concat_dfs
+
+
+class DfsAccumulator():
+    """Accumulates data as dataframes or rows for a single final concatenation.
+
+    Appending data step by step through the `concat_dfs` function copies
+    and deduplicates the whole accumulated data at each step. The dataframes
+    and rows are rather stored in lists and concatenated once through
+    the `concat_dfs` function imported from `bmfuncts.useful_functs` module
+    when the result is got, which gives the same result as the successive
+    concatenations.
+
+    Args:
+        init_df (dataframe): Optional initial data, that is also the data \
+        returned when nothing has been appended (default = None, \
+        an empty dataframe is then used).
+        **concat_kwargs: Optional keyword arguments of the `concat_dfs` function \
+        used for the final concatenation.
+    """
+
+    def __init__(self, init_df=None, **concat_kwargs):
+        if init_df is None:
+            init_df = pd.DataFrame()
+        self.dfs_list = [init_df]
+        self.rows_list = []
+        self.concat_kwargs = concat_kwargs
+
+    def _flush_rows(self):
+        """Moves the appended rows to the list of dataframes as a single dataframe."""
+        if self.rows_list:
+            self.dfs_list.append(pd.DataFrame(self.rows_list))
+            self.rows_list = []
+
+    def append(self, df):
+        """Appends a dataframe to the accumulated data.
+
+        Args:
+            df (dataframe): The data to append.
+        """
+        self._flush_rows()
+        self.dfs_list.append(df)
+
+    def append_row(self, row_dict):
+        """Appends a single row to the accumulated data.
+
+        Args:
+            row_dict (dict): The row data keyed by column names.
+        """
+        self.rows_list.append(row_dict)
+
+    def get_df(self):
+        """Concatenates the accumulated data through the `concat_dfs` function.
+
+        Returns:
+            (dataframe): Result of the concatenation.
+        """
+        self._flush_rows()
+        concat_df = concat_dfs(self.dfs_list, **self.concat_kwargs)
+        self.dfs_list = [concat_df]
+        return concat_df
+
+
+def _xlsx_str_value(value):
+    """Sets the value of a dataframe cell of string type as read back 
+    after saving the dataframe as xlsx file.
+
+    The strings containing characters that cannot be saved in xlsx file \
+    are rejected raising the same error as the openpyxl package. \
+    The carriage returns are read back as line feeds.
+
+    Args:
+        value (str): The value of the dataframe cell.
+    Returns:
+        The value of the cell as got from the xlsx file \
+        before pandas parsing.
+    """
+    if openpyxl_ILLEGAL_CHARACTERS_RE.search(value):
+        # Rejected as when saving the xlsx file
+        raise IllegalCharacterError(f"{value} cannot be used in worksheets.")
+    if value in openpyxl_ERROR_CODES:
+        # Saved as error cell read back as NaN
+        cell_value = math.nan
+    elif value.startswith("=") and len(value)>1:
+        # Saved as formula with no computed value
+        cell_value = ""
+    else:
+        # Line ends normalized when reading the xml of the xlsx file
+        cell_value = value.replace("\r\n", "\n").replace("\r", "\n")
+    return cell_value
+
+
+def _xlsx_cell_value(value):
+    """Sets the value of a dataframe cell as read back after saving 
+    the dataframe as xlsx file.
+
+    The values are converted as written and read back by the openpyxl \
+    package: the missing values, including `pd.NA`, give empty cells, \
+    the dates and datetimes are read back as datetimes rounded \
+    to the millisecond, the timedeltas as numbers of days, the times \
+    as strings and the strings through the `_xlsx_str_value` internal \
+    function. The datetimes with timezone are rejected raising the same \
+    error as pandas.
+
+    Args:
+        value: The value of the dataframe cell.
+    Returns:
+        The value of the cell as got from the xlsx file \
+        before pandas parsing.
+    """
+    cell_value = value
+    if isinstance(value, float):
+        if math.isnan(value):
+            cell_value = ""
+        elif math.isinf(value):
+            cell_value = "inf" if value > 0 else "-inf"
+        elif value.is_integer():
+            cell_value = int(value)
+    elif value is None or value is pd.NaT or value is pd.NA:
+        cell_value = ""
+    elif isinstance(value, (list, tuple, dict, set, dt.time)):
+        # Saved as the string of the value
+        cell_value = str(value)
+    elif isinstance(value, dt.timedelta):
+        # Saved as number of days
+        cell_value = openpyxl_to_excel(value)
+    elif isinstance(value, dt.date):
+        if getattr(value, "tzinfo", None) is not None:
+            # Rejected as when saving the xlsx file
+            raise ValueError("Excel does not support datetimes with timezones. "
+                             "Please ensure that datetimes are timezone unaware "
+                             "before writing to Excel.")
+        # Saved as number of days and read back as datetime
+        cell_value = openpyxl_from_excel(openpyxl_to_excel(value))
+    elif isinstance(value, str):
+        cell_value = _xlsx_str_value(value)
+    return cell_value
+
+
+def read_as_xlsx(df, **read_kwargs):
+    """Builds the dataframe that would be got by saving 'df' as xlsx file 
+    and reading it back through the pandas `read_excel` function.
+
+    The cells values are set as read from the xlsx file through \
+    the `_xlsx_cell_value` internal function. Then they are parsed \
+    by the same parser as the one used by the `read_excel` function \
+    so that the NaN values, the dtypes, the converters and the duplicated \
+    column names are set as through the xlsx file round trip. \
+    As when saving the xlsx file, the column names and the values \
+    containing illegal characters are rejected.
+
+    Args:
+        df (dataframe): The data to read as xlsx file.
+        **read_kwargs: Optional keyword arguments of the `read_excel` function \
+        as 'converters' or 'keep_default_na'.
+    Returns:
+        (dataframe): The data as read back from xlsx file.
+    """
+    if df.columns.empty:
+        return pd.DataFrame()
+
+    # Setting the columns by position for duplicated column names
+    header_list = [_xlsx_cell_value(col) for col in df.columns]
+    cols_values_list = [[_xlsx_cell_value(value) for value in df.iloc[:, col_idx].tolist()]
+                        for col_idx in range(len(df.columns))]
+    data = [list(row) for row in zip(*cols_values_list)]
+
+    # Dropping trailing empty rows as done when reading xlsx files
+    while data and all(value=="" for value in data[-1]):
+        data.pop()
+    data.insert(0, header_list)
+
+    parser = TextParser(data, header=0, skip_blank_lines=False, **read_kwargs)
+    return parser.read()
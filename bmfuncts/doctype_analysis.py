@@ -58,7 +58,8 @@ def _unique_journal_name(init_analysis_df, journal_col, issn_col):
     return analysis_df
 
 
-def _read_articles_data(bibliometer_path, saved_results_path, corpus_year):
+def _read_articles_data(bibliometer_path, saved_results_path, corpus_year,
+                        cols_list=None):
     """Reads saved data of publications list resulting from the parsing step.
 
     It uses the `get_final_dedup` function imported from the 
@@ -69,6 +70,8 @@ def _read_articles_data(bibliometer_path, saved_results_path, corpus_year):
         saved_results_path (path): Full path to the folder \
         where final results are saved.
         corpus_year (str): 4 digits year of the corpus.
+        cols_list (list): Optional list of the columns to read \
+        (default = None for all the columns).
     Returns:
         (dataframe): The data of the publications list.
     """
@@ -78,7 +81,8 @@ def _read_articles_data(bibliometer_path, saved_results_path, corpus_year):
     # Getting the dict of deduplication results
     dedup_parsing_dict = get_final_dedup(bibliometer_path,
                                          saved_results_path,
-                                         corpus_year)
+                                         corpus_year,
+                                         columns_dict={articles_item_alias: cols_list})
 
     # Getting ID of each author with author name
     articles_df = dedup_parsing_dict[articles_item_alias]
@@ -127,7 +131,8 @@ def build_doctype_analysis_data(bibliometer_path, datatype, corpus_year,
 
     # Getting articles data resulting from deduplication parsing
     parsing_articles_df = _read_articles_data(bibliometer_path,
-                                              saved_results_path, corpus_year)
+                                              saved_results_path, corpus_year,
+                                              cols_list=[journal_col, journal_norm_col_alias])
 
     # Building the dict {journal name : normalized journal name,}
     # from the deduplication results
@@ -0,0 +1,387 @@
+"""Module of functions for storing the employees data out of the EXCEL files 
+of the employees database.
+
+The months of the employees are stored as append-only partitions in a months 
+history folder with one file per month. The standardized employees data 
+of each year are stored in a cache folder with one file per year and a manifest 
+recording the cache version, the key of the all-years employees file 
+and the available years.
+
+"""
+
+__all__ = ['backup_months_history',
+           'check_history_newer',
+           'get_employees_sheets',
+           'get_file_key',
+           'get_history_months',
+           'get_history_years',
+           'read_employees_cache_manifest',
+           'read_employees_sheets',
+           'read_months_history',
+           'save_months_history',
+           'set_employees_cache_paths',
+           'set_employees_history_path',
+           'set_employees_year_data',
+           'set_month_history_path',
+           'set_year_cache_path',
+           'standardize_employees_names',
+           'write_employees_cache_manifest',
+          ]
+
+
+# Standard library imports
+import os
+import shutil
+from pathlib import Path
+
+# 3rd party imports
+import pandas as pd
+
+# Local imports
+import bmfuncts.employees_globals as eg
+from bmfuncts.cache_utils import get_file_hash
+from bmfuncts.cache_utils import read_manifest
+from bmfuncts.cache_utils import write_manifest
+from bmfuncts.dfs_utils import read_as_xlsx
+from bmfuncts.useful_functs import standardize_txt
+
+
+def set_employees_history_path(all_effectifs_path):
+    """Sets the full path to the months history of the employees.
+
+    The months history folder is hosted in the folder of the all-years \
+    employees file under the name given by the global 'EMPLOYEES_ARCHI' \
+    at key 'employees_history_folder'. It contains a folder per year \
+    with a file per month named mmyyyy where mm stands for the month \
+    and yyyy for the year.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+    Returns:
+        (path): Full path to the months history folder.
+    """
+    return Path(all_effectifs_path).parent / Path(eg.EMPLOYEES_ARCHI["employees_history_folder"])
+
+
+def set_month_history_path(history_folder_path, month):
+    """Sets the full path to the file of a month in the months history of the employees.
+
+    Args:
+        history_folder_path (path): Full path to the months history folder.
+        month (str): The month formatted as mmyyyy.
+    Returns:
+        (path): Full path to the pickle file of the month in the folder of its year.
+    """
+    return history_folder_path / Path(month[2:]) / Path(f"{month}.pkl")
+
+
+def get_history_months(history_folder_path, year):
+    """Gets the months of a year available in the months history of the employees.
+
+    Args:
+        history_folder_path (path): Full path to the months history folder.
+        year (str): The year defined by 4 digits.
+    Returns:
+        (list): The sorted months (str) formatted as mmyyyy.
+    """
+    year_folder_path = history_folder_path / Path(year)
+    if not os.path.exists(year_folder_path):
+        return []
+    return sorted(file[:-4] for file in os.listdir(year_folder_path) if file.endswith(".pkl"))
+
+
+def get_history_years(history_folder_path):
+    """Gets the years available in the months history of the employees.
+
+    Args:
+        history_folder_path (path): Full path to the months history folder.
+    Returns:
+        (list): The sorted years (str).
+    """
+    if not os.path.exists(history_folder_path):
+        return []
+    return sorted(year for year in os.listdir(history_folder_path)
+                  if get_history_months(history_folder_path, year))
+
+
+def save_months_history(history_folder_path, months_df_dict):
+    """Appends months to the months history of the employees.
+
+    Each month is saved in its own file so that adding or replacing a month \
+    does not rewrite the other months of the history.
+
+    Args:
+        history_folder_path (path): Full path to the months history folder.
+        months_df_dict (dict): The employees data of each month keyed \
+        by the months (str) formatted as mmyyyy.
+    """
+    for month, month_df in months_df_dict.items():
+        month_path = set_month_history_path(history_folder_path, month)
+        if not os.path.exists(month_path.parent):
+            os.makedirs(month_path.parent)
+        month_df.to_pickle(month_path)
+
+
+def read_months_history(history_folder_path, year):
+    """Reads the months of a year from the months history of the employees.
+
+    Args:
+        history_folder_path (path): Full path to the months history folder.
+        year (str): The year defined by 4 digits.
+    Returns:
+        (dict): The employees data of each month keyed by the months (str) \
+        formatted as mmyyyy and ordered by month.
+    """
+    return {month: pd.read_pickle(set_month_history_path(history_folder_path, month))
+            for month in get_history_months(history_folder_path, year)}
+
+
+def check_history_newer(all_effectifs_path, year):
+    """Checks if the months history of a year is more recent 
+    than the all-years employees file.
+
+    The all-years employees file may be edited by the user after the months \
+    of a year have been added to the months history. In this case, the sheet \
+    of the year in the all-years employees file takes precedence over \
+    the months history of the year.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+        year (str): The year defined by 4 digits.
+    Returns:
+        (bool): True if the months history of the year is available and \
+        modified after the all-years employees file or if this file does not exist.
+    """
+    history_folder_path = set_employees_history_path(all_effectifs_path)
+    months_list = get_history_months(history_folder_path, year)
+    if not months_list:
+        return False
+    if not os.path.exists(all_effectifs_path):
+        return True
+    history_mtime = max(os.path.getmtime(set_month_history_path(history_folder_path, month))
+                        for month in months_list)
+    return history_mtime>os.path.getmtime(all_effectifs_path)
+
+
+def backup_months_history(history_folder_path, backup_folder_path, year):
+    """Copies the months history of a year to the backup folder.
+
+    The months history of the year is copied in the folder named as \
+    the months history folder in the backup folder.
+
+    Args:
+        history_folder_path (path): Full path to the months history folder.
+        backup_folder_path (path): Full path to the backup folder.
+        year (str): The year defined by 4 digits.
+    """
+    year_folder_path = history_folder_path / Path(year)
+    backup_year_folder_path = backup_folder_path / Path(history_folder_path.name) / Path(year)
+    shutil.copytree(year_folder_path, backup_year_folder_path, dirs_exist_ok=True)
+
+
+def get_file_key(file_path, with_hash=True):
+    """Builds the key identifying the content of a file.
+
+    Args:
+        file_path (path): Full path to the file.
+        with_hash (bool): If true, the SHA-256 hash of the file content \
+        got through the `get_file_hash` function imported from \
+        `bmfuncts.cache_utils` module is added to the key (default = True).
+    Returns:
+        (dict): The key composed by the modification time and size of the file \
+        and optionally the hash of its content.
+    """
+    file_stat = os.stat(file_path)
+    file_key = {"mtime": file_stat.st_mtime,
+                "size" : file_stat.st_size}
+    if with_hash:
+        file_key["sha256"] = get_file_hash(file_path)
+    return file_key
+
+
+def set_employees_cache_paths(all_effectifs_path):
+    """Sets the full paths to the cache of the all-years employees data.
+
+    The cache folder and manifest file are hosted in the folder of the \
+    all-years employees file under the names given by the global \
+    'EMPLOYEES_ARCHI' at keys 'employees_cache_folder' and \
+    'employees_cache_manifest'.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+    Returns:
+        (tup): (full path to the cache folder, full path to the cache manifest file).
+    """
+    all_effectifs_folder_path = Path(all_effectifs_path).parent
+    cache_folder_path = all_effectifs_folder_path / \
+                        Path(eg.EMPLOYEES_ARCHI["employees_cache_folder"])
+    cache_manifest_path = all_effectifs_folder_path / \
+                          Path(eg.EMPLOYEES_ARCHI["employees_cache_manifest"])
+    return cache_folder_path, cache_manifest_path
+
+
+def set_year_cache_path(cache_folder_path, year):
+    """Sets the full path to the cache file of the employees data of a year.
+
+    Args:
+        cache_folder_path (path): Full path to the cache folder.
+        year (str): The year defined by 4 digits.
+    Returns:
+        (path): The full path to the pickle file of the year.
+    """
+    return cache_folder_path / Path(f"{year}.pkl")
+
+
+def write_employees_cache_manifest(all_effectifs_path, manifest_dict):
+    """Writes the manifest of the cache of the all-years employees data 
+    as json file.
+
+    The manifest path is set through the `set_employees_cache_paths` function \
+    and the manifest is written through the `write_manifest` function imported \
+    from `bmfuncts.cache_utils` module.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+        manifest_dict (dict): The manifest of the cache to be written.
+    """
+    _, cache_manifest_path = set_employees_cache_paths(all_effectifs_path)
+    write_manifest(cache_manifest_path, manifest_dict)
+
+
+def read_employees_cache_manifest(all_effectifs_path):
+    """Reads the manifest of the cache of the all-years employees data 
+    and checks that the cache is valid for the current all-years employees file.
+
+    The cache is valid if its version is the one given by the global \
+    'EMPLOYEES_CACHE_VERSION' and if the key of the all-years employees file \
+    recorded in the manifest matches the current file through the file \
+    modification time and size or, if they differ, through the file-content hash. \
+    The all-years employees file being an optional export of the cache, \
+    the cache is also valid if this file does not exist.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+    Returns:
+        (dict): The manifest of the cache if valid, None otherwise.
+    """
+    cache_folder_path, cache_manifest_path = set_employees_cache_paths(all_effectifs_path)
+    manifest_dict = None
+    if os.path.exists(cache_folder_path):
+        manifest_dict = read_manifest(cache_manifest_path)
+    if not manifest_dict or manifest_dict.get("version")!=eg.EMPLOYEES_CACHE_VERSION:
+        return None
+    if not os.path.exists(all_effectifs_path):
+        return manifest_dict
+
+    cached_key = manifest_dict.get("source") or {}
+    file_key = get_file_key(all_effectifs_path, with_hash=False)
+    if all(cached_key.get(key)==value for key, value in file_key.items()):
+        return manifest_dict
+    if cached_key.get("size")!=file_key["size"]:
+        return None
+    file_key = get_file_key(all_effectifs_path)
+    if cached_key.get("sha256")!=file_key["sha256"]:
+        return None
+
+    # Same content with new modification time
+    manifest_dict["source"] = file_key
+    write_employees_cache_manifest(all_effectifs_path, manifest_dict)
+    return manifest_dict
+
+
+def standardize_employees_names(year_df):
+    """Standardizes the employees last names of the employees data of a year.
+
+    The employee last name is standardized through the `standardize_txt` \
+    function imported from `bmfuncts.useful_functs` module and the employee \
+    full name is rebuilt accordingly.
+
+    Args:
+        year_df (dataframe): The employees data of a year.
+    Returns:
+        (dataframe): The standardized employees data.
+    """
+    # Setting useful columns aliases
+    last_name_col_alias = eg.EMPLOYEES_USEFUL_COLS['name']
+    full_name_col_alias = eg.EMPLOYEES_ADD_COLS['employee_full_name']
+    first_name_col_alias = eg.EMPLOYEES_ADD_COLS['first_name_initials']
+
+    # Standardizing employee last name and consequently updating employee full name
+    year_all_effectifs_df = year_df.copy()
+    year_all_effectifs_df[last_name_col_alias] = year_all_effectifs_df[last_name_col_alias].\
+    apply(standardize_txt)
+    if not year_all_effectifs_df.empty:
+        year_all_effectifs_df[full_name_col_alias] = year_all_effectifs_df[last_name_col_alias] \
+                                                     + " " \
+                                                     + year_all_effectifs_df[first_name_col_alias]
+    return year_all_effectifs_df
+
+
+def get_employees_sheets(all_effectifs_path):
+    """Gets the sheet names of the all-years employees file.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+    Returns:
+        (list): The sheet names (str), empty if the file does not exist.
+    """
+    if not os.path.exists(all_effectifs_path):
+        return []
+    with pd.ExcelFile(all_effectifs_path) as all_effectifs_file:
+        sheets_list = [str(x) for x in all_effectifs_file.sheet_names]
+    return sheets_list
+
+
+def read_employees_sheets(all_effectifs_path, sheet_names=None):
+    """Reads the sheets of the all-years employees file and standardizes 
+    the employees names through the `standardize_employees_names` function.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+        sheet_names (list): The names (str) of the sheets to read \
+        (default = None for all the sheets).
+    Returns:
+        (dict): The standardized employees data keyed by sheet names (str).
+    """
+    # Getting employees df
+    useful_col_list = list(eg.EMPLOYEES_USEFUL_COLS.values()) + list(eg.EMPLOYEES_ADD_COLS.values())
+    all_effectifs_df = pd.read_excel(all_effectifs_path,
+                                     sheet_name=sheet_names,
+                                     dtype=eg.EMPLOYEES_COL_TYPES,
+                                     usecols=useful_col_list,
+                                     keep_default_na=False)
+
+    # Standardizing employee names
+    new_all_effectifs_df = {}
+    for year, year_df in all_effectifs_df.items():
+        new_all_effectifs_df[year] = standardize_employees_names(year_df)
+    return new_all_effectifs_df
+
+
+def set_employees_year_data(employees_df):
+    """Sets the standardized employees data of a year from the employees data 
+    of the year built from the months of the year.
+
+    The data are set as read from the all-years employees file after saving them \
+    in this file through the `read_as_xlsx` function imported from \
+    `bmfuncts.dfs_utils` module and then standardized through \
+    the `standardize_employees_names` function.
+
+    Args:
+        employees_df (dataframe): The employees data of the year.
+    Returns:
+        (dataframe): The standardized employees data of the year.
+    """
+    useful_col_list = list(eg.EMPLOYEES_USEFUL_COLS.values()) + list(eg.EMPLOYEES_ADD_COLS.values())
+    year_df = read_as_xlsx(employees_df,
+                           dtype=eg.EMPLOYEES_COL_TYPES,
+                           usecols=useful_col_list,
+                           keep_default_na=False)
+    return standardize_employees_names(year_df)
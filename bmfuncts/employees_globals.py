@@ -6,6 +6,7 @@ __all__ = [
            'CATEGORIES_DIC',
            'EMPLOYEES_ADD_COLS',
            'EMPLOYEES_ARCHI',
+           'EMPLOYEES_CACHE_VERSION',
            'EMPLOYEES_COL_TYPES',
            'EMPLOYEES_CONVERTERS_DIC',
            'EMPLOYEES_FULL_COLS',
@@ -23,7 +24,14 @@ EMPLOYEES_ARCHI = {"root"                        : "Parametres Institut",
                    "one_year_employees"          : "Effectifs annuels",
                    "employees_file_name"         : "All_effectifs.xlsx",
                    "one_year_employees_filebase" : "_Effectifs.xlsx",
-                   "complementary_employees"     : "Effectifs de consolidation",}
+                   "complementary_employees"     : "Effectifs de consolidation",
+                   "employees_cache_folder"      : "All_effectifs_cache",
+                   "employees_cache_manifest"    : "All_effectifs_cache.json",
+                   "employees_history_folder"    : "Historique_effectifs",}
+
+# Version of the cache of the standardized all-years employees data
+# to be incremented when the standardization of these data is modified
+EMPLOYEES_CACHE_VERSION = 1
 
 
 # This is only the full list of employees file columns available
@@ -24,11 +24,14 @@ from pathlib import Path
 
 # 3rd party imports
 from openpyxl import Workbook as openpyxl_Workbook
+from openpyxl.cell import WriteOnlyCell as openpyxl_WriteOnlyCell
 from openpyxl.styles import Font as openpyxl_Font
 from openpyxl.styles import PatternFill as openpyxl_PatternFill
 from openpyxl.styles import Alignment as openpyxl_Alignment
 from openpyxl.styles import Border as openpyxl_Border
 from openpyxl.styles import Side as openpyxl_Side
+from openpyxl.styles import NamedStyle as openpyxl_NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT as openpyxl_DEFAULT_FONT
 from openpyxl.utils.dataframe import dataframe_to_rows \
     as openpyxl_dataframe_to_rows
 from openpyxl.utils import get_column_letter \
@@ -87,21 +90,24 @@ def build_cell_fill_patterns():
     return cell_colors
 
 
-def color_row(ws, idx_row, cell_colors):
+def color_row(ws, idx_row, cell_colors, row_cells=None):
     """Colors alternately rows in an openpyxl sheet.
 
     Args:
         ws (openpyxl worksheet): The worksheet where cells are colored.
         idx_row (int): Row index to be colored.
         cell_colors (list): List of openpyxl.PatternFill objects.
+        row_cells (list): The cells of the row to be colored \
+        (optional, default = None, the cells of the last row of 'ws').
     Returns:
         (openpyxl worksheet): The openpyxl worksheet where cells \
         have been colored.
     """
-    last_row = ws[ws.max_row]
+    if row_cells is None:
+        row_cells = ws[ws.max_row]
     if idx_row >= 1:
         cell_color = cell_colors[idx_row%2]
-        for cell in last_row:
+        for cell in row_cells:
             cell.fill = cell_color
     return ws
 
@@ -130,10 +136,11 @@ def align_cell(ws, columns_list, col_attr, xl_idx_base):
         column_letter = openpyxl_get_column_letter(col_idx + xl_idx_base)
         if col_idx==len(columns_list):
             wrap_text = True
+        col_alignment = openpyxl_Alignment(wrap_text=wrap_text,
+                                           horizontal=col_attr[col][1],
+                                           vertical="center")
         for cell in ws[column_letter]:
-            cell.alignment = openpyxl_Alignment(wrap_text=wrap_text,
-                                                horizontal=col_attr[col][1],
-                                                vertical="center")
+            cell.alignment = col_alignment
             cell.border = borders
     return ws
 
@@ -909,8 +916,130 @@ def set_df_attributes(df_title, df_cols_list):
     return attr_tup
 
 
+def _build_write_only_styles(wb, df_title, df_cols_list, col_attr_dict, cell_colors):
+    """Builds the named styles of the cells of each column for formatting 
+    a write-only worksheet as done by the `color_row`, `align_cell` 
+    and `format_heading` functions.
+
+    The named styles already added to the workbook are reused so that 
+    several worksheets of the same workbook can be formatted.
+
+    Args:
+        wb (openpyxl workbook): The write-only workbook where the named styles are added.
+        df_title (str): Name of the data type to be formatted.
+        df_cols_list (list): List of columns names (str) to be formatted.
+        col_attr_dict (dict): The columns attributes as dict keyed by column names (str) \
+        and valued by the attributes lists of each column composed \
+        by [width (int), horizontal alignment (str)].
+        cell_colors (list): List of openpyxl.PatternFill objects.
+    Returns:
+        (list): List of the named styles names (str) per column given \
+        as lists [heading style, style for even rows, style for odd rows].
+    """
+    borders = openpyxl_Border(left=openpyxl_Side(border_style='thick',
+                                                 color='FFFFFF'),
+                              right=openpyxl_Side(border_style='thick',
+                                                  color='FFFFFF'))
+    head_font = openpyxl_Font(bold=True)
+    head_align = openpyxl_Alignment(wrap_text=True, horizontal="center",
+                                    vertical="center")
+    pub_alias = pg.DF_TITLES_LIST[0]
+
+    styles_dict = {}
+    def _get_style_name(head_status, horizontal, color_idx):
+        style_key = (head_status, horizontal, color_idx)
+        if style_key not in styles_dict:
+            style_name = "BM " + "-".join(str(x) for x in style_key)
+            if style_name not in wb.named_styles:
+                style = openpyxl_NamedStyle(name=style_name, border=borders)
+                if head_status:
+                    style.font = head_font
+                    style.alignment = head_align
+                else:
+                    style.font = openpyxl_DEFAULT_FONT
+                    style.alignment = openpyxl_Alignment(wrap_text=False,
+                                                         horizontal=horizontal,
+                                                         vertical="center")
+                if color_idx is not None:
+                    style.fill = cell_colors[color_idx]
+                wb.add_named_style(style)
+            styles_dict[style_key] = style_name
+        return styles_dict[style_key]
+
+    cols_styles_list = []
+    for col_idx, col in enumerate(df_cols_list):
+        horizontal = col_attr_dict[col][1]
+        head_col_status = df_title==pub_alias and col_idx==0
+        cols_styles_list.append([_get_style_name(True, horizontal, None),
+                                 _get_style_name(head_col_status, horizontal, 0),
+                                 _get_style_name(head_col_status, horizontal, 1)])
+    return cols_styles_list
+
+
+def _format_write_only_page(df, df_title, wb, cell_colors, idx_wrap):
+    """Formats a new worksheet of a write-only openpyxl workbook in a single 
+    streaming pass with the same result as the `format_page` function.
+
+    The columns widths and the rows heights are set before writing the rows. \
+    The cells are styled through named styles built once per workbook \
+    by the `_build_write_only_styles` internal function.
+
+    Args:
+        df (dataframe): The dataframe to be formatted.
+        df_title (str): Name of data to be formatted for setting \
+        columns attributes.
+        wb (openpyxl workbook): Write-only workbook of the worksheet \
+        to be formatted, created if None.
+        cell_colors (list): List of openpyxl.PatternFill objects.
+        idx_wrap (int): The optional maximum index of the rows \
+        for which text is wraped in the last column.
+    Returns:
+        (tup): (worbook of the formatted worksheet (openpyxl workbook), \
+        formatted worksheet).
+    """
+    # Setting base of columns and row indexes in openpyxl objects
+    xl_idx_base = pg.XL_INDEX_BASE
+
+    # Setting useful df attributes
+    df_cols_list = df.columns
+    attrib_tup = set_df_attributes(df_title, df_cols_list)
+    col_attr_dict, row_heights_dict, col_idx_init = attrib_tup
+
+    # Initialize wb as a write-only openpyxl workbook and ws a new worksheet
+    if not wb:
+        wb = openpyxl_Workbook(write_only=True)
+    ws = wb.create_sheet()
+
+    # Setting the columns width and the height of rows before writing rows
+    ws = set_col_width(ws, df_cols_list, col_attr_dict,
+                       col_idx_init, xl_idx_base)
+    for idx_row in range(len(df) + 1):
+        if idx_row==0:
+            height = row_heights_dict['first_row']
+        elif idx_wrap and idx_row<=idx_wrap: # Auto Height of data row
+            height = None
+        else:
+            height = row_heights_dict['other_rows']
+        ws.row_dimensions[idx_row + 1].height = height
+
+    # Writing rows with heading format and alternate colors
+    cols_styles_list = _build_write_only_styles(wb, df_title, df_cols_list,
+                                                col_attr_dict, cell_colors)
+    ws_rows = openpyxl_dataframe_to_rows(df, index=False, header=True)
+    for idx_row, row in enumerate(ws_rows):
+        style_idx = 0 if idx_row==0 else 1 + idx_row%2
+        cells_list = []
+        for value, col_styles in zip(row, cols_styles_list):
+            cell = openpyxl_WriteOnlyCell(ws)
+            cell.style = col_styles[style_idx]
+            cell.value = value
+            cells_list.append(cell)
+        ws.append(cells_list)
+    return wb, ws
+
+
 def format_page(df, df_title, wb=None, header=True,
-                cell_colors=None, idx_wrap=None):
+                cell_colors=None, idx_wrap=None, write_only=False):
     """Formats a worksheet of an openpyxl workbook using 
     columns attributes got through the `set_df_attributes`  
     internal function.
@@ -919,6 +1048,12 @@ def format_page(df, df_title, wb=None, header=True,
     to the active worksheet of the passed workbook. 
     If the workbook wb is None, then the workbook is created.
 
+    When 'write_only' is True, the formatting is done in a single streaming 
+    pass through the `_format_write_only_page` internal function 
+    on a new worksheet of a write-only workbook; the returned worksheet 
+    can then be only renamed before saving the workbook. The heading row 
+    being always written on this new worksheet, 'header' must be True.
+
     Args:
         df (dataframe): The dataframe to be formatted.
         df_title (str): Name of data to be formatted for setting \
@@ -933,6 +1068,9 @@ def format_page(df, df_title, wb=None, header=True,
         (default = None).
         idx_wrap (int): The optional maximum index of the rows \
         for which text is wraped in the last column.
+        write_only (bool): If true, the formatting is done on a new worksheet \
+        of a write-only workbook, 'wb' being then a write-only workbook \
+        (default = False).
     Returns:
         (tup): (worbook of the formatted worksheet (openpyxl workbook), \
         formatted active sheet).
@@ -944,6 +1082,12 @@ def format_page(df, df_title, wb=None, header=True,
     if not cell_colors:
         cell_colors = build_cell_fill_patterns()
 
+    if write_only:
+        if not header:
+            raise ValueError("The heading row is always written in write-only mode; "
+                             "'header' must be True.")
+        return _format_write_only_page(df, df_title, wb, cell_colors, idx_wrap)
+
     # Setting useful df attributes
     df_cols_list = df.columns
     attrib_tup = set_df_attributes(df_title, df_cols_list)
@@ -955,11 +1099,16 @@ def format_page(df, df_title, wb=None, header=True,
         header = True
     ws = wb.active
 
-    # Coloring alternately rows in ws
+    # Coloring alternately rows in ws, the number of each appended row
+    # being got once from the sheet and then incremented
     ws_rows = openpyxl_dataframe_to_rows(df, index=False, header=header)
+    row_nb = 0
     for idx_row, row in enumerate(ws_rows):
         ws.append(row)
-        ws = color_row(ws, idx_row, cell_colors)
+        row_nb = ws.max_row if idx_row==0 else row_nb + 1
+        row_cells = [ws.cell(row=row_nb, column=col_idx + xl_idx_base)
+                     for col_idx in range(len(row))]
+        ws = color_row(ws, idx_row, cell_colors, row_cells=row_cells)
 
     # Setting cell alignment and border in ws
     ws = align_cell(ws, df_cols_list, col_attr_dict, xl_idx_base)
@@ -983,7 +1132,8 @@ def format_page(df, df_title, wb=None, header=True,
     return wb, ws
 
 
-def format_wb_sheet(sheet_name, df, df_title, wb, first, idx_wrap=None):
+def format_wb_sheet(sheet_name, df, df_title, wb, first, idx_wrap=None,
+                    cell_colors=None):
     """Formats impact-factors (IFs) sheet in the 'wb' openpyxl workbook 
     as first sheet of the workbook if first is True.
 
@@ -1000,21 +1150,26 @@ def format_wb_sheet(sheet_name, df, df_title, wb, first, idx_wrap=None):
         first (bool): True if the sheet to add is the first of the workbook.
         idx_wrap (int): The optional maximum index of the rows \
         for which text is wraped in the last column.
+        cell_colors (list): List of openpyxl.PatternFill objects \
+        (default = None).
     Returns:
         (openpyxl workbook): The updated workbook with the 'sheet_name' sheet.
     """
     if first:
-        wb, ws = format_page(df, df_title, wb=wb, idx_wrap=idx_wrap)
+        wb, ws = format_page(df, df_title, wb=wb, idx_wrap=idx_wrap,
+                             cell_colors=cell_colors)
         ws.title = sheet_name
     else:
         wb.create_sheet(sheet_name)
         wb.active = wb[sheet_name]
-        wb, ws = format_page(df, df_title, wb=wb, idx_wrap=idx_wrap)
+        wb, ws = format_page(df, df_title, wb=wb, idx_wrap=idx_wrap,
+                             cell_colors=cell_colors)
     return wb
 
 
 def save_formatted_df_to_xlsx(save_path, item_filename, item_df,
-                              item_df_title, sheet_name, idx_wrap=None):
+                              item_df_title, sheet_name, idx_wrap=None,
+                              write_only=False):
     """Formats the 'item_df' dataframe through `format_page` function imported 
     from the `bmfuncts.format_files` module and saves it as xlsx workbook.
 
@@ -1028,9 +1183,12 @@ def save_formatted_df_to_xlsx(save_path, item_filename, item_df,
         sheet_name (str): 4-digits IFs sheet-name. 
         idx_wrap (int): The optional maximum index of the rows \
         for which text is wraped in the last column.
+        write_only (bool): If true, the formatting is done in a single \
+        streaming pass of a write-only workbook (default = False).
     """
     item_xlsx_file = item_filename
     item_xlsx_path = save_path / Path(item_xlsx_file)
-    wb, ws = format_page(item_df, item_df_title, idx_wrap=idx_wrap)
+    wb, ws = format_page(item_df, item_df_title, idx_wrap=idx_wrap,
+                         write_only=write_only)
     ws.title = sheet_name
     wb.save(item_xlsx_path)
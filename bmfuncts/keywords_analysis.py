@@ -11,6 +11,7 @@ from pathlib import Path
 
 # 3rd party imports
 import BiblioParsing as bp
+import numpy as np
 import pandas as pd
 
 # Local imports
@@ -23,6 +24,61 @@ from bmfuncts.useful_functs import read_final_pub_list_data
 from bmfuncts.useful_functs import set_saved_results_path
 
 
+def _build_depts_kw_weights_df(institute, analysis_df, kw_df, cols_tup):
+    """Builds the weights of the keywords (KWs) of 'kw_df' for each department 
+    of the Institute including itself in a single pass.
+
+    This is done through the following steps:
+
+    1. Builds the table of the publications KWs with one row per KW \
+    by splitting and exploding the KWs of 'kw_df' dataframe;
+    2. Builds the publication-IDs per department membership data from \
+    'analysis_df' dataframe with the publication IDs normalized \
+    by removing the 4 first characters corresponding to the corpus year \
+    in order to make them comparable to 'parsing_pub_id_col' values;
+    3. Computes the number of occurrences of each KW for all the departments \
+    at once by a grouped count on the KWs table joined to the membership data.
+
+    Args:
+        institute (str): Institute name.
+        analysis_df (dataframe): Publications list to be analyzed.
+        kw_df (dataframe): Keywords list to be analyzed.
+        cols_tup (tup): Tuple = (list of column name for each department of the Institute, \
+        publication-IDs column name in 'analysis_df' dataframe, \
+        publication-IDs column name in 'kw_df' dataframe, \
+        keywords column name).
+    Returns:
+        (dataframe): The KWs weights with one row per KW sorted by KW \
+        and one column per department including the Institute.
+    """
+    # Setting useful column names aliases
+    depts_col_list, final_pub_id_col, parsing_pub_id_col, keywords_col = cols_tup
+    all_depts_list = [institute] + depts_col_list
+
+    # Building the table of the publications keywords with one row per keyword
+    pub_kw_df = kw_df[[parsing_pub_id_col, keywords_col]].copy()
+    pub_kw_df[keywords_col] = [[word.strip() for word in keyword.split(";")]
+                               for keyword in pub_kw_df[keywords_col]]
+    pub_kw_df = pub_kw_df.explode(keywords_col, ignore_index=True)
+
+    # Building the membership of the normalized pub IDs to each department
+    norm_pub_ids = [int(x[5:8]) for x in analysis_df[final_pub_id_col].tolist()]
+    membership_df = pd.DataFrame(analysis_df[depts_col_list].eq(1).to_numpy(),
+                                 columns=depts_col_list)
+    membership_df.insert(0, institute, True)
+    membership_df[parsing_pub_id_col] = norm_pub_ids
+    membership_df = membership_df.groupby(parsing_pub_id_col)[all_depts_list].any()
+
+    # Counting the keywords occurrences for all departments at once
+    pub_kw_df = pub_kw_df[pub_kw_df[parsing_pub_id_col].isin(membership_df.index)]
+    dept_membership_df = membership_df.loc[pub_kw_df[parsing_pub_id_col]]
+    dept_membership_df.index = pub_kw_df[keywords_col].to_numpy()
+    kw_weights_df = dept_membership_df.groupby(level=0, sort=False).sum()
+    sorted_kw_list = sorted(kw_weights_df.index)
+    kw_weights_df = kw_weights_df.loc[sorted_kw_list]
+    return kw_weights_df
+
+
 def _create_kw_analysis_data(institute, year, analysis_df, kw_type, kw_df, cols_tup,
                              kw_analysis_folder_path, verbose=False):
     """Creates publications-keywords (KW) data for the 'kw_type' KW type 
@@ -30,14 +86,12 @@ def _create_kw_analysis_data(institute, year, analysis_df, kw_type, kw_df, cols_
 
     This is done through the following steps:
 
-    1. Builds the list of publication IDs of the department \
-    extracted from the 'analysis_df' dataframe;
-    2. Builds the list of KWs for the 'kw_type' KW type extracted \
-    from the 'kw_df' dataframe using the built list of publication IDs \
-    of the department;
-    3. Builds the 'dept_kw_df' dataframe by computing the number \
-    of occurences of each KW in the built list of KWs;
-    4. Saves the 'dept_kw_df' dataframe as openpyxl workbook using the \
+    1. Builds the weights of the KWs for the 'kw_type' KW type for all \
+    the departments at once through the `_build_depts_kw_weights_df` \
+    internal function;
+    2. Builds the 'dept_kw_df' dataframe of each department by selecting \
+    the KWs of the department from the built weights;
+    3. Saves the 'dept_kw_df' dataframe as openpyxl workbook using the \
     `format_page` function imported from the `bmfuncts.format_files` \
     module.
 
@@ -58,40 +112,25 @@ def _create_kw_analysis_data(institute, year, analysis_df, kw_type, kw_df, cols_
     # Setting useful column names aliases
     depts_col_list, final_pub_id_col, parsing_pub_id_col, keywords_col, weight_col = cols_tup
 
+    # Building the keywords weights of all the departments for the keywords type 'kw_type'
+    weights_cols_tup = (depts_col_list, final_pub_id_col, parsing_pub_id_col, keywords_col)
+    kw_weights_df = _build_depts_kw_weights_df(institute, analysis_df, kw_df,
+                                               weights_cols_tup)
+
     # Analyzing the keywords for each of the department in 'depts_col_list'
     for dept in [institute] + depts_col_list:
-        # Collecting and normalizing all the Pub_ids of the department 'dept'
-        # by removing the 4 first characters corresponding to the corpus "year"
-        # in order to make them comparable to 'parsing_pub_id_col' values
-        if dept != institute:
-            raw_pub_id_list = analysis_df[analysis_df[dept] == 1][final_pub_id_col].tolist()
-            dept_pub_id_list = [int(x[5:8]) for x in raw_pub_id_list]
-        else:
-            dept_pub_id_list = [int(x[5:8]) for x in analysis_df[final_pub_id_col].tolist()]
-
-        # Building the list of keywords for the keywords type 'kw_type' and the department 'dept'
-        dept_kw_list = []
-        for _, row in kw_df.iterrows():
-            pub_id = row[parsing_pub_id_col]
-            keyword = row[keywords_col]
-            if pub_id in dept_pub_id_list:
-                pub_kw_list = [word.strip() for word in keyword.split(";")]
-                dept_kw_list = dept_kw_list + pub_kw_list
-
         # Building a dataframe with the keywords and their weight for the keywords type 'kw_type'
         # and the department 'dept'
-        dept_kw_df = pd.DataFrame(columns=[keywords_col, weight_col])
-        dept_kw_set_to_list = sorted(list(set(dept_kw_list)))
-        kw_drop = 0
-        for idx, keyword in enumerate(dept_kw_set_to_list):
-            if len(keyword) > 1:
-                dept_kw_df.loc[idx, keywords_col] = keyword
-                dept_kw_df.loc[idx, weight_col] = dept_kw_list.count(keyword)
-            else:
-                kw_drop += 1
+        dept_weights = kw_weights_df[dept]
+        dept_weights = dept_weights[dept_weights > 0]
+        long_kw_mask = np.array([len(keyword) > 1 for keyword in dept_weights.index],
+                                dtype=bool)
+        dept_kw_df = pd.DataFrame({keywords_col: dept_weights.index[long_kw_mask],
+                                   weight_col: dept_weights.to_numpy()[long_kw_mask]})
+        kw_drop = len(dept_weights) - len(dept_kw_df)
         if kw_drop and dept == institute:
             print(f"    WARNING: {kw_drop} dropped keywords of 1 character "
-                  f"among {len(dept_kw_set_to_list)} {kw_type} ones of {institute}")
+                  f"among {len(dept_weights)} {kw_type} ones of {institute}")
 
         # Saving the keywords dataframe as EXCEL file
         dept_xlsx_file_path = Path(kw_analysis_folder_path) / Path(f'{dept} {year}-{kw_type}.xlsx')
@@ -193,8 +232,12 @@ def keywords_analysis(institute, org_tup, bibliometer_path, datatype,
     if progress_callback:
         progress_callback(15)
 
-    # Getting the dict of deduplication results
-    dedup_parsing_dict = get_final_dedup(bibliometer_path, saved_results_path, year)
+    # Getting the dict of deduplication results restricted to the keywords data
+    kw_cols_list = [parsing_pub_id_col_alias, keywords_col_alias]
+    kw_columns_dict = dict.fromkeys([auth_kw_item_alias, index_kw_item_alias,
+                                     title_kw_item_alias], kw_cols_list)
+    dedup_parsing_dict = get_final_dedup(bibliometer_path, saved_results_path, year,
+                                         columns_dict=kw_columns_dict)
     if progress_callback:
         progress_callback(25)
 
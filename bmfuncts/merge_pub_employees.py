@@ -7,14 +7,18 @@ of the Institute taking care of:
 
 """
 
-__all__ = ['recursive_year_search']
+__all__ = ['adapt_depth_search',
+           'recursive_year_search',
+          ]
 
 
 # Standard Library imports
+import re
 import warnings
 from pathlib import Path
 
 # 3rd party imports
+import numpy as np
 import pandas as pd
 import BiblioParsing as bp
 
@@ -22,8 +26,20 @@ import BiblioParsing as bp
 import bmfuncts.employees_globals as eg
 import bmfuncts.pub_globals as pg
 from bmfuncts.build_pub_authors import build_institute_pubs_authors
+from bmfuncts.build_year_pub_empl import build_empl_index
+from bmfuncts.build_year_pub_empl import build_fuzzy_orphan_df
 from bmfuncts.build_year_pub_empl import build_submit_df
-from bmfuncts.create_hash_id import create_hash_id
+from bmfuncts.build_year_pub_empl import build_years_submit_df
+from bmfuncts.create_hash_id import build_hash_id_dfs
+from bmfuncts.dfs_utils import DfsAccumulator
+from bmfuncts.dfs_utils import read_as_xlsx
+from bmfuncts.merge_state import build_merge_inputs_key
+from bmfuncts.merge_state import build_pub_keys_df
+from bmfuncts.merge_state import get_reused_merge_results
+from bmfuncts.merge_state import read_merge_state
+from bmfuncts.merge_state import save_merge_state
+from bmfuncts.merge_state import set_merge_results_dtypes
+from bmfuncts.merge_state import set_merge_results_order
 from bmfuncts.rename_cols import build_col_conversion_dic
 from bmfuncts.useful_functs import concat_dfs
 from bmfuncts.useful_functs import keep_initials
@@ -32,7 +48,92 @@ from bmfuncts.useful_functs import standardize_full_name_order
 from bmfuncts.useful_functs import standardize_txt
 
 
-def _add_author_job_type(in_path, out_path, empl_dict, years):
+def _build_job_types_classifiers(author_types_dic):
+    """Compiles the keywords rules of each job-types dict into a single regex.
+
+    For each column, the regex contains one optional lookahead group per job type \
+    so that a single search gives all the job types which keywords are found \
+    in the column value.
+
+    Args:
+        author_types_dic (dict): Dict keyed by column names and valued by \
+        the job-types dicts keyed by job types and valued by keywords lists.
+    Returns:
+        (dict): Dict keyed by column names and valued by tuples (compiled regex, \
+        list of the job types ordered as the regex groups).
+    """
+    classifiers_dict = {}
+    for col_name, dic in author_types_dic.items():
+        groups_list = []
+        for values_list in dic.values():
+            values_pattern = "|".join(re.escape(value) for value in values_list)
+            groups_list.append(f"(?:(?=.*?({values_pattern})))?")
+        regex = re.compile("^" + "".join(groups_list), re.DOTALL)
+        classifiers_dict[col_name] = (regex, list(dic.keys()))
+    return classifiers_dict
+
+
+def _get_job_types_matches(df, classifiers_dict):
+    """Gets the job types matching the values of the columns of 'df' \
+    using the classifiers built by the `_build_job_types_classifiers` \
+    internal function.
+
+    Args:
+        df (dataframe): Data containing the columns of the classifiers.
+        classifiers_dict (dict): Dict keyed by column names and valued by \
+        tuples (compiled regex, list of the job types ordered as the regex groups).
+    Returns:
+        (list): List of tuples (job type, boolean series of the matching rows) \
+        ordered as the columns and then as the job types.
+    """
+    matches_list = []
+    for col_name, (regex, keys_list) in classifiers_dict.items():
+        # Classifying only the distinct values of the column
+        col_values = df[col_name].astype(str)
+        uniq_values = pd.Series(col_values.unique(), dtype=object)
+        uniq_matches_df = uniq_values.str.extract(regex)
+        for idx, key in enumerate(keys_list):
+            key_values = uniq_values[uniq_matches_df[idx].notna()]
+            matches_list.append((key, col_values.isin(key_values)))
+    return matches_list
+
+
+def _build_mat_job_types(empl_dict, years, classifiers_dict):
+    """Builds the lookup table of job types keyed by employee matricule.
+
+    For each year, the job type of an employee is the last job type \
+    matching its first row in the employees data, "FIN" by default. \
+    The job type retained is the one of the first year of 'years' \
+    for which it is not "FIN".
+
+    Args:
+        empl_dict (dict): The employees database as a dict keyed by the years \
+        and valued by the employees data for each year.
+        years (list): The years list for recursive search in the employees database.
+        classifiers_dict (dict): Dict keyed by column names and valued by \
+        tuples (compiled regex, list of the job types ordered as the regex groups).
+    Returns:
+        (dict): Dict keyed by matricules and valued by job types.
+    """
+    # Setting useful aliases
+    mat_col_alias = eg.EMPLOYEES_USEFUL_COLS['matricule']
+
+    years_types_list = []
+    for year in years:
+        year_empl_df = empl_dict[year].drop_duplicates(subset=[mat_col_alias], keep='first')
+        year_types = pd.Series("FIN", index=year_empl_df.index)
+        for key, matches in _get_job_types_matches(year_empl_df, classifiers_dict):
+            year_types = year_types.mask(matches, key)
+        year_types.index = year_empl_df[mat_col_alias]
+        years_types_list.append(year_types[year_types!="FIN"])
+    if not years_types_list:
+        return {}
+    mat_types = pd.concat(years_types_list)
+    mat_types = mat_types[~mat_types.index.duplicated(keep='first')]
+    return mat_types.to_dict()
+
+
+def _add_author_job_type(submit_df, empl_dict, years):
     """Adds a new column containing the job type for each author 
     of the publications list with one row per author.
 
@@ -40,53 +141,20 @@ def _add_author_job_type(in_path, out_path, empl_dict, years):
     in 3 columns which names are given by 'category_col_alias', 
     'status_col_alias' and 'qualification_col_alias'. 
     The name of the new column is given by 'author_type_col_alias'. 
-    The updated publications list is saved as xlsx file.
+    For employees, the job type is got from a lookup table keyed by matricule 
+    built once through the `_build_mat_job_types` internal function. 
+    For external authors, the job type is the first one matching 
+    the author information, 'Coll' by default.
 
     Args:
-        in_path (path):  Full path to the file of the publications list \
+        submit_df (dataframe): Data of the publications list \
         with one row per author with attributes as Institute employee.
-        out_path (path): Full path for saving the modified publications list.
         empl_dict (dict): The employees database as a dict keyed by the years \
         and valued by the employees data for each year.
         years (list): The years list for recursive search in the employees database.
     Returns:
-        (str): End message recalling the full path to the saved file of \
-        the modified publications list.
+        (dataframe): The modified publications list.
     """
-    # internal functions:
-    def _get_author_type(row):
-        mat = row[mat_col_alias]
-        if mat!="externe":
-            author_type = '-'
-            years_nb = len(years)
-            year_idx = 0
-            set_author_type = "FIN"
-            while set_author_type=="FIN" and year_idx<years_nb:
-                year_empl_df = empl_dict[years[year_idx]]
-                year_mat_df = year_empl_df[year_empl_df[mat_col_alias]==str(mat)]
-                for col_name, dic in author_types_dic.items():
-                    mat_value = ""
-                    if not year_mat_df[col_name].empty:
-                        mat_value = list(year_mat_df[col_name])[0]
-                    for key, values_list in dic.items():
-                        values_status = [True for value in values_list if value in mat_value]
-                        if any(values_status):
-                            set_author_type = key
-                year_idx += 1
-            author_type = set_author_type
-        else:
-            author_type = 'Coll'
-            for col_name, dic in author_types_dic.items():
-                mat_value = row[col_name]
-                for key, values_list in dic.items():
-                    values_status = [True for value in values_list if value in mat_value]
-                    if any(values_status):
-                        author_type = key
-                        break
-                if author_type!='Coll':
-                    break
-        return author_type
-
     # Setting useful aliases
     mat_col_alias = eg.EMPLOYEES_USEFUL_COLS['matricule']
     category_col_alias = eg.EMPLOYEES_USEFUL_COLS['category']
@@ -98,15 +166,25 @@ def _add_author_job_type(in_path, out_path, empl_dict, years):
                         status_col_alias        : eg.STATUS_DIC,
                         qualification_col_alias : eg.QUALIFICATION_DIC}
 
-    # Read of the xlsx file with dates conversion through EMPLOYEES_CONVERTERS_DIC
-    submit_df = pd.read_excel(in_path, converters=eg.EMPLOYEES_CONVERTERS_DIC)
+    # Building job-types classifiers and lookup table of employees job type
+    classifiers_dict = _build_job_types_classifiers(author_types_dic)
+    mat_types_dict = _build_mat_job_types(empl_dict, years, classifiers_dict)
 
-    submit_df[author_type_col_alias] = submit_df.apply(_get_author_type, axis=1)
+    # Setting job type of employees
+    author_types = submit_df[mat_col_alias].map(str).map(mat_types_dict).fillna("FIN")
 
-    submit_df.to_excel(out_path, index=False)
+    # Setting job type of external authors with the first matching job type
+    extern_mask = submit_df[mat_col_alias]=="externe"
+    if extern_mask.any():
+        extern_df = submit_df[extern_mask]
+        extern_types = pd.Series('Coll', index=extern_df.index)
+        matches_list = _get_job_types_matches(extern_df, classifiers_dict)
+        for key, matches in reversed(matches_list):
+            extern_types = extern_types.mask(matches, key)
+        author_types[extern_mask] = extern_types
 
-    end_message = f"Column with author job type added in file: \n  '{out_path}'"
-    return end_message
+    submit_df[author_type_col_alias] = author_types
+    return submit_df
 
 
 def _set_full_ref(title, first_author, journal_name, pub_year, doi):
@@ -130,7 +208,7 @@ def _set_full_ref(title, first_author, journal_name, pub_year, doi):
     return full_ref
 
 
-def _add_biblio_list(in_path, out_path):
+def _add_biblio_list(submit_df):
     """Adds a new column containing the full reference of each publication 
     of the publications list with one row per author.
 
@@ -139,15 +217,12 @@ def _add_biblio_list(in_path, out_path):
     These items are got from the columns which names are given by 
     'pub_title_alias', 'pub_first_author_alias', 'pub_year_alias', 
     'pub_journal_alias' and 'pub_doi_alias', respectively. 
-    The name of the new column is given by 'pub_full_ref_alias'. 
-    The updated publications list is saved as an xlsx file.
+    The name of the new column is given by 'pub_full_ref_alias'.
 
     Args:
-        in_path (path): Full path to the xlsx file of the publications list.
-        out_path (path): Full path for saving the modified publications list.
+        submit_df (dataframe): Data of the publications list.
     Returns:
-        (str): End message recalling the full path to the saved file \
-        of the modified publications list.
+        (dataframe): The modified publications list.
     """
 
     # Setting useful aliases
@@ -159,10 +234,7 @@ def _add_biblio_list(in_path, out_path):
     pub_title_alias = bp.COL_NAMES['articles'][9]
     pub_full_ref_alias = pg.COL_NAMES_BONUS['liste biblio']
 
-    # Read of the xlsx file with dates convertion through EMPLOYEES_CONVERTERS_DIC
-    submit_df = pd.read_excel(in_path, converters=eg.EMPLOYEES_CONVERTERS_DIC)
-
-    articles_plus_full_ref_df = pd.DataFrame()
+    articles_plus_full_ref_dfs = DfsAccumulator()
     # Splitting the frame into subframes with same Pub_id
     for _, pub_id_df in submit_df.groupby(pub_id_alias):
         # Select the first row and build the full reference
@@ -175,14 +247,12 @@ def _add_biblio_list(in_path, out_path):
         doi = str(pub_id_first_row[pub_doi_alias])
         pub_id_df[pub_full_ref_alias] = _set_full_ref(title, first_author,
                                                       journal_name, pub_year, doi)
-        articles_plus_full_ref_df = concat_dfs([articles_plus_full_ref_df, pub_id_df])
-    articles_plus_full_ref_df.to_excel(out_path, index=False)
+        articles_plus_full_ref_dfs.append(pub_id_df)
+    articles_plus_full_ref_df = articles_plus_full_ref_dfs.get_df()
+    return articles_plus_full_ref_df
 
-    end_message = f"Column with full reference of publication added in file: \n  '{out_path}'"
-    return end_message
 
-
-def _add_ext_docs(submit_path, orphan_path, ext_docs_path):
+def _add_ext_docs(init_submit_df, init_orphan_df, ext_docs_path):
     """Adds to the publications-list dataframe with one row per author 
     new rows containing the information of specific authors.
 
@@ -191,13 +261,12 @@ def _add_ext_docs(submit_path, orphan_path, ext_docs_path):
     the xlsx file which full path is given by 'ext_docs_path' in sheet which 
     name is given by 'ext_docs_sheet_name_alias'. 
     The row of the added PhD students is dropped in the publications list 
-    with one row per author that has not been identified as Institute employee. 
-    The new publications lists are saved as an xlsx files.
+    with one row per author that has not been identified as Institute employee.
 
     Args:
-        submit_path (path): Full path to the xlsx file of the publications list \
+        init_submit_df (dataframe): Data of the publications list \
         with one row per author with attributes as Institute employee.
-        orphan_path (path): Full path to the xlsx file of the publications list \
+        init_orphan_df (dataframe): Data of the publications list \
         with one row per author that has not been identified as Institute employee.
         ext_docs_path (path): Full path to the xlsx file giving the PhD students \
         at the Institute but not employees of it.
@@ -226,11 +295,6 @@ def _add_ext_docs(submit_path, orphan_path, ext_docs_path):
     orphan_full_name_alias = pg.COL_NAMES_BM['Full_name']
     orphan_last_name_alias = pg.COL_NAMES_BM['Last_name']
 
-    # Reading of the existing submit xlsx file of the corpus year
-    # with dates conversion through converters_alias
-    init_submit_df = pd.read_excel(submit_path, converters=converters_alias)
-    init_orphan_df = pd.read_excel(orphan_path, converters=converters_alias)
-
     # Replace in "init_submit_df" and "init_orphan_df" NaN values "NA" in first name initials
     init_submit_df = keep_initials(init_submit_df, firstname_initials_col_base_alias,
                                    missing_fill=bp.UNKNOWN)
@@ -323,15 +387,11 @@ def _add_ext_docs(submit_path, orphan_path, ext_docs_path):
                                  firstname_initials_col_base_alias}
     new_orphan_df = new_orphan_df.rename(columns=col_invert_rename_dic)
 
-    # Saving new_submit_df and new_orphan_df replacing init_submit_df and init_submit_df
-    new_submit_df.to_excel(submit_path, index=False)
-    new_orphan_df.to_excel(orphan_path, index=False)
-
     print("    External PhD students added")
     return (new_submit_df, new_orphan_df)
 
 
-def _add_other_ext(submit_path, orphan_path, others_path):
+def _add_other_ext(init_submit_df, init_orphan_df, others_path):
     """Adds to the publications-list dataframe with one row per author 
     new rows containing the information of specific authors.
 
@@ -340,13 +400,12 @@ def _add_other_ext(submit_path, orphan_path, others_path):
     the xlsx file which full path is given by 'others_path' in sheet which 
     name is given by 'others_sheet_name_alias'. 
     The row of the added employees is dropped in the publications list 
-    with one row per author that has not been identified as Institute employee. 
-    The new publications lists are saved as an xlsx files.
+    with one row per author that has not been identified as Institute employee.
 
     Args:
-        submit_path (path): Full path to the xlsx file of the publications list \
+        init_submit_df (dataframe): Data of the publications list \
         with one row per author with attributes as Institute employee.
-        orphan_path (path): Full path to the xlsx file of the publications list \
+        init_orphan_df (dataframe): Data of the publications list \
         with one row per author that has not been identified as Institute employee.
         others_path (path): Full path to the xlsx file giving the employees \
         under external hiring contract at the Institute.
@@ -375,11 +434,6 @@ def _add_other_ext(submit_path, orphan_path, others_path):
     orphan_full_name_alias = pg.COL_NAMES_BM['Full_name']
     orphan_last_name_alias = pg.COL_NAMES_BM['Last_name']
 
-    # Reading of the existing submit xlsx file of the corpus year
-    # with dates conversion through converters_alias
-    init_submit_df = pd.read_excel(submit_path, converters=converters_alias)
-    init_orphan_df = pd.read_excel(orphan_path, converters=converters_alias)
-
     # Replace in "init_submit_df" and "init_orphan_df" NaN values "NA" in first name initials
     init_submit_df = keep_initials(init_submit_df, firstname_initials_col_base_alias,
                                    missing_fill=bp.UNKNOWN)
@@ -473,17 +527,13 @@ def _add_other_ext(submit_path, orphan_path, others_path):
                                  firstname_initials_col_base_alias}
     new_orphan_df = new_orphan_df.rename(columns=col_invert_rename_dic)
 
-    # Saving new_submit_df and new_orphan_df replacing init_submit_df and init_submit_df
-    new_submit_df.to_excel(submit_path, index=False)
-    new_orphan_df.to_excel(orphan_path, index=False)
-
     print("    Other external collaborators added")
     return (new_submit_df, new_orphan_df)
 
 
-def _change_col_names(institute, org_tup, submit_path, orphan_path):
-    """Sets new column names to the files pointed by 'submit_path' 
-    and 'orphan_path' paths.
+def _change_col_names(institute, org_tup, submit_df, orphan_df):
+    """Sets new column names to the publications lists 'submit_df' 
+    and 'orphan_df'.
 
     For that it uses the `build_col_conversion_dic` function 
     imported from `bmfuncts.rename_cols` module.
@@ -491,12 +541,12 @@ def _change_col_names(institute, org_tup, submit_path, orphan_path):
     Args:
         institute (str): Institute name.
         org_tup (tup): Contains Institute parameters.
-        submit_path (path): Full path to the xlsx file of the publications list \
+        submit_df (dataframe): Data of the publications list \
         with one row per author with attributes as Institute employee.
-        orphan_path (path): Full path to the xlsx file of the publications list \
+        orphan_df (dataframe): Data of the publications list \
         with one row per author that has not been identified as Institute employee.
     Returns:
-        (str): End message recalling the full paths to the modified files.        
+        (tup): (renamed 'submit_df' dataframe, renamed 'orphan_df' dataframe).
     """
 
     #  Setting useful col names
@@ -504,26 +554,12 @@ def _change_col_names(institute, org_tup, submit_path, orphan_path):
     orphan_col_rename_dic = col_rename_tup[0]
     submit_col_rename_dic = col_rename_tup[1]
 
-    # Read of the 'submit' file with dates convertion through EMPLOYEES_CONVERTERS_DIC
-    submit_df = pd.read_excel(submit_path, converters=eg.EMPLOYEES_CONVERTERS_DIC,
-                              keep_default_na=False)
     submit_df = submit_df.rename(columns=submit_col_rename_dic)
-
-    # Resaving submit_df
-    submit_df.to_excel(submit_path, index=False)
-
-    # Read of the 'orphan' file
-    orphan_df = pd.read_excel(orphan_path, keep_default_na=False)
     orphan_df = orphan_df.rename(columns=orphan_col_rename_dic)
-
-    # Resaving orphan_df
-    orphan_df.to_excel(orphan_path, index=False)
-
-    end_message = f"Column renamed in files: \n  '{submit_path}' \n  '{orphan_path}' "
-    return end_message
+    return submit_df, orphan_df
 
 
-def _split_orphan(org_tup, working_folder_path, orphan_file_name, verbose=False):
+def _split_orphan(org_tup, working_folder_path, orphan_file_name, orphan_df, verbose=False):
     """Splits the publications list with one row per author that has not been identified 
     as Institute employees.
 
@@ -533,43 +569,36 @@ def _split_orphan(org_tup, working_folder_path, orphan_file_name, verbose=False)
     the Institute, are dropped from the initial publications list with one row 
     per author that has not been identified as Institute employees. The lists 
     resulting from the split are saved as xlsx files in the folder which full path 
-    is given by 'orphan_path'.
+    is given by 'working_folder_path'.
 
     Args:
         org_tup (tup): Contains Institute parameters.
         working_folder_path (path): Full path to working folder.
         orphan_file_name (str): File name of the xlsx file of the publications list \
         with one row per author that has not been identified as Institute employee.
+        orphan_df (dataframe): Data of the publications list with one row per author \
+        that has not been identified as Institute employee.
         verbose (bool): Status of prints (default = False).
     Returns:
-        (bool): The empty status of the publications list with authors \
-        not found in the employees database.
+        (tup): (The empty status (bool) of the publications list with authors \
+        not found in the employees database, the publications list (dataframe) \
+        with authors not found in the employees database after drop of the lists \
+        identified by 'orphan_drop_dict').
     """
 
     # Internal function
     def _save_inst_col_df(inst_col, df_to_save):
-        if inst_col=="all_undrop":
-            file_path = orphan_path
-        else:
-            file_name = inst_col + "_" + orphan_file_name
-            file_path = working_folder_path / Path(file_name)
+        file_name = inst_col + "_" + orphan_file_name
+        file_path = working_folder_path / Path(file_name)
         df_to_save.to_excel(file_path, index=False)
         message = f"    File of orphan authors created for Institute subdivision: {inst_col}"
         if verbose:
             print(message)
 
-    # Setting useful aliases
-    converters_alias = eg.EMPLOYEES_CONVERTERS_DIC
-
     # Setting useful column names list and droping status
     inst_col_list = org_tup[4]
     orphan_drop_dict = org_tup[10]
 
-    # Reading of the existing orphan xlsx file
-    # with dates conversion through converters_alias
-    orphan_path = working_folder_path / Path(orphan_file_name)
-    orphan_df = pd.read_excel(orphan_path, converters=converters_alias, keep_default_na=False)
-
     # Creating, and saving as an xlsx file, orphan authors for each Institute subdivision
     institute_df = orphan_df.copy()
     new_orphan_df = orphan_df.copy()
@@ -583,14 +612,13 @@ def _split_orphan(org_tup, working_folder_path, orphan_file_name, verbose=False)
         if orphan_drop_dict[inst_col]:
             new_orphan_df = new_orphan_df.drop(inst_col_df.index)
     _save_inst_col_df(inst_col_list[0], institute_df)
-    _save_inst_col_df("all_undrop", new_orphan_df)
 
     # Updating orphab status
     orphan_status = new_orphan_df.empty
-    return orphan_status
+    return orphan_status, new_orphan_df
 
 
-def _adapt_depth_search(empl_dict, corpus_year, search_depth):
+def adapt_depth_search(empl_dict, corpus_year, search_depth):
     """Sets the list of years for recursive search of author-employee match.
 
     Args: 
@@ -612,7 +640,8 @@ def _adapt_depth_search(empl_dict, corpus_year, search_depth):
 def recursive_year_search(out_path, empl_dict, institute, org_tup,
                           bibliometer_path, datatype, corpus_year, search_depth,
                           progress_callback=None, progress_bar_state=None,
-                          set_test_case="No test", set_test_name="No name"):
+                          set_test_case="No test", set_test_name="No name",
+                          in_memory=True, incremental=False, fuzzy_orphans=False):
     """Searches in the employees database of the Institute the information for the authors 
     of the publications of a corpus.
 
@@ -625,7 +654,9 @@ def recursive_year_search(out_path, empl_dict, institute, org_tup,
     2. The 'submit_df' dataframe of the publications list containing all matches \
     between Institute authors and employee names is initialized using the most recent year \
     of the employees database through the `build_submit_df` function imported from \
-    `bmfuncts.build_year_pub_empl` module; this is done together with the initialization \
+    `bmfuncts.build_year_pub_empl` module using the indexes of the employees data \
+    built once per year through the `build_empl_index` function imported from \
+    the same module; this is done together with the initialization \
     of 'orphan_df' dataframe of the publications list with authors not found in the \
     employees database; these two dataframes contains one row per author of each publication.
     3. New rows containing the information of authors that are PhD students \
@@ -635,22 +666,47 @@ def recursive_year_search(out_path, empl_dict, institute, org_tup,
     contract at the Institute are added through the `_add_other_ext` internal function \
     updating 'submit_df' and 'orphan_df' dataframes.
     5. The 'submit_df' and 'orphan_df' dataframes are updated by search in the employees \
-    database through the `build_submit_df` function using recursively items from \
-    'years' list for the search year.
+    database of all the years of 'years' list in a single pass through \
+    the `build_years_submit_df` function imported from the same module, \
+    keeping for each author the match of the most recent year.
     6. The dataframes are refactored by replacing NaN values by the UNKNOWN global and \
     modifying the publications IDs through the `set_year_pub_id` function imported from \
-    the `bmfuncts.useful_functs`module. Then they are saved as xlsx files which full \
-    paths are given by 'submit_path' and 'orphan_path', respectively.
-    7. A new column containing the job type for each author is added in the file which \
-    full path is given by 'submit_path' through the `_add_author_job_type` internal function.
+    the `bmfuncts.useful_functs`module.
+    7. A new column containing the job type for each author is added to 'submit_df' \
+    through the `_add_author_job_type` internal function.
     8. A new column containing the full reference of each publication is added \
-    in the file which full path is given by 'submit_path' through the `_add_biblio_list` \
-    internal function.
-    9. Column names are changed in the two files which full path are given by respectively, \
-    'submit_path' and 'orphan_path' through the `_change_col_names` internal function.    
-    10. An xlsx file containing the unique hash ID built for each publication \
-    is created through the `create_hash_id` function imported from "bmfuncts.create_hash_id" \
-    module.
+    to 'submit_df' through the `_add_biblio_list` internal function.
+    9. Column names are changed in 'submit_df' and 'orphan_df' through \
+    the `_change_col_names` internal function; then 'orphan_df' is split \
+    in subdivisions of the Institute through the `_split_orphan` internal function \
+    if required by the Institute parameters.
+    10. The unique hash ID of each publication is built through the `build_hash_id_dfs` \
+    function imported from "bmfuncts.create_hash_id" module.
+    11. The 'submit_df' and 'orphan_df' dataframes and the hash IDs data are saved \
+    as xlsx files which full paths are given by 'submit_path', 'orphan_path' \
+    and 'hash_id_path', respectively.
+
+    In the in-memory mode, the dataframes are passed from one step to the next \
+    and the files are saved only once, at the end. Otherwise, the dataframes \
+    are saved as xlsx files and read back between steps as in the initial \
+    file-based pipeline, which allows to check the intermediate files.
+
+    The results of steps 2 to 5 are saved as merge state with the keys \
+    of the publications and the key of the other inputs through the functions \
+    imported from `bmfuncts.merge_state` module. In the incremental mode, \
+    if the other inputs are unchanged, the results of the previous merge \
+    are reused for the publications which hash ID and authors fingerprint \
+    are unchanged and only the new or modified publications \
+    go through steps 2 to 5; the combined results are then ordered \
+    as for a full merge through the `set_merge_results_order` function. \
+    In both modes, the dtypes of the results are then set from their values \
+    through the `set_merge_results_dtypes` function so that the incremental \
+    and full merges give the same results.
+
+    In the fuzzy-orphans mode, near-miss matches of the remaining orphan authors \
+    with the employees are proposed for review through the `build_fuzzy_orphan_df` \
+    function imported from `bmfuncts.build_year_pub_empl` module and saved \
+    in the xlsx file which full path is given by 'proposals_path'.
 
     Args:
         out_path (path): Full path to the folder for saving built dataframes. 
@@ -670,6 +726,12 @@ def recursive_year_search(out_path, empl_dict, institute, org_tup,
         (optional, default = "No test").
         set_test_name (str): Author last-name for testing the `build_submit_df` function \
         (optional, default = "No name").
+        in_memory (bool): If true, the intermediate xlsx files are not saved \
+        (optional, default = True).
+        incremental (bool): If true, the results of the previous merge \
+        are reused for the unchanged publications (optional, default = False).
+        fuzzy_orphans (bool): If true, near-miss matches of the orphan authors \
+        with the employees are proposed for review (optional, default = False).
     Returns:
         (tup): (end_message (str), empty status (bool) of the publications \
         list with authors not found in the employees database).
@@ -678,14 +740,78 @@ def recursive_year_search(out_path, empl_dict, institute, org_tup,
         that are set to NaN by default through the `keep_initials` function \
         imported from "bmfuncts.useful_functs" internal module.
     """
+    # Internal function
+    def _round_trip(df, file_path, **read_kwargs):
+        if in_memory:
+            return read_as_xlsx(df, **read_kwargs)
+        df.to_excel(file_path, index=False)
+        return pd.read_excel(file_path, **read_kwargs)
+
+    def _build_submit_orphan_dfs(pub_df):
+        # Building the initial dataframes
+        print("    Initializing cross pub_employees data")
+        submit_df, orphan_df = build_submit_df(empl_dict[years[0]],
+                                               pub_df, bibliometer_path,
+                                               test_case=set_test_case,
+                                               test_name=set_test_name,
+                                               empl_index=empl_index_dict[years[0]])
+
+        # Saving initial files of submit_df and orphan_df if not in memory
+        submit_df = _round_trip(submit_df, submit_path, converters=converters_alias)
+        orphan_df = _round_trip(orphan_df, orphan_path, converters=converters_alias)
+        if progress_callback:
+            progress_callback(progress_bar_state + step * 20)
+
+        # Adding authors from list of external_phd students
+        submit_df, orphan_df = _add_ext_docs(submit_df, orphan_df, ext_docs_path)
+        submit_df = _round_trip(submit_df, submit_path, converters=converters_alias)
+        orphan_df = _round_trip(orphan_df, orphan_path, converters=converters_alias)
+        if progress_callback:
+            progress_callback(progress_bar_state + step * 25)
+
+        # Adding authors from list of external employees under other hiring contract
+        submit_df, orphan_df = _add_other_ext(submit_df, orphan_df, others_path)
+        submit_stages = np.zeros(len(submit_df), dtype=int)
+        if progress_callback:
+            loop_progress_bar_state = progress_bar_state + step * 30
+            progress_callback(loop_progress_bar_state)
+
+        # Searching the remaining orphans among the employees of all the years at once
+        print(f"    Search among employees of {', '.join(years)}")
+        years_submit_tup = build_years_submit_df(empl_dict, years, orphan_df,
+                                                 bibliometer_path,
+                                                 test_case=set_test_case,
+                                                 test_name=set_test_name,
+                                                 empl_index_dict=empl_index_dict)
+        submit_df_add, orphan_df, add_ranks = years_submit_tup
+
+        # Updating submit_df keeping the merge stage of the added rows
+        submit_df = concat_dfs([submit_df, submit_df_add], dedup=False)
+        submit_stages = np.concatenate([submit_stages, add_ranks + 1])
+        if not submit_df.empty:
+            kept_rows_mask = ~submit_df.duplicated().to_numpy()
+            submit_df = submit_df[kept_rows_mask]
+            submit_stages = submit_stages[kept_rows_mask]
+
+        # Updating progress bar state
+        if progress_callback:
+            loop_progress_bar_state += progress_bar_loop_progression * len(years)
+            progress_callback(loop_progress_bar_state)
+        return submit_df, orphan_df, submit_stages
+
     print(f"\nMerge publications and employees information launched for year {corpus_year}...")
 
     # Setting useful aliases
     pub_id_alias = bp.COL_NAMES['pub_id']
     mat_col_alias = eg.EMPLOYEES_USEFUL_COLS['matricule']
     initials_col_alias = eg.EMPLOYEES_ADD_COLS['first_name_initials']
+    converters_alias = eg.EMPLOYEES_CONVERTERS_DIC
     submit_file_name_alias = pg.ARCHI_YEAR["submit file name"]
     orphan_file_name_alias = pg.ARCHI_YEAR["orphan file name"]
+    hash_id_file_name_alias = pg.ARCHI_YEAR["hash_id file name"]
+    merge_state_file_name_alias = pg.ARCHI_YEAR["merge state file name"]
+    proposals_file_name_alias = pg.ARCHI_YEAR["orphan proposals file name"]
+    proposals_sheet_alias = pg.SHEET_NAMES_ORPHAN["proposals"]
     orphan_treat_alias = pg.ARCHI_ORPHAN["root"]
     adds_file_name_alias = pg.ARCHI_ORPHAN["employees adds file"]
 
@@ -695,6 +821,9 @@ def recursive_year_search(out_path, empl_dict, institute, org_tup,
     # Setting useful paths
     submit_path = out_path / Path(submit_file_name_alias)
     orphan_path = out_path / Path(orphan_file_name_alias)
+    hash_id_path = out_path / Path(hash_id_file_name_alias)
+    merge_state_path = out_path / Path(merge_state_file_name_alias)
+    proposals_path = out_path / Path(proposals_file_name_alias)
     ext_docs_path = bibliometer_path / Path(orphan_treat_alias) / Path(adds_file_name_alias)
     others_path = bibliometer_path / Path(orphan_treat_alias) / Path(adds_file_name_alias)
 
@@ -706,13 +835,16 @@ def recursive_year_search(out_path, empl_dict, institute, org_tup,
     pub_df = keep_initials(pub_df, initials_col_alias, missing_fill=bp.UNKNOWN)
 
     # Setting the years list for recursive search of author-employee match
-    years = _adapt_depth_search(empl_dict, corpus_year, search_depth)
+    years = adapt_depth_search(empl_dict, corpus_year, search_depth)
 
     # Replace in "empl_dict" NaN values by UNKNOWN string except in first name initials
+    # and building once the indexes of the employees data of each year
+    empl_index_dict = {}
     for year in years:
         empl_dict[year] = keep_initials(empl_dict[year], initials_col_alias,
                                         missing_fill=bp.UNKNOWN)
         empl_dict[year] = empl_dict[year].astype({mat_col_alias: 'str'})
+        empl_index_dict[year] = build_empl_index(empl_dict[year])
     if progress_callback:
         step = (100 - progress_bar_state) / 100
         progress_callback(progress_bar_state + step * 10)
@@ -722,59 +854,56 @@ def recursive_year_search(out_path, empl_dict, institute, org_tup,
     # *                 using `empl_dict` files of years                   *
     # *******************************************************************
 
-    # Initializing the dataframes to be built
-    # a Data frame containing all matches between article Institute authors and employee names
-    submit_df = pd.DataFrame()
-    # a Data frame containing containing article Institute authors
-    # not matching with any employee name
-    orphan_df = pd.DataFrame()
-
-    # Building the initial dataframes
-    print("    Initializing cross pub_employees data")
-    submit_df, orphan_df = build_submit_df(empl_dict[years[0]],
-                                           pub_df, bibliometer_path,
-                                           test_case=set_test_case,
-                                           test_name=set_test_name)
-
-    # Saving initial files of submit_df and orphan_df
-    submit_df.to_excel(submit_path, index=False)
-    orphan_df.to_excel(orphan_path, index=False)
-    if progress_callback:
-        progress_callback(progress_bar_state + step * 20)
-
-    # Adding authors from list of external_phd students and saving new submit_df and orphan_df
-    submit_df, orphan_df = _add_ext_docs(submit_path, orphan_path, ext_docs_path)
-    if progress_callback:
-        progress_callback(progress_bar_state + step * 25)
-
-    # Adding authors from list of external employees under other hiring contract
-    # and saving new submit_df and orphan_df
-    submit_df, orphan_df = _add_other_ext(submit_path, orphan_path, others_path)
+    # Getting the reusable results of the previous merge if incremental
+    pub_keys_df = build_pub_keys_df(pub_df)
+    inputs_key = build_merge_inputs_key(pub_df, empl_dict, years, ext_docs_path,
+                                        (set_test_case, set_test_name))
+    reused_tup = (pd.DataFrame(), pd.DataFrame(), np.zeros(0, dtype=int), [])
+    if incremental:
+        merge_state = read_merge_state(merge_state_path, inputs_key)
+        if merge_state:
+            reused_tup = get_reused_merge_results(merge_state, pub_keys_df)
+    reused_submit_df, reused_orphan_df, reused_stages, reused_pub_ids_list = reused_tup
+    new_pub_df = pub_df[~pub_df[pub_id_alias].isin(reused_pub_ids_list)]
+    if incremental:
+        print(f"    {len(set(reused_pub_ids_list))} publications reused from previous merge")
+
+    # Building the merge results of the new or modified publications
     if progress_callback:
-        new_progress_bar_state = progress_bar_state + step * 30
-        progress_callback(new_progress_bar_state)
         progress_bar_loop_progression = step * 50 // len(years)
-
-    for _, year in enumerate(years):
-        print(f"    Search among employees of {year}")
-        # Updating the dataframes submit_df_add and orphan_df
-        submit_df_add, orphan_df = build_submit_df(empl_dict[year],
-                                                   orphan_df,
-                                                   bibliometer_path,
-                                                   test_case=set_test_case,
-                                                   test_name=set_test_name)
-
-        # Updating submit_df and orphan_df
-        submit_df = concat_dfs([submit_df, submit_df_add])
-
-        # Updating progress bar state
-        if progress_callback:
-            new_progress_bar_state += progress_bar_loop_progression
-            progress_callback(new_progress_bar_state)
-
-    # *************************************************************************************
-    # * Saving results in 'submit_file_name_alias' file and 'orphan_file_name_alias' file *
-    # *************************************************************************************
+        new_progress_bar_state = progress_bar_state + step * 30 \
+                                 + progress_bar_loop_progression * len(years)
+    if new_pub_df.empty:
+        submit_df, orphan_df = pd.DataFrame(), pd.DataFrame()
+        submit_stages = np.zeros(0, dtype=int)
+    else:
+        submit_df, orphan_df, submit_stages = _build_submit_orphan_dfs(new_pub_df)
+
+    # Combining the reused and the new merge results
+    if reused_pub_ids_list:
+        submit_df = concat_dfs([reused_submit_df, submit_df], dedup=False)
+        orphan_df = concat_dfs([reused_orphan_df, orphan_df], dedup=False)
+        submit_stages = np.concatenate([reused_stages, submit_stages])
+        submit_df, orphan_df, submit_stages = set_merge_results_order(submit_df, orphan_df,
+                                                                      submit_stages, pub_df)
+
+    # Setting the dtypes of the merge results from their values
+    submit_df = set_merge_results_dtypes(submit_df)
+    orphan_df = set_merge_results_dtypes(orphan_df)
+
+    # Saving the merge state for the next incremental merge
+    save_merge_state(merge_state_path, inputs_key, pub_keys_df,
+                     (submit_df, orphan_df, submit_stages))
+
+    # Proposing near-miss matches of the orphan authors for review
+    if fuzzy_orphans:
+        proposals_df = build_fuzzy_orphan_df(empl_dict, years, orphan_df)
+        proposals_df.to_excel(proposals_path, sheet_name=proposals_sheet_alias, index=False)
+        print(f"    {len(proposals_df)} near-miss matches of orphan authors proposed for review")
+
+    # ***************************************************************************
+    # * Completing 'submit_df' and 'orphan_df' and saving results in xlsx files *
+    # ***************************************************************************
 
     # Replace NaN values by UNKNOWN string except in first name initials
     submit_df = keep_initials(submit_df, initials_col_alias, missing_fill=bp.UNKNOWN)
@@ -787,35 +916,45 @@ def recursive_year_search(out_path, empl_dict, institute, org_tup,
     if not orphan_status:
         orphan_df = set_year_pub_id(orphan_df, corpus_year, pub_id_alias)
 
-    # Saving orphan_df
-    orphan_df.to_excel(orphan_path, index=False)
-
-    # Saving submit_df
-    submit_df.to_excel(submit_path, index=False)
-
-    # Adding author job type and saving new submit_df
+    # Adding author job type
     print("    Adding column with author job type")
-    _add_author_job_type(submit_path, submit_path, empl_dict, years)
+    submit_df = _round_trip(submit_df, submit_path, converters=converters_alias)
+    submit_df = _add_author_job_type(submit_df, empl_dict, years)
     if progress_callback:
         progress_callback(new_progress_bar_state + step * 5)
 
-    # Adding full article reference and saving new submit_df
-    _add_biblio_list(submit_path, submit_path)
+    # Adding full article reference
+    submit_df = _round_trip(submit_df, submit_path, converters=converters_alias)
+    submit_df = _add_biblio_list(submit_df)
     if progress_callback:
         progress_callback(new_progress_bar_state + step * 10)
 
     # Renaming column names using submit_col_rename_dic and orphan_col_rename_dic
-    _change_col_names(institute, org_tup, submit_path, orphan_path)
+    submit_df = _round_trip(submit_df, submit_path, converters=converters_alias,
+                            keep_default_na=False)
+    orphan_df = _round_trip(orphan_df, orphan_path, keep_default_na=False)
+    submit_df, orphan_df = _change_col_names(institute, org_tup, submit_df, orphan_df)
 
-    # Splitting orphan file in subdivisions of Institute
+    # Splitting orphan data in subdivisions of Institute
     if orphan_split_status:
-        orphan_status = _split_orphan(org_tup, out_path, orphan_file_name_alias)
+        orphan_df = _round_trip(orphan_df, orphan_path, converters=converters_alias,
+                                keep_default_na=False)
+        orphan_status, orphan_df = _split_orphan(org_tup, out_path,
+                                                 orphan_file_name_alias, orphan_df)
     if progress_callback:
         progress_callback(new_progress_bar_state + step * 15)
 
     # Creating universal identification of articles independent of database extraction
-    file_names_tup = (submit_file_name_alias, orphan_file_name_alias)
-    create_hash_id(institute, org_tup, out_path, file_names_tup)
+    submit_df = _round_trip(submit_df, submit_path)
+    orphan_df = _round_trip(orphan_df, orphan_path)
+    submit_df, orphan_df, hash_id_df = build_hash_id_dfs(institute, org_tup,
+                                                         submit_df, orphan_df)
+    print(f"{len(hash_id_df)} hash IDs of publications created")
+
+    # Saving submit_df, orphan_df and hash_id_df
+    submit_df.to_excel(submit_path, index=False)
+    orphan_df.to_excel(orphan_path, index=False)
+    hash_id_df.to_excel(hash_id_path, index=False)
     if progress_callback:
         progress_callback(100)
 
@@ -0,0 +1,295 @@
+"""Module of functions for the incremental merge of authors with employees 
+through the state saved by the previous merge.
+
+The state is keyed by the hash ID and the authors fingerprint of each publication 
+and by the key of the other inputs of the merge.
+
+"""
+
+__all__ = ['build_merge_inputs_key',
+           'build_pub_keys_df',
+           'get_reused_merge_results',
+           'read_merge_state',
+           'save_merge_state',
+           'set_merge_results_dtypes',
+           'set_merge_results_order',
+          ]
+
+
+# Standard Library imports
+import hashlib
+import pickle
+from pathlib import Path
+
+# 3rd party imports
+import numpy as np
+import pandas as pd
+import BiblioParsing as bp
+
+# Local imports
+import bmfuncts.pub_globals as pg
+from bmfuncts.create_hash_id import build_pub_hash_ids
+from bmfuncts.useful_functs import concat_dfs
+
+
+def build_pub_keys_df(pub_df):
+    """Builds the keys of the publications used for the incremental merge 
+    of authors with employees.
+
+    The key of each publication is composed of its hash ID, built through \
+    the `build_pub_hash_ids` function imported from `bmfuncts.create_hash_id` \
+    module, and of the fingerprint of its authors rows, which is the hash \
+    of the values of these rows except the publication ID.
+
+    Args:
+        pub_df (dataframe): Data of the publications list with one row \
+        per Institute author of each publication.
+    Returns:
+        (dataframe): The keys with one row per publication ID.
+    """
+    # Setting useful aliases
+    pub_id_alias = bp.COL_NAMES['pub_id']
+    hash_id_alias = pg.COL_HASH['hash_id']
+    fingerprint_alias = "Fingerprint"
+    hash_cols_list = [bp.COL_NAMES['articles'][2], bp.COL_NAMES['articles'][1],
+                      bp.COL_NAMES['articles'][9], bp.COL_NAMES['articles'][10],
+                      bp.COL_NAMES['articles'][6]]
+
+    # Building the fingerprint of the authors rows of each publication
+    rows_hash = pd.util.hash_pandas_object(pub_df.drop(columns=[pub_id_alias]).astype(str),
+                                           index=False)
+    fingerprints = rows_hash.groupby(pub_df[pub_id_alias].to_numpy(), sort=False) \
+                            .agg(lambda x: hashlib.sha256(x.to_numpy().tobytes()).hexdigest())
+
+    # Building the keys of the publications
+    first_rows_df = pub_df.drop_duplicates(subset=[pub_id_alias])
+    pub_keys_df = pd.DataFrame({pub_id_alias: first_rows_df[pub_id_alias].to_numpy(),
+                                hash_id_alias: build_pub_hash_ids(first_rows_df,
+                                                                  hash_cols_list)})
+    pub_keys_df[fingerprint_alias] = pub_keys_df[pub_id_alias].map(fingerprints)
+    return pub_keys_df
+
+
+def build_merge_inputs_key(pub_df, empl_dict, years, ext_docs_path, test_tup):
+    """Builds the key of the inputs of the merge of authors with employees 
+    other than the publications themselves.
+
+    The key is the hash of the columns of 'pub_df', of the searched years, \
+    of the employees data of these years, of the content of the file \
+    of the authors to add and of the test parameters.
+
+    Args:
+        pub_df (dataframe): Data of the publications list with one row \
+        per Institute author of each publication.
+        empl_dict (dict): The employees database as a dict keyed by the years \
+        and valued by the employees data for each year.
+        years (list): The years (str) of search in the employees data.
+        ext_docs_path (path): Full path to the xlsx file of the authors to add.
+        test_tup (tup): (test case (str), test name (str)).
+    Returns:
+        (str): The built key.
+    """
+    inputs_hash = hashlib.sha256()
+    inputs_hash.update(repr((pg.MERGE_STATE_VERSION, list(pub_df.columns),
+                             list(years), test_tup)).encode())
+    for year in years:
+        year_empl_df = empl_dict[year]
+        inputs_hash.update(repr(list(year_empl_df.columns)).encode())
+        year_empl_hash = pd.util.hash_pandas_object(year_empl_df.astype(str), index=False)
+        inputs_hash.update(year_empl_hash.to_numpy().tobytes())
+    if Path(ext_docs_path).is_file():
+        with open(ext_docs_path, 'rb') as file:
+            inputs_hash.update(file.read())
+    return inputs_hash.hexdigest()
+
+
+def read_merge_state(merge_state_path, inputs_key):
+    """Reads the state saved by the previous merge of authors with employees.
+
+    Args:
+        merge_state_path (path): Full path to the file of the merge state.
+        inputs_key (str): The key of the current inputs of the merge \
+        built through the `build_merge_inputs_key` function.
+    Returns:
+        (dict): The merge state if it is available and valid for the current inputs, \
+        None otherwise.
+    """
+    if not Path(merge_state_path).is_file():
+        return None
+    try:
+        merge_state = pd.read_pickle(merge_state_path)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return None
+    if not isinstance(merge_state, dict):
+        return None
+    if merge_state.get("version")!=pg.MERGE_STATE_VERSION:
+        return None
+    if merge_state.get("inputs_key")!=inputs_key:
+        return None
+    return merge_state
+
+
+def get_reused_merge_results(merge_state, pub_keys_df):
+    """Gets the results of the previous merge of authors with employees 
+    for the publications which hash ID and authors fingerprint are unchanged.
+
+    The publication IDs of the reused rows are set to the current ones.
+
+    Args:
+        merge_state (dict): The merge state saved by the previous merge.
+        pub_keys_df (dataframe): The keys of the current publications built \
+        through the `build_pub_keys_df` function.
+    Returns:
+        (tup): (reused rows (dataframe) of the publications list with one row \
+        per Institute author with attributes as employee, reused rows (dataframe) \
+        of the publications list with one row per author not found in the employees \
+        database, merge stages (numpy array) of the reused rows of the first \
+        dataframe, list of the current IDs of the reused publications).
+    """
+    # Setting useful aliases
+    pub_id_alias = bp.COL_NAMES['pub_id']
+    hash_id_alias = pg.COL_HASH['hash_id']
+    fingerprint_alias = "Fingerprint"
+    old_pub_id_alias = "Old_pub_id"
+    new_pub_id_alias = "New_pub_id"
+    stage_alias = "Merge_stage"
+
+    # Building the map between the old and the current IDs of unchanged publications
+    old_keys_df = merge_state["pub_keys_df"].drop_duplicates(subset=[hash_id_alias,
+                                                                     fingerprint_alias])
+    old_keys_df = old_keys_df.rename(columns={pub_id_alias: old_pub_id_alias})
+    new_keys_df = pub_keys_df.rename(columns={pub_id_alias: new_pub_id_alias})
+    pub_ids_map_df = new_keys_df.merge(old_keys_df, how='inner',
+                                       on=[hash_id_alias, fingerprint_alias])
+    pub_ids_map_df = pub_ids_map_df[[old_pub_id_alias, new_pub_id_alias]]
+
+    def _reuse_rows(old_df):
+        if pub_id_alias not in old_df.columns:
+            return pd.DataFrame()
+        reused_df = old_df.merge(pub_ids_map_df, how='inner',
+                                 left_on=pub_id_alias, right_on=old_pub_id_alias)
+        reused_df[pub_id_alias] = reused_df[new_pub_id_alias]
+        return reused_df.drop(columns=[old_pub_id_alias, new_pub_id_alias])
+
+    old_submit_df = merge_state["submit_df"].copy()
+    old_submit_df[stage_alias] = merge_state["submit_stages"]
+    reused_submit_df = _reuse_rows(old_submit_df)
+    reused_stages = np.zeros(0, dtype=int)
+    if stage_alias in reused_submit_df.columns:
+        reused_stages = reused_submit_df[stage_alias].to_numpy(dtype=int)
+        reused_submit_df = reused_submit_df.drop(columns=[stage_alias])
+    reused_orphan_df = _reuse_rows(merge_state["orphan_df"])
+    reused_pub_ids_list = pub_ids_map_df[new_pub_id_alias].to_list()
+    return reused_submit_df, reused_orphan_df, reused_stages, reused_pub_ids_list
+
+
+def set_merge_results_order(submit_df, orphan_df, submit_stages, pub_df):
+    """Sets the rows order of the results of the merge of authors with employees 
+    as given by the merge of all the publications at once.
+
+    The rows of the first stage of the merge are ordered by publication ID \
+    and author ID; the rows of the next stages, that are the searches \
+    in the employees data of each year, are ordered by stage and then by position \
+    of the author in 'pub_df', as are the rows of 'orphan_df'.
+
+    Args:
+        submit_df (dataframe): Data of the publications list with one row \
+        per Institute author with attributes as employee.
+        orphan_df (dataframe): Data of the publications list with one row \
+        per author not found in the employees database.
+        submit_stages (numpy array): The merge stages of the 'submit_df' rows.
+        pub_df (dataframe): Data of the publications list with one row \
+        per Institute author of each publication.
+    Returns:
+        (tup): (ordered 'submit_df' dataframe, ordered 'orphan_df' dataframe, \
+        merge stages (numpy array) of the ordered 'submit_df' rows).
+    """
+    # Setting useful aliases
+    pub_id_alias = bp.COL_NAMES['pub_id']
+    author_id_alias = bp.COL_NAMES['authors'][1]
+
+    # Setting the position of each author in 'pub_df'
+    positions_dict = {}
+    for position, key in enumerate(zip(pub_df[pub_id_alias], pub_df[author_id_alias])):
+        positions_dict.setdefault(key, position)
+
+    def _get_positions(df):
+        if df.empty:
+            return np.zeros(0, dtype=int)
+        return np.array([positions_dict.get(key, len(pub_df)) for key
+                         in zip(df[pub_id_alias], df[author_id_alias])], dtype=int)
+
+    # Ordering the rows of 'submit_df'
+    first_stage_mask = submit_stages==0
+    first_stage_df = submit_df[first_stage_mask]
+    if not first_stage_df.empty:
+        first_stage_df = first_stage_df.sort_values([pub_id_alias, author_id_alias],
+                                                    kind='stable')
+    next_stages_df = submit_df[~first_stage_mask]
+    next_stages = submit_stages[~first_stage_mask]
+    next_stages_order = np.lexsort((_get_positions(next_stages_df), next_stages))
+    next_stages_df = next_stages_df.iloc[next_stages_order]
+    new_submit_df = concat_dfs([first_stage_df, next_stages_df], dedup=False)
+    new_submit_stages = np.concatenate([submit_stages[first_stage_mask],
+                                        next_stages[next_stages_order]])
+
+    # Ordering the rows of 'orphan_df'
+    orphan_order = np.argsort(_get_positions(orphan_df), kind='stable')
+    new_orphan_df = orphan_df.iloc[orphan_order]
+    return new_submit_df, new_orphan_df, new_submit_stages
+
+
+def set_merge_results_dtypes(merge_df):
+    """Sets the dtypes of the results of the merge of authors with employees 
+    from the values of their columns.
+
+    The dtype of each column is inferred from its values as when the column \
+    is built at once; as when reading an xlsx file, the float columns \
+    of integer values without NaN get the integer dtype. Thus, the results \
+    combined from the reused rows of the previous merge and the rows \
+    of the new publications get the same dtypes as the results of the merge \
+    of all the publications at once, whatever the dtypes of the combined parts.
+
+    Args:
+        merge_df (dataframe): Data of the merge results.
+    Returns:
+        (dataframe): The data with the inferred dtypes.
+    """
+    typed_cols_list = []
+    for col_idx in range(len(merge_df.columns)):
+        typed_col = pd.Series(merge_df.iloc[:, col_idx].tolist(),
+                              index=merge_df.index, dtype=None)
+        if typed_col.dtype==np.float64 and not typed_col.empty \
+           and typed_col.notna().all() and (typed_col % 1==0).all():
+            typed_col = typed_col.astype(np.int64)
+        typed_cols_list.append(typed_col)
+    if not typed_cols_list:
+        return merge_df
+    typed_df = pd.concat(typed_cols_list, axis=1)
+    typed_df.columns = merge_df.columns
+    return typed_df
+
+
+def save_merge_state(merge_state_path, inputs_key, pub_keys_df, merge_results_tup):
+    """Saves the state of the merge of authors with employees 
+    for the next incremental merge.
+
+    Args:
+        merge_state_path (path): Full path to the file of the merge state.
+        inputs_key (str): The key of the inputs of the merge built through \
+        the `build_merge_inputs_key` function.
+        pub_keys_df (dataframe): The keys of the publications built through \
+        the `build_pub_keys_df` function.
+        merge_results_tup (tup): (publications list (dataframe) with one row \
+        per Institute author with attributes as employee, publications list \
+        (dataframe) with one row per author not found in the employees database, \
+        merge stages (numpy array) of the rows of the first dataframe).
+    """
+    submit_df, orphan_df, submit_stages = merge_results_tup
+    merge_state = {"version"      : pg.MERGE_STATE_VERSION,
+                   "inputs_key"   : inputs_key,
+                   "pub_keys_df"  : pub_keys_df,
+                   "submit_df"    : submit_df,
+                   "orphan_df"    : orphan_df,
+                   "submit_stages": submit_stages}
+    pd.to_pickle(merge_state, merge_state_path)
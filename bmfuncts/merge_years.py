@@ -0,0 +1,167 @@
+"""Module of functions for the merge of employees information with the publications lists 
+of several corpus years in parallel worker processes.
+
+"""
+
+__all__ = ['recursive_years_search',
+          ]
+
+
+# Standard Library imports
+import multiprocessing
+import os
+import queue
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from pathlib import Path
+
+# Local imports
+import bmfuncts.pub_globals as pg
+from bmfuncts.merge_pub_employees import adapt_depth_search
+from bmfuncts.merge_pub_employees import recursive_year_search
+
+# Data shared by the merges of several corpus years in a worker process
+_MERGE_WORKER_DATA = {}
+
+
+def _init_merge_worker(empl_dict, progress_queue):
+    """Initializes a worker process of the merge of several corpus years 
+    with the data shared by the merges of all the corpus years.
+
+    Args:
+        empl_dict (dict): The employees data keyed by the years.
+        progress_queue (multiprocessing.Queue): The queue of the progress \
+        of the merge of each corpus year.
+    """
+    _MERGE_WORKER_DATA["empl_dict"] = empl_dict
+    _MERGE_WORKER_DATA["progress_queue"] = progress_queue
+
+
+def _merge_corpus_year(corpus_year, args_tup):
+    """Merges the publications of a corpus year with the employees data 
+    in a worker process through the `recursive_year_search` function \
+    imported from `bmfuncts.merge_pub_employees` module.
+
+    The employees data are those set by the `_init_merge_worker` internal function \
+    and the progress of the merge is put in the progress queue set by the same function.
+
+    Args:
+        corpus_year (str): Contains the corpus year defined by 4 digits.
+        args_tup (tup): (institute (str), org_tup (tup), bibliometer_path (path), \
+        datatype (str), search_depth (int), incremental (bool), fuzzy_orphans (bool)).
+    Returns:
+        (tup): (corpus year (str), end_message (str), empty status (bool) \
+        of the publications list with authors not found in the employees database).
+    """
+    # Setting parameters from args
+    (institute, org_tup, bibliometer_path, datatype,
+     search_depth, incremental, fuzzy_orphans) = args_tup
+    progress_queue = _MERGE_WORKER_DATA["progress_queue"]
+
+    def _put_progress(progress_value):
+        progress_queue.put((corpus_year, progress_value))
+
+    # Setting useful aliases
+    bdd_mensuelle_alias = pg.ARCHI_YEAR["bdd mensuelle"]
+
+    # Setting useful paths
+    out_path = Path(bibliometer_path) / Path(corpus_year) / Path(bdd_mensuelle_alias)
+
+    empl_dict = dict(_MERGE_WORKER_DATA["empl_dict"])
+    end_message, orphan_status = recursive_year_search(out_path, empl_dict, institute, org_tup,
+                                                       bibliometer_path, datatype,
+                                                       corpus_year, search_depth,
+                                                       progress_callback=_put_progress,
+                                                       progress_bar_state=0,
+                                                       incremental=incremental,
+                                                       fuzzy_orphans=fuzzy_orphans)
+    return corpus_year, end_message, orphan_status
+
+
+def recursive_years_search(empl_dict, institute, org_tup, bibliometer_path,
+                           datatype, corpus_years, search_depth,
+                           progress_callback=None, progress_bar_state=0,
+                           max_workers=None, incremental=False, fuzzy_orphans=False):
+    """Searches in the employees database of the Institute the information for the authors 
+    of the publications of several corpuses in parallel.
+
+    The merge of each corpus year is run in a pool of worker processes \
+    through the `_merge_corpus_year` internal function that calls \
+    the `recursive_year_search` function. The employees data of the years \
+    searched for all the corpus years are shared with the worker processes \
+    at their initialization through the `_init_merge_worker` internal function \
+    and standardized by the `recursive_year_search` function. The progress of the merge \
+    of each corpus year is got from a queue and aggregated in a single status \
+    of the progress bar.
+
+    Args:
+        empl_dict (dict): The employees database as a dict keyed by the years \
+        and valued by the employees data for each year.
+        institute (str): Institute name.
+        org_tup (tup): Contains Institute parameters.
+        bibliometer_path (path): Full path to working folder.
+        datatype (str): Data combination type from corpuses databases.
+        corpus_years (list): The corpus years (str) defined by 4 digits.
+        search_depth (int): Depth for search in 'empl_dict'.
+        progress_callback (function): Function for updating ProgressBar \
+        tkinter widget status (optional, default = None).
+        progress_bar_state (int): Initial status of ProgressBar tkinter widget \
+        (optional, default = 0).
+        max_workers (int): Number of worker processes (optional, default = None, \
+        the number of corpus years limited to the number of CPUs).
+        incremental (bool): If true, the results of the previous merge \
+        are reused for the unchanged publications (optional, default = False).
+        fuzzy_orphans (bool): If true, near-miss matches of the orphan authors \
+        with the employees are proposed for review (optional, default = False).
+    Returns:
+        (dict): The results of the `recursive_year_search` function as tuples \
+        (end_message (str), empty status (bool) of the publications list \
+        with authors not found in the employees database) keyed by the corpus years.
+    """
+    # Selecting the employees data of the years searched for all the corpus years
+    shared_empl_dict = {}
+    for corpus_year in corpus_years:
+        for year in adapt_depth_search(empl_dict, corpus_year, search_depth):
+            if year in empl_dict:
+                shared_empl_dict[year] = empl_dict[year]
+
+    # Setting the progress of the merge of each corpus year
+    years_progress_dict = dict.fromkeys(corpus_years, 0)
+    if progress_callback:
+        step = (100 - progress_bar_state) / 100
+
+    def _get_progress():
+        while True:
+            try:
+                corpus_year, progress_value = progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            years_progress_dict[corpus_year] = max(years_progress_dict[corpus_year],
+                                                   progress_value)
+
+    # Running the merge of the corpus years in the pool of worker processes
+    if max_workers is None:
+        max_workers = min(len(corpus_years), os.cpu_count() or 1)
+    progress_queue = multiprocessing.Queue()
+    args_tup = (institute, org_tup, bibliometer_path, datatype,
+                search_depth, incremental, fuzzy_orphans)
+    results_dict = {}
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_merge_worker,
+                             initargs=(shared_empl_dict, progress_queue)) as executor:
+        pending_futures = {executor.submit(_merge_corpus_year, corpus_year, args_tup)
+                           for corpus_year in corpus_years}
+        while pending_futures:
+            done_futures, pending_futures = wait(pending_futures, timeout=0.5,
+                                                 return_when=FIRST_COMPLETED)
+            _get_progress()
+            for future in done_futures:
+                corpus_year, end_message, orphan_status = future.result()
+                results_dict[corpus_year] = (end_message, orphan_status)
+                years_progress_dict[corpus_year] = 100
+            if progress_callback:
+                mean_progress = sum(years_progress_dict.values()) / len(years_progress_dict)
+                progress_callback(progress_bar_state + step * mean_progress)
+
+    return {corpus_year: results_dict[corpus_year] for corpus_year in corpus_years}
@@ -0,0 +1,248 @@
+"""Module of functions for managing the history of the OTPs
+attributed by the user as a SQLite database.
+
+The database is shared by the corpus years. It keeps the OTPs
+set by Hash-ID and the OTPs set by DOI and first-author name
+in two tables indexed on these keys with one row per key
+and per corpus year, the last OTP set for a key replacing
+the previous one.
+
+"""
+
+__all__ = ['export_otps_history',
+           'get_doi_otps_history',
+           'get_hash_otps_history',
+           'import_otps_history',
+           'set_otps_history_db',
+           'upsert_otps_history',
+          ]
+
+
+# Standard library imports
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+
+# 3rd party imports
+import pandas as pd
+
+# Local imports
+import bmfuncts.pub_globals as pg
+
+
+_OTPS_DB_SCHEMA = ("CREATE TABLE IF NOT EXISTS otps_years "
+                   "(year TEXT PRIMARY KEY)",
+                   "CREATE TABLE IF NOT EXISTS hash_otps "
+                   "(year TEXT NOT NULL, hash_id TEXT NOT NULL, otp TEXT NOT NULL, "
+                   "PRIMARY KEY (year, hash_id))",
+                   "CREATE TABLE IF NOT EXISTS doi_otps "
+                   "(year TEXT NOT NULL, doi TEXT NOT NULL, first_author TEXT NOT NULL, "
+                   "otp TEXT NOT NULL, PRIMARY KEY (year, doi, first_author))",
+                   "CREATE INDEX IF NOT EXISTS doi_otps_author "
+                   "ON doi_otps (year, first_author)",
+                  )
+
+_HASH_OTPS_UPSERT = ("INSERT INTO hash_otps (year, hash_id, otp) VALUES (?, ?, ?) "
+                     "ON CONFLICT (year, hash_id) DO UPDATE SET otp=excluded.otp")
+
+_DOI_OTPS_UPSERT = ("INSERT INTO doi_otps (year, doi, first_author, otp) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (year, doi, first_author) DO UPDATE SET otp=excluded.otp")
+
+
+@contextmanager
+def _open_otps_db(db_path):
+    """Opens the database of the OTPs history after creating
+    its folder and its tables if they do not exist.
+
+    The transaction is committed and the connection closed
+    when leaving the context.
+
+    Args:
+        db_path (path): Full path to the database of the OTPs history.
+    Yields:
+        (sqlite3.Connection): The connection to the database.
+    """
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            for statement in _OTPS_DB_SCHEMA:
+                conn.execute(statement)
+            yield conn
+    finally:
+        conn.close()
+
+
+def _set_otps_rows(df, cols_list, corpus_year):
+    """Sets the rows to be upserted in a table of the OTPs history.
+
+    The values are converted to strings and the rows with missing
+    values are dropped.
+
+    Args:
+        df (dataframe): The data to upsert.
+        cols_list (list): The column names (str) of 'df' data \
+        in the order of the table columns following the year.
+        corpus_year (str): 4 digits year of the corpus.
+    Returns:
+        (list): The rows (tup) to be upserted.
+    """
+    rows_df = df[cols_list].dropna()
+    rows_df = rows_df.astype(str)
+    return [(corpus_year,) + tuple(row) for row in rows_df.itertuples(index=False)]
+
+
+def upsert_otps_history(db_path, corpus_year, otps_dfs_tup, cols_tup):
+    """Inserts the set OTPs in the OTPs history of a corpus year,
+    the OTPs of already known keys being replaced.
+
+    Args:
+        db_path (path): Full path to the database of the OTPs history.
+        corpus_year (str): 4 digits year of the corpus.
+        otps_dfs_tup (tup): (OTPs set by Hash-ID (dataframe), \
+        OTPs set by DOI and first author (dataframe)).
+        cols_tup (tup): (Hash-ID column name (str), first-author \
+        column name (str), DOI column name (str), OTP column name (str)).
+    """
+    # Setting parameters from args
+    hash_otps_df, doi_otps_df = otps_dfs_tup
+    hash_id_col, author_col, doi_col, otp_col = cols_tup
+
+    hash_rows_list = _set_otps_rows(hash_otps_df, [hash_id_col, otp_col], corpus_year)
+    doi_rows_list = _set_otps_rows(doi_otps_df, [doi_col, author_col, otp_col],
+                                   corpus_year)
+    with _open_otps_db(db_path) as conn:
+        conn.execute("INSERT OR IGNORE INTO otps_years (year) VALUES (?)", (corpus_year,))
+        conn.executemany(_HASH_OTPS_UPSERT, hash_rows_list)
+        conn.executemany(_DOI_OTPS_UPSERT, doi_rows_list)
+
+
+def import_otps_history(db_path, corpus_year, kept_otps_file_path, cols_tup):
+    """Imports in the OTPs history of a corpus year the kept-OTPs workbook
+    with the sheets given by 'SHEET_SAVE_OTP' global.
+
+    The rows of the workbook are upserted in their order so that
+    the last OTP set for a key is the one kept.
+
+    Args:
+        db_path (path): Full path to the database of the OTPs history.
+        corpus_year (str): 4 digits year of the corpus.
+        kept_otps_file_path (path): Full path to the kept-OTPs workbook.
+        cols_tup (tup): (Hash-ID column name (str), first-author \
+        column name (str), DOI column name (str), OTP column name (str)).
+    """
+    # Setting useful sheet names aliases
+    hash_otp_sheet_alias = pg.SHEET_SAVE_OTP['hash_OTP']
+    doi_otp_sheet_alias = pg.SHEET_SAVE_OTP['doi_OTP']
+
+    otps_history_dict = pd.read_excel(kept_otps_file_path,
+                                      sheet_name=[hash_otp_sheet_alias,
+                                                  doi_otp_sheet_alias])
+    otps_dfs_tup = (otps_history_dict[hash_otp_sheet_alias],
+                    otps_history_dict[doi_otp_sheet_alias])
+    upsert_otps_history(db_path, corpus_year, otps_dfs_tup, cols_tup)
+
+
+def set_otps_history_db(db_path, corpus_year, kept_otps_file_path, cols_tup):
+    """Sets the OTPs history of a corpus year in the database.
+
+    The kept-OTPs workbook of the corpus year is imported through
+    the `import_otps_history` function when the corpus year is not yet
+    in the database.
+
+    Args:
+        db_path (path): Full path to the database of the OTPs history.
+        corpus_year (str): 4 digits year of the corpus.
+        kept_otps_file_path (path): Full path to the kept-OTPs workbook.
+        cols_tup (tup): (Hash-ID column name (str), first-author \
+        column name (str), DOI column name (str), OTP column name (str)).
+    Returns:
+        (bool): True if an OTPs history is available for the corpus year.
+    """
+    with _open_otps_db(db_path) as conn:
+        year_status = conn.execute("SELECT 1 FROM otps_years WHERE year=?",
+                                   (corpus_year,)).fetchone() is not None
+    if not year_status and Path(kept_otps_file_path).is_file():
+        import_otps_history(db_path, corpus_year, kept_otps_file_path, cols_tup)
+        year_status = True
+    return year_status
+
+
+def get_hash_otps_history(db_path, corpus_year, hash_id_list, cols_tup):
+    """Gets the OTPs set by Hash-ID for the Hash-IDs of 'hash_id_list'
+    in the OTPs history of a corpus year.
+
+    Args:
+        db_path (path): Full path to the database of the OTPs history.
+        corpus_year (str): 4 digits year of the corpus.
+        hash_id_list (list): The Hash-IDs (str) to look for.
+        cols_tup (tup): (Hash-ID column name (str), first-author \
+        column name (str), DOI column name (str), OTP column name (str)).
+    Returns:
+        (dataframe): The OTPs set by Hash-ID in the order of the history.
+    """
+    # Setting parameters from args
+    hash_id_col, _, _, otp_col = cols_tup
+
+    with _open_otps_db(db_path) as conn:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS hash_keys (hash_id TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM hash_keys")
+        conn.executemany("INSERT OR IGNORE INTO hash_keys (hash_id) VALUES (?)",
+                         [(str(hash_id),) for hash_id in hash_id_list])
+        rows_list = conn.execute("SELECT h.hash_id, h.otp FROM hash_keys k "
+                                 "JOIN hash_otps h ON h.year=? AND h.hash_id=k.hash_id "
+                                 "ORDER BY h.rowid", (corpus_year,)).fetchall()
+    return pd.DataFrame(rows_list, columns=[hash_id_col, otp_col])
+
+
+def get_doi_otps_history(db_path, corpus_year, cols_tup):
+    """Gets the OTPs set by DOI and first author in the OTPs history
+    of a corpus year.
+
+    Args:
+        db_path (path): Full path to the database of the OTPs history.
+        corpus_year (str): 4 digits year of the corpus.
+        cols_tup (tup): (Hash-ID column name (str), first-author \
+        column name (str), DOI column name (str), OTP column name (str)).
+    Returns:
+        (dataframe): The OTPs set by DOI and first author \
+        in the order of the history.
+    """
+    # Setting parameters from args
+    _, author_col, doi_col, otp_col = cols_tup
+
+    with _open_otps_db(db_path) as conn:
+        rows_list = conn.execute("SELECT first_author, doi, otp FROM doi_otps "
+                                 "WHERE year=? ORDER BY rowid", (corpus_year,)).fetchall()
+    return pd.DataFrame(rows_list, columns=[author_col, doi_col, otp_col])
+
+
+def export_otps_history(db_path, corpus_year, kept_otps_file_path, cols_tup):
+    """Exports the OTPs history of a corpus year as the kept-OTPs workbook
+    with the sheets given by 'SHEET_SAVE_OTP' global.
+
+    Args:
+        db_path (path): Full path to the database of the OTPs history.
+        corpus_year (str): 4 digits year of the corpus.
+        kept_otps_file_path (path): Full path to the kept-OTPs workbook.
+        cols_tup (tup): (Hash-ID column name (str), first-author \
+        column name (str), DOI column name (str), OTP column name (str)).
+    """
+    # Setting parameters from args
+    hash_id_col, _, _, otp_col = cols_tup
+
+    # Setting useful sheet names aliases
+    hash_otp_sheet_alias = pg.SHEET_SAVE_OTP['hash_OTP']
+    doi_otp_sheet_alias = pg.SHEET_SAVE_OTP['doi_OTP']
+
+    with _open_otps_db(db_path) as conn:
+        hash_rows_list = conn.execute("SELECT hash_id, otp FROM hash_otps "
+                                      "WHERE year=? ORDER BY rowid",
+                                      (corpus_year,)).fetchall()
+    hash_otps_df = pd.DataFrame(hash_rows_list, columns=[hash_id_col, otp_col])
+    doi_otps_df = get_doi_otps_history(db_path, corpus_year, cols_tup)
+
+    with pd.ExcelWriter(kept_otps_file_path) as writer: # https://github.com/PyCQA/pylint/issues/3060 pylint: disable=abstract-class-instantiated
+        hash_otps_df.to_excel(writer, sheet_name=hash_otp_sheet_alias, index=False)
+        doi_otps_df.to_excel(writer, sheet_name=doi_otp_sheet_alias, index=False)
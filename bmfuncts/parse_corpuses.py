@@ -0,0 +1,653 @@
+"""Module of functions for the parsing of the rawdata extracted
+from the external databases and for the synthesis of the parsings
+of the databases through their concatenation and deduplication.
+
+The content hashes of the inputs of each parsing and of each synthesis
+are recorded in a manifest named by the 'PARSING_MANIFEST' global
+in the folder of the results so that they are rebuilt only
+when their inputs change.
+
+The large rawdata files are parsed by chunks of records
+in parallel worker processes.
+
+"""
+
+__all__ = ['deduplicate_corpus_parsing',
+           'get_parsing_status',
+           'parse_corpus',
+           'parse_corpuses',
+           'parse_rawdata_chunks',
+          ]
+
+
+# Standard library imports
+import json
+import math
+import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from pathlib import Path
+
+# 3rd party imports
+import BiblioParsing as bp
+import pandas as pd
+
+# Local imports
+import bmfuncts.pub_globals as pg
+from bmfuncts.cache_utils import get_file_hash
+from bmfuncts.cache_utils import read_manifest
+from bmfuncts.cache_utils import write_manifest
+from bmfuncts.config_utils import set_user_config
+from bmfuncts.useful_functs import read_parsing_dict
+from bmfuncts.useful_functs import save_fails_dict
+from bmfuncts.useful_functs import save_parsing_dict
+
+
+def _set_progress(progress_callback, progress_value):
+    """Updates the progress status when a progress callback is given."""
+    if progress_callback:
+        progress_callback(progress_value)
+
+
+def _get_rawdata_files(rawdata_path, database_type):
+    """Gets the rawdata files of the 'database_type' database
+    in the folder pointed by 'rawdata_path'.
+
+    Args:
+        rawdata_path (path): Full path to the rawdata folder.
+        database_type (str): Database name (ex: 'wos' or 'scopus').
+    Returns:
+        (list): The full paths (path) to the rawdata files.
+    """
+    rawdata_extent_dict = {bp.WOS: bp.WOS_RAWDATA_EXTENT,
+                           bp.SCOPUS: bp.SCOPUS_RAWDATA_EXTENT}
+    rawdata_extent = "." + rawdata_extent_dict[database_type]
+    rawdata_files_list = []
+    for path, _, files in os.walk(rawdata_path):
+        rawdata_files_list += [Path(path) / Path(file) for file in sorted(files)
+                               if file.endswith(rawdata_extent)]
+    return rawdata_files_list
+
+
+def _get_rawdata_status(rawdata_path, database_type):
+    """Checks the availability of a rawdata file of the 'database_type'
+    database in the folder pointed by 'rawdata_path'.
+
+    Args:
+        rawdata_path (path): Full path to the rawdata folder.
+        database_type (str): Database name (ex: 'wos' or 'scopus').
+    Returns:
+        (bool): True if a rawdata file is available.
+    """
+    return bool(_get_rawdata_files(rawdata_path, database_type))
+
+
+def _set_inputs_key(inputs_dict):
+    """Sets the key of the inputs of a parsing or of a synthesis
+    as stored in a json manifest.
+
+    Args:
+        inputs_dict (dict): The version of the manifests and the content \
+        hashes of the inputs.
+    Returns:
+        (dict): The key of the inputs.
+    """
+    inputs_dict = {"version": pg.PARSING_MANIFEST_VERSION,
+                   "biblio_parsing": getattr(bp, "__version__", None),
+                   **inputs_dict}
+    return json.loads(json.dumps(inputs_dict))
+
+
+def _get_parsing_inputs_key(rawdata_path, paths_tup):
+    """Builds the key of the inputs of the parsing of a database
+    from the content hashes of the rawdata files and of the files
+    of the institute affiliations and of the institutions types.
+
+    Args:
+        rawdata_path (path): Full path to the rawdata folder.
+        paths_tup (tup): (full path to working folder, \
+        full path to institute-affiliations file, \
+        full path to institutions-types file).
+    Returns:
+        (dict): The key of the inputs of the parsing.
+    """
+    # Setting parameters from args
+    _, institute_affil_file_path, inst_types_file_path = paths_tup
+
+    rawdata_dict = {}
+    for path, _, files in os.walk(rawdata_path):
+        for file in files:
+            file_path = Path(path) / Path(file)
+            rawdata_dict[file_path.relative_to(rawdata_path).as_posix()] = get_file_hash(file_path)
+    inputs_dict = {"rawdata"        : dict(sorted(rawdata_dict.items())),
+                   "institute_affil": get_file_hash(institute_affil_file_path),
+                   "inst_types"     : get_file_hash(inst_types_file_path)}
+    return _set_inputs_key(inputs_dict)
+
+
+def _check_parsing_manifest(parsing_path, inputs_key, item_filename_dict):
+    """Checks that the parsing results saved in the 'parsing_path' folder
+    have been built from the inputs given by 'inputs_key'.
+
+    Args:
+        parsing_path (path): Full path to the parsing folder.
+        inputs_key (dict): The key of the inputs of the parsing.
+        item_filename_dict (dict): Dict keyed by the parsing items \
+        and valued by the file names of the parsing results.
+    Returns:
+        (dict): The manifest of the parsing if up to date, None otherwise.
+    """
+    articles_file = item_filename_dict[bp.PARSING_ITEMS_LIST[0]] + "." + pg.TSV_SAVE_EXTENT
+    if not (Path(parsing_path) / Path(articles_file)).is_file():
+        return None
+    manifest_dict = read_manifest(Path(parsing_path) / Path(pg.PARSING_MANIFEST))
+    if manifest_dict is None or manifest_dict.get("inputs")!=inputs_key:
+        return None
+    return manifest_dict
+
+
+def get_parsing_status(corpus_year, database_type, paths_tup):
+    """Checks that the saved parsing of the 'database_type' database
+    for a corpus year is up to date with its inputs.
+
+    Args:
+        corpus_year (str): Corpus year defined by 4 digits.
+        database_type (str): Database name (ex: 'wos' or 'scopus').
+        paths_tup (tup): (full path to working folder, \
+        full path to institute-affiliations file, \
+        full path to institutions-types file).
+    Returns:
+        (bool): True if the parsing is available and its inputs unchanged, \
+        False if its inputs have changed and None if unknown, the parsing \
+        having no manifest as when built before the manifests were saved.
+    """
+    config_tup = set_user_config(paths_tup[0], corpus_year, pg.BDD_LIST)
+    rawdata_path = config_tup[0][database_type]
+    parsing_path = config_tup[1][database_type]
+    if read_manifest(Path(parsing_path) / Path(pg.PARSING_MANIFEST)) is None:
+        return None
+    inputs_key = _get_parsing_inputs_key(rawdata_path, paths_tup)
+    return _check_parsing_manifest(parsing_path, inputs_key, config_tup[2]) is not None
+
+
+def _parse_rawdata(rawdata_path, database_type, paths_tup):
+    """Parses the rawdata of the 'database_type' database
+    of the folder pointed by 'rawdata_path'.
+
+    This is done through the `biblio_parser` function imported from
+    the 3rd party package imported as bp.
+
+    Args:
+        rawdata_path (path): Full path to the rawdata folder.
+        database_type (str): Database name (ex: 'wos' or 'scopus').
+        paths_tup (tup): (full path to working folder, \
+        full path to institute-affiliations file, \
+        full path to institutions-types file).
+    Returns:
+        (tup): (parsing results (dict), parsing fails (dict)).
+    """
+    # Setting parameters from args
+    _, institute_affil_file_path, inst_types_file_path = paths_tup
+
+    return bp.biblio_parser(rawdata_path, database_type,
+                            inst_filter_list=None,
+                            country_affiliations_file_path=institute_affil_file_path,
+                            inst_types_file_path=inst_types_file_path)
+
+
+def _split_rawdata_records(rawdata_file_path, database_type):
+    """Splits the content of a rawdata file into its header line
+    and its records.
+
+    The WoS rawdata are tab-delimited without quoting so that each line
+    is a record. The Scopus rawdata are comma-separated with quoted fields
+    that may hold line breaks so that a record ends at the first line break
+    out of the quoted fields. The empty lines between records are dropped.
+
+    Args:
+        rawdata_file_path (path): Full path to the rawdata file.
+        database_type (str): Database name (ex: 'wos' or 'scopus').
+    Returns:
+        (tup): (header line (bytes), records (list of bytes)).
+    """
+    quoted_fields = database_type==bp.SCOPUS
+    records_list = []
+    record = b""
+    with open(rawdata_file_path, 'rb') as file:
+        for line in file:
+            record += line
+            if quoted_fields and record.count(b'"') % 2:
+                continue
+            if record.strip():
+                records_list.append(record)
+            record = b""
+    if record.strip():
+        records_list.append(record)
+    if not records_list:
+        return b"", []
+    if not records_list[-1].endswith(b"\n"):
+        records_list[-1] += b"\n"
+    return records_list[0], records_list[1:]
+
+
+def _merge_parsing_dicts(parsing_dicts_list, pub_id_offsets_list):
+    """Merges the parsing results of the chunks of a rawdata file
+    with the Pub_ids of each chunk re-based by the chunk offset.
+
+    Args:
+        parsing_dicts_list (list): The parsing results (dict) of the chunks.
+        pub_id_offsets_list (list): The Pub_ids offsets (int) of the chunks.
+    Returns:
+        (dict): Parsing results keyed by parsing items and valued \
+        by the dataframes of parsing results.
+    """
+    # Setting useful column names aliases
+    pub_id_col = bp.COL_NAMES['pub_id']
+
+    parsing_dict = {}
+    for item in bp.PARSING_ITEMS_LIST:
+        item_dfs_list = []
+        for chunk_parsing_dict, pub_id_offset in zip(parsing_dicts_list, pub_id_offsets_list):
+            if item in chunk_parsing_dict:
+                item_df = chunk_parsing_dict[item].copy()
+                if pub_id_col in item_df.columns:
+                    item_df[pub_id_col] = item_df[pub_id_col] + pub_id_offset
+                item_dfs_list.append(item_df)
+        if item_dfs_list:
+            full_dfs_list = [item_df for item_df in item_dfs_list if not item_df.empty]
+            parsing_dict[item] = pd.concat(full_dfs_list or item_dfs_list[:1],
+                                           ignore_index=True)
+    return parsing_dict
+
+
+def _merge_fails_values(key, values_tups_list):
+    """Merges recursively the values of a key of the parsing fails
+    of the chunks of a rawdata file.
+
+    The numbers are summed except the success rates that are averaged
+    with the numbers of articles of the chunks as weights. The lists
+    are concatenated with the Pub_ids re-based by the chunk offset.
+
+    Args:
+        key (str): The key of the values.
+        values_tups_list (list): The tuples (value, Pub_ids offset (int), \
+        number of articles (int)) of the chunks holding the key.
+    Returns:
+        The merged value.
+    """
+    values_list = [value for value, _, _ in values_tups_list]
+    if all(isinstance(value, dict) for value in values_list):
+        sub_keys_list = list(dict.fromkeys(sub_key for value in values_list
+                                           for sub_key in value))
+        return {sub_key: _merge_fails_values(sub_key,
+                                             [(value[sub_key], pub_id_offset, articles_nb)
+                                              for value, pub_id_offset, articles_nb
+                                              in values_tups_list if sub_key in value])
+                for sub_key in sub_keys_list}
+    if all(isinstance(value, list) for value in values_list):
+        merged_list = []
+        for value, pub_id_offset, _ in values_tups_list:
+            if key==bp.COL_NAMES['pub_id']:
+                value = [pub_id + pub_id_offset for pub_id in value]
+            merged_list += value
+        return merged_list
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool)
+           for value in values_list):
+        if "%" in str(key):
+            articles_nb = sum(nb for _, _, nb in values_tups_list)
+            if not articles_nb:
+                return values_list[0]
+            return sum(value * nb for value, _, nb in values_tups_list) / articles_nb
+        return sum(values_list)
+    return values_list[0]
+
+
+def _merge_fails_dicts(fails_dicts_list, pub_id_offsets_list):
+    """Merges the parsing fails of the chunks of a rawdata file
+    through the `_merge_fails_values` internal function.
+
+    Args:
+        fails_dicts_list (list): The parsing fails (dict) of the chunks.
+        pub_id_offsets_list (list): The Pub_ids offsets (int) of the chunks.
+    Returns:
+        (dict): The parsing fails of the rawdata file.
+    """
+    values_tups_list = [(fails_dict, pub_id_offset, fails_dict.get("number of article", 0))
+                        for fails_dict, pub_id_offset
+                        in zip(fails_dicts_list, pub_id_offsets_list)]
+    return _merge_fails_values(None, values_tups_list)
+
+
+def parse_rawdata_chunks(rawdata_path, database_type, paths_tup,
+                         chunks_nb=None, max_workers=None):
+    """Parses the rawdata of the 'database_type' database of the folder
+    pointed by 'rawdata_path' by chunks in parallel worker processes.
+
+    The rawdata file is split on its records boundaries through
+    the `_split_rawdata_records` internal function. Each chunk is saved
+    with the header line in a temporary folder and parsed in its own worker
+    process through the `_parse_rawdata` internal function. The parsing
+    results and the parsing fails of the chunks are then merged with
+    the Pub_ids re-based by the number of records of the previous chunks.
+    The rawdata are parsed at once when the folder does not hold a single
+    rawdata file or when a single chunk is set.
+
+    Args:
+        rawdata_path (path): Full path to the rawdata folder.
+        database_type (str): Database name (ex: 'wos' or 'scopus').
+        paths_tup (tup): (full path to working folder, \
+        full path to institute-affiliations file, \
+        full path to institutions-types file).
+        chunks_nb (int): Number of chunks (optional, default = None, \
+        the number of chunks of 'PARSING_CHUNK_RECORDS' global records \
+        limited to the number of CPUs).
+        max_workers (int): Number of worker processes (optional, \
+        default = None, the number of chunks).
+    Returns:
+        (tup): (parsing results (dict) keyed by parsing items and valued \
+        by the dataframes of parsing results, parsing fails (dict)).
+    """
+    rawdata_files_list = _get_rawdata_files(rawdata_path, database_type)
+    if len(rawdata_files_list)!=1:
+        return _parse_rawdata(rawdata_path, database_type, paths_tup)
+
+    # Splitting the rawdata file on the records boundaries
+    rawdata_file_path = rawdata_files_list[0]
+    header, records_list = _split_rawdata_records(rawdata_file_path, database_type)
+    records_nb = len(records_list)
+    if chunks_nb is None:
+        chunks_nb = min(math.ceil(records_nb / pg.PARSING_CHUNK_RECORDS), os.cpu_count() or 1)
+    chunks_nb = min(chunks_nb, records_nb)
+    if chunks_nb<=1:
+        return _parse_rawdata(rawdata_path, database_type, paths_tup)
+    chunk_size = math.ceil(records_nb / chunks_nb)
+    pub_id_offsets_list = list(range(0, records_nb, chunk_size))
+
+    # Parsing the chunks in the pool of worker processes
+    if max_workers is None:
+        max_workers = len(pub_id_offsets_list)
+    with tempfile.TemporaryDirectory() as chunks_root_path:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures_list = []
+            for chunk_idx, pub_id_offset in enumerate(pub_id_offsets_list):
+                chunk_path = Path(chunks_root_path) / Path(f"chunk_{chunk_idx}")
+                os.makedirs(chunk_path)
+                with open(chunk_path / Path(rawdata_file_path.name), 'wb') as file:
+                    file.write(header)
+                    file.writelines(records_list[pub_id_offset:pub_id_offset + chunk_size])
+                futures_list.append(executor.submit(_parse_rawdata, chunk_path,
+                                                    database_type, paths_tup))
+            chunks_results_list = [future.result() for future in futures_list]
+
+    parsing_dict = _merge_parsing_dicts([parsing_dict for parsing_dict, _
+                                         in chunks_results_list], pub_id_offsets_list)
+    fails_dict = _merge_fails_dicts([fails_dict for _, fails_dict
+                                     in chunks_results_list], pub_id_offsets_list)
+    return parsing_dict, fails_dict
+
+
+def parse_corpus(corpus_year, database_type, paths_tup, progress_callback=None,
+                 force=False, chunks_nb=None, max_workers=None):
+    """Parses the rawdata of the 'database_type' database for a corpus year
+    and saves the parsing results.
+
+    The parsing is done through the `parse_rawdata_chunks` function that
+    parses the large rawdata files by chunks in parallel worker processes
+    using the `biblio_parser` function imported from the 3rd party package
+    imported as bp. The parsing results are saved through
+    the `save_parsing_dict` and `save_fails_dict` functions imported from
+    the `bmfuncts.useful_functs` module using paths set through the
+    `set_user_config` function imported from the `bmfuncts.config_utils` module.
+    The parsing is skipped when the manifest of the saved parsing results
+    records the same inputs.
+
+    Args:
+        corpus_year (str): Corpus year defined by 4 digits.
+        database_type (str): Database name (ex: 'wos' or 'scopus').
+        paths_tup (tup): (full path to working folder, \
+        full path to institute-affiliations file, \
+        full path to institutions-types file).
+        progress_callback (function): Function for updating \
+        ProgressBar tkinter widget status (optional, default = None).
+        force (bool): If true, the parsing is done even if its inputs \
+        are unchanged (optional, default = False).
+        chunks_nb (int): Number of chunks passed to the `parse_rawdata_chunks` \
+        function, 1 for parsing the rawdata at once (optional, default = None).
+        max_workers (int): Number of worker processes passed to the \
+        `parse_rawdata_chunks` function (optional, default = None).
+    Returns:
+        (int): The number of articles of the corpus.
+    """
+    # Setting parameters from args
+    bibliometer_path = paths_tup[0]
+
+    # Getting the full paths of the working folder architecture for the corpus "corpus_year"
+    config_tup = set_user_config(bibliometer_path, corpus_year, pg.BDD_LIST)
+    rawdata_path = config_tup[0][database_type]
+    parsing_path = config_tup[1][database_type]
+    item_filename_dict = config_tup[2]
+
+    # Setting parsing files extension for saving
+    parsing_save_extent = pg.TSV_SAVE_EXTENT
+
+    # Skipping the parsing if its inputs are unchanged
+    manifest_path = Path(parsing_path) / Path(pg.PARSING_MANIFEST)
+    inputs_key = _get_parsing_inputs_key(rawdata_path, paths_tup)
+    manifest_dict = _check_parsing_manifest(parsing_path, inputs_key, item_filename_dict)
+    if manifest_dict and not force:
+        _set_progress(progress_callback, 100)
+        return manifest_dict["articles number"]
+
+    _set_progress(progress_callback, 20)
+    if not os.path.exists(parsing_path):
+        os.makedirs(parsing_path)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    parsing_tup = parse_rawdata_chunks(rawdata_path, database_type, paths_tup,
+                                       chunks_nb=chunks_nb, max_workers=max_workers)
+    parsing_dict, fails_dict = parsing_tup
+    _set_progress(progress_callback, 80)
+    save_parsing_dict(parsing_dict, parsing_path,
+                      item_filename_dict, parsing_save_extent)
+    _set_progress(progress_callback, 90)
+    save_fails_dict(fails_dict, parsing_path)
+    articles_number = fails_dict["number of article"]
+    write_manifest(manifest_path, {"inputs": inputs_key,
+                                   "articles number": articles_number})
+    _set_progress(progress_callback, 100)
+    return articles_number
+
+
+def deduplicate_corpus_parsing(corpus_year, org_tup, datatype, paths_tup,
+                               progress_callback=None, force=False):
+    """Concatenates and deduplicates the parsings of the databases
+    for a corpus year and saves the results.
+
+    This is done through the functions `concatenate_parsing`
+    and `deduplicate_parsing` imported from 3rd party package
+    imported as bp. The resulting parsing files are saved using
+    paths set through the `set_user_config` function imported
+    from the `bmfuncts.config_utils` module.
+    The synthesis is skipped when its manifest records the same inputs,
+    that are the inputs of the parsings of the databases recorded
+    in their manifests and the parameters of the synthesis.
+
+    Args:
+        corpus_year (str): Corpus year defined by 4 digits.
+        org_tup (tup): Contains Institute parameters.
+        datatype (str): Data combination type from corpuses databases.
+        paths_tup (tup): (full path to working folder, \
+        full path to institute-affiliations file, \
+        full path to institutions-types file).
+        progress_callback (function): Function for updating \
+        ProgressBar tkinter widget status (optional, default = None).
+        force (bool): If true, the synthesis is done even if its inputs \
+        are unchanged (optional, default = False).
+    Returns:
+        (int): The number of articles of the synthesis.
+    """
+    # Setting parameters from args
+    bibliometer_path, institute_affil_file_path, inst_types_file_path = paths_tup
+
+    # Setting Institute parameters
+    institutions_filter_list = org_tup[3]
+
+    # Getting the full paths of the working folder architecture for the corpus "corpus_year"
+    config_tup = set_user_config(bibliometer_path, corpus_year, pg.BDD_LIST)
+    parsing_path_dict, item_filename_dict = config_tup[1], config_tup[2]
+
+    # Setting useful paths
+    scopus_parsing_path = parsing_path_dict["scopus"]
+    wos_parsing_path = parsing_path_dict["wos"]
+    concat_root_folder = parsing_path_dict["concat_root"]
+    concat_parsing_path = parsing_path_dict["concat"]
+    dedup_root_folder = parsing_path_dict["dedup_root"]
+    dedup_parsing_path = parsing_path_dict["dedup"]
+
+    # Setting parsing files extension for saving
+    parsing_save_extent = pg.TSV_SAVE_EXTENT
+
+    # Skipping the synthesis if its inputs are unchanged
+    manifest_path = Path(dedup_parsing_path) / Path(pg.PARSING_MANIFEST)
+    parsings_inputs_dict = {}
+    for database_type in pg.BDD_LIST:
+        database_manifest_dict = read_manifest(Path(parsing_path_dict[database_type])
+                                               / Path(pg.PARSING_MANIFEST))
+        if database_manifest_dict:
+            parsings_inputs_dict[database_type] = database_manifest_dict["inputs"]
+    inputs_key = _set_inputs_key({"parsings"           : parsings_inputs_dict,
+                                  "institutions_filter": institutions_filter_list,
+                                  "datatype"           : datatype,
+                                  "institute_affil"    : get_file_hash(institute_affil_file_path),
+                                  "inst_types"         : get_file_hash(inst_types_file_path)})
+    manifest_dict = None
+    if len(parsings_inputs_dict)==len(pg.BDD_LIST):
+        manifest_dict = _check_parsing_manifest(dedup_parsing_path, inputs_key,
+                                                item_filename_dict)
+    if manifest_dict and not force:
+        _set_progress(progress_callback, 100)
+        return manifest_dict["articles number"]
+
+    for folder_path in [concat_root_folder, concat_parsing_path,
+                        dedup_root_folder, dedup_parsing_path]:
+        if not os.path.exists(folder_path):
+            os.mkdir(folder_path)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    _set_progress(progress_callback, 15)
+
+    scopus_parsing_dict = read_parsing_dict(scopus_parsing_path, item_filename_dict,
+                                            parsing_save_extent)
+    wos_parsing_dict = read_parsing_dict(wos_parsing_path, item_filename_dict,
+                                         parsing_save_extent)
+    _set_progress(progress_callback, 30)
+    concat_parsing_dict = bp.concatenate_parsing(scopus_parsing_dict, wos_parsing_dict,
+                                                 inst_filter_list=institutions_filter_list)
+    _set_progress(progress_callback, 50)
+    save_parsing_dict(concat_parsing_dict, concat_parsing_path,
+                      item_filename_dict, parsing_save_extent)
+    _set_progress(progress_callback, 60)
+    file_path_0 = inst_types_file_path
+    file_path_1 = institute_affil_file_path
+    dedup_parsing_dict = bp.deduplicate_parsing(concat_parsing_dict,
+                                                norm_inst_status=False,
+                                                inst_types_file_path=file_path_0,
+                                                country_affiliations_file_path=file_path_1)
+
+    synthese_articles_nb = len(dedup_parsing_dict["articles"])
+    _set_progress(progress_callback, 90)
+    save_parsing_dict(dedup_parsing_dict, dedup_parsing_path,
+                      item_filename_dict, parsing_save_extent,
+                      dedup_infos=(bibliometer_path, datatype, corpus_year))
+    write_manifest(manifest_path, {"inputs": inputs_key,
+                                   "articles number": synthese_articles_nb})
+    _set_progress(progress_callback, 100)
+    return synthese_articles_nb
+
+
+def parse_corpuses(corpus_years, org_tup, datatype, paths_tup,
+                   progress_callback=None, progress_bar_state=0,
+                   max_workers=None, force=False):
+    """Parses the rawdata of all the databases for several corpus years
+    in parallel and builds the synthesis of each corpus year as soon as
+    the parsings of all the databases of the corpus year are ready.
+
+    The parsings of each database and each corpus year are run in a pool
+    of worker processes through the `parse_corpus` function that saves
+    the parsing results as soon as they are available. The synthesis
+    of a corpus year is then run in the same pool through
+    the `deduplicate_corpus_parsing` function.
+    The databases without available rawdata for a corpus year are skipped
+    and the synthesis of this corpus year is not built.
+    The parsings and the syntheses which inputs are unchanged are not rebuilt
+    unless 'force' is true. Each parsing is run at once in its worker process,
+    without chunks, to avoid nesting pools of worker processes.
+
+    Args:
+        corpus_years (list): The corpus years (str) defined by 4 digits.
+        org_tup (tup): Contains Institute parameters.
+        datatype (str): Data combination type from corpuses databases.
+        paths_tup (tup): (full path to working folder, \
+        full path to institute-affiliations file, \
+        full path to institutions-types file).
+        progress_callback (function): Function for updating \
+        ProgressBar tkinter widget status (optional, default = None).
+        progress_bar_state (int): Initial status of ProgressBar tkinter widget \
+        (optional, default = 0).
+        max_workers (int): Number of worker processes (optional, default = None, \
+        the number of parsings limited to the number of CPUs).
+        force (bool): If true, the parsings and the syntheses are done even if \
+        their inputs are unchanged (optional, default = False).
+    Returns:
+        (dict): Dict keyed by the corpus years and valued by dicts keyed \
+        by the databases names and "dedup" for the synthesis and valued \
+        by the number of articles (int) or None when not built.
+    """
+    # Setting parameters from args
+    bibliometer_path = paths_tup[0]
+
+    # Setting the parsings to run depending on the rawdata availability
+    results_dict = {}
+    parsings_list = []
+    for corpus_year in corpus_years:
+        results_dict[corpus_year] = dict.fromkeys(pg.BDD_LIST + ["dedup"])
+        rawdata_path_dict = set_user_config(bibliometer_path, corpus_year, pg.BDD_LIST)[0]
+        for database_type in pg.BDD_LIST:
+            if _get_rawdata_status(rawdata_path_dict[database_type], database_type):
+                parsings_list.append((corpus_year, database_type))
+    dedup_years_list = [corpus_year for corpus_year in corpus_years
+                        if all((corpus_year, database_type) in parsings_list
+                               for database_type in pg.BDD_LIST)]
+    tasks_nb = len(parsings_list) + len(dedup_years_list)
+    if not tasks_nb:
+        _set_progress(progress_callback, 100)
+        return results_dict
+
+    # Running the parsings and the syntheses in the pool of worker processes
+    if max_workers is None:
+        max_workers = min(len(parsings_list), os.cpu_count() or 1)
+    step = (100 - progress_bar_state) / tasks_nb
+    done_tasks_nb = 0
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending_futures = {}
+        for corpus_year, database_type in parsings_list:
+            future = executor.submit(parse_corpus, corpus_year, database_type, paths_tup,
+                                     force=force, chunks_nb=1)
+            pending_futures[future] = (corpus_year, database_type)
+        while pending_futures:
+            done_futures, _ = wait(pending_futures, return_when=FIRST_COMPLETED)
+            for future in done_futures:
+                corpus_year, task_type = pending_futures.pop(future)
+                results_dict[corpus_year][task_type] = future.result()
+                done_tasks_nb += 1
+                year_parsings_list = [results_dict[corpus_year][database_type]
+                                      for database_type in pg.BDD_LIST]
+                if (task_type!="dedup" and corpus_year in dedup_years_list
+                    and None not in year_parsings_list):
+                    future = executor.submit(deduplicate_corpus_parsing, corpus_year,
+                                             org_tup, datatype, paths_tup, force=force)
+                    pending_futures[future] = (corpus_year, "dedup")
+            _set_progress(progress_callback, progress_bar_state + step * done_tasks_nb)
+    return results_dict
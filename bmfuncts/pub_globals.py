@@ -21,10 +21,12 @@ __all__ = ['ANALYSIS_IF',
            'COL_NAMES_COMPL',
            'COL_NAMES_DOCTYPE_ANALYSIS',
            'COL_NAMES_EXT',
+           'COL_NAMES_FUZZY',
            'COL_NAMES_IF_ANALYSIS',
            'COL_NAMES_ORTHO',
            'COL_NAMES_PUB_NAMES',
            'CONFIG_FOLDER',
+           'CORPUSES_STATUS_INDEX',
            'DATATYPE_LIST',
            'DF_TITLES_LIST',
            'DOC_TYPE_DICT',
@@ -34,12 +36,18 @@ __all__ = ['ANALYSIS_IF',
            'KPI_KEYS_DICT',
            'KPI_KEYS_ORDER_DICT',
            'LISTES_CONCAT',
+           'MERGE_STATE_VERSION',
            'NOT_AVAILABLE_IF',
            'OTHER_DOCTYPE',
            'OTP_SHEET_NAME_BASE',
            'OUTSIDE_ANALYSIS',
+           'PARSING_CACHE_EXTENT',
+           'PARSING_CHUNK_RECORDS',
            'PARSING_CONFIG_FILE',
+           'PARSING_MANIFEST',
+           'PARSING_MANIFEST_VERSION',
            'PARSING_PERF',
+           'RAWDATA_MANIFEST',
            'RESULTS_TO_SAVE',
            'ROW_COLORS',
            'SHEET_NAMES_ORPHAN',
@@ -77,8 +85,34 @@ PARSING_CONFIG_FILE = 'BiblioParsing_config.json'
 
 PARSING_PERF = "Parsing_perf.json"
 
+# Name of the index of the rawdata and parsings availability by corpus year
+# saved in the working folder
+CORPUSES_STATUS_INDEX = "Corpuses_status.json"
+
+# Number of records of the chunks of large rawdata files parsed in parallel
+PARSING_CHUNK_RECORDS = 20000
+
+# Names of the manifests of the content hashes of the inputs
+# of the rawdata copies and of the parsings
+RAWDATA_MANIFEST = "Rawdata_manifest.json"
+
+PARSING_MANIFEST = "Parsing_manifest.json"
+
+# Version of the manifests of the parsings inputs
+# to be incremented when the parsing of the rawdata is modified
+PARSING_MANIFEST_VERSION = 1
+
 TSV_SAVE_EXTENT = "dat"
 
+# Extent of the binary cache files saved alongside the parsing files
+# ("pkl", "parquet" or "feather", the last two requiring pyarrow package),
+# set to None for no cache
+PARSING_CACHE_EXTENT = "pkl"
+
+# Version of the state of authors-employees merge saved for incremental merge
+# to be incremented when the merge of authors with employees is modified
+MERGE_STATE_VERSION = 2
+
 XL_INDEX_BASE = 1
 
 LISTES_CONCAT = False
@@ -87,9 +121,10 @@ AUTHORS_FULL_LIST_NAME_CORRECTION = False
 
 ARCHI_BACKUP = {"root" : "Sauvegarde de secours"}
 
-ARCHI_BDD_MULTI_ANNUELLE = {"root"                  : "BDD multi annuelle",
-                            "concat file name base" : "Concaténation par",
-                            "kpis file name base"   : "Synthèse des KPIs",
+ARCHI_BDD_MULTI_ANNUELLE = {"root"                   : "BDD multi annuelle",
+                            "concat file name base"  : "Concaténation par",
+                            "kpis file name base"    : "Synthèse des KPIs",
+                            "kept OTPs db file name" : "OTPs conservés.db",
                            }
 
 ARCHI_EXTRACT = {"root"             : "Extractions Institut",
@@ -178,6 +213,8 @@ ARCHI_YEAR = {
               "submit file name"                    : "submit.xlsx",
               "orphan file name"                    : "orphan.xlsx",
               "hash_id file name"                   : "hash_id.xlsx",
+              "merge state file name"               : "merge_state.pkl",
+              "orphan proposals file name"          : "orphan_proposals.xlsx",
               "homonymes folder"                    : "1 - Consolidation Homonymes",
               "homonymes file name base"            : "Fichier Consolidation",
               "OTP folder"                          : "2 - OTP",
@@ -308,10 +345,23 @@ COL_NAMES_EXT = {'last name'   : PUB_LAST_NAME,
                 }
 
 
+COL_NAMES_FUZZY = {'last name init' : PUB_LAST_NAME,
+                   'initials init'  : PUB_INITIALS,
+                   'last name new'  : EMPLOYEE_LAST_NAME,
+                   'initials new'   : EMPLOYEE_INITIALS,
+                   'matricule'      : 'Matricule',
+                   'employees year' : 'Année eff',
+                   'distance'       : 'Distance',
+                   'similarity'     : 'Similarité',
+                   'pub nb'         : 'Nb pub',
+                  }
+
+
 SHEET_NAMES_ORPHAN = {"to replace"    : "Spécifique par publi",
                       "to remove"     : "Externes ",
                       "docs to add"   : "Doctorants externes",
                       "others to add" : "Autres externes",
+                      "proposals"     : "Propositions orthographe",
                      }
 
 
@@ -1,4 +1,7 @@
 """Module of useful functions for setting columns names of dataframes.
+
+The columns renaming dicts are cached for the process keyed by the Institute 
+and by the organization parameters they depend on.
 """
 
 __all__ = ['build_col_conversion_dic',
@@ -10,6 +13,9 @@ __all__ = ['build_col_conversion_dic',
           ]
 
 
+# Standard library imports
+from functools import lru_cache
+
 # 3rd party imports
 import BiblioParsing as bp
 
@@ -17,14 +23,32 @@ import BiblioParsing as bp
 import bmfuncts.employees_globals as eg
 import bmfuncts.pub_globals as pg
 
-def build_col_conversion_dic(institute, org_tup):
-    """Builds a dict for setting the final column names 
-    given the initial column names of 3 dataframes.
+
+def _set_org_key(org_tup):
+    """Sets the key (hashable) of the organization parameters used 
+    for setting the columns names.
 
     Args:
-        institute (str): The Intitute name.
         org_tup (tup): The tuple of the organization structure \
         of the Institute.
+    Returns:
+        (tup): (departments columns names items (tup), \
+        institutions columns names (tup)).
+    """
+    return (tuple(org_tup[0].items()), tuple(org_tup[4]))
+
+
+@lru_cache(maxsize=16)
+def _build_col_rename_dicts(institute, org_key):
+    """Builds the dicts for setting the final column names 
+    given the initial column names of 3 dataframes.
+
+    The dicts are cached and must not be modified by the callers.
+
+    Args:
+        institute (str): The Intitute name.
+        org_key (tup): The key of the organization parameters \
+        set by the `_set_org_key` internal function.
     Returns:
         (tup): (dict for renaming the specific columns of the dataframe \
         of publications list with one row per author that has not been \
@@ -36,9 +60,9 @@ def build_col_conversion_dic(institute, org_tup):
     """
 
     # Setting institute parameters
-    col_names_dpt  = org_tup[0]
+    col_names_dpt  = dict(org_key[0])
     dpt_col_list   = list(col_names_dpt.values())
-    inst_col_list  = org_tup[4]
+    inst_col_list  = list(org_key[1])
 
     init_orphan_col_list = sum([[pg.COL_HASH['hash_id']],
                                 bp.COL_NAMES['auth_inst'][:5],
@@ -126,12 +150,36 @@ def build_col_conversion_dic(institute, org_tup):
     return orphan_col_rename_dic, submit_col_rename_dic, all_col_rename_dic
 
 
+def build_col_conversion_dic(institute, org_tup):
+    """Builds a dict for setting the final column names 
+    given the initial column names of 3 dataframes.
+
+    The dicts are built through the `_build_col_rename_dicts` internal 
+    function that caches them and copies are returned.
+
+    Args:
+        institute (str): The Intitute name.
+        org_tup (tup): The tuple of the organization structure \
+        of the Institute.
+    Returns:
+        (tup): (dict for renaming the specific columns of the dataframe \
+        of publications list with one row per author that has not been \
+        identified as Institute employee, \
+        dict for renaming the specific columns of the dataframe of merged \
+        employees information with the publications list with one \
+        row per Institute author, \
+        dict for renaming the columns of all the results dataframes).
+    """
+    col_rename_tup = _build_col_rename_dicts(institute, _set_org_key(org_tup))
+    return tuple(dict(col_rename_dic) for col_rename_dic in col_rename_tup)
+
+
 def set_homonym_col_names(institute, org_tup):
     """Sets the dict for setting the final column names to be used for building 
     the dataframe for homonyms solving by the user.
 
-    This is done through the `build_col_conversion_dic` function of 
-    the same module.
+    This is done through the `_build_col_rename_dicts` internal function 
+    of the same module.
 
     Args:
         institute (str): The Intitute name.
@@ -142,7 +190,7 @@ def set_homonym_col_names(institute, org_tup):
         of the dataframe built for homonyms solving by the user.
     """
     #  Setting useful col names
-    col_rename_tup = build_col_conversion_dic(institute, org_tup)
+    col_rename_tup = _build_col_rename_dicts(institute, _set_org_key(org_tup))
     all_col_rename_dic = col_rename_tup[2]
 
     homonyms_col_dic_init = {'hash_id'       : pg.COL_HASH['hash_id'],
@@ -179,8 +227,8 @@ def set_otp_col_names(institute, org_tup):
     """Sets the dict for setting the final column names to be used for building 
     the dataframes for OTPs attribution by the user.
 
-    This is done through the `build_col_conversion_dic` function of 
-    the same module.
+    This is done through the `_build_col_rename_dicts` internal function 
+    of the same module.
 
     Args:
         institute (str): The Intitute name.
@@ -194,7 +242,7 @@ def set_otp_col_names(institute, org_tup):
     dpt_col_names = org_tup[0]
 
     #  Setting useful col names
-    col_rename_tup = build_col_conversion_dic(institute, org_tup)
+    col_rename_tup = _build_col_rename_dicts(institute, _set_org_key(org_tup))
     all_col_rename_dic = col_rename_tup[2]
 
     otp_col_dic_init = {'hash_id'           : pg.COL_HASH['hash_id'],
@@ -230,7 +278,7 @@ def set_final_col_names(institute, org_tup):
     """Sets the dict for setting the final column names to be used for building 
     the final publications-list dataframe.
 
-    This is done through the `build_col_conversion_dic` function 
+    This is done through the `_build_col_rename_dicts` internal function 
     of the same module.
 
     Args:
@@ -246,7 +294,7 @@ def set_final_col_names(institute, org_tup):
     dpt_col_names = org_tup[0]
 
     #  Setting useful col names
-    col_rename_tup = build_col_conversion_dic(institute, org_tup)
+    col_rename_tup = _build_col_rename_dicts(institute, _set_org_key(org_tup))
     all_col_rename_dic = col_rename_tup[2]
 
     final_col_dic_init = {'hash_id'           : pg.COL_HASH['hash_id'],
@@ -308,7 +356,7 @@ def set_col_attr(institute, org_tup, columns_list):
     dataframes before openpyxl save.
 
     The final column names are got through the 
-    `build_col_conversion_dic` internal function.
+    `_build_col_rename_dicts` internal function.
 
     Args:
         institute (str): The Institute name.
@@ -326,7 +374,7 @@ def set_col_attr(institute, org_tup, columns_list):
     col_names_dpt = org_tup[0]
 
     #  Setting useful col names
-    col_rename_tup = build_col_conversion_dic(institute, org_tup)
+    col_rename_tup = _build_col_rename_dicts(institute, _set_org_key(org_tup))
     all_col_rename_dic = col_rename_tup[2]
 
     init_col_attr   = {pg.COL_HASH['hash_id']                 : [25, "center"],
@@ -1,23 +1,42 @@
 """Module of functions for the update of the employees database.
 """
-__all__ = ['set_employees_data',
+__all__ = ['export_employees_xlsx',
+           'set_employees_data',
            'update_employees',]
 
 # Standard library imports
 import os
 import re
 import shutil
+from collections.abc import MutableMapping
 from pathlib import Path
 from tkinter import messagebox
 
 # 3rd party imports
+import numpy as np
 import pandas as pd
 
 # local imports
 import bmfuncts.employees_globals as eg
 import bmfuncts.pub_globals as pg
+from bmfuncts.cache_utils import read_manifest
+from bmfuncts.employees_cache import backup_months_history
+from bmfuncts.employees_cache import check_history_newer
+from bmfuncts.employees_cache import get_employees_sheets
+from bmfuncts.employees_cache import get_file_key
+from bmfuncts.employees_cache import get_history_months
+from bmfuncts.employees_cache import get_history_years
+from bmfuncts.employees_cache import read_employees_cache_manifest
+from bmfuncts.employees_cache import read_employees_sheets
+from bmfuncts.employees_cache import read_months_history
+from bmfuncts.employees_cache import save_months_history
+from bmfuncts.employees_cache import set_employees_cache_paths
+from bmfuncts.employees_cache import set_employees_history_path
+from bmfuncts.employees_cache import set_employees_year_data
+from bmfuncts.employees_cache import set_month_history_path
+from bmfuncts.employees_cache import set_year_cache_path
+from bmfuncts.employees_cache import write_employees_cache_manifest
 from bmfuncts.useful_functs import concat_dfs
-from bmfuncts.useful_functs import standardize_txt
 
 
 def _set_employees_paths(bibliometer_path):
@@ -129,35 +148,38 @@ def _add_sheets_to_workbook(file_full_path, df_to_add, sheet_name):
 
 
 def _update_months_history(months2add_file_path,
+                           history_folder_path,
                            one_year_employees_folder_path,
                            one_year_employees_base_name,
-                           replace=True,):
-    """Updates the file pointed by 'year_months_file_path' for a year.
+                           replace=True):
+    """Updates the months history of the employees for a year.
 
     More specifically only the new months contained in the EXCEL file 
-    pointed by 'months2add_file_path' are added as new sheets 
-    named mmyyyy where mm stands for the month and yyyy for the year.
+    pointed by 'months2add_file_path' are added to the months history 
+    as new files named mmyyyy where mm stands for the month and yyyy for the year.
 
     The sheets are checked using the local function '_check_sheet_month' 
     of the module 'BiblioMeterUpdateEmployees' of the package 'bmfuncts'.
 
     This function returns error messages if the sheets to add are misconfigured. 
-    If no error is returned, the sheets are added using the local function 
-    '_add_sheets_to_workbook' of the module 'BiblioMeterUpdateEmployees' 
-    of the package 'bmfuncts'.
+    If no error is returned, the months are added through the `save_months_history` 
+    internal function after initializing, if needed, the months history of the year 
+    from the existing file gathering the employees for the year.
 
     Args:
         months2add_file_path (path): Full path to the employees EXCEL file \
         with one sheet per months to update the employees file.
+        history_folder_path (path): Full path to the months history folder.
         one_year_employees_folder_path (path): Full path to the folder containing \
         the files gathering the employees per year.
         one_year_employees_base_name (path): Base for building the file \
         name of the file gathering the employees for a year.
-        replace (bool): If true, existing sheets are replaced in the Ecxel \
-        file (default: True).
+        replace (bool): If true, existing months are replaced in the months \
+        history (default: True).
     Returns:
-        (tup): Tuple of 5 strings = (year, year_months_file_path, \
-        sheet_name_message, col_message, years2add_message).
+        (tup): Tuple of 5 items = (year (str), employees data of the months \
+        of the year (dict), sheet_name_message (str), col_message (str), \
+        years2add_message (str)).
 
     """
 
@@ -186,29 +208,57 @@ def _update_months_history(months2add_file_path,
     file_name = f'{year}' + one_year_employees_base_name
     year_months_file_path = one_year_employees_folder_path / Path(file_name)
 
-    if os.path.isfile(year_months_file_path):
-        # if the file already exits we update with new sheets
-        df_months_dict = pd.read_excel(year_months_file_path, sheet_name=None)
-        if not replace: # we only add missing months
-            months_present = list(df_months_dict.keys())
-            months_to_add  = list(set(months_to_add) - set(months_present))
-            months_to_add  = sorted(months_to_add)
-        for month in months_to_add:
-            _add_sheets_to_workbook(year_months_file_path, df_months_to_add[month], month)
+    # Initializing the months history of the year from the existing file
+    months_present = get_history_months(history_folder_path, year)
+    if not months_present and os.path.isfile(year_months_file_path):
+        save_months_history(history_folder_path,
+                             pd.read_excel(year_months_file_path, sheet_name=None))
+        months_present = get_history_months(history_folder_path, year)
 
-    else:
-        # if the file is not present we create a new Excel file with one sheet per month
-        month = months_to_add[0]
-        # we add the first month
-        df_months_to_add[month].to_excel(year_months_file_path, sheet_name=month)
-        for month in months_to_add[1:]:
-            # we add the other months
-            _add_sheets_to_workbook(year_months_file_path, df_months_to_add[month], month)
+    if not replace: # we only add missing months
+        months_to_add  = list(set(months_to_add) - set(months_present))
+        months_to_add  = sorted(months_to_add)
+
+    # Appending the months to the months history
+    save_months_history(history_folder_path,
+                         {month: df_months_to_add[month] for month in months_to_add})
+    year_months_dict = read_months_history(history_folder_path, year)
+    return year, year_months_dict, None, None, None
 
-    return year, year_months_file_path, None, None, None
 
+def _set_groups_values(year_df, idx_col, keys_list, cols_list, groups_nb):
+    """Sets, for each group of rows of 'year_df' defined by the 'idx_col' column, 
+    the lists of the values of the 'cols_list' columns for the unique values 
+    of the 'keys_list' columns in the order of the rows.
 
-def _add_column_keep_history(df):
+    Args:
+        year_df (dataframe): The employees data of the months of a year \
+        in long format with one row per employee and per month.
+        idx_col (str): The name of the column of the groups indexes \
+        (int) ranging from 0 to 'groups_nb' - 1.
+        keys_list (list): The names (str) of the columns defining \
+        the unique values.
+        cols_list (list): The names (str) of the columns which values are listed.
+        groups_nb (int): The number of groups.
+    Returns:
+        (dict): The arrays of the lists of values ordered by groups indexes \
+        keyed by the names of the 'cols_list' columns.
+    """
+    unique_df = year_df[[idx_col] + keys_list].drop_duplicates().\
+                sort_values(by=[idx_col], kind='stable')
+    ends_list = np.cumsum(np.bincount(unique_df[idx_col], minlength=groups_nb)).tolist()
+    starts_list = [0] + ends_list[:-1]
+    groups_values_dict = {}
+    for col in cols_list:
+        values_list = unique_df[col].astype(object).to_numpy().tolist()
+        groups_values_array = np.empty(groups_nb, dtype=object)
+        for group_idx, (start, end) in enumerate(zip(starts_list, ends_list)):
+            groups_values_array[group_idx] = values_list[start:end]
+        groups_values_dict[col] = groups_values_array
+    return groups_values_dict
+
+
+def _add_column_keep_history(df, year_df, idx_col):
     """Creates 4 new columns defined by the global 'EFFECTIF_ADD_COLS' 
     at the keys 'dpts_list', 'servs_list', 'months_list' and 'years_list'.
 
@@ -223,18 +273,21 @@ def _add_column_keep_history(df):
         - and the colummn of key dpts_list' contains \
         ['DTCH', 'DTCH', 'DTCH', 'DTNM', 'DTNM', 'DTNM', 'DTNM', 'DTNM', 'DTNM'].
 
-    The function uses the columns defined by the global `EMPLOYEES_USEFUL_COLS`
-    at keys 'dpt' and 'serv' that contain, for each employee,
-    a list of at most 12 tuples:
-
-        [(mm_1, yyyy_1, dep_1),(mm_2, yyyy_2, dep_2), ..., (mm_n, yyyy_n, dep_n)]
-
-    witch are re-casted in 3 lists [mm_1, mm_2, ..., mm_n]:
-
-        [yyyy_1, yyyy_2, ..., yyyy_n], [dep_1, dep_2, ..., dep_n].
+    The function uses the long-format data of the year 'year_df' with one row 
+    per employee and per month where the columns defined by the global 
+    `EMPLOYEES_ADD_COLS` at keys 'months_list' and 'years_list' contain 
+    the month mm and the year yyyy of the row. The unique rows 
+    (mm, yyyy, dep) and (mm, yyyy, serv) of each employee are listed 
+    in month order through the `_set_groups_values` internal function; 
+    the months and years lists are those of the services.
 
     Args:
-        df (dataframe): The dataframe to which the 4 columns are added.
+        df (dataframe): The dataframe to which the 4 columns are added \
+        indexed by the employees groups indexes.
+        year_df (dataframe): The employees data of the months of the year \
+        in long format.
+        idx_col (str): The name of the column of the employees groups indexes \
+        in 'year_df'.
     Returns:
         (dataframe): The updated dataframe.
     """
@@ -247,22 +300,20 @@ def _add_column_keep_history(df):
     col_add_month_alias = eg.EMPLOYEES_ADD_COLS['months_list']
     col_add_year_alias = eg.EMPLOYEES_ADD_COLS['years_list']
 
-    # Converting the list of tuples[(mm_1, yyyy_1, item_1), ...(mm_n, yyyy_n, item_n)]
-    # into a list of 3 lists [[mm_1,...,mm_n], [yyyy_1,....yyyy_n],[item_1,....,item_n]]
-    # where 'item' stands for department.
-    # The 2 lists of 3 lists are put into the two new columns
-    # named 'col_add_dpts_alias' and 'col_add_servs_alias'
-    cols_tup_list = [(col_eff_dpt_alias, col_add_dpts_alias),
-                     (col_eff_service_alias, col_add_servs_alias)]
-    for cols_tup in cols_tup_list:
-        col_in, col_out = cols_tup[0], cols_tup[1]
-        df[col_out] = df[col_in].apply(lambda x: [list(x) for x in list(zip(*x))])
-
-    # Exploding the 2 lists of 3 lists into the columns
-    # named 'months', 'years', 'Dpts' and 'Servs'
-    for col in [col_add_dpts_alias, col_add_servs_alias]:
-        new_col = [col_add_month_alias,col_add_year_alias,col]
-        df[new_col] = pd.DataFrame(df[col].tolist(), index=df.index)
+    # Setting the lists of the unique (mm, yyyy, item) of each employee
+    # where 'item' stands for department or service
+    groups_nb = len(df.index.unique())
+    groups_idx_array = df.index.to_numpy()
+    cols_tup_list = [(col_eff_dpt_alias, {col_eff_dpt_alias: col_add_dpts_alias}),
+                     (col_eff_service_alias, {col_eff_service_alias: col_add_servs_alias,
+                                              col_add_month_alias: col_add_month_alias,
+                                              col_add_year_alias: col_add_year_alias})]
+    for col_item, cols_dict in cols_tup_list:
+        keys_list = [col_add_month_alias, col_add_year_alias, col_item]
+        groups_values_dict = _set_groups_values(year_df, idx_col, keys_list,
+                                                list(cols_dict.keys()), groups_nb)
+        for col_in, col_out in cols_dict.items():
+            df[col_out] = groups_values_dict[col_in][groups_idx_array]
 
     return df
 
@@ -276,24 +327,20 @@ def _add_column_firstname_initial(df):
 
         ex: PIERRE -->P, JEAN-PIERRE --> JP , JEAN-PIERRE MARIE --> JPM.
 
+    The initials are built with vectorized string methods by replacing 
+    each word by its first character.
+
     Args:
         df (dataframe): The dataframe to which the column is added.
     Returns:
         (dataframe): The updated dataframe.
     """
 
-    # Internal functions
-    def _get_firstname_initials(row):
-        row = row[0] if isinstance(row, list) else row
-        row = row.replace('-',' ')
-        row_list = row.split(' ')
-        initial_list = [x[0] for x in row_list]
-        initials = ''.join(initial_list)
-        return initials
-
     col_in  = eg.EMPLOYEES_USEFUL_COLS['first_name']
     col_out = eg.EMPLOYEES_ADD_COLS['first_name_initials']
-    df[col_out] = df[col_in].apply(_get_firstname_initials)
+    df[col_out] = df[col_in].str.replace('-', ' ', regex=False).\
+                  str.replace(r'([^ ])[^ ]*', r'\1', regex=True).\
+                  str.replace(' ', '', regex=False)
     return df
 
 
@@ -331,14 +378,14 @@ def _select_employee_dpt_and_serv(df):
     The rule is to choose the department and the service corresponding 
     to the first available month of the year.
 
-        ex: The column defined by the global  'EMPLOYEES_USEFUL_COLS' \
-        at key 'dpt' contains the list of tuples (mm, yyyy, dpt) such as:
+        ex: The column defined by the global  'EMPLOYEES_ADD_COLS' \
+        at key 'dpts_list' contains the list of departments in month order such as:
 
-            x = [('04', '2019', 'DTBH'), ('05', '2019', 'DTBH'), \
-            ('06', '2019', 'DTNM'), ..., ('12', '2019', 'DTNM')].
+            x = ['DTBH', 'DTBH', 'DTNM', ..., 'DTNM'] \
+            for the months ['04', '05', '06', ..., '12'].
 
-        We select DTBH = x[0][-1] as the first occurrence. \
-        The last occurrence would be DTNM = x[-1][-1].
+        We select DTBH = x[0] as the first occurrence. \
+        The last occurrence would be DTNM = x[-1].
 
     Args:
         df (dataframe): The dataframe to be modified.
@@ -350,35 +397,45 @@ def _select_employee_dpt_and_serv(df):
         This may be done using the lambda function where 'Counter' \
         is a method of the 'collections' library: 
 
-        >lambda x: max((count := Counter([y[2] for y in x])), key = count.get)
+        >lambda x: max((count := Counter(x)), key = count.get)
 
     """
 
     col_dpt_alias = eg.EMPLOYEES_USEFUL_COLS['dpt']
     col_serv_alias = eg.EMPLOYEES_USEFUL_COLS['serv']
+    col_dpts_alias = eg.EMPLOYEES_ADD_COLS['dpts_list']
+    col_servs_alias = eg.EMPLOYEES_ADD_COLS['servs_list']
 
-    cols_list = [col_dpt_alias, col_serv_alias]
-    for col in cols_list:
-        df[col] = df[col].apply(lambda x: x[0][-1])
+    cols_list = [(col_dpt_alias, col_dpts_alias), (col_serv_alias, col_servs_alias)]
+    for col, col_list in cols_list:
+        df[col] = df[col_list].str[0]
 
     return df
 
 
-def _build_year_month_dpt(year_months_file_path):
+def _build_year_month_dpt(year_months_dict):
     """Merges all employees information of a year available
-    by month in an Excel workbook.
+    by month in the months history of the employees.
 
-    This workbook contains a worksheet per month. 
-    Each worksheet is labelled mmyyyy where mm stands for the month
+    The months history contains the data of each month of the year. 
+    Each month is labelled mmyyyy where mm stands for the month
     (01, 02, ..., 12) and yyyy stands for the year (2019, 2020, ...). 
-    All the worksheets must at least contain the columns which names 
+    All the months data must at least contain the columns which names 
     are defined by the keys 'matricule', 'first_name', 'name', 'dpt' 
     and 'serv' in the global 'EMPLOYEES_USEFUL_COLS'.
 
-    The function merges the list of sheets and builds the new columns 
-    defined by the global 'EMPLOYEES_ADD_COLS' using the local functions 
-    '_add_column_keep_history', '_add_column_firstname_initial' and 
-    '_add_column_full_name' of the module 'update_employees' of the package 'bmfuncts'.
+    The function concatenates the months data in a long-format table 
+    with one row per employee and per month, tagged by the month and the year, 
+    and indexes the employees by sorted matricule. The values of each column 
+    are then listed per employee without duplicates in month order through 
+    the `_set_groups_values` internal function; a list of a single value is 
+    recasted into this value. The employees with several last names or first 
+    names get one row per couple of last name and first name.
+
+    The new columns defined by the global 'EMPLOYEES_ADD_COLS' are built 
+    using the local functions '_add_column_keep_history', 
+    '_add_column_firstname_initial' and '_add_column_full_name' 
+    of the module 'update_employees' of the package 'bmfuncts'.
 
     The columns added at keys 'months_list', 'years_list', 'dpts_list' and 'servs_list' 
     contains lists formated as: [item_1, item_2, ... items_n] of the n items 
@@ -390,16 +447,12 @@ def _build_year_month_dpt(year_months_file_path):
     of the package 'bmfuncts'.
 
     Args:
-       year_months_file_path (path): The path to the Excel file \
-       that contains a sheet per month of a year.
+       year_months_dict (dict): The employees data of each month of a year \
+       keyed by the months (str) formatted as mmyyyy and ordered by month.
     Returns:
        (dataframe): The built employees dataframe.
     """
 
-    # Internal functions
-    def _set_tup(month, year):
-        return lambda x: (month, year, x)
-
     # Setting lists of columns
     useful_col_list = list(eg.EMPLOYEES_USEFUL_COLS.values())
     add_col_list = list(eg.EMPLOYEES_ADD_COLS.values())
@@ -410,53 +463,52 @@ def _build_year_month_dpt(year_months_file_path):
     name_col_alias = eg.EMPLOYEES_USEFUL_COLS['name']
     matricule_col_alias = eg.EMPLOYEES_USEFUL_COLS['matricule']
     serv_col_alias = eg.EMPLOYEES_USEFUL_COLS['serv']
+    month_col_alias = eg.EMPLOYEES_ADD_COLS['months_list']
+    year_col_alias = eg.EMPLOYEES_ADD_COLS['years_list']
+    idx_col_alias = "Idx_" + matricule_col_alias
+
+    # Concatenating the useful columns of the months data into the dataframe
+    # 'year_df' tagged by month mm and year yyyy extracted from the month name mmyyyy
+    months_df_list = []
+    for month, month_df in year_months_dict.items():
+        month_cols_list = [col for col in month_df.columns if col in useful_col_list]
+        month_df = month_df[month_cols_list].copy()
+        month_df[month_col_alias] = month[0:2]
+        month_df[year_col_alias] = month[2:]
+        months_df_list.append(month_df)
+    year_df = concat_dfs(months_df_list, dedup=False, concat_ignore_index=True)
+
+    # Indexing the employees by sorted matricule
+    year_df[idx_col_alias] = year_df.groupby(matricule_col_alias, sort=True).\
+                             ngroup().to_numpy()
+    year_df = year_df[year_df[idx_col_alias]>=0]
+    groups_nb = year_df[idx_col_alias].nunique()
 
-    # Reading the sheets from the excel file as a dict
-    # {sheet-name: sheet-content dataframe}
-    df_dict = pd.read_excel(year_months_file_path,
-                            sheet_name=None,
-                            usecols=useful_col_list)
-
-    # Concatenating the sheets from the 'sheet_names'
-    # list into the dataframe 'df_eff_year'
-    list_df_eff_month = []
-    for sheet_name,df_eff_month in df_dict.items():
-        month = sheet_name[0:2] # Extraction of the month mm for the sheet name mmyyyy
-        year = sheet_name[2:] # Extraction of year yyyy for the sheet name mmyyyy
-
-        # For the sheet 'sheet_name' of the dataframe 'df_eff_month'
-        # replacing each cell of column 'dpt_col_alias'/'serv_col_alias' that specifies
-        # the employee department dpt/service by a tuple (month,year,dpt)/(month,year,serv)
-        for col_keep_history in [dpt_col_alias, serv_col_alias]:
-            df_eff_month[col_keep_history] = df_eff_month[col_keep_history].\
-                                             apply(_set_tup(month, year))
-
-        list_df_eff_month.append(df_eff_month)
-
-    df_eff_year = concat_dfs(list_df_eff_month)
+    # Dealing with same matriculate for different lastnames and firstnames
+    names_df = year_df[[idx_col_alias, name_col_alias]].drop_duplicates()
+    firstnames_df = year_df[[idx_col_alias, firstname_col_alias]].drop_duplicates()
+    employees_df = names_df.merge(firstnames_df, how='inner', on=idx_col_alias).\
+                   sort_values(by=[idx_col_alias], kind='stable').\
+                   set_index(idx_col_alias)
+    employees_df.index.name = None
+    groups_idx_array = employees_df.index.to_numpy()
 
     # Aggregating all the information related to one matriculate
-    # as a list without duplicates, for each column (except 'Matricule')
-    df_eff_year_singlemat = df_eff_year.groupby(matricule_col_alias).\
-                                                agg(lambda x :list(dict.fromkeys(x))).\
-                                                reset_index()
-
-    # Recasting lists into string if its length is equal to 1
-    col_set = {matricule_col_alias,
-               name_col_alias,
+    # as a list without duplicates recasted into its single value if any
+    col_set = {name_col_alias,
                serv_col_alias,
                dpt_col_alias,
                firstname_col_alias}
-    for col in set(useful_col_list) - col_set:
-        df_eff_year_singlemat[col] = df_eff_year_singlemat[col].\
-                                     apply(lambda x: x[0] if len(x)==1 else list(x))
-
-    # Dealing with same matriculate for different lastnames and firstnames
-    employees_df = df_eff_year_singlemat.explode([name_col_alias])
-    employees_df = employees_df.explode([firstname_col_alias])
+    cols_list = [col for col in useful_col_list
+                 if col not in col_set and col in year_df.columns]
+    for col in cols_list:
+        groups_values_array = _set_groups_values(year_df, idx_col_alias, [col], [col],
+                                                 groups_nb)[col]
+        employees_df[col] = [values[0] if len(values)==1 else values
+                             for values in groups_values_array[groups_idx_array]]
 
     # Adding 6 new columns
-    employees_df = _add_column_keep_history(employees_df)
+    employees_df = _add_column_keep_history(employees_df, year_df, idx_col_alias)
     employees_df = _add_column_firstname_initial(employees_df)
     employees_df = _add_column_full_name(employees_df)
     employees_df = _select_employee_dpt_and_serv(employees_df)
@@ -466,23 +518,119 @@ def _build_year_month_dpt(year_months_file_path):
     return employees_df
 
 
-def update_employees(bibliometer_path, progress_callback=None, replace=True):
-    """Updates the file defined by the global 'EMPLOYEES_ARCHI' at key 
-    'employees_file_name' using the file defined by the global 
-    'EMPLOYEES_ARCHI' at key "one_year_employees_filebase" 
-    and the year 'year'.
+def export_employees_xlsx(bibliometer_path, employees_year):
+    """Exports the employees data of a year from the months history 
+    of the employees to the employees EXCEL files.
+
+    The months of the months history modified after the EXCEL file of the year \
+    defined by the global 'EMPLOYEES_ARCHI' at key "one_year_employees_filebase" \
+    are added as sheets to this file, which is created with all the months \
+    if missing. The employees data of the year built from the months history \
+    through the `_build_year_month_dpt` internal function are saved as the sheet \
+    of the year in the all-years EXCEL file defined by the same global at key \
+    'employees_file_name', which is then copied to the backup folder. \
+    The cache of the standardized all-years employees data is updated \
+    with the data of the year through the `_update_employees_cache` \
+    internal function so that it stays valid for the exported file.
+
+    Args:
+        bibliometer_path (path): The path to the working folder.
+        employees_year (str): The year defined by 4 digits.
+    Returns:
+        (str): The message of creation of the all-years EXCEL file \
+        if it has been created, None otherwise.
+    """
+    # Setting useful file name aliases
+    one_year_employees_basename_alias = eg.EMPLOYEES_ARCHI["one_year_employees_filebase"]
+    all_years_employees_file_alias = eg.EMPLOYEES_ARCHI["employees_file_name"]
+
+    # Getting useful employees paths
+    (_, all_years_employees_folder_path,
+     one_year_employees_folder_path,
+     backup_folder_path) = _set_employees_paths(bibliometer_path)
+
+    # Setting full paths to useful files
+    all_years_file_path = all_years_employees_folder_path / Path(all_years_employees_file_alias)
+    year_months_file_name = employees_year + one_year_employees_basename_alias
+    year_months_file_path = one_year_employees_folder_path / Path(year_months_file_name)
+    history_folder_path = set_employees_history_path(all_years_file_path)
+
+    # Getting the months history of the year
+    year_months_dict = read_months_history(history_folder_path, employees_year)
+
+    if os.path.isfile(year_months_file_path):
+        # if the file already exits we update it with the months modified after it
+        year_file_mtime = os.path.getmtime(year_months_file_path)
+        for month, month_df in year_months_dict.items():
+            month_path = set_month_history_path(history_folder_path, month)
+            if os.path.getmtime(month_path)>year_file_mtime:
+                _add_sheets_to_workbook(year_months_file_path, month_df, month)
+    else:
+        # if the file is not present we create a new Excel file with one sheet per month
+        months_list = list(year_months_dict.keys())
+        month = months_list[0]
+        # we add the first month
+        year_months_dict[month].to_excel(year_months_file_path, sheet_name=month)
+        for month in months_list[1:]:
+            # we add the other months
+            _add_sheets_to_workbook(year_months_file_path, year_months_dict[month], month)
+
+    # Getting the validity status of the cache before the export
+    cache_status = read_employees_cache_manifest(all_years_file_path) is not None
+
+    # Saving the employees data of the year as a sheet named after employees_year,
+    # in the workbook pointed by all_years_file_path
+    employees_df = _build_year_month_dpt(year_months_dict)
+    all_years_file_error = None
+    if os.path.exists(all_years_file_path):
+        _add_sheets_to_workbook(all_years_file_path, employees_df, employees_year)
+    else:
+        employees_df.to_excel(all_years_file_path, sheet_name=employees_year)
+        all_years_file_error  = f"The file '{all_years_file_path}' has been "
+        all_years_file_error += f"created with a sheet named '{employees_year}'"
+
+    # Copying the all-years employees file updated to the backup folder
+    shutil.copy(all_years_file_path, backup_folder_path)
+
+    # Updating the cache of the standardized all-years employees data
+    _update_employees_cache(all_years_file_path, cache_status, employees_year, employees_df)
+    return all_years_file_error
+
+
+def update_employees(bibliometer_path, progress_callback=None, replace=True,
+                     export_xlsx=False):
+    """Updates the employees database with the months of a year available 
+    in the folder defined by the global 'EMPLOYEES_ARCHI' at key 
+    'complementary_employees'.
+
+    The months are appended to the months history of the employees through \
+    the `_update_months_history` internal function. Then the employees data \
+    of the year are built from the months history of the year through \
+    the `_build_year_month_dpt` internal function and saved in the cache \
+    of the standardized all-years employees data through \
+    the `_update_employees_cache` internal function. The months history \
+    of the year is copied to the backup folder through the `backup_months_history` \
+    function imported from `bmfuncts.employees_cache` module. \
+    Thus, a monthly update only writes the new months and the data of their year.
+
+    The employees EXCEL files are updated through the `export_employees_xlsx` \
+    function only if 'export_xlsx' is true.
 
     Args:
         bibliometer_path (path): The path to the working folder.
         progress_callback (function): Function for updating ProgressBar \
         tkinter widget status (default = None).
-        replace (bool): Optional (default = True); if true, existing sheets \
-        are replaced in employees EXCEL files specific to a year.
+        replace (bool): Optional (default = True); if true, existing months \
+        are replaced in the months history of the employees.
+        export_xlsx (bool): Optional (default = False); if true, the employees \
+        EXCEL files are updated.
     Returns:
-        (tup): Tuple of 5 strings; a first string giving the employees year \
+        (tup): Tuple of 6 strings; a first string giving the employees year \
         if no error is raised; then 4 strings specifying errors related \
         respectively to files number, sheet-name, column name and number \
-        of years to update; these 4 strings are set to "None" when no error is raised.
+        of years to update; these 4 strings are set to "None" when no error is raised; \
+        a last string giving the restoration or creation message \
+        of the all-years employees file, set to "None" if none of them occurred.
     """
 
     # Setting useful file name aliases
@@ -498,6 +646,7 @@ def update_employees(bibliometer_path, progress_callback=None, replace=True):
     # Setting full paths to useful files
     all_years_file_path = all_years_employees_folder_path / Path(all_years_employees_file_alias)
     all_years_file_backup_path = backup_folder_path / Path(all_years_employees_file_alias)
+    history_folder_path = set_employees_history_path(all_years_file_path)
 
     # Setting the list of files available to add (expected only one)
     months2add_files = [file for file in os.listdir(months2add_employees_folder_path)
@@ -517,97 +666,262 @@ def update_employees(bibliometer_path, progress_callback=None, replace=True):
     months2add_file_path = months2add_employees_folder_path / Path(months2add_files[0])
 
     (employees_year,
-     year_months_file_path,
+     year_months_dict,
      sheet_name_error,
      column_error,
      years2add_error) = _update_months_history(months2add_file_path,
+                                               history_folder_path,
                                                one_year_employees_folder_path,
                                                one_year_employees_basename_alias,
-                                               replace)
+                                               replace=replace)
     if progress_callback:
         progress_callback(20)
 
-    if employees_year is None or year_months_file_path is None:
+    if employees_year is None or year_months_dict is None:
         return None, None, sheet_name_error, column_error, years2add_error, None
 
+    # Copying the months history of the year updated to the backup folder
+    backup_months_history(history_folder_path, backup_folder_path, employees_year)
+
     # Building the dataframe employees_df by concatenating
     # the months of the current year
-    employees_df = _build_year_month_dpt(year_months_file_path)
+    employees_df = _build_year_month_dpt(year_months_dict)
     if progress_callback:
         progress_callback(25)
 
-    # Saving employees_df as a sheet mame after employees_year,
-    # in the workbook pointed by all_years_file_path
-    all_years_file_status = os.path.exists(all_years_file_path)
-    all_years_file_backup_status = os.path.exists(all_years_file_backup_path)
+    # Restoring the all-years employees file from the backup file if missing
     all_years_file_error = None
-    if all_years_file_status:
-        _add_sheets_to_workbook(all_years_file_path, employees_df, employees_year)
-    elif all_years_file_backup_status:
+    if not os.path.exists(all_years_file_path) and os.path.exists(all_years_file_backup_path):
         _ = shutil.copy(all_years_file_backup_path, all_years_file_path)
-        _add_sheets_to_workbook(all_years_file_path, employees_df, employees_year)
         all_years_file_error  = ("The file:"
                                  f"\n '{all_years_file_path}' \n"
                                  "\nhas been copied from the backup file:"
-                                 f"\n '{all_years_file_backup_path}' \n"
-                                 "\nand then updated.")
-    else:
-        employees_df.to_excel(all_years_file_path, sheet_name=employees_year)
-        all_years_file_error  = f"The file '{all_years_file_path}' has been "
-        all_years_file_error += f"created with a sheet named '{employees_year}'"
+                                 f"\n '{all_years_file_backup_path}' \n")
 
-    # Copying the all-years employees file updated to the backup folder
-    shutil.copy(all_years_file_path, backup_folder_path)
+    # Getting the validity status of the cache before the update
+    cache_status = read_employees_cache_manifest(all_years_file_path) is not None
+
+    # Updating the cache of the standardized all-years employees data
+    _update_employees_cache(all_years_file_path, cache_status, employees_year, employees_df)
+
+    if export_xlsx:
+        export_error = export_employees_xlsx(bibliometer_path, employees_year)
+        if all_years_file_error:
+            all_years_file_error += "\nand then updated."
+        else:
+            all_years_file_error = export_error
 
     return employees_year, None, None, None, None, all_years_file_error
 
 
+def _read_employees_year(all_effectifs_path, year, sheets_list=None):
+    """Reads the standardized employees data of a year.
+
+    The data are built from the months history of the employees if the year \
+    is not a sheet of the all-years employees file or if its months history \
+    is more recent than this file as checked through the `check_history_newer` \
+    function imported from `bmfuncts.employees_cache` module. Otherwise, \
+    the data are read from the all-years employees file so that the sheet \
+    edited after the update of the months history takes precedence.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+        year (str): The year defined by 4 digits.
+        sheets_list (list): The sheet names (str) of the all-years employees \
+        file (default = None for getting them from the file).
+    Returns:
+        (dataframe): The standardized employees data of the year.
+    """
+    if sheets_list is None:
+        sheets_list = get_employees_sheets(all_effectifs_path)
+    if year not in sheets_list or check_history_newer(all_effectifs_path, year):
+        history_folder_path = set_employees_history_path(all_effectifs_path)
+        employees_df = _build_year_month_dpt(read_months_history(history_folder_path, year))
+        return set_employees_year_data(employees_df)
+    return read_employees_sheets(all_effectifs_path, sheet_names=[year])[year]
+
+
+def _build_employees_cache(all_effectifs_path):
+    """Builds the cache of the standardized all-years employees data.
+
+    The available years are those of the sheets of the all-years employees file \
+    and those of the months history of the employees. The data of the years \
+    with months history are built from it through the `_read_employees_year` \
+    internal function unless the sheet of the year has been edited after \
+    the update of the months history; the data of the other years are read \
+    from the all-years employees file through the `read_employees_sheets` \
+    function imported from `bmfuncts.employees_cache` module. \
+    The standardized data of each year are saved as a pickle file in the cache \
+    folder and the manifest of the cache records the cache version, the key \
+    of the all-years employees file and the list of the available years.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+    Returns:
+        (tup): (manifest of the cache (dict), the standardized data (dict) \
+        of the years keyed by years (str)).
+    """
+    cache_folder_path, _ = set_employees_cache_paths(all_effectifs_path)
+    if not os.path.exists(cache_folder_path):
+        os.makedirs(cache_folder_path)
+
+    sheets_list = get_employees_sheets(all_effectifs_path)
+    all_effectifs_key = None
+    if os.path.exists(all_effectifs_path):
+        all_effectifs_key = get_file_key(all_effectifs_path)
+    history_years_list = [year for year
+                          in get_history_years(set_employees_history_path(all_effectifs_path))
+                          if year not in sheets_list
+                          or check_history_newer(all_effectifs_path, year)]
+    years_list = sheets_list + [year for year in history_years_list if year not in sheets_list]
+
+    sheets_to_read = [year for year in sheets_list if year not in history_years_list]
+    sheets_df_dict = {}
+    if sheets_to_read:
+        sheets_df_dict = read_employees_sheets(all_effectifs_path, sheet_names=sheets_to_read)
+    new_all_effectifs_df = {}
+    for year in years_list:
+        if year in sheets_df_dict:
+            new_all_effectifs_df[year] = sheets_df_dict[year]
+        else:
+            new_all_effectifs_df[year] = _read_employees_year(all_effectifs_path, year,
+                                                              sheets_list)
+        new_all_effectifs_df[year].to_pickle(set_year_cache_path(cache_folder_path, year))
+
+    manifest_dict = {"version": eg.EMPLOYEES_CACHE_VERSION,
+                     "source" : all_effectifs_key,
+                     "years"  : years_list}
+    write_employees_cache_manifest(all_effectifs_path, manifest_dict)
+    return manifest_dict, new_all_effectifs_df
+
+
+def _update_employees_cache(all_effectifs_path, cache_status, employees_year,
+                            employees_df):
+    """Updates the cache of the standardized all-years employees data 
+    with the employees data of the 'employees_year' year.
+
+    Only the data of the 'employees_year' year are saved if the cache was \
+    valid before the update, the full cache is rebuilt otherwise. \
+    The data are set from 'employees_df' through the `set_employees_year_data` \
+    function imported from `bmfuncts.employees_cache` module without reading \
+    the all-years employees file. The key of this file recorded in the manifest \
+    is refreshed so that the cache stays valid when the file has just been \
+    exported; as the cache was valid, the file was not edited since.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+        cache_status (bool): Validity status of the cache before the update.
+        employees_year (str): The updated year.
+        employees_df (dataframe): The employees data of the updated year.
+    """
+    if not cache_status:
+        _ = _build_employees_cache(all_effectifs_path)
+        return
+
+    cache_folder_path, cache_manifest_path = set_employees_cache_paths(all_effectifs_path)
+    manifest_dict = read_manifest(cache_manifest_path)
+    if os.path.exists(all_effectifs_path):
+        manifest_dict["source"] = get_file_key(all_effectifs_path)
+    year_df = set_employees_year_data(employees_df)
+    year_df.to_pickle(set_year_cache_path(cache_folder_path, employees_year))
+    if employees_year not in manifest_dict["years"]:
+        manifest_dict["years"].append(employees_year)
+    write_employees_cache_manifest(all_effectifs_path, manifest_dict)
+
+
+class _EmployeesYearsDict(MutableMapping):
+    """Dict of the standardized employees data keyed by years that loads 
+    lazily the data of each year from the cache of the all-years employees data.
+
+    The data of a year missing in the cache folder are read through \
+    the `_read_employees_year` internal function and saved in the cache folder.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+        years_list (list): The available years (str).
+        years_dict (dict): Optional data already loaded keyed by years (str).
+    """
+
+    def __init__(self, all_effectifs_path, years_list, years_dict=None):
+        self.all_effectifs_path = all_effectifs_path
+        self.cache_folder_path, _ = set_employees_cache_paths(all_effectifs_path)
+        self.years_list = list(years_list)
+        self.years_dict = dict(years_dict) if years_dict else {}
+
+    def __getitem__(self, year):
+        if year not in self.years_dict:
+            if year not in self.years_list:
+                raise KeyError(year)
+            year_cache_path = set_year_cache_path(self.cache_folder_path, year)
+            if os.path.exists(year_cache_path):
+                self.years_dict[year] = pd.read_pickle(year_cache_path)
+            else:
+                self.years_dict[year] = _read_employees_year(self.all_effectifs_path, year)
+                self.years_dict[year].to_pickle(year_cache_path)
+        return self.years_dict[year]
+
+    def __setitem__(self, year, year_df):
+        if year not in self.years_list:
+            self.years_list.append(year)
+        self.years_dict[year] = year_df
+
+    def __delitem__(self, year):
+        self.years_list.remove(year)
+        self.years_dict.pop(year, None)
+
+    def __iter__(self):
+        return iter(self.years_list)
+
+    def __len__(self):
+        return len(self.years_list)
+
+
+def _get_employees_data(all_effectifs_path):
+    """Gets the standardized all-years employees data from their cache.
+
+    The cache is built through the `_build_employees_cache` internal function \
+    if it is missing or not valid for the current all-years employees file.
+
+    Args:
+        all_effectifs_path (path): Full path to file of Institute \
+        employees database.
+    Returns:
+        (_EmployeesYearsDict): The standardized employees data keyed by years (str) \
+        and loaded lazily per year.
+    """
+    manifest_dict = read_employees_cache_manifest(all_effectifs_path)
+    years_dict = None
+    if manifest_dict is None:
+        manifest_dict, years_dict = _build_employees_cache(all_effectifs_path)
+    return _EmployeesYearsDict(all_effectifs_path, manifest_dict["years"], years_dict)
+
+
 def set_employees_data(corpus_year, all_effectifs_path, search_depth):
     """Sets employees data through the reading of Institute employees database.
 
     The employee last name is standardized through the `standardize_txt` 
-    function imported from `bmfuncts.useful_functs` module.
+    function imported from `bmfuncts.useful_functs` module. The standardized 
+    data are got from their cache through the `_get_employees_data` internal 
+    function and are loaded lazily per year.
 
     Args:
         corpus_year (str): Corpus year defined by 4 digits.
         all_effectifs_path (path): Full path to file of Institute \
         employees database.
         search_depth (int): Initial search depth.
-        progress_callback (function): Function for updating \
-        ProgressBar tkinter widget status.
     Returns:
-        (tup): (employees data (df), adapted search depth (int), \
-        list of available years of employees data).    
+        (tup): (employees data (dict-like of dataframes keyed by years), \
+        adapted search depth (int), list of available years of employees data).    
     """
-
-    # Setting useful columns aliases
-    last_name_col_alias = eg.EMPLOYEES_USEFUL_COLS['name']
-    full_name_col_alias = eg.EMPLOYEES_ADD_COLS['employee_full_name']
-    first_name_col_alias = eg.EMPLOYEES_ADD_COLS['first_name_initials']
-
-    # Getting employees df
-    useful_col_list = list(eg.EMPLOYEES_USEFUL_COLS.values()) + list(eg.EMPLOYEES_ADD_COLS.values())
-    all_effectifs_df = pd.read_excel(all_effectifs_path,
-                                     sheet_name=None,
-                                     dtype=eg.EMPLOYEES_COL_TYPES,
-                                     usecols=useful_col_list,
-                                     keep_default_na=False)
-
-    # Standardizing employee last name and consequently updating employee full name
-    new_all_effectifs_df = {}
-    for year in all_effectifs_df.keys():
-        year_all_effectifs_df = all_effectifs_df[year].copy()
-        year_all_effectifs_df[last_name_col_alias] = year_all_effectifs_df[last_name_col_alias].\
-        apply(standardize_txt)
-        for row_num, _ in year_all_effectifs_df.iterrows():
-            last_name = year_all_effectifs_df.loc[row_num, last_name_col_alias]
-            first_name = year_all_effectifs_df.loc[row_num, first_name_col_alias]
-            full_name = last_name + " " + first_name
-            year_all_effectifs_df.loc[row_num, full_name_col_alias] = full_name
-        new_all_effectifs_df[year] = year_all_effectifs_df
+    # Getting standardized employees data
+    new_all_effectifs_df = _get_employees_data(all_effectifs_path)
 
     # Identifying available years in employees df
-    annees_dispo = [int(x) for x in list(all_effectifs_df.keys())]
+    annees_dispo = [int(x) for x in list(new_all_effectifs_df.keys())]
     annees_a_verifier = [int(corpus_year) - int(search_depth)
                          + (i+1) for i in range(int(search_depth))]
     annees_verifiees = []
@@ -15,6 +15,7 @@ from pathlib import Path
 
 # 3rd party imports
 import BiblioParsing as bp
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook as openpyxl_Workbook
 
@@ -22,6 +23,7 @@ from openpyxl import Workbook as openpyxl_Workbook
 import bmfuncts.institute_globals as ig
 import bmfuncts.pub_globals as pg
 from bmfuncts.add_otps import add_data_val
+from bmfuncts.add_otps import save_otp_workbooks
 from bmfuncts.build_otps_info import set_lab_otps
 from bmfuncts.format_files import align_cell
 from bmfuncts.format_files import build_data_val
@@ -32,6 +34,11 @@ from bmfuncts.format_files import format_page
 from bmfuncts.format_files import format_wb_sheet
 from bmfuncts.format_files import get_col_letter
 from bmfuncts.format_files import set_df_attributes
+from bmfuncts.otps_history import export_otps_history
+from bmfuncts.otps_history import get_doi_otps_history
+from bmfuncts.otps_history import get_hash_otps_history
+from bmfuncts.otps_history import set_otps_history_db
+from bmfuncts.otps_history import upsert_otps_history
 from bmfuncts.rename_cols import set_final_col_names
 from bmfuncts.rename_cols import build_col_conversion_dic
 from bmfuncts.useful_functs import concat_dfs
@@ -151,7 +158,11 @@ def save_otps(institute, org_tup, bibliometer_path, corpus_year,
         - DOI of the publication for which OTPs have been attributed.
         - The OTPs value attributed.
 
-    Finally, saves the history data as a multisheet xlsx file.
+    Finally, upserts the history data in the OTPs history database of the corpus \
+    year through the `upsert_otps_history` function imported from \
+    the `bmfuncts.otps_history` module, and exports this history \
+    as a multisheet xlsx file through the `export_otps_history` function \
+    imported from the same module.
 
     Args:
         institute (str): Institute name.
@@ -179,11 +190,12 @@ def save_otps(institute, org_tup, bibliometer_path, corpus_year,
     history_folder_alias = pg.ARCHI_YEAR["history folder"]
     kept_otps_file_alias = pg.ARCHI_YEAR["kept OTPs file name"]
     hash_id_file_alias = pg.ARCHI_YEAR["hash_id file name"]
+    bdd_multi_annuelle_alias = pg.ARCHI_BDD_MULTI_ANNUELLE["root"]
+    kept_otps_db_alias = pg.ARCHI_BDD_MULTI_ANNUELLE["kept OTPs db file name"]
 
     # Setting useful column name aliases
+    hash_id_col_alias = pg.COL_HASH['hash_id']
     otp_col_alias = pg.COL_NAMES_BONUS['final OTP']
-    hash_otp_sheet_alias = pg.SHEET_SAVE_OTP['hash_OTP']
-    doi_otp_sheet_alias = pg.SHEET_SAVE_OTP['doi_OTP']
 
     # Setting useful paths
     corpus_year_path = bibliometer_path / Path(corpus_year)
@@ -191,6 +203,8 @@ def save_otps(institute, org_tup, bibliometer_path, corpus_year,
     hash_id_file_path = bdd_mensuelle_path / Path(hash_id_file_alias)
     history_folder_path = corpus_year_path / Path(history_folder_alias)
     kept_otps_file_path = history_folder_path / Path(kept_otps_file_alias)
+    kept_otps_db_path = bibliometer_path / Path(bdd_multi_annuelle_alias) \
+                        / Path(kept_otps_db_alias)
 
     # Getting the hash_id dataframe
     hash_id_df  = pd.read_excel(hash_id_file_path)
@@ -224,182 +238,182 @@ def save_otps(institute, org_tup, bibliometer_path, corpus_year,
     doi_otps_history_df = set_otps_df[[author_col, doi_col, otp_col]].copy()
     doi_otps_history_df = doi_otps_history_df.rename(columns={otp_col:otp_col_alias})
 
-    # Concatenating with the dataframes of already saved solved OTPs by hash_id and by DOI
-    if kept_otps_file_path.is_file():
-        existing_otps_history_dict = pd.read_excel(kept_otps_file_path, sheet_name=None)
-        existing_hash_otps_history_df = existing_otps_history_dict[hash_otp_sheet_alias]
-        existing_doi_otps_history_df = existing_otps_history_dict[doi_otp_sheet_alias]
-    else:
-        existing_hash_otps_history_df = pd.DataFrame(columns=hash_otps_history_df.columns)
-        existing_doi_otps_history_df = pd.DataFrame(columns=doi_otps_history_df.columns)
-        with pd.ExcelWriter(kept_otps_file_path) as writer: # https://github.com/PyCQA/pylint/issues/3060 pylint: disable=abstract-class-instantiated
-            existing_hash_otps_history_df.to_excel(writer, sheet_name=hash_otp_sheet_alias, index=False)
-            existing_doi_otps_history_df.to_excel(writer, sheet_name=doi_otp_sheet_alias, index=False)
-
-    if len(existing_hash_otps_history_df)-1:
-        hash_otps_history_df = concat_dfs([existing_hash_otps_history_df, hash_otps_history_df])
-    hash_otps_history_df = hash_otps_history_df.astype('str')
-    hash_otps_history_df = hash_otps_history_df.drop_duplicates()
-
-    if len(existing_doi_otps_history_df)-1:
-        doi_otps_history_df = concat_dfs([existing_doi_otps_history_df, doi_otps_history_df])
-    doi_otps_history_df = doi_otps_history_df.astype('str')
-    doi_otps_history_df = doi_otps_history_df.drop_duplicates()
-
-    with pd.ExcelWriter(kept_otps_file_path,  # https://github.com/PyCQA/pylint/issues/3060 pylint: disable=abstract-class-instantiated
-                        mode='a', if_sheet_exists='replace') as writer:
-        hash_otps_history_df.to_excel(writer, sheet_name=hash_otp_sheet_alias, index=False)
-        doi_otps_history_df.to_excel(writer, sheet_name=doi_otp_sheet_alias, index=False)
+    # Upserting the set OTPs in the OTPs history of the corpus year
+    # after importing the existing kept-OTPs workbook if not yet done
+    otps_db_cols_tup = (hash_id_col_alias, author_col, doi_col, otp_col_alias)
+    set_otps_history_db(kept_otps_db_path, corpus_year,
+                        kept_otps_file_path, otps_db_cols_tup)
+    upsert_otps_history(kept_otps_db_path, corpus_year,
+                        (hash_otps_history_df, doi_otps_history_df), otps_db_cols_tup)
+
+    # Exporting the OTPs history of the corpus year as kept-OTPs workbook
+    export_otps_history(kept_otps_db_path, corpus_year,
+                        kept_otps_file_path, otps_db_cols_tup)
 
     message = "History of kept OTPs saved"
     return message, pub_otp_df
 
 
-def _use_hash_id_set_otps(dpt_df, otps_history_tup):
-    """Uses set otps by Hash-IDs.
+def _set_keys_index(df, keys_list):
+    """Sets the index of the keys given by the columns 'keys_list' of 'df' data.
+
+    Args:
+        df (dataframe): The data to be keyed.
+        keys_list (list): The column names (str) of the keys.
+    Returns:
+        (pandas.Index): The index of the keys, a multi-index \
+        when several columns are given.
     """
-    # Setting parameters from args
-    lists_tup, cols_tup, _ = otps_history_tup
-    pub_id_to_check_list, otp_to_set_list = lists_tup[0], lists_tup[1]
-    pub_id_col, otp_list_col = cols_tup[1], cols_tup[4]
+    if len(keys_list)==1:
+        return pd.Index(df[keys_list[0]])
+    return pd.MultiIndex.from_frame(df[keys_list])
 
-    # Setting columns list
-    col_list = list(dpt_df.columns)
 
-    # Setting the pub-id list for department dpt
-    dept_pub_id_list = dpt_df[pub_id_col].to_list()
+def _set_otps_keys(history_df, keys_list, otp_col):
+    """Sets the unique keys of the history of previously set OTPs.
 
-    # Building the 'otp_set_dpt_df' dataframe of publication with OTP set
-    otp_set_dpt_df = pd.DataFrame(columns=col_list)
+    The history entries with missing key values are ignored and 
+    the first history entry of a key is the one kept for this key. 
+    The positions of the entries in the history are given 
+    by the index of 'history_df' data.
 
-    # Building the 'otp_to_set_dpt_df' dataframe of publication
-    # with OTP still to be defined
-    otp_to_set_dpt_df = dpt_df.copy()
-    otp_to_set_dpt_df = otp_to_set_dpt_df.drop(columns=[otp_list_col])
-
-    for otp_idx, pub_id_to_check in enumerate(pub_id_to_check_list):
-        if pub_id_to_check in dept_pub_id_list:
-            otp_to_set = otp_to_set_list[otp_idx]
-            pub_id_idx = [i for i,e in enumerate(dept_pub_id_list)
-                          if e==pub_id_to_check][0]
-            dpt_df.loc[pub_id_idx, otp_list_col] = otp_to_set
-            dpt_pub_id_to_check_df = dpt_df[dpt_df[pub_id_col]==pub_id_to_check]
-            otp_set_dpt_df = concat_dfs([otp_set_dpt_df, dpt_pub_id_to_check_df])
-            otp_to_set_dpt_df = otp_to_set_dpt_df.drop(index=pub_id_idx)
-        else:
-            continue
-    dfs_tup = (otp_set_dpt_df, otp_to_set_dpt_df)
-    return dfs_tup
+    Args:
+        history_df (dataframe): The history of previously set OTPs.
+        keys_list (list): The column names (str) of the keys.
+        otp_col (str): The column name of the set OTPs.
+    Returns:
+        (tup): (The unique keys (pandas.Index), the OTPs to set \
+        per key (list), the positions of the keys in the history \
+        (numpy.ndarray)).
+    """
+    keys_df = history_df.dropna(subset=keys_list)
+    keys_df = keys_df.drop_duplicates(subset=keys_list, keep='first')
+    keys_idx = _set_keys_index(keys_df, keys_list)
+    otps_list = keys_df[otp_col].to_list()
+    keys_pos_array = keys_df.index.to_numpy()
+    return keys_idx, otps_list, keys_pos_array
 
 
-def _use_known_doi_otps(dfs_tup, cols_tup, dpt_df,
-                        doi_to_check, doi_otp_to_set):
-    """Manages case of known DOIs.
+def _get_keyed_otps(dpt_df, otps_keys_tup, keys_list):
+    """Joins the publications of a department to the history of 
+    previously set OTPs on the keys given by 'keys_list'.
+
+    Args:
+        dpt_df (dataframe): The publications of the department.
+        otps_keys_tup (tup): The unique keys of the history as built \
+        by the `_set_otps_keys` internal function.
+        keys_list (list): The column names (str) of the keys.
+    Returns:
+        (tup): (The index of the joined publications (pandas.Index), \
+        the OTPs to set for them (list), the positions in the history \
+        of their keys (numpy.ndarray)).
     """
-    # Setting parameters from args
-    otp_set_dpt_df, otp_to_set_dpt_df = dfs_tup
-    doi_col = cols_tup[3]
-    otp_list_col = cols_tup[4]
+    keys_idx, otps_list, keys_pos_array = otps_keys_tup
+    keys_nb_array = keys_idx.get_indexer(_set_keys_index(dpt_df, keys_list))
+    found_array = keys_nb_array>=0
+    keys_nb_array = keys_nb_array[found_array]
+    rows_idx = dpt_df.index[found_array]
+    rows_otps_list = [otps_list[key_nb] for key_nb in keys_nb_array]
+    rows_pos_array = keys_pos_array[keys_nb_array]
+    return rows_idx, rows_otps_list, rows_pos_array
 
-    # Setting the DOI index in 'dpt_df' to fill with 'doi_otp_to_set'
-    # at 'otp_list_col' col
-    dept_doi_list = dpt_df[doi_col].to_list()
-    dpt_doi_idx_list = [i for i,e in enumerate(dept_doi_list)
-                        if e==doi_to_check]
-    doi_idx = dpt_doi_idx_list[0]
-
-    dpt_df_to_add = dpt_df[dpt_df[doi_col]==doi_to_check].copy()
-    dpt_df_to_add.loc[doi_idx, otp_list_col] = doi_otp_to_set
-    otp_set_dpt_df = concat_dfs([otp_set_dpt_df, dpt_df_to_add])
-    otp_to_set_dpt_df = otp_to_set_dpt_df.drop(index=doi_idx)
-    dfs_tup = (otp_set_dpt_df, otp_to_set_dpt_df)
-    return dfs_tup
 
+def _move_set_otps(dfs_tup, dpt_df, rows_tup, otp_list_col):
+    """Moves the publications joined to the history of previously set OTPs 
+    from the data of the OTPs to be set to the data of set OTPs.
 
-def _use_authors_otps(dfs_tup, cols_tup, dpt_df_to_add,
-                      auth_idx, auth_to_check, auth_otp_to_set):
-    """Uses set OTPs by first-author name of unknown DOIs.
+    Args:
+        dfs_tup (tup): (Data of set OTPs (dataframe), Data of OTPs \
+        still to be set (dataframe)).
+        dpt_df (dataframe): The publications of the department.
+        rows_tup (tup): (The index of the joined publications (pandas.Index), \
+        the OTPs to set for them (list), the order of their rows (numpy.ndarray)).
+        otp_list_col (str): The column name of the OTPs.
+    Returns:
+        (tup): The updated 'dfs_tup' tuple.
     """
     # Setting parameters from args
     otp_set_dpt_df, otp_to_set_dpt_df = dfs_tup
-    author_col = cols_tup[2]
-    otp_list_col = cols_tup[4]
+    rows_idx, rows_otps_list, rows_order_array = rows_tup
 
-    auth_idx_to_replace_list = []
-    if auth_idx in otp_to_set_dpt_df.index:
-        auth_idx_to_replace_list.append(auth_idx)
-        if auth_idx in otp_set_dpt_df.index:
-            otp_set_dpt_df = otp_set_dpt_df.drop(index=auth_idx)
-
-        for auth_idx_to_replace in auth_idx_to_replace_list:
-            dpt_df_to_add.loc[auth_idx_to_replace, otp_list_col] = auth_otp_to_set
-            new_dpt_df_to_add = dpt_df_to_add[dpt_df_to_add[author_col]==auth_to_check].copy()
-            new_dpt_df_to_add.loc[auth_idx_to_replace, otp_list_col] = auth_otp_to_set
-            otp_set_dpt_df = concat_dfs([otp_set_dpt_df, new_dpt_df_to_add])
-            otp_to_set_dpt_df = otp_to_set_dpt_df.drop(index=auth_idx_to_replace)
+    if rows_idx.empty:
+        return dfs_tup
+
+    rows_df = dpt_df.loc[rows_idx].copy()
+    rows_df[otp_list_col] = rows_otps_list
+    rows_df = rows_df.iloc[rows_order_array]
+    otp_set_dpt_df = concat_dfs([otp_set_dpt_df, rows_df])
+    otp_to_set_dpt_df = otp_to_set_dpt_df.drop(index=rows_idx)
     dfs_tup = (otp_set_dpt_df, otp_to_set_dpt_df)
     return dfs_tup
 
 
-def _use_unknown_doi_otps(dfs_tup, otps_history_tup, dpt_df,
-                          doi_to_check):
-    """Manages case of unknown DOIs.
+def _use_hash_id_set_otps(dpt_df, otps_history_tup):
+    """Uses set OTPs by Hash-IDs.
+
+    The publications are joined on their pub-ID to the history 
+    of the OTPs set by Hash-ID and are kept in the order of this history.
     """
     # Setting parameters from args
-    otp_to_set_dpt_df = dfs_tup[1]
-    _, cols_tup, doi_otp_history_df = otps_history_tup
-    author_col = cols_tup[2]
-    doi_col = cols_tup[3]
-    otp_col = cols_tup[5]
-
-    new_otp_to_set_dpt_df = otp_to_set_dpt_df[otp_to_set_dpt_df[doi_col]==doi_to_check].copy()
-    otp_to_set_auth_list = new_otp_to_set_dpt_df[author_col].to_list()
-
-    new_doi_otp_history_df = doi_otp_history_df[doi_otp_history_df[doi_col]==doi_to_check].copy()
-    new_author_to_check_list = new_doi_otp_history_df[author_col].to_list()
-    auth_otp_to_set_list = new_doi_otp_history_df[otp_col].to_list()
-
-    for auth_otp_idx, auth_to_check in enumerate(new_author_to_check_list):
-        if auth_to_check in otp_to_set_auth_list:
-            auth_otp_to_set = auth_otp_to_set_list[auth_otp_idx]
-            dpt_df_to_add = dpt_df[dpt_df[doi_col]==doi_to_check].copy()
-            dept_auth_list = dpt_df[author_col].to_list()
-            dpt_auth_idx_list = [i for i,e in enumerate(dept_auth_list) if e==auth_to_check]
-
-            for auth_idx in dpt_auth_idx_list:
-                dfs_tup = _use_authors_otps(dfs_tup, cols_tup, dpt_df_to_add,
-                                            auth_idx, auth_to_check, auth_otp_to_set)
-        else:
-            continue
+    keys_tup, cols_tup, _ = otps_history_tup
+    pub_id_col, otp_list_col = cols_tup[1], cols_tup[4]
+    hash_keys_tup = keys_tup[0]
+
+    # Building the 'otp_set_dpt_df' dataframe of publication with OTP set
+    otp_set_dpt_df = pd.DataFrame(columns=list(dpt_df.columns))
+
+    # Building the 'otp_to_set_dpt_df' dataframe of publication
+    # with OTP still to be defined
+    otp_to_set_dpt_df = dpt_df.drop(columns=[otp_list_col])
+
+    # Joining the publications to the history on pub-ID
+    rows_idx, rows_otps_list, rows_pos_array = _get_keyed_otps(dpt_df, hash_keys_tup,
+                                                               [pub_id_col])
+    rows_order_array = np.argsort(rows_pos_array, kind='stable')
+
+    dfs_tup = _move_set_otps((otp_set_dpt_df, otp_to_set_dpt_df), dpt_df,
+                            (rows_idx, rows_otps_list, rows_order_array),
+                            otp_list_col)
     return dfs_tup
 
 
 def _use_doi_set_otps(dpt_df, otps_history_tup, dfs_tup):
     """Uses set OTPs by DOI.
+
+    The publications of which OTPs are still to be set are joined 
+    to the history of the OTPs set by DOI on their DOI when known 
+    and on their DOI and first-author name otherwise. 
+    They are kept in the order of this history, the publications 
+    of unknown DOI being grouped at the first history entry of unknown DOI.
     """
     # Setting parameters from args
-    lists_tup, cols_tup, _ = otps_history_tup
-    doi_to_check_list = lists_tup[3]
-    doi_otp_to_set_list = lists_tup[4]
-    doi_col = cols_tup[3]
+    keys_tup, cols_tup, _ = otps_history_tup
+    _, doi_keys_tup, doi_auth_keys_tup, unknown_doi_pos = keys_tup
+    author_col, doi_col, otp_list_col = cols_tup[2], cols_tup[3], cols_tup[4]
     otp_to_set_dpt_df = dfs_tup[1]
 
-    # Setting the DOIs list of otp_to_set_dpt_df
-    otp_to_set_doi_list = otp_to_set_dpt_df[doi_col].to_list()
-
-    for otp_idx, doi_to_check in enumerate(doi_to_check_list):
-        if doi_to_check in otp_to_set_doi_list:
-            if doi_to_check!=bp.UNKNOWN:
-                # Case of known DOIs
-                doi_otp_to_set = doi_otp_to_set_list[otp_idx]
-                dfs_tup = _use_known_doi_otps(dfs_tup, cols_tup, dpt_df,
-                                              doi_to_check, doi_otp_to_set)
-            else:
-                # Case of unknown DOIs (use of first author name)
-                dfs_tup = _use_unknown_doi_otps(dfs_tup, otps_history_tup, dpt_df,
-                                                doi_to_check)
-        else:
-            continue
+    # Joining the publications of known DOI to the history on DOI
+    to_set_dpt_df = dpt_df.loc[otp_to_set_dpt_df.index]
+    doi_idx, doi_otps_list, doi_pos_array = _get_keyed_otps(to_set_dpt_df, doi_keys_tup,
+                                                            [doi_col])
+
+    # Joining the publications of unknown DOI to the history on DOI and first author
+    auth_idx, auth_otps_list, auth_pos_array = _get_keyed_otps(to_set_dpt_df,
+                                                               doi_auth_keys_tup,
+                                                               [doi_col, author_col])
+
+    # Ordering the joined publications as the history
+    rows_idx = doi_idx.append(auth_idx)
+    rows_otps_list = doi_otps_list + auth_otps_list
+    first_pos_array = np.concatenate([doi_pos_array,
+                                      np.full(len(auth_idx), unknown_doi_pos)])
+    second_pos_array = np.concatenate([np.zeros(len(doi_idx), dtype=int),
+                                       auth_pos_array])
+    rows_order_array = np.lexsort((second_pos_array, first_pos_array))
+
+    dfs_tup = _move_set_otps(dfs_tup, dpt_df,
+                            (rows_idx, rows_otps_list, rows_order_array),
+                            otp_list_col)
     return dfs_tup
 
 
@@ -407,18 +421,24 @@ def _add_set_otp_rows(ws, otp_set_df, df_len, cell_colors):
     """Adds rows with set OTPs to the openpyxl sheet 
     and colors them alternatively.
     """
+    # Setting num of first col and first row in EXCEL files
+    xl_idx_base = pg.XL_INDEX_BASE
+
     # use of a continuously incremented index
     # because row index is not continuously incremented
     idx = 1
     for _, row in otp_set_df.iterrows():
-        ws.append(row.values.flatten().tolist())
+        row_list = row.values.flatten().tolist()
+        ws.append(row_list)
         row_color_idx = df_len + idx
-        ws = color_row(ws, row_color_idx, cell_colors)
+        row_cells = [ws.cell(row=row_color_idx + xl_idx_base, column=col_idx + xl_idx_base)
+                     for col_idx in range(len(row_list))]
+        ws = color_row(ws, row_color_idx, cell_colors, row_cells=row_cells)
         idx += 1
     return ws
 
 
-def _set_lab_otp_ws(lab, dfs_tup, lab_otp_list, wb, first, common_args_tup):
+def _set_lab_otp_ws(lab, dfs_tup, data_val_tup, wb, first, common_args_tup):
     """Builts the openpyxl sheet of a laboratory in the openpyxl workbook 
     of the department it belongs, to using set OTPs and keeping validation 
     rules for not set OTPs.
@@ -431,8 +451,8 @@ def _set_lab_otp_ws(lab, dfs_tup, lab_otp_list, wb, first, common_args_tup):
     # Initializing new_lab_df with the publications which otp is not yet set
     new_lab_df = otp_to_set_lab_df.copy()
 
-    # Building validation list of OTP for 'lab' laboratory
-    validation_list, data_val = build_data_val(lab_otp_list)
+    # Setting validation list of OTP for 'lab' laboratory
+    validation_list, data_val = data_val_tup
 
     # Adding a column containing OTPs of 'dpt' department
     new_lab_df[otp_list_col] = validation_list
@@ -441,7 +461,8 @@ def _set_lab_otp_ws(lab, dfs_tup, lab_otp_list, wb, first, common_args_tup):
     sheet_name = lab
     new_lab_df_title = pg.DF_TITLES_LIST[2]
     wb = format_wb_sheet(sheet_name, new_lab_df,
-                         new_lab_df_title, wb, first)
+                         new_lab_df_title, wb, first,
+                         cell_colors=cell_colors)
     ws = wb.active
 
     # Activating the validation data list in the OTPs column of new_lab_df
@@ -465,8 +486,9 @@ def _set_lab_otp_ws(lab, dfs_tup, lab_otp_list, wb, first, common_args_tup):
     return wb, ws
 
 
-def _re_save_labs_otp_file(dpt_pub_dict, dpt_lab_otps_dict,
-                           dpt_otp_file_name_path, otps_history_tup):
+def _re_save_labs_otp_file(dpt_pub_dict, dpt_data_val_dict,
+                           dpt_otp_file_name_path, otps_history_tup,
+                           cell_colors):
     """Rebuilds and saves the OTPs data for a department as a multi-sheet 
     Openpyxl workbook with one sheet per lab.
 
@@ -481,18 +503,17 @@ def _re_save_labs_otp_file(dpt_pub_dict, dpt_lab_otps_dict,
     Args:
         dpt_pub_dict (dict): The data of the department keyed by laboratory \
         names (str) and valued by publications data (dataframe).
-        dpt_lab_otps_dict (dict): The data of the department keyed \
-        by laboratory names (str) and valued by OTPs lists (list). 
+        dpt_data_val_dict (dict): The data of the department keyed \
+        by laboratory names (str) and valued by tuples (validation list (str), \
+        list-data-validation rule (openpyxl.DataValidation)) of the OTPs. 
         dpt_otp_file_name_path (path): Full path to where the workbook is saved.
-        otps_history_tup (tup): (useful lists (tup), useful column names (tup), \
+        otps_history_tup (tup): (useful keys (tup), useful column names (tup), \
         data of OTPs set by DOI (dataframe).
+        cell_colors (list): List of openpyxl.PatternFill objects.
     """
     # Setting num of first col and first row in EXCEL files
     xl_idx_base = pg.XL_INDEX_BASE
 
-    # Setting cell colors
-    cell_colors = build_cell_fill_patterns()
-
     # Setting parameters from args
     cols_tup = otps_history_tup[1]
 
@@ -521,11 +542,11 @@ def _re_save_labs_otp_file(dpt_pub_dict, dpt_lab_otps_dict,
         if len(otp_to_set_lab_df):
             dfs_tup = _use_doi_set_otps(lab_df, otps_history_tup, dfs_tup)
 
-        # Setting OTPs list for "lab" laboratory
-        lab_otp_list = dpt_lab_otps_dict[lab]
+        # Setting OTPs validation list for "lab" laboratory
+        data_val_tup = dpt_data_val_dict[lab]
 
         # Formatting the worksheet for "lab" lboratory of the department
-        wb, _ = _set_lab_otp_ws(lab, dfs_tup, lab_otp_list,
+        wb, _ = _set_lab_otp_ws(lab, dfs_tup, data_val_tup,
                                 wb, first, common_args_tup)
         first = False
 
@@ -533,28 +554,55 @@ def _re_save_labs_otp_file(dpt_pub_dict, dpt_lab_otps_dict,
     wb.save(dpt_otp_file_name_path)
 
 
+def _re_set_labs_otp_file(dpt_otp_file_name_path, dpt_data_val_dict,
+                          otps_history_tup, cell_colors):
+    """Reads the OTPs workbook of a department with one sheet per lab 
+    and saves it again through the `_re_save_labs_otp_file` internal function.
+
+    Args:
+        dpt_otp_file_name_path (path): Full path to the workbook of the department.
+        dpt_data_val_dict (dict): The data of the department keyed \
+        by laboratory names (str) and valued by tuples (validation list (str), \
+        list-data-validation rule (openpyxl.DataValidation)) of the OTPs. 
+        otps_history_tup (tup): (useful keys (tup), useful column names (tup), \
+        data of OTPs set by DOI (dataframe).
+        cell_colors (list): List of openpyxl.PatternFill objects.
+    """
+    # Getting the pub list for the department and per lab
+    dpt_pub_dict = pd.read_excel(dpt_otp_file_name_path, sheet_name=None)
+
+    # Resetting validation list for OTPs when not already set and saving the file
+    _re_save_labs_otp_file(dpt_pub_dict, dpt_data_val_dict,
+                           dpt_otp_file_name_path, otps_history_tup,
+                           cell_colors)
+
+
 def _set_saved_lab_otps(org_tup, otps_history_tup,
                         otp_folder_path, otp_file_base,
-                        lab_otps_dict):
+                        lab_otps_dict, max_workers=None):
     """Attributes the OTPs from the history of the attributed OTPs 
     before submiting to the user the file for attributing the not yet 
     attributed OTPs.
 
-    Loops on department to:
+    The validation lists of the OTPs of the labs and the cell colors are built once. 
+    Then, the files of the departments are processed in parallel through 
+    the `save_otp_workbooks` function imported from the `bmfuncts.add_otps` module 
+    to:
 
         1. Build the dataframe with already attributed OTPs \
     and OTPs remaining to be attributed. 
         2. Save the file to be submitted to the user through the \
-    `_re_save_dpt_otp_file` internal function.
+    `_re_set_labs_otp_file` internal function.
 
     Args:
         org_tup (tup): Contains Institute parameters.
-        otps_history_tup (tup): (useful lists (tup), useful column names (tup), \
+        otps_history_tup (tup): (useful keys (tup), useful column names (tup), \
         data of OTPs set by DOI (dataframe).
         otp_folder_path (path): The full path to the folder where the file is saved.
         otp_file_base (str): The name base of the file to be saved.
         lab_otps_dict (hierarchical dict): The data keyed by department names (str) \
         and valued by OTPs data given by laboratory of each department (dict).
+        max_workers (int): Number of worker processes (optional, default = None).
     """
 
     # Setting institute parameters
@@ -563,25 +611,30 @@ def _set_saved_lab_otps(org_tup, otps_history_tup,
     # Setting departments list
     dpt_list = list(dpt_attributs_dict.keys())
 
+    # Setting cell colors
+    cell_colors = build_cell_fill_patterns()
+
     # Setting the already attributed OTPs for each department
+    args_tups_list = []
     for dpt in sorted(dpt_list):
         # Setting the full path of the EXCEl file for the 'dpt' department
         dpt_otp_file_name = f'{otp_file_base}_{dpt}.xlsx'
         dpt_otp_file_name_path = otp_folder_path / Path(dpt_otp_file_name)
 
-        # Setting the dict of list of OTPs per lab for the 'dpt' department
-        dpt_lab_otps_dict = lab_otps_dict[dpt]
+        # Building validation lists of OTPs per lab for the 'dpt' department
+        dpt_data_val_dict = {lab: build_data_val(lab_otp_list)
+                             for lab, lab_otp_list in lab_otps_dict[dpt].items()}
 
-        # Getting the pub list for department dpt and per lab
-        dpt_pub_dict = pd.read_excel(dpt_otp_file_name_path, sheet_name=None)
+        args_tups_list.append((dpt_otp_file_name_path, dpt_data_val_dict,
+                               otps_history_tup, cell_colors))
 
-        # Resetting validation list for OTPs when not already set and saving the file
-        _re_save_labs_otp_file(dpt_pub_dict, dpt_lab_otps_dict,
-                               dpt_otp_file_name_path, otps_history_tup)
+    # Resetting validation list for OTPs when not already set and saving the files
+    save_otp_workbooks(_re_set_labs_otp_file, args_tups_list, max_workers=max_workers)
 
 
-def _re_save_dpt_otp_file(dfs_tup, cols_tup, dpt_otp_list,
-                          dpt_otp_file_name_path, dpt_otp_sheet_name):
+def _re_save_dpt_otp_file(dfs_tup, cols_tup, data_val_tup,
+                          dpt_otp_file_name_path, dpt_otp_sheet_name,
+                          cell_colors):
     """Rebuilds and saves the openpyxl workbook of the publications list with set OTPs 
     and list-data-validation rules for not yet set OTPs for a department.
 
@@ -599,26 +652,23 @@ def _re_save_dpt_otp_file(dfs_tup, cols_tup, dpt_otp_list,
         dfs_tup (tup): (Data of the already attributed OTPs for the department (dataframe), \
         Data of the OTPs still to be attributed for the department (dataframe)).
         cols_tup (tup): Useful column names (str).
-        dpt_otp_list (list): The OTPs list of the department.
+        data_val_tup (tup): (Validation list (str), list-data-validation rule \
+        (openpyxl.DataValidation)) of the OTPs of the department.
         dpt_otp_file_name_path (path): Full path to where the workbook is saved. 
         dpt_otp_sheet_name (str): Name of the openpyxl sheet of the workbook.
+        cell_colors (list): List of openpyxl.PatternFill objects.
     """
     # Setting num of first col and first row in EXCEL files
     xl_idx_base = pg.XL_INDEX_BASE
 
-    # Setting cell colors
-    cell_colors = build_cell_fill_patterns()
-
     # Setting parameters from args
     otp_set_dpt_df, otp_to_set_dpt_df = dfs_tup
     otp_list_col = cols_tup[4]
+    validation_list, data_val = data_val_tup
 
     # Setting formatting attributes
     dpt_df_title = pg.DF_TITLES_LIST[2]
 
-    # Building validation list of OTP for the department
-    validation_list, data_val = build_data_val(dpt_otp_list)
-
     # Initializing new_dpt_df with the publications which otp is not yet set
     new_dpt_df = otp_to_set_dpt_df.copy()
 
@@ -626,7 +676,7 @@ def _re_save_dpt_otp_file(dfs_tup, cols_tup, dpt_otp_list,
     new_dpt_df[otp_list_col] = validation_list
 
     # Creating and formatting the openpyxl workbook
-    wb, ws = format_page(new_dpt_df, dpt_df_title)
+    wb, ws = format_page(new_dpt_df, dpt_df_title, cell_colors=cell_colors)
 
     # Getting the column letter for the OTPs column
     otp_col_letter = get_col_letter(new_dpt_df, otp_list_col, xl_idx_base)
@@ -657,37 +707,80 @@ def _re_save_dpt_otp_file(dfs_tup, cols_tup, dpt_otp_list,
     wb.save(dpt_otp_file_name_path)
 
 
+def _re_set_dpt_otp_file(dpt_otp_file_name_path, dpt_otp_sheet_name,
+                         data_val_tup, otps_history_tup, cell_colors):
+    """Reads the OTPs workbook of a department, uses the set OTPs 
+    and saves it again through the `_re_save_dpt_otp_file` internal function.
+
+    The set OTPs are used by Hash-ID through the `_use_hash_id_set_otps` internal 
+    function and then by DOI through the `_use_doi_set_otps` internal function.
+
+    Args:
+        dpt_otp_file_name_path (path): Full path to the workbook of the department.
+        dpt_otp_sheet_name (str): Name of the openpyxl sheet of the workbook.
+        data_val_tup (tup): (Validation list (str), list-data-validation rule \
+        (openpyxl.DataValidation)) of the OTPs of the department.
+        otps_history_tup (tup): (useful keys (tup), useful column names (tup), \
+        data of OTPs set by DOI (dataframe).
+        cell_colors (list): List of openpyxl.PatternFill objects.
+    """
+    # Setting parameters from args
+    cols_tup = otps_history_tup[1]
+
+    # Getting the pub list for the department
+    dpt_df = pd.read_excel(dpt_otp_file_name_path)
+
+    # Using set OTPs by Hash-ID
+    dfs_tup = _use_hash_id_set_otps(dpt_df, otps_history_tup)
+    _, otp_to_set_dpt_df = dfs_tup
+
+    # Using set OTPs by DOI
+    if len(otp_to_set_dpt_df):
+        dfs_tup = _use_doi_set_otps(dpt_df, otps_history_tup, dfs_tup)
+
+    # Resetting validation list for OTPs when not already set and saving the file
+    _re_save_dpt_otp_file(dfs_tup, cols_tup, data_val_tup,
+                          dpt_otp_file_name_path, dpt_otp_sheet_name,
+                          cell_colors)
+
+
 def _set_saved_dept_otps(org_tup, otps_history_tup,
-                         otp_folder_path, otp_file_base):
+                         otp_folder_path, otp_file_base,
+                         max_workers=None):
     """Attributes the OTPs from the history of the attributed OTPs 
     at department level before submiting to the user the file 
     for attributing the not-yet attributed OTPs.
 
-    Loops on department to:
+    The validation lists of the OTPs of the departments and the cell colors 
+    are built once. Then, the files of the departments are processed in parallel 
+    through the `save_otp_workbooks` function imported from the `bmfuncts.add_otps` 
+    module to:
 
         1. Build the dataframe with already attributed OTPs \
     and OTPs remaining to be attributed. 
         2. Save the file to be submitted to the user through the \
-    `_re_save_dpt_otp_file` internal function.
+    `_re_set_dpt_otp_file` internal function.
 
     Args:
         org_tup (tup): Contains Institute parameters.
-        otps_history_tup (tup): (useful lists (tup), useful column names (tup), \
+        otps_history_tup (tup): (useful keys (tup), useful column names (tup), \
         data of OTPs set by DOI (dataframe).
         otp_folder_path (path): The full path to the folder where the file is saved.
         otp_file_base (str): The name base of the file to be saved.
+        max_workers (int): Number of worker processes (optional, default = None).
     """
 
-    # Setting parameters from args
-    cols_tup = otps_history_tup[1]
-
     # Setting institute parameters
     dpt_attributs_dict  = org_tup[2]
 
     # Setting departments list
     dpt_list = list(dpt_attributs_dict.keys())
 
+    # Setting cell colors
+    cell_colors = build_cell_fill_patterns()
+
     # Setting the already attributed OTPs for each department
+    args_tups_list = []
     for dpt in sorted(dpt_list):
         # Setting the full path of the EXCEl file for the 'dpt' department
         dpt_otp_file_name = f'{otp_file_base}_{dpt}.xlsx'
@@ -696,40 +789,36 @@ def _set_saved_dept_otps(org_tup, otps_history_tup,
         # Setting the sheet name of the EXCEl file for the 'dpt' department
         dpt_otp_sheet_name = pg.OTP_SHEET_NAME_BASE + " " +  dpt
 
-        # Getting the pub list for department dpt
-        dpt_df = pd.read_excel(dpt_otp_file_name_path)
+        # Building validation list of OTPs for the 'dpt' department
+        data_val_tup = build_data_val(dpt_attributs_dict[dpt][ig.DPT_OTP_KEY])
 
-        # Using set OTPs by Hash-ID
-        dfs_tup = _use_hash_id_set_otps(dpt_df, otps_history_tup)
-        _, otp_to_set_dpt_df = dfs_tup
-
-        # Using set OTPs by DOI
-        if len(otp_to_set_dpt_df):
-            dfs_tup = _use_doi_set_otps(dpt_df, otps_history_tup, dfs_tup)
+        args_tups_list.append((dpt_otp_file_name_path, dpt_otp_sheet_name,
+                               data_val_tup, otps_history_tup, cell_colors))
 
-        # Setting the list of OTPs for the 'dpt' department
-        dpt_otp_list = dpt_attributs_dict[dpt][ig.DPT_OTP_KEY]
-
-        # Resetting validation list for OTPs when not already set and saving the file
-        _re_save_dpt_otp_file(dfs_tup, cols_tup, dpt_otp_list,
-                              dpt_otp_file_name_path, dpt_otp_sheet_name)
+    # Resetting validation list for OTPs when not already set and saving the files
+    save_otp_workbooks(_re_set_dpt_otp_file, args_tups_list, max_workers=max_workers)
 
 
 def _get_otps_history(institute, org_tup,
                       hash_id_file_path,
-                      kept_otps_file_path):
-    """Gets the history of previously set OTPs.
+                      otps_db_tup):
+    """Gets the history of previously set OTPs for a corpus year.
+
+    The history is got from the OTPs history database through the functions \
+    imported from the `bmfuncts.otps_history` module, only the OTPs set \
+    for the Hash-IDs of the corpus year being read.
 
     Args:
         institute (str): Institute name.
         org_tup (tup): Contains Institute parameters.
         hash_id_file_path (path): The full path to the Hash-IDs file.
-        kept_otps_file_path (path): the full path to the history of \
-        the set OTPs.
+        otps_db_tup (tup): (Full path to the OTPs history database (path), \
+        4 digits year of the corpus (str), Full path to the kept-OTPs \
+        workbook to be imported in the database if not yet done (path)).
     Returns:
-        (tup): (Tuple of lists of infos for using previoulsly set OTPs, \
+        (tup): (Tuple of keys of infos for using previoulsly set OTPs, \
         Tuple of useful columns names, The data of the the history \
-        of previously set OTPs by DOI).
+        of previously set OTPs by DOI) or None if no history is available.
     """
     # Setting useful col names
     col_rename_tup = build_col_conversion_dic(institute, org_tup)
@@ -742,15 +831,23 @@ def _get_otps_history(institute, org_tup,
     doi_col_alias = all_col_rename_dic[bp.COL_NAMES['articles'][6]]
     otp_list_col_alias = all_col_rename_dic[pg.COL_NAMES_BONUS['list OTP']]
     otp_col_alias = pg.COL_NAMES_BONUS['final OTP']
-    hash_otp_sheet_alias = pg.SHEET_SAVE_OTP['hash_OTP']
-    doi_otp_sheet_alias = pg.SHEET_SAVE_OTP['doi_OTP']
+
+    # Setting the OTPs history of the corpus year
+    db_path, corpus_year, kept_otps_file_path = otps_db_tup
+    otps_db_cols_tup = (hash_id_col_alias, author_col_alias,
+                        doi_col_alias, otp_col_alias)
+    if not set_otps_history_db(db_path, corpus_year,
+                               kept_otps_file_path, otps_db_cols_tup):
+        return None
 
     # Getting the hash_id dataframe
     hash_id_df = pd.read_excel(hash_id_file_path)
+    hash_id_df[hash_id_col_alias] = hash_id_df[hash_id_col_alias].astype(str)
 
-    # Getting the kept OTPs dataframe by hash_id
-    hash_otp_history_df = pd.read_excel(kept_otps_file_path,
-                                        sheet_name=hash_otp_sheet_alias)
+    # Getting the kept OTPs dataframe for the hash_id of the corpus year
+    hash_otp_history_df = get_hash_otps_history(db_path, corpus_year,
+                                                hash_id_df[hash_id_col_alias].to_list(),
+                                                otps_db_cols_tup)
 
     # Building data of pub_id and OTPs to set related to hash_id
     pub_id_otp_to_set_df = pd.merge(hash_id_df,
@@ -760,29 +857,34 @@ def _get_otps_history(institute, org_tup,
 
     pub_id_otp_to_set_df = pub_id_otp_to_set_df.astype(str)
     pub_id_otp_to_set_df = pub_id_otp_to_set_df.drop(columns=[hash_id_col_alias])
-    pub_id_to_check_list = [str(row[pub_id_alias]) for _,row
-                            in pub_id_otp_to_set_df.iterrows()]
-    otp_to_set_list = [str(row[otp_col_alias]) for _,row
-                       in pub_id_otp_to_set_df.iterrows()]
+    hash_keys_tup = _set_otps_keys(pub_id_otp_to_set_df, [pub_id_alias], otp_col_alias)
 
     # Getting the kept OTPs dataframe by DOI and first author
-    doi_otp_history_df = pd.read_excel(kept_otps_file_path,
-                                       sheet_name=doi_otp_sheet_alias)
-    author_to_check_list = doi_otp_history_df[author_col_alias].to_list()
-    doi_to_check_list = doi_otp_history_df[doi_col_alias].to_list()
-    doi_otp_to_set_list = doi_otp_history_df[otp_col_alias].to_list()
+    doi_otp_history_df = get_doi_otps_history(db_path, corpus_year, otps_db_cols_tup)
+
+    # Building keys of OTPs to set by DOI when known
+    # and by DOI and first author otherwise
+    unknown_doi_mask = doi_otp_history_df[doi_col_alias]==bp.UNKNOWN
+    doi_keys_tup = _set_otps_keys(doi_otp_history_df[~unknown_doi_mask],
+                                  [doi_col_alias], otp_col_alias)
+    doi_auth_keys_tup = _set_otps_keys(doi_otp_history_df[unknown_doi_mask],
+                                       [doi_col_alias, author_col_alias], otp_col_alias)
+    unknown_doi_pos_list = list(doi_otp_history_df.index[unknown_doi_mask])
+    unknown_doi_pos = len(doi_otp_history_df)
+    if unknown_doi_pos_list:
+        unknown_doi_pos = unknown_doi_pos_list[0]
 
     # Setting parameters tuples to return
-    lists_tup = (pub_id_to_check_list, otp_to_set_list,
-                 author_to_check_list, doi_to_check_list, doi_otp_to_set_list)
+    keys_tup = (hash_keys_tup, doi_keys_tup, doi_auth_keys_tup, unknown_doi_pos)
 
     cols_tup = (hash_id_col_alias, pub_id_alias, author_col_alias,
                 doi_col_alias, otp_list_col_alias, otp_col_alias)
 
-    return lists_tup, cols_tup, doi_otp_history_df
+    return keys_tup, cols_tup, doi_otp_history_df
 
 
-def set_saved_otps(institute, org_tup, bibliometer_path, corpus_year):
+def set_saved_otps(institute, org_tup, bibliometer_path, corpus_year,
+                   max_workers=None):
     """Attributes the OTPs from the history of the attributed OTPs 
     before submiting to the user the file for attributing the not yet 
     attributed OTPs.
@@ -800,11 +902,15 @@ def set_saved_otps(institute, org_tup, bibliometer_path, corpus_year):
     OTPs is used to built the files to be submitted to the user through \
     the `_set_saved_dept_otps` internal function.
 
+    The files of the departments are built and saved in parallel.
+
     Args:
         institute (str): Institute name.
         org_tup (tup): Contains Institute parameters.
         bibliometer_path (path): Full path to working folder.
         corpus_year (str): 4 digits year of the corpus.
+        max_workers (int): Number of worker processes (optional, default = None, \
+        the number of departments limited to the number of CPUs).
     Returns:
         (str): End message giving the status of the OTPs attribution.
     """
@@ -818,6 +924,8 @@ def set_saved_otps(institute, org_tup, bibliometer_path, corpus_year):
     history_folder_alias = pg.ARCHI_YEAR["history folder"]
     kept_otps_file_alias = pg.ARCHI_YEAR["kept OTPs file name"]
     hash_id_file_alias = pg.ARCHI_YEAR["hash_id file name"]
+    bdd_multi_annuelle_alias = pg.ARCHI_BDD_MULTI_ANNUELLE["root"]
+    kept_otps_db_alias = pg.ARCHI_BDD_MULTI_ANNUELLE["kept OTPs db file name"]
 
     # Setting useful paths
     corpus_year_path = bibliometer_path / Path(corpus_year)
@@ -825,20 +933,24 @@ def set_saved_otps(institute, org_tup, bibliometer_path, corpus_year):
     hash_id_file_path = bdd_mensuelle_path / Path(hash_id_file_alias)
     history_folder_path = corpus_year_path / Path(history_folder_alias)
     kept_otps_file_path = history_folder_path / Path(kept_otps_file_alias)
+    kept_otps_db_path = bibliometer_path / Path(bdd_multi_annuelle_alias) \
+                        / Path(kept_otps_db_alias)
     otp_folder_path = corpus_year_path / Path(otp_folder_alias)
 
-    if kept_otps_file_path.is_file():
-        otps_history_tup = _get_otps_history(institute, org_tup,
-                                             hash_id_file_path,
-                                             kept_otps_file_path)
+    otps_db_tup = (kept_otps_db_path, corpus_year, kept_otps_file_path)
+    otps_history_tup = _get_otps_history(institute, org_tup,
+                                         hash_id_file_path,
+                                         otps_db_tup)
+    if otps_history_tup:
         if otp_level=="LAB":
             lab_otps_dict = set_lab_otps(institute, org_tup, bibliometer_path)
             _set_saved_lab_otps(org_tup, otps_history_tup,
                                 otp_folder_path, otp_file_base_alias,
-                                lab_otps_dict)
+                                lab_otps_dict, max_workers=max_workers)
         else:
             _set_saved_dept_otps(org_tup, otps_history_tup,
-                                 otp_folder_path, otp_file_base_alias)
+                                 otp_folder_path, otp_file_base_alias,
+                                 max_workers=max_workers)
 
         message = "Already set OTPS used"
     else:
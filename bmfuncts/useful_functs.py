@@ -44,6 +44,12 @@ import pandas as pd
 
 # local imports
 import bmfuncts.pub_globals as pg
+from bmfuncts.cache_utils import get_file_hash
+from bmfuncts.cache_utils import read_cached_item
+from bmfuncts.cache_utils import read_manifest
+from bmfuncts.cache_utils import save_item_cache
+from bmfuncts.cache_utils import set_item_path
+from bmfuncts.cache_utils import write_manifest
 from bmfuncts.config_utils import set_user_config
 
 
@@ -470,6 +476,26 @@ def _get_database_file_path(database_folder_path, database_file_end):
     return database_file_path
 
 
+def _check_rawdata_copy(rawdata_path, rawdata_manifest_path, rawdata_key):
+    """Checks that the rawdata folder holds only the copy of the database 
+    file given by 'rawdata_key' as recorded in the rawdata manifest.
+
+    Args:
+        rawdata_path (path): Full path to the rawdata folder.
+        rawdata_manifest_path (path): Full path to the rawdata manifest.
+        rawdata_key (dict): The name, size and content hash \
+        of the database file.
+    Returns:
+        (bool): True if the rawdata copy is up to date.
+    """
+    if read_manifest(rawdata_manifest_path)!=rawdata_key:
+        return False
+    if not os.path.isdir(rawdata_path) or os.listdir(rawdata_path)!=[rawdata_key["file"]]:
+        return False
+    rawdata_file_path = Path(rawdata_path) / Path(rawdata_key["file"])
+    return os.path.getsize(rawdata_file_path)==rawdata_key["size"]
+
+
 def _set_database_extract_info(bibliometer_path, datatype, database):
     """Builds the path to database extractions and the file 
     names ending that are specific to the data type 'datatype'.
@@ -513,6 +539,10 @@ def set_rawdata(bibliometer_path, datatype, years_list, database):
     targeted by the path 'database_folder_path' to the rawdata folder 
     targeted by the path 'rawdata_path'. 
     To do that it uses the `_set_database_extract_info` internal function. 
+    The name, size and content hash of the copied file are recorded in 
+    a manifest named by the 'RAWDATA_MANIFEST' global in the parent folder 
+    of the rawdata folder so that the copy is skipped when the rawdata 
+    folder already holds the same file. 
     When the database is Scopus and the data type to be analysed is restricted to WoS, 
     empty files ending with 'database_file_end' are used as Scopus rawdata.
 
@@ -553,10 +583,20 @@ def set_rawdata(bibliometer_path, datatype, years_list, database):
 
         rawdata_path_dict, _, _ = set_user_config(bibliometer_path, year, pg.BDD_LIST)
         rawdata_path = rawdata_path_dict[database]
+        rawdata_manifest_path = Path(rawdata_path).parent / Path(pg.RAWDATA_MANIFEST)
+        rawdata_key = {"file"  : Path(year_database_file_path).name,
+                       "size"  : os.path.getsize(year_database_file_path),
+                       "sha256": get_file_hash(year_database_file_path)}
+        if _check_rawdata_copy(rawdata_path, rawdata_manifest_path, rawdata_key):
+            continue
+
+        if os.path.exists(rawdata_manifest_path):
+            os.remove(rawdata_manifest_path)
         if os.path.exists(rawdata_path):
             shutil.rmtree(rawdata_path)
         os.makedirs(rawdata_path)
         shutil.copy2(year_database_file_path, rawdata_path)
+        write_manifest(rawdata_manifest_path, rawdata_key)
 
     message = f"\n{database} rawdata set for {datatype} data type."
     return message
@@ -649,20 +689,16 @@ def create_archi(bibliometer_path, corpus_year_folder, verbose=False):
     return message
 
 
-def _set_item_path(item_filename_base, save_extent, parsing_path):
-    item_file_name = item_filename_base + "." + save_extent
-    item_path = parsing_path / Path(item_file_name)
-    return item_path
-
-
 def _save_item(item_df, item_filename_base, save_extent, parsing_path):
-    item_working_path = _set_item_path(item_filename_base, save_extent, parsing_path)
+    item_working_path = set_item_path(item_filename_base, save_extent, parsing_path)
     if save_extent=="xlsx":
         item_df.to_excel(item_working_path, index=False)
     elif save_extent=="dat":
         item_df.to_csv(item_working_path, index=False, sep='\t')
     else:
         item_df.to_csv(item_working_path, index=False, sep=',')
+    if pg.PARSING_CACHE_EXTENT and save_extent in ["xlsx", "dat"]:
+        save_item_cache(item_filename_base, save_extent, parsing_path)
 
 
 def save_final_dedup(item_df, item_filename_base, save_extent, dedup_infos):
@@ -702,13 +738,7 @@ def save_final_dedup(item_df, item_filename_base, save_extent, dedup_infos):
     if not os.path.exists(target_parsing_path):
         os.makedirs(target_parsing_path)
 
-    item_final_path = _set_item_path(item_filename_base, save_extent, target_parsing_path)
-    if save_extent=="xlsx":
-        item_df.to_excel(item_final_path, index=False)
-    elif save_extent=="dat":
-        item_df.to_csv(item_final_path, index=False, sep='\t')
-    else:
-        item_df.to_csv(item_final_path, index=False, sep=',')
+    _save_item(item_df, item_filename_base, save_extent, target_parsing_path)
     return corpus_year, target_parsing_path
 
 
@@ -755,9 +785,13 @@ def save_parsing_dict(parsing_dict, parsing_path,
                     print(end_message)
 
 
-def read_parsing_dict(parsing_path, item_filename_dict, save_extent):
+def read_parsing_dict(parsing_path, item_filename_dict, save_extent, columns_dict=None):
     """Reads the dataframes of the parsing results from files of a specifyed type.
 
+    The data are read through the `read_cached_item` function imported \
+    from the `bmfuncts.cache_utils` module that serves them from the binary \
+    cache files when available and not older than the files of the parsing results.
+
     Args:
         parsing_path (path): Full path to the folder where the the parsing \
         results are located.
@@ -765,39 +799,34 @@ def read_parsing_dict(parsing_path, item_filename_dict, save_extent):
         by the file names of the parsing results.
         save_extent (str): File type given by file extension without the dot \
         seprator (ex: "xlsx" for Excel file type).
+        columns_dict (dict): Optional dict keyed by the parsing items to read \
+        and valued by the list of the columns to read for the item or None \
+        for all its columns (default = None for reading all the columns \
+        of all the items).
     Returns:
         (dict): Parsing results keyed by parsing items \
         given by 'PARSING_ITEMS_LIST' global imported from \
         the package imported as bp and valued by the dataframes \
         of parsing results.
     """
+    # Setting the items to read and their columns
+    if columns_dict is None:
+        columns_dict = dict.fromkeys(bp.PARSING_ITEMS_LIST)
+
     parsing_dict = {}
     # Cycling on parsing items
     for item in bp.PARSING_ITEMS_LIST:
-        item_df = None
-        if save_extent == "xlsx":
-            item_xlsx_file = item_filename_dict[item] + ".xlsx"
-            item_xlsx_path = parsing_path / Path(item_xlsx_file)
-            if item_xlsx_path.is_file():
-                try:
-                    item_df = pd.read_excel(item_xlsx_path)
-                except pd.errors.EmptyDataError:
-                    item_df = pd.DataFrame()
-        elif save_extent=="dat":
-            item_tsv_file = item_filename_dict[item] + ".dat"
-            item_tsv_path = parsing_path / Path(item_tsv_file)
-            if item_tsv_path.is_file():
-                try:
-                    item_df = pd.read_csv(item_tsv_path, sep = "\t")
-                except pd.errors.EmptyDataError:
-                    item_df = pd.DataFrame()
-
-        if item_df is not None:
-            parsing_dict[item] = item_df
+        if save_extent in ["xlsx", "dat"] and item in columns_dict:
+            item_filename_base = item_filename_dict[item]
+            item_path = set_item_path(item_filename_base, save_extent, parsing_path)
+            if item_path.is_file():
+                parsing_dict[item] = read_cached_item(item_filename_base, save_extent,
+                                                      parsing_path,
+                                                      columns=columns_dict[item])
     return parsing_dict
 
 
-def get_final_dedup(bibliometer_path, saved_results_path, corpus_year):
+def get_final_dedup(bibliometer_path, saved_results_path, corpus_year, columns_dict=None):
     """Reads saved final-parsing data as dict resulting from the parsing step.
 
     It uses the `read_parsing_dict` function of 
@@ -808,6 +837,10 @@ def get_final_dedup(bibliometer_path, saved_results_path, corpus_year):
         saved_results_path (path): Full path to the folder \
         where final results are saved.
         corpus_year (str): 4 digits year of the corpus.
+        columns_dict (dict): Optional dict keyed by the parsing items to read \
+        and valued by the list of the columns to read for the item or None \
+        for all its columns (default = None for reading all the columns \
+        of all the items).
     Returns:
         (dict): Parsing results keyed by parsing items (str) and valued \
         by data (dataframe) of the parsing item.
@@ -826,7 +859,8 @@ def get_final_dedup(bibliometer_path, saved_results_path, corpus_year):
 
     # Getting the dict of deduplication results
     dedup_parsing_dict = read_parsing_dict(saved_dedup_parsing_path, item_filename_dict,
-                                           parsing_save_extent_alias)
+                                           parsing_save_extent_alias,
+                                           columns_dict=columns_dict)
     return dedup_parsing_dict
 
 
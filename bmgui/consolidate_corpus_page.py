@@ -54,13 +54,15 @@ def _launch_update_employees(bibliometer_path,
                              effectifs_file_name,
                              year_select,
                              check_effectif_status,
-                             progress_callback):
+                             progress_callback,
+                             export_effectif_status=0):
     """Launches update of Intitute employees database.
 
     This is done through the `update_employees` function imported from 
     `bmfuncts.update_employees` module after check of available 
     files for update (should be single) and check of Institute 
-    employees database file.
+    employees database file. The employees EXCEL files are updated 
+    only on demand through 'export_effectif_status' arg.
 
     Args:
         bibliometer_path (path): Full path to working folder.
@@ -74,6 +76,9 @@ def _launch_update_employees(bibliometer_path,
         Institute employees database '0: no update; 1: update'.
         progress_callback (function): Function for updating \
         ProgressBar tkinter widget status.
+        export_effectif_status (int): Value for exporting the updated \
+        Institute employees database to the employees EXCEL files \
+        '0: no export; 1: export' (default = 0).
     """
 
     # Setting parameters from args
@@ -99,7 +104,8 @@ def _launch_update_employees(bibliometer_path,
              sheet_name_error,
              column_error,
              years2add_error,
-             all_years_file_error) = update_employees(bibliometer_path, progress_callback)
+             all_years_file_error) = update_employees(bibliometer_path, progress_callback,
+                                                      export_xlsx=bool(export_effectif_status))
             if not any([files_number_error, sheet_name_error, column_error,
                         years2add_error, all_years_file_error]):
                 info_title = "- Information -"
@@ -236,7 +242,8 @@ def _launch_recursive_year_search_try(institute, org_tup,
                                                                year_select,
                                                                search_depth,
                                                                progress_callback,
-                                                               progress_bar_state)
+                                                               progress_bar_state,
+                                                               incremental=True)
             print('\n',end_message)
 
             info_title = '- Information -'
@@ -824,8 +831,9 @@ def create_consolidate_corpus(self, master, page_name, institute, bibliometer_pa
         corpus_year_path = bibliometer_path / Path(year_select)
         bdd_mensuelle_path = corpus_year_path / Path(bdd_mensuelle_alias)
 
-        # Getting check_effectif_status
+        # Getting check_effectif_status and export_effectif_status
         check_effectif_status = check_effectif_var.get()
+        export_effectif_status = check_export_var.get()
         progress_callback(10)
 
         # Updating employees file
@@ -835,7 +843,8 @@ def create_consolidate_corpus(self, master, page_name, institute, bibliometer_pa
                                                            effectifs_file_name_alias,
                                                            year_select,
                                                            check_effectif_status,
-                                                           progress_callback)
+                                                           progress_callback,
+                                                           export_effectif_status)
         if not employees_update_status:
             check_effectif_var.set(0)
             check_effectif_status = check_effectif_var.get()
@@ -879,6 +888,12 @@ def create_consolidate_corpus(self, master, page_name, institute, bibliometer_pa
                                         variable=check_effectif_var,
                                         onvalue=1,
                                         offvalue=0)
+    check_export_var = tk.IntVar()
+    check_export_box = tk.Checkbutton(self,
+                                      text=gg.TEXT_EXPORT_EFFECTIFS,
+                                      variable=check_export_var,
+                                      onvalue=1,
+                                      offvalue=0)
 
     etape_1 = etapes[0]
     place_bellow(etape_1,
@@ -886,6 +901,8 @@ def create_consolidate_corpus(self, master, page_name, institute, bibliometer_pa
                  dx=etape_button_dx,
                  dy=etape_button_dy / 2)
     place_bellow(check_effectif_box,
+                 check_export_box)
+    place_bellow(check_export_box,
                  merge_button,
                  dy=etape_button_dy / 2)
 
@@ -70,9 +70,11 @@ __all__ = ['ADD_SPACE_MM',
            'TEXT_ETAPE_4',
            'TEXT_ETAPE_5',
            'TEXT_ETAPE_6',
+           'TEXT_EXPORT_EFFECTIFS',
            'TEXT_HOMONYMES',
            'TEXT_INSTITUTE',
            'TEXT_LAUNCH_PARSING',
+           'TEXT_LAUNCH_PARSING_ALL',
            'TEXT_LAUNCH_SYNTHESE',
            'TEXT_MAJ_BDD_IF',
            'TEXT_MAJ_EFFECTIFS',
@@ -314,6 +316,9 @@ TEXT_UPDATE_STATUS = "Mettre à jour le statut des fichiers"
 # - Bouton lancement parsing
 TEXT_LAUNCH_PARSING = "Lancer le Parsing"
 
+# - Bouton lancement parsing de toutes les BDD et synthese
+TEXT_LAUNCH_PARSING_ALL = "Lancer le Parsing de toutes les BDD et la synthèse"
+
 # - Bouton lancement concatenation et deduplication des parsings
 TEXT_LAUNCH_SYNTHESE = "Lancer la synthèse"
 
@@ -325,6 +330,7 @@ TEXT_YEAR_PI = "Sélection de l'année "
 # - Etape 1
 TEXT_ETAPE_1 = "Etape 1 : Croisement auteurs-efffectifs de l'institut"
 TEXT_MAJ_EFFECTIFS = "Mettre à jour les effectifs de l'institut avant le croisement (coché = OUI) ?"
+TEXT_EXPORT_EFFECTIFS = "Exporter les effectifs mis à jour dans les fichiers EXCEL (coché = OUI) ?"
 TEXT_CROISEMENT = "Effectuer le croisement auteurs-efffectifs"
 
 # - Etape 2
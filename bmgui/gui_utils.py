@@ -30,6 +30,9 @@ import BiblioParsing as bp
 # Local imports
 import bmfuncts.pub_globals as pg
 import bmgui.gui_globals as gg
+from bmfuncts.cache_utils import read_manifest
+from bmfuncts.cache_utils import write_manifest
+from bmfuncts.config_utils import clear_config_cache
 from bmfuncts.config_utils import set_user_config
 
 
@@ -174,7 +177,85 @@ def last_available_years(bibliometer_path, year_number):
     return years_list
 
 
-def existing_corpuses(bibliometer_path, corpuses_number=None):
+def _get_dir_mtime(dir_path):
+    """Returns the modification time in nanoseconds of the folder
+    pointed by 'dir_path' or None if not available.
+    """
+    try:
+        return os.stat(dir_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _check_year_status(bibliometer_path, year_status_dict):
+    """Checks that the folders recorded in the status of a corpus year 
+    have not been modified since the status was set.
+
+    Args:
+        bibliometer_path (path):  Full path to working folder.
+        year_status_dict (dict): The status of the corpus year \
+        as set by the `_scan_year_status` internal function.
+    Returns:
+        (bool): True if the status of the corpus year is up to date.
+    """
+    mtimes_dict = year_status_dict.get("mtimes")
+    if not isinstance(mtimes_dict, dict) or not mtimes_dict:
+        return False
+    return all(_get_dir_mtime(Path(bibliometer_path) / Path(dir_path))==dir_mtime
+               for dir_path, dir_mtime in mtimes_dict.items())
+
+
+def _scan_year_status(bibliometer_path, year):
+    """Scans the rawdata and parsing folders of a corpus year 
+    for the availability of the rawdata and parsing results.
+
+    The rawdata are available when a file with the rawdata extension 
+    of the database is in the rawdata folder. The parsing results 
+    are available when the articles file is in the parsing folder. 
+    The modification times of these folders, read before their content, 
+    are recorded with paths relative to the working folder.
+
+    Args:
+        bibliometer_path (path):  Full path to working folder.
+        year (str): Corpus year defined by 4 digits.
+    Returns:
+        (dict): The status of the corpus year keyed by the databases \
+        and "dedup" and valued by dicts keyed by "rawdata" and "parsing" \
+        and valued by the availability (bool) with the folders \
+        modification times keyed by "mtimes".
+    """
+    # Getting the full paths of the working folder architecture for the corpus "year"
+    config_tup = set_user_config(bibliometer_path, year, pg.BDD_LIST)
+    rawdata_path_dict, parsing_path_dict = config_tup[0], config_tup[1]
+
+    # Setting the files type of raw data and the articles file of saved parsing results
+    rawdata_extent_dict = {bp.WOS: bp.WOS_RAWDATA_EXTENT,
+                           bp.SCOPUS: bp.SCOPUS_RAWDATA_EXTENT}
+    articles_file = bp.PARSING_ITEMS_LIST[0] + "." + pg.TSV_SAVE_EXTENT
+
+    year_status_dict = {}
+    mtimes_dict = {}
+    for database_type in pg.BDD_LIST:
+        rawdata_path = rawdata_path_dict[database_type]
+        rawdata_extent = "." + rawdata_extent_dict[database_type]
+        mtimes_dict[os.path.relpath(rawdata_path, bibliometer_path)] = _get_dir_mtime(rawdata_path)
+        rawdata_status = False
+        if os.path.isdir(rawdata_path):
+            rawdata_status = any(file.endswith(rawdata_extent)
+                                 and (Path(rawdata_path) / Path(file)).is_file()
+                                 for file in os.listdir(rawdata_path))
+        year_status_dict[database_type] = {"rawdata": rawdata_status}
+
+    for parsing_type in pg.BDD_LIST + ["dedup"]:
+        parsing_path = parsing_path_dict[parsing_type]
+        mtimes_dict[os.path.relpath(parsing_path, bibliometer_path)] = _get_dir_mtime(parsing_path)
+        parsing_status = (Path(parsing_path) / Path(articles_file)).is_file()
+        year_status_dict.setdefault(parsing_type, {})["parsing"] = parsing_status
+    year_status_dict["mtimes"] = mtimes_dict
+    return year_status_dict
+
+
+def existing_corpuses(bibliometer_path, corpuses_number=None, rescan=False):
     """Returns a list of lists of booleans displaying True
     if rawdata and parsing results are available, and False otherwise.
 
@@ -188,50 +269,41 @@ def existing_corpuses(bibliometer_path, corpuses_number=None):
         - Scopus parsing boolean list         = [ True,   True,   True,   True,   True,   False]
         - Deduplication parsing boolean list  = [ True,   True,   True,   True,   True,   False]
 
+    The status of each corpus year is read from the index saved in the 
+    working folder under the name given by the 'CORPUSES_STATUS_INDEX' global. 
+    The folders of a corpus year are scanned through the `_scan_year_status` 
+    internal function only when the corpus year is not in the index or when 
+    the modification time of one of its folders has changed, as checked 
+    through the `_check_year_status` internal function.
+
     Args:
         bibliometer_path (path):  Full path to working folder.
         corpuses_number (int): The number of corpuses to be checked \
         (default: CORPUSES_NUMBER global).
+        rescan (bool): If true, the configuration cache is cleared and \
+        the folders of all the corpus years are scanned and the index \
+        rebuilt (optional, default = False).
     Returns:
         (tup of lists): (Years list, WoS raw-data boolean list, \
         WoS parsing boolean list, Scopus raw-data boolean list, \
         Scopus parsing boolean list, Deduplication parsing boolean list).
     """
 
-    # internal functions
-    def _get_rawdata_file_path(rawdata_path, rawdata_extent):
-        """Returns the name of the rawdata file with 'rawdata_extent' extention
-        pointed by the full path 'rawdata_path'.
-        """
-
-        filenames_list = []
-        for _, _, files in os.walk(rawdata_path):
-            filenames_list.extend(file for file in files if file.endswith("." + rawdata_extent))
-        if not filenames_list:
-            return Path(f'{database_type} rawdata file not Found')
-        return rawdata_path / Path(filenames_list[0])
-
-    def _get_parsing_file_paths(parsing_path):
-        """Returns the full path to the file named 'articles_item_alias' 
-        given the full path to the parsing folder 'parsing_path' 
-        and the extension 'parsing_save_extent' of the file.
-        """
-        file_name = articles_item_alias + "." + parsing_save_extent
-        parsing_file_path = parsing_path / Path(file_name)
-        return parsing_file_path
-
     # Getting the last available corpus years
     if not corpuses_number:
         corpuses_number = gg.CORPUSES_NUMBER
     years_folder_list = last_available_years(bibliometer_path, corpuses_number)
 
-    # Setting the files type of raw data and saved parsing results
-    parsing_save_extent = pg.TSV_SAVE_EXTENT
-    wos_rawdata_extent = bp.WOS_RAWDATA_EXTENT
-    scopus_rawdata_extent = bp.SCOPUS_RAWDATA_EXTENT
-
-    # Setting articles item alias for checking availability of parsing
-    articles_item_alias = bp.PARSING_ITEMS_LIST[0]
+    # Getting the saved status index
+    status_index_path = Path(bibliometer_path) / Path(pg.CORPUSES_STATUS_INDEX)
+    status_index_dict = None
+    if rescan:
+        clear_config_cache()
+    else:
+        status_index_dict = read_manifest(status_index_path)
+    if not isinstance(status_index_dict, dict):
+        status_index_dict = {}
+    index_update = rescan
 
     # Initialization of lists
     years_list = []
@@ -242,39 +314,26 @@ def existing_corpuses(bibliometer_path, corpuses_number=None):
     dedup_parsing_list = []
 
     for year in years_folder_list:
-
-        # Getting the full paths of the working folder architecture for the corpus "year"
-        config_tup = set_user_config(bibliometer_path, year, pg.BDD_LIST)
-        rawdata_path_dict, parsing_path_dict = config_tup[0], config_tup[1]
-
-        # Setting useful paths for database 'database_type'
-        scopus_rawdata_path = rawdata_path_dict["scopus"]
-        wos_rawdata_path = rawdata_path_dict["wos"]
-        scopus_parsing_path = parsing_path_dict["scopus"]
-        wos_parsing_path = parsing_path_dict["wos"]
-        dedup_parsing_path = parsing_path_dict["dedup"]
+        year_status_dict = status_index_dict.get(year)
+        if (not isinstance(year_status_dict, dict)
+            or not _check_year_status(bibliometer_path, year_status_dict)):
+            year_status_dict = _scan_year_status(bibliometer_path, year)
+            status_index_dict[year] = year_status_dict
+            index_update = True
 
         years_list.append(year)
-
-        # Wos
-        database_type = bp.WOS
-        wos_rawdata_file_path = _get_rawdata_file_path(wos_rawdata_path,
-                                                       wos_rawdata_extent)
-        wos_parsing_articles_path = _get_parsing_file_paths(wos_parsing_path)
-        wos_rawdata_list.append(wos_rawdata_file_path.is_file())
-        wos_parsing_list.append(wos_parsing_articles_path.is_file())
-
-        # Scopus
-        database_type = bp.SCOPUS
-        scopus_rawdata_file_path = _get_rawdata_file_path(scopus_rawdata_path,
-                                                          scopus_rawdata_extent)
-        scopus_parsing_articles_path = _get_parsing_file_paths(scopus_parsing_path)
-        scopus_rawdata_list.append(scopus_rawdata_file_path.is_file())
-        scopus_parsing_list.append(scopus_parsing_articles_path.is_file())
-
-        # Concatenation and deduplication
-        dedup_parsing_articles_path = _get_parsing_file_paths(dedup_parsing_path)
-        dedup_parsing_list.append(dedup_parsing_articles_path.is_file())
+        wos_rawdata_list.append(year_status_dict[bp.WOS]["rawdata"])
+        wos_parsing_list.append(year_status_dict[bp.WOS]["parsing"])
+        scopus_rawdata_list.append(year_status_dict[bp.SCOPUS]["rawdata"])
+        scopus_parsing_list.append(year_status_dict[bp.SCOPUS]["parsing"])
+        dedup_parsing_list.append(year_status_dict["dedup"]["parsing"])
+
+    # Saving the updated status index if the working folder is writable
+    if index_update and years_list:
+        try:
+            write_manifest(status_index_path, status_index_dict)
+        except OSError:
+            pass
 
     return (years_list, wos_rawdata_list, wos_parsing_list,
             scopus_rawdata_list, scopus_parsing_list, dedup_parsing_list)
@@ -22,9 +22,10 @@ import bmfuncts.pub_globals as pg
 import bmgui.gui_globals as gg
 from bmfuncts.config_utils import set_org_params
 from bmfuncts.config_utils import set_user_config
-from bmfuncts.useful_functs import read_parsing_dict
-from bmfuncts.useful_functs import save_fails_dict
-from bmfuncts.useful_functs import save_parsing_dict
+from bmfuncts.parse_corpuses import deduplicate_corpus_parsing
+from bmfuncts.parse_corpuses import get_parsing_status
+from bmfuncts.parse_corpuses import parse_corpus
+from bmfuncts.parse_corpuses import parse_corpuses
 from bmgui.gui_utils import disable_buttons
 from bmgui.gui_utils import enable_buttons
 from bmgui.gui_utils import existing_corpuses
@@ -153,7 +154,7 @@ def _create_table(self, master, pos_x_init):
     _set_table_item(item_text, pos_x)
 
 
-def _update(self, master, bibliometer_path, pos_tup):
+def _update(self, master, bibliometer_path, pos_tup, rescan=False):
     """Refreshes the current state of the files in the 
     working folder using the `_create_table` internal function.
 
@@ -164,6 +165,9 @@ def _update(self, master, bibliometer_path, pos_tup):
         pos_tup (tup): (x position (int) for widgets location, \
         y position (int) for widgets location, space value (int) \
         for widgets spacing).
+        rescan (bool): If true, the files status is rebuilt by a full scan \
+        of the working folder instead of being read from the saved index \
+        (optional, default = False).
     Note:
         The function 'mm_to_px' is imported from the module 'gui_utils'
         of the package 'bmgui'.
@@ -176,7 +180,7 @@ def _update(self, master, bibliometer_path, pos_tup):
     pos_x, pos_y, esp_ligne = pos_tup
 
     # Setting existing corpuses status
-    files_status = existing_corpuses(bibliometer_path)
+    files_status = existing_corpuses(bibliometer_path, rescan=rescan)
     master.list_corpus_year = files_status[0]
     master.list_wos_rawdata = files_status[1]
     master.list_wos_parsing = files_status[2]
@@ -208,13 +212,15 @@ def _launch_parsing(master, corpus_year, database_type,
                     paths_tup, progress_callback):
     """Launches parsing of raw-data of 'database_type' database.
 
-    This is done through `biblio_parser` function imported from 
-    3rd party package imported as bp after check of database name 
+    This is done through `parse_corpus` function imported from 
+    `bmfuncts.parse_corpuses` module after check of database name 
     and database raw-data availability.
 
-    It saves the resulting parsing files using paths set through 
-    `set_user_config` function imported from `bmfuncts.config_utils` 
-    module.
+    The resulting parsing files are saved by the `parse_corpus` function.
+    An available parsing is rebuilt without confirmation only when its inputs 
+    have changed as checked through the `get_parsing_status` function 
+    imported from `bmfuncts.parse_corpuses` module. The confirmation is still 
+    asked when the parsing is up to date or has no manifest.
 
     It updates the files status using the internal function `_update`.
 
@@ -229,44 +235,24 @@ def _launch_parsing(master, corpus_year, database_type,
     """
 
     # Internal functions
-    def _corpus_parsing(rawdata_path, parsing_path,
-                        database_type, progress_callback):
-        progress_callback(20)
-        if not os.path.exists(parsing_path):
-            os.mkdir(parsing_path)
-        parsing_tup = bp.biblio_parser(rawdata_path, database_type,
-                                       inst_filter_list=None,
-                                       country_affiliations_file_path=institute_affil_file_path,
-                                       inst_types_file_path=inst_types_file_path)
-        parsing_dict, dic_failed = parsing_tup
-        progress_callback(80)
-        save_parsing_dict(parsing_dict, parsing_path,
-                          item_filename_dict, parsing_save_extent)
-        progress_callback(90)
-        save_fails_dict(dic_failed, parsing_path)
-        progress_callback(100)
-
-        articles_number = dic_failed["number of article"]
+    def _corpus_parsing(database_type, progress_callback, force=False):
+        articles_number = parse_corpus(corpus_year, database_type, paths_tup,
+                                       progress_callback=progress_callback,
+                                       force=force)
         info_title = "Information"
         info_text = (f"'Parsing' de '{database_type}' effectué pour l'année {corpus_year}."
                      f"\n\n  Nombre d'articles du corpus : {articles_number}")
         messagebox.showinfo(info_title, info_text)
 
     # Setting parameters from args
-    bibliometer_path, institute_affil_file_path, inst_types_file_path = paths_tup
+    bibliometer_path = paths_tup[0]
 
     # Getting the full paths of the working folder architecture for the corpus "corpus_year"
     config_tup = set_user_config(bibliometer_path, corpus_year, pg.BDD_LIST)
-    rawdata_path_dict = config_tup[0]
     parsing_path_dict = config_tup[1]
-    item_filename_dict = config_tup[2]
 
     # Setting useful paths for database 'database_type'
-    rawdata_path = rawdata_path_dict[database_type]
     parsing_path = parsing_path_dict[database_type]
-
-    # Setting parsing files extension for saving
-    parsing_save_extent = pg.TSV_SAVE_EXTENT
     progress_callback(10)
 
     # Getting files status for corpus parsing
@@ -299,8 +285,10 @@ def _launch_parsing(master, corpus_year, database_type,
             else:
                 if not os.path.exists(parsing_path):
                     os.mkdir(parsing_path)
-                if parsing_status==1:
-                    # Ask to carry on with parsing if already done
+                if parsing_status==1 and get_parsing_status(corpus_year, database_type,
+                                                            paths_tup) is not False:
+                    # Ask to carry on with parsing if already done with unchanged
+                    # or unknown inputs
                     ask_title = "Confirmation de traitement"
                     ask_text = (f"Le 'parsing' du corpus '{database_type}' "
                                 f"de l'année {corpus_year} est déjà disponible."
@@ -308,8 +296,7 @@ def _launch_parsing(master, corpus_year, database_type,
                     answer_2 = messagebox.askokcancel(ask_title, ask_text)
                     if answer_2:
                         # Parse when already parsed and ok for reconstructing parsing
-                        _corpus_parsing(rawdata_path, parsing_path,
-                                        database_type, progress_callback)
+                        _corpus_parsing(database_type, progress_callback, force=True)
                     else:
                         # Cancel parsing reconstruction
                         progress_callback(100)
@@ -318,9 +305,8 @@ def _launch_parsing(master, corpus_year, database_type,
                                      f"de l'année {corpus_year} a été conservé.")
                         messagebox.showinfo(info_title, info_text)
                 else:
-                    # Parse when not parsed yet
-                    _corpus_parsing(rawdata_path, parsing_path,
-                                    database_type, progress_callback)
+                    # Parse when not parsed yet or when inputs have changed
+                    _corpus_parsing(database_type, progress_callback)
         else:
             progress_callback(100)
             info_title = "Information"
@@ -341,16 +327,12 @@ def _launch_synthese(master, corpus_year, org_tup, datatype,
                      paths_tup, progress_callback):
     """Concatenates and deduplicates the parsing from wos or scopus databases.
 
-    This is done through the functions `concatenate_parsing` 
-    and `deduplicate_parsing` imported from 3rd party package 
-    imported as bp.
+    This is done through the `deduplicate_corpus_parsing` function 
+    imported from `bmfuncts.parse_corpuses` module that saves 
+    the resulting parsing files.
 
     It checks if all useful files are available in the working folder.
 
-    It saves the resulting parsing files using paths set through 
-    `set_user_config` function imported from `bmfuncts.config_utils` 
-    module.
-
     It updates the files status using the internal function `_update`.
 
     Args:
@@ -365,65 +347,10 @@ def _launch_synthese(master, corpus_year, org_tup, datatype,
     """
 
     # Internal functions
-    def _deduplicate_corpus_parsing(progress_callback):
-        if not os.path.exists(concat_root_folder):
-            os.mkdir(concat_root_folder)
-        if not os.path.exists(concat_parsing_path):
-            os.mkdir(concat_parsing_path)
-        if not os.path.exists(dedup_root_folder):
-            os.mkdir(dedup_root_folder)
-        if not os.path.exists(dedup_parsing_path):
-            os.mkdir(dedup_parsing_path)
-
-        progress_callback(15)
-
-        scopus_parsing_dict = read_parsing_dict(scopus_parsing_path, item_filename_dict,
-                                                parsing_save_extent)
-        wos_parsing_dict = read_parsing_dict(wos_parsing_path, item_filename_dict,
-                                             parsing_save_extent)
-        progress_callback(30)
-        concat_parsing_dict = bp.concatenate_parsing(scopus_parsing_dict, wos_parsing_dict,
-                                                     inst_filter_list=institutions_filter_list)
-        progress_callback(50)
-        save_parsing_dict(concat_parsing_dict, concat_parsing_path,
-                          item_filename_dict, parsing_save_extent)
-        progress_callback(60)
-        file_path_0 = inst_types_file_path
-        file_path_1 = institute_affil_file_path
-        dedup_parsing_dict = bp.deduplicate_parsing(concat_parsing_dict,
-                                                    norm_inst_status=False,
-                                                    inst_types_file_path=file_path_0,
-                                                    country_affiliations_file_path=file_path_1)
-
-        synthese_articles_nb = len(dedup_parsing_dict["articles"])
-        progress_callback(90)
-        save_parsing_dict(dedup_parsing_dict, dedup_parsing_path,
-                          item_filename_dict, parsing_save_extent,
-                          dedup_infos=(bibliometer_path, datatype, corpus_year))
-
-        progress_callback(100)
-        return synthese_articles_nb
-
-    # Setting parameters from args
-    bibliometer_path, institute_affil_file_path, inst_types_file_path = paths_tup
-
-    # Setting Institute parameters
-    institutions_filter_list = org_tup[3]
-
-    # Getting the full paths of the working folder architecture for the corpus "corpus_year"
-    config_tup = set_user_config(bibliometer_path, corpus_year, pg.BDD_LIST)
-    parsing_path_dict, item_filename_dict = config_tup[1], config_tup[2]
-
-    # Setting useful paths for database 'database_type'
-    scopus_parsing_path = parsing_path_dict["scopus"]
-    wos_parsing_path = parsing_path_dict["wos"]
-    concat_root_folder = parsing_path_dict["concat_root"]
-    concat_parsing_path = parsing_path_dict["concat"]
-    dedup_root_folder = parsing_path_dict["dedup_root"]
-    dedup_parsing_path = parsing_path_dict["dedup"]
-
-    # Setting parsing files extension for saving
-    parsing_save_extent = pg.TSV_SAVE_EXTENT
+    def _deduplicate_corpus_parsing(progress_callback, force=False):
+        return deduplicate_corpus_parsing(corpus_year, org_tup, datatype, paths_tup,
+                                          progress_callback=progress_callback,
+                                          force=force)
 
     # Getting files status for corpus concatenation and deduplication
     wos_parsing_status = master.list_wos_parsing[master.list_corpus_year.index(corpus_year)]
@@ -467,7 +394,8 @@ def _launch_synthese(master, corpus_year, org_tup, datatype,
                             "\n\nReconstruire la synthèse ?")
                 answer_2 = messagebox.askokcancel(ask_title, ask_text)
                 if answer_2:
-                    synthese_articles_nb = _deduplicate_corpus_parsing(progress_callback)
+                    synthese_articles_nb = _deduplicate_corpus_parsing(progress_callback,
+                                                                       force=True)
                     info_title = "Information"
                     info_text = (f"La synthèse pour l'année {corpus_year} a été reconstruite."
                                  f"\n\nNombre d'articles de synthèse : {synthese_articles_nb}.")
@@ -490,11 +418,91 @@ def _launch_synthese(master, corpus_year, org_tup, datatype,
         messagebox.showinfo(info_title, info_text)
 
 
+def _launch_parsing_all(master, corpus_year, org_tup, datatype,
+                       paths_tup, progress_callback):
+    """Launches the parsing of the raw-data of all the databases 
+    and then the synthesis of the parsings for a corpus year.
+
+    This is done through the `parse_corpuses` function imported from 
+    `bmfuncts.parse_corpuses` module that runs the parsings of the databases 
+    in parallel and saves each of them as soon as it is available 
+    before building the synthesis. When the user chooses not to rebuild 
+    the available results, only the ones with changed inputs are rebuilt.
+
+    Args:
+        corpus_year (str): Corpus year defined by 4 digits.
+        org_tup (tup): Contains Institute parameters.
+        datatype (str): Data combination type from corpuses databases.
+        paths_tup (tup): (full path to working folder, \
+        full path to institute-affiliations file, \
+        full path to institutions-types file).
+        progress_callback (function): Function for updating \
+        ProgressBar tkinter widget status.
+    """
+    # Getting files status for corpus parsing and synthesis
+    year_idx = master.list_corpus_year.index(corpus_year)
+    rawdata_status_list = [master.list_wos_rawdata[year_idx],
+                           master.list_scopus_rawdata[year_idx]]
+    parsing_status_list = [master.list_wos_parsing[year_idx],
+                           master.list_scopus_parsing[year_idx],
+                           master.list_dedup[year_idx]]
+    progress_callback(10)
+
+    # Asking for confirmation of corpus year to parse
+    ask_title = "Confirmation de l'année de traitement"
+    ask_text = (f"Le 'parsing' de toutes les BDD et la synthèse pour l'année {corpus_year} "
+                "ont été lancés."
+                "\n\nConfirmer ce choix ?")
+    answer_1 = messagebox.askokcancel(ask_title, ask_text)
+    force = False
+    if answer_1 and any(parsing_status_list):
+        # Ask to carry on with parsing if already done
+        ask_title = "Confirmation de traitement"
+        ask_text = (f"Des fichiers de 'parsing' de l'année {corpus_year} "
+                    "sont déjà disponibles."
+                    "\n\nReconstruire tous les 'parsings' et la synthèse ?"
+                    "\n\nSinon, seuls ceux dont les fichiers d'entrée "
+                    "ont changé seront reconstruits.")
+        answer_2 = messagebox.askyesnocancel(ask_title, ask_text)
+        answer_1 = answer_2 is not None
+        force = bool(answer_2)
+    if not answer_1:
+        progress_callback(100)
+        info_title = "Information"
+        info_text = "Modifiez vos choix et relancez le 'parsing'."
+        messagebox.showinfo(info_title, info_text)
+        return
+
+    if not all(rawdata_status_list):
+        progress_callback(100)
+        warning_title = "Attention ! Fichier manquant"
+        warning_text = ("Les fichiers bruts d'extraction de toutes les BDD "
+                        f"de l'année {corpus_year} ne sont pas disponibles."
+                        "\nLes 'parsings' correspondants ne peuvent être construits !"
+                        "\n\nAjoutez les fichiers aux emplacements attendus "
+                        "et relancez le 'parsing'.")
+        messagebox.showwarning(warning_title, warning_text)
+        return
+
+    results_dict = parse_corpuses([corpus_year], org_tup, datatype, paths_tup,
+                                  progress_callback=progress_callback,
+                                  progress_bar_state=10, force=force)
+    year_results_dict = results_dict[corpus_year]
+    articles_nb_text = "".join(f"\n  Nombre d'articles du corpus '{database_type}' : "
+                               f"{year_results_dict[database_type]}"
+                               for database_type in pg.BDD_LIST)
+    info_title = "Information"
+    info_text = (f"'Parsing' de toutes les BDD et synthèse effectués pour l'année {corpus_year}."
+                 f"\n{articles_nb_text}"
+                 f"\n\nNombre d'articles de synthèse : {year_results_dict['dedup']}.")
+    messagebox.showinfo(info_title, info_text)
+
+
 def create_parsing_concat(self, master, page_name, institute, bibliometer_path, datatype):
     """Manages creation and use of widgets for corpus parsing.
 
     This is done through the internal functions  `_launch_parsing`, 
-    `_launch_synthese` and `_update`.
+    `_launch_synthese`, `_launch_parsing_all` and `_update`.
 
     Args:
         page_name (str): Name of parsing page.
@@ -520,6 +528,13 @@ def create_parsing_concat(self, master, page_name, institute, bibliometer_path,
                          paths_tup, progress_callback)
         progress_bar.place_forget()
 
+    def _launch_parsing_all_try(progress_callback):
+        parsing_all_year = self.var_year_pc_2.get()
+        _launch_parsing_all(master, parsing_all_year,
+                            org_tup, datatype,
+                            paths_tup, progress_callback)
+        progress_bar.place_forget()
+
     def _update_progress(value):
         progress_var.set(value)
         progress_bar.update_idletasks()
@@ -546,6 +561,16 @@ def create_parsing_concat(self, master, page_name, institute, bibliometer_path,
         # update files status
         _update(self, master, bibliometer_path, pos_tup)
 
+    def _start_launch_parsing_all_try():
+        disable_buttons(parse_buttons_list)
+        place_after(parsing_all_launch_button,
+                    progress_bar, dx=40, dy=0)
+        progress_var.set(0)
+        threading.Thread(target=_launch_parsing_all_try,
+                         args=(_update_progress,)).start()
+        # update files status
+        _update(self, master, bibliometer_path, pos_tup)
+
 
     # Setting useful local variables for positions modification (globals to create ??)
     # numbers are reference values in mm for reference screen
@@ -638,7 +663,8 @@ def create_parsing_concat(self, master, page_name, institute, bibliometer_path,
                              command=lambda: _update(self,
                                                      master,
                                                      bibliometer_path,
-                                                     pos_tup))
+                                                     pos_tup,
+                                                     rescan=True))
     gg.GUI_BUTTONS.append(exist_button)
     exist_button.place(x=status_button_x_pos,
                        y=status_button_y_pos,
@@ -763,6 +789,19 @@ def create_parsing_concat(self, master, page_name, institute, bibliometer_path,
                 dx=dx_launch,
                 dy=dy_launch)
 
+    # Lancement du parsing de toutes les BDD et de la synthèse
+    parsing_all_launch_font = tkFont.Font(family=gg.FONT_NAME,
+                                          size=eff_buttons_font_size)
+    parsing_all_launch_button = tk.Button(self,
+                                          text=gg.TEXT_LAUNCH_PARSING_ALL,
+                                          font=parsing_all_launch_font,
+                                          command=_start_launch_parsing_all_try)
+    gg.GUI_BUTTONS.append(parsing_all_launch_button)
+    place_after(synthese_launch_button,
+                parsing_all_launch_button,
+                dx=dx_launch,
+                dy=0)
+
     # **************** Placement de CHECKBOXCORPUSES :
     _update(self, master, bibliometer_path, pos_tup)
 
@@ -772,4 +811,5 @@ def create_parsing_concat(self, master, page_name, institute, bibliometer_path,
                           om_bdd_pc_1,
                           self.om_year_pc_2,
                           parsing_launch_button,
-                          synthese_launch_button]
+                          synthese_launch_button,
+                          parsing_all_launch_button]
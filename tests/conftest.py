@@ -0,0 +1,11 @@
+"""Configuration of the tests of package `bmfuncts`.
+
+The modules of package `bmfuncts` import the `BiblioParsing` package,
+so the tests are not collected when it is not installed.
+
+"""
+
+# Standard library imports
+import importlib.util
+
+collect_ignore_glob = [] if importlib.util.find_spec("BiblioParsing") else ["test_*.py"]
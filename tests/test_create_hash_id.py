@@ -0,0 +1,63 @@
+"""Tests of the hash IDs of the publications.
+
+The hash IDs key the merge results and the OTP history, so the digests
+built for all the strings at once must stay those of the former per-row
+implementation of the `_my_hash` function.
+
+"""
+
+# 3rd party imports
+import pandas as pd
+import pytest
+
+# Local imports
+from bmfuncts.create_hash_id import _my_hash
+from bmfuncts.create_hash_id import _my_hash_array
+from bmfuncts.create_hash_id import build_pub_hash_ids
+
+# Digests built by the former per-row implementation
+KNOWN_DIGESTS = {"": 0,
+                 "a": 93217,
+                 "2023": 1417129795,
+                 "2023MARTIN JP10.1016/j.jnucmat.2023.154321": 3286828511,
+                 "Étude des matériaux à haute température": 1479262992,
+                 "naïve 漢字 \U0001F600": 733392646,
+                 "tab\tand\x00null": 2968241166,
+                 "trailing\x00": 3312287874,
+                 "x" * 300: 1560662016,
+                }
+
+
+@pytest.mark.parametrize("text, digest", list(KNOWN_DIGESTS.items()))
+def test_my_hash_known_digests(text, digest):
+    """Checks the digest of each string against the former implementation."""
+    assert _my_hash(text) == digest
+
+
+def test_my_hash_array_known_digests():
+    """Checks the digests of all the strings built at once."""
+    texts_list = list(KNOWN_DIGESTS)
+    hashes = _my_hash_array(texts_list)
+    assert [int(value) for value in hashes] == list(KNOWN_DIGESTS.values())
+
+
+def test_my_hash_array_order_independent():
+    """Checks that the digests do not depend on the order of the strings."""
+    texts_list = list(KNOWN_DIGESTS)[::-1]
+    hashes = _my_hash_array(texts_list)
+    assert [int(value) for value in hashes] == [KNOWN_DIGESTS[text] for text in texts_list]
+
+
+def test_my_hash_array_empty():
+    """Checks the digests of an empty list of strings."""
+    assert len(_my_hash_array([])) == 0
+
+
+def test_build_pub_hash_ids():
+    """Checks the hash IDs built from the columns of the publications."""
+    pub_df = pd.DataFrame({"Year": [2023, 2023],
+                           "Authors": ["MARTIN JP", "a"],
+                           "DOI": ["10.1016/j.jnucmat.2023.154321", ""]})
+    hash_ids = build_pub_hash_ids(pub_df, ["Year", "Authors", "DOI"])
+    assert list(hash_ids) == [str(KNOWN_DIGESTS["2023MARTIN JP10.1016/j.jnucmat.2023.154321"]),
+                              str(_my_hash("2023a"))]
@@ -0,0 +1,112 @@
+"""Tests of the in-memory emulation of the xlsx files round trip.
+
+The `read_as_xlsx` function must give the same dataframe as saving
+the data as xlsx file and reading it back through the pandas
+`read_excel` function.
+
+"""
+
+# Standard library imports
+import datetime as dt
+
+# 3rd party imports
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl.utils.exceptions import IllegalCharacterError
+
+# Local imports
+from bmfuncts.dfs_utils import read_as_xlsx
+
+READ_KWARGS_LIST = [{},
+                    {"keep_default_na": False},
+                    {"converters": {"mixed": str}},
+                    {"converters": {"mixed": str}, "keep_default_na": False},
+                   ]
+
+
+# Data of the values converted when saved as xlsx file
+TYPED_DFS_LIST = [pd.DataFrame({"col": ["a\rb", "x\r\ny", "\r", "end\r"]}),
+                  pd.DataFrame({"col": pd.Series(["a", pd.NA, "b"], dtype=object)}),
+                  pd.DataFrame({"col": pd.Series(["a", pd.NA, "b"], dtype="string")}),
+                  pd.DataFrame({"col": pd.Series([1, pd.NA, 3], dtype="Int64")}),
+                  pd.DataFrame({"col": pd.Series([1, 2, 3], dtype="Int64")}),
+                  pd.DataFrame({"col": pd.Series([1.5, pd.NA, 3], dtype="Float64")}),
+                  pd.DataFrame({"col": pd.Series([True, pd.NA, False], dtype="boolean")}),
+                  pd.DataFrame({"col": pd.to_timedelta(["1 days", "36 hours", "-2 hours",
+                                                        None, "1 us"])}),
+                  pd.DataFrame({"col": pd.to_datetime(["2021-03-04", "2021-03-05 12:30",
+                                                       None, "1900-01-15"],
+                                                      format="ISO8601")}),
+                  pd.DataFrame({"col": [dt.datetime(2021, 3, 4, 1, 2, 3, 456789),
+                                        dt.datetime(2021, 3, 4, 1, 2, 3, 999999)]}),
+                  pd.DataFrame({"col": [dt.date(2021, 3, 4), dt.date(2022, 1, 1)]}),
+                  pd.DataFrame({"col": [dt.date(2021, 3, 4), "x", 3]}),
+                  pd.DataFrame({"col": [dt.time(12, 30), dt.time(1, 2, 3, 500000)]}),
+                  pd.DataFrame([[1, "a", 2.5, 3], [2, "b", np.nan, 4]],
+                               columns=["col", "col", "other", "col"]),
+                  pd.DataFrame([[1, 2, 3]], columns=[1.0, np.nan, "x\ry"]),
+                 ]
+
+
+def _read_from_xlsx(df, tmp_path, **read_kwargs):
+    """Saves the data as xlsx file and reads it back."""
+    file_path = tmp_path / "round_trip.xlsx"
+    df.to_excel(file_path, index=False)
+    return pd.read_excel(file_path, **read_kwargs)
+
+
+def _build_sample_df():
+    """Builds data with mixed values, NaN rows and a non-default index."""
+    mixed_values = ["=A1", "#DIV/0!", "#N/A", "=", "1234", "0012", "NA", "nan", "",
+                    "None", "N/A", "null", "Thèse", 3, 0, -2, 2.5, 4.0, np.nan, None,
+                    True, False, "2021-03-04", float('inf'), " NA", "tab\tand\nnewline"]
+    rows_nb = len(mixed_values)
+    sample_df = pd.DataFrame({"mixed": mixed_values,
+                              "int": range(rows_nb),
+                              "float": [1.0, 2.5, np.nan] * (rows_nb // 3) + [1.0] * (rows_nb % 3),
+                              "str": ["a", "NA", "", "12"] * (rows_nb // 4)
+                                     + ["a"] * (rows_nb % 4),
+                             })
+    sample_df.loc[rows_nb] = np.nan
+    sample_df.index = sample_df.index * 3
+    return sample_df
+
+
+@pytest.mark.parametrize("read_kwargs", READ_KWARGS_LIST)
+def test_read_as_xlsx_same_as_file(tmp_path, read_kwargs):
+    """Checks the data read as xlsx file against the real round trip."""
+    sample_df = _build_sample_df()
+    file_df = _read_from_xlsx(sample_df, tmp_path, **read_kwargs)
+    memory_df = read_as_xlsx(sample_df, **read_kwargs)
+    pd.testing.assert_frame_equal(memory_df, file_df)
+
+
+@pytest.mark.parametrize("sample_df", [pd.DataFrame({"col": ["ok", "bad\x01value"]}),
+                                       pd.DataFrame({"col": ["nul\x00"]}),
+                                       pd.DataFrame({"bad\x1fcol": ["ok"]}),
+                                      ])
+def test_read_as_xlsx_illegal_characters(tmp_path, sample_df):
+    """Checks that the illegal characters are rejected as by openpyxl."""
+    with pytest.raises(IllegalCharacterError):
+        _read_from_xlsx(sample_df, tmp_path)
+    with pytest.raises(IllegalCharacterError):
+        read_as_xlsx(sample_df)
+
+
+@pytest.mark.parametrize("sample_df", TYPED_DFS_LIST)
+def test_read_as_xlsx_converted_values(tmp_path, sample_df):
+    """Checks the values converted when saved as xlsx file against
+    the real round trip."""
+    file_df = _read_from_xlsx(sample_df, tmp_path)
+    memory_df = read_as_xlsx(sample_df)
+    pd.testing.assert_frame_equal(memory_df, file_df)
+
+
+def test_read_as_xlsx_timezone(tmp_path):
+    """Checks that the datetimes with timezone are rejected as by pandas."""
+    sample_df = pd.DataFrame({"col": pd.to_datetime(["2021-03-04"]).tz_localize("UTC")})
+    with pytest.raises(ValueError):
+        _read_from_xlsx(sample_df, tmp_path)
+    with pytest.raises(ValueError):
+        read_as_xlsx(sample_df)
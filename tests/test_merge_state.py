@@ -0,0 +1,121 @@
+"""Tests of the incremental merge of authors with employees.
+
+The results combined from the reused rows of the previous merge and
+the rows of the new publications must be the same, values and dtypes,
+as the results of the merge of all the publications at once.
+
+"""
+
+# 3rd party imports
+import BiblioParsing as bp
+import numpy as np
+import pandas as pd
+
+# Local imports
+from bmfuncts.merge_state import build_pub_keys_df
+from bmfuncts.merge_state import get_reused_merge_results
+from bmfuncts.merge_state import set_merge_results_dtypes
+from bmfuncts.merge_state import set_merge_results_order
+
+PUB_ID_COL = bp.COL_NAMES['pub_id']
+AUTHOR_ID_COL = bp.COL_NAMES['authors'][1]
+TITLE_COL = bp.COL_NAMES['articles'][9]
+EMPL_ID_COL = "Employee_ID"
+
+
+def _build_pub_df(pubs_list):
+    """Builds the publications list with one row per author."""
+    rows_list = []
+    for pub_id, (title, authors_list) in enumerate(pubs_list):
+        for author_id, author in enumerate(authors_list):
+            row_dict = dict.fromkeys(bp.COL_NAMES['articles'], "")
+            row_dict.update({PUB_ID_COL: pub_id,
+                             bp.COL_NAMES['articles'][1]: "AUTHOR A",
+                             bp.COL_NAMES['articles'][2]: 2023,
+                             TITLE_COL: title,
+                             AUTHOR_ID_COL: author_id,
+                             "Author": author})
+            rows_list.append(row_dict)
+    return pd.DataFrame(rows_list)
+
+
+def _merge(pub_df):
+    """Stands for the merge steps: the authors named 'EMPL' are matched
+    at the first stage, the ones named 'OLD' at the second stage
+    and the other ones are orphans; the employee ID of the authors
+    of 'Title B' publication is missing."""
+    submit_df = pd.concat([pub_df[pub_df["Author"]=="EMPL"],
+                           pub_df[pub_df["Author"]=="OLD"]])
+    submit_df[EMPL_ID_COL] = [np.nan if title=="Title B" else 100 + author_id
+                              for title, author_id in zip(submit_df[TITLE_COL],
+                                                          submit_df[AUTHOR_ID_COL])]
+    submit_stages = np.array([0 if author=="EMPL" else 1
+                              for author in submit_df["Author"]], dtype=int)
+    orphan_df = pub_df[~pub_df["Author"].isin(["EMPL", "OLD"])]
+    return submit_df, orphan_df, submit_stages
+
+
+def _set_full_results(pub_df):
+    """Builds the results of the merge of all the publications at once."""
+    submit_df, orphan_df, submit_stages = _merge(pub_df)
+    submit_df, orphan_df, _ = set_merge_results_order(submit_df, orphan_df,
+                                                      submit_stages, pub_df)
+    return set_merge_results_dtypes(submit_df), set_merge_results_dtypes(orphan_df)
+
+
+def _set_incremental_results(prev_pub_df, pub_df):
+    """Builds the results of the merge combining the reused results
+    of the merge of 'prev_pub_df' and the merge of the new publications."""
+    prev_submit_df, prev_orphan_df, prev_stages = _merge(prev_pub_df)
+    merge_state = {"pub_keys_df"  : build_pub_keys_df(prev_pub_df),
+                   "submit_df"    : prev_submit_df,
+                   "orphan_df"    : prev_orphan_df,
+                   "submit_stages": prev_stages}
+    reused_tup = get_reused_merge_results(merge_state, build_pub_keys_df(pub_df))
+    reused_submit_df, reused_orphan_df, reused_stages, reused_pub_ids_list = reused_tup
+    new_pub_df = pub_df[~pub_df[PUB_ID_COL].isin(reused_pub_ids_list)]
+    new_submit_df, new_orphan_df, new_stages = _merge(new_pub_df)
+    submit_df = pd.concat([reused_submit_df, new_submit_df])
+    orphan_df = pd.concat([reused_orphan_df, new_orphan_df])
+    submit_stages = np.concatenate([reused_stages, new_stages])
+    submit_df, orphan_df, _ = set_merge_results_order(submit_df, orphan_df,
+                                                      submit_stages, pub_df)
+    return set_merge_results_dtypes(submit_df), set_merge_results_dtypes(orphan_df)
+
+
+def test_incremental_merge_equals_full_merge():
+    """Checks the incremental merge after deletion, modification
+    and addition of publications."""
+    prev_pubs_list = [("Title A", ["EMPL", "X", "OLD"]),
+                      ("Title B", ["Y", "EMPL"]),
+                      ("Title C", ["OLD", "Z"]),
+                      ("Title D", ["EMPL"])]
+    pubs_list = [("Title C", ["OLD", "Z"]),
+                 ("Title A", ["EMPL", "X", "OLD"]),
+                 ("Title D", ["EMPL", "W"]),
+                 ("Title E", ["X", "OLD", "EMPL"])]
+    prev_pub_df = _build_pub_df(prev_pubs_list)
+    pub_df = _build_pub_df(pubs_list)
+
+    full_submit_df, full_orphan_df = _set_full_results(pub_df)
+    inc_submit_df, inc_orphan_df = _set_incremental_results(prev_pub_df, pub_df)
+
+    assert _merge(prev_pub_df)[0][EMPL_ID_COL].dtype == np.float64
+    assert full_submit_df[EMPL_ID_COL].dtype == np.int64
+    pd.testing.assert_frame_equal(inc_submit_df.reset_index(drop=True),
+                                  full_submit_df.reset_index(drop=True))
+    pd.testing.assert_frame_equal(inc_orphan_df.reset_index(drop=True),
+                                  full_orphan_df.reset_index(drop=True))
+
+
+def test_set_merge_results_dtypes():
+    """Checks the dtypes inferred from the values of the columns."""
+    merge_df = pd.DataFrame({"int": pd.Series([1, 2], dtype=object),
+                             "float": [1.0, np.nan],
+                             "integral": [1.0, 2],
+                             "str": ["NA", None],
+                             "empty": pd.Series([np.nan, np.nan], dtype=object)})
+    typed_df = set_merge_results_dtypes(merge_df)
+    assert list(typed_df.dtypes) == [np.int64, np.float64, np.int64, object, np.float64]
+    assert typed_df["str"].tolist() == ["NA", None]
+    assert set_merge_results_dtypes(pd.DataFrame()).empty